@@ -0,0 +1,5 @@
+# This program is dedicated to the public domain under the CC0 license.
+"""Benchmarks for python-telegram-bot. Run them from the repository root, e.g.
+
+    python -m benchmarks.bench_update_fetcher
+"""
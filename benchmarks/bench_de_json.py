@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+"""
+Measures decoding ``getUpdates`` responses with 100 updates each: parsing the JSON and converting
+the updates with ``Update.de_list``
+
+* eagerly, copying the data of each update first, which is what ``Update.de_json`` does by default
+* eagerly, without copying the data, which is what ``Bot.get_updates`` does
+* lazily, i.e. nested objects are only converted when accessed
+* lazily, followed by what a typical handler accesses: the update type, ``message.text`` and
+  ``effective_chat.id``
+
+Usage:
+    python -m benchmarks.bench_de_json
+"""
+import json
+import random
+from typing import Callable, List
+
+from telegram import Update
+
+from benchmarks.utils import BOT_USER, make_bot, print_table, timeit
+
+BATCH_SIZE = 100
+NUMBER = 200
+SEED = 1
+
+USER = {
+    'id': 42,
+    'is_bot': False,
+    'first_name': 'Jane',
+    'last_name': 'Doe',
+    'username': 'jane',
+    'language_code': 'en',
+}
+CHAT = {'id': -100123, 'type': 'supergroup', 'title': 'Group', 'username': 'group'}
+
+
+def make_message(message_id: int, rng: random.Random, reply: bool = True) -> dict:
+    message = {
+        'message_id': message_id,
+        'date': 1635768000,
+        'chat': CHAT,
+        'from': USER,
+        'text': 'Hey @someone, see /help and https://python-telegram-bot.org',
+        'entities': [
+            {'type': 'mention', 'offset': 4, 'length': 8},
+            {'type': 'bot_command', 'offset': 18, 'length': 5},
+            {'type': 'url', 'offset': 28, 'length': 31},
+        ],
+    }
+    if rng.random() < 0.2:
+        del message['text'], message['entities']
+        message['caption'] = 'A photo'
+        message['photo'] = [
+            {
+                'file_id': f'photo{size}',
+                'file_unique_id': f'unique{size}',
+                'width': size,
+                'height': size,
+                'file_size': size * 100,
+            }
+            for size in (90, 320, 800, 1280)
+        ]
+    if reply and rng.random() < 0.3:
+        message['reply_to_message'] = make_message(message_id - 1, rng, reply=False)
+    return message
+
+
+def make_response(rng: random.Random) -> bytes:
+    updates = []
+    for update_id in range(BATCH_SIZE):
+        if rng.random() < 0.8:
+            updates.append({'update_id': update_id, 'message': make_message(update_id, rng)})
+        else:
+            updates.append(
+                {
+                    'update_id': update_id,
+                    'callback_query': {
+                        'id': str(update_id),
+                        'from': USER,
+                        'chat_instance': '1',
+                        'data': 'menu:1',
+                        'message': {
+                            **make_message(update_id, rng, reply=False),
+                            'from': BOT_USER,
+                            'reply_markup': {
+                                'inline_keyboard': [
+                                    [
+                                        {'text': f'Button {i}', 'callback_data': f'menu:{i}'}
+                                        for i in range(3)
+                                    ]
+                                ]
+                            },
+                        },
+                    },
+                }
+            )
+    return json.dumps({'ok': True, 'result': updates}).encode('utf-8')
+
+
+def typical_access(updates: List[Update]) -> None:
+    for update in updates:
+        for update_type in Update.ALL_TYPES:
+            if getattr(update, update_type) is not None:
+                break
+        if update.message:
+            _ = update.message.text
+        _ = update.effective_chat.id  # type: ignore[union-attr]
+
+
+def main() -> None:
+    bot = make_bot()
+    bot._bot = BOT_USER  # type: ignore[attr-defined]
+    response = make_response(random.Random(SEED))
+
+    def decode() -> List[dict]:
+        return json.loads(response.decode('utf-8'))['result']
+
+    cases: List[Callable[[], object]] = [
+        decode,
+        lambda: Update.de_list(decode(), bot),
+        lambda: Update.de_list(decode(), bot, copy=False),
+        lambda: Update.de_list(decode(), bot, lazy=True, copy=False),
+        lambda: typical_access(Update.de_list(decode(), bot, lazy=True, copy=False)),
+        lambda: typical_access(Update.de_list(decode(), bot, copy=False)),
+    ]
+    names = [
+        'json.loads only',
+        'eager',
+        'eager, no copy',
+        'lazy, no copy',
+        'lazy, no copy + typical access',
+        'eager, no copy + typical access',
+    ]
+
+    # The decoded updates must be the same
+    assert [u.to_dict() for u in Update.de_list(decode(), bot)] == [
+        u.to_dict() for u in Update.de_list(decode(), bot, lazy=True, copy=False)
+    ]
+
+    timings = [timeit(case, NUMBER) for case in cases]
+    baseline = timings[1]
+    print(f'{BATCH_SIZE} updates per batch, {len(response) // 1024} KiB\n')
+    print_table(
+        ('mode', 'µs/batch', 'speedup'),
+        [
+            (name, f'{us:.0f}', f'{baseline / us:.2f}x' if index else '')
+            for index, (name, us) in enumerate(zip(names, timings))
+        ],
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+"""
+Measures the time the Dispatcher needs to route an update through a realistic handler table of
+~150 handlers in 6 groups, where most handlers can never match most updates.
+
+The same updates are routed twice: once with the dispatchers index of the handlers by
+``Handler.update_types`` and once with every handler of every group being checked, which is what
+the dispatcher did before the index was introduced.
+
+Usage:
+    python -m benchmarks.bench_handler_index
+"""
+import asyncio
+import random
+import time
+from typing import Dict, List
+
+from telegram import Update
+from telegram.ext import (
+    CallbackQueryHandler,
+    ChatJoinRequestHandler,
+    ChatMemberHandler,
+    ChosenInlineResultHandler,
+    CommandHandler,
+    ConversationHandler,
+    Dispatcher,
+    InlineQueryHandler,
+    MessageHandler,
+    PollAnswerHandler,
+    PreCheckoutQueryHandler,
+    ShippingQueryHandler,
+    TypeHandler,
+    filters,
+)
+
+from benchmarks.utils import make_bot, make_dispatcher, print_table
+
+N_UPDATES = 20_000
+SEED = 1
+
+USER = {'id': 42, 'is_bot': False, 'first_name': 'Jane'}
+CHAT = {'id': -100123, 'type': 'supergroup', 'title': 'Group'}
+
+
+def noop(_: object, __: object) -> None:
+    pass
+
+
+def build_handler_table(dispatcher: Dispatcher) -> None:
+    # group -1: an update logger that sees every update
+    dispatcher.add_handler(TypeHandler(Update, noop), group=-1)
+
+    # group 0: the bots commands
+    for i in range(60):
+        dispatcher.add_handler(CommandHandler(f'command{i}', noop))
+
+    # group 1: menus driven by inline keyboards
+    for i in range(30):
+        dispatcher.add_handler(CallbackQueryHandler(noop, pattern=f'^menu{i}:'), group=1)
+
+    # group 2: plain messages
+    for i in range(20):
+        dispatcher.add_handler(
+            MessageHandler(filters.Regex(f'^keyword{i}') & ~filters.COMMAND, noop), group=2
+        )
+    for message_filter in (filters.PHOTO, filters.LOCATION, filters.STICKER):
+        dispatcher.add_handler(MessageHandler(message_filter, noop), group=2)
+
+    # group 3: inline mode
+    for i in range(10):
+        dispatcher.add_handler(InlineQueryHandler(noop, pattern=f'^search{i}'), group=3)
+    for i in range(5):
+        dispatcher.add_handler(ChosenInlineResultHandler(noop, pattern=f'^result{i}'), group=3)
+
+    # group 4: chat management and payments
+    dispatcher.add_handler(ChatMemberHandler(noop, ChatMemberHandler.ANY_CHAT_MEMBER), group=4)
+    dispatcher.add_handler(ChatJoinRequestHandler(noop), group=4)
+    dispatcher.add_handler(PollAnswerHandler(noop), group=4)
+    dispatcher.add_handler(PreCheckoutQueryHandler(noop), group=4)
+    dispatcher.add_handler(ShippingQueryHandler(noop), group=4)
+
+    # group 5: a few conversations
+    for i in range(5):
+        dispatcher.add_handler(
+            ConversationHandler(
+                entry_points=[CommandHandler(f'start{i}', noop)],
+                states={
+                    0: [MessageHandler(filters.TEXT & ~filters.COMMAND, noop)],
+                    1: [CallbackQueryHandler(noop, pattern=f'^conv{i}:')],
+                },
+                fallbacks=[CommandHandler('cancel', noop)],
+                per_message=False,
+            ),
+            group=5,
+        )
+
+
+def make_updates(bot: object) -> List[Update]:
+    rng = random.Random(SEED)
+    message = {'message_id': 1, 'date': 0, 'chat': CHAT, 'from': USER}
+    kinds = [
+        # weight, update payload
+        (55, lambda i: {'message': {**message, 'text': f'hello there {i}'}}),
+        (
+            10,
+            lambda i: {
+                'message': {
+                    **message,
+                    'text': f'/command{i % 60} arg',
+                    'entities': [{'type': 'bot_command', 'offset': 0, 'length': 10}],
+                }
+            },
+        ),
+        (
+            20,
+            lambda i: {
+                'callback_query': {
+                    'id': str(i),
+                    'from': USER,
+                    'chat_instance': '1',
+                    'data': f'menu{i % 30}:item',
+                    'message': message,
+                }
+            },
+        ),
+        (
+            7,
+            lambda i: {
+                'inline_query': {'id': str(i), 'from': USER, 'query': 'foo', 'offset': ''}
+            },
+        ),
+        (
+            3,
+            lambda i: {
+                'chosen_inline_result': {'result_id': 'bar', 'from': USER, 'query': 'foo'}
+            },
+        ),
+        (
+            5,
+            lambda i: {
+                'my_chat_member': {
+                    'chat': CHAT,
+                    'from': USER,
+                    'date': 0,
+                    'old_chat_member': {'status': 'left', 'user': USER},
+                    'new_chat_member': {'status': 'member', 'user': USER},
+                }
+            },
+        ),
+    ]
+    weights = [weight for weight, _ in kinds]
+    payloads = [payload for _, payload in kinds]
+    return [
+        Update.de_json(
+            {'update_id': i, **rng.choices(payloads, weights)[0](i)}, bot  # type: ignore
+        )
+        for i in range(N_UPDATES)
+    ]
+
+
+def disable_index(dispatcher: Dispatcher) -> None:
+    # Every kind of update is checked against every handler of every group
+    all_handlers = [dispatcher.handlers[group] for group in dispatcher.groups]
+    index: Dict[object, List[list]] = {kind: all_handlers for kind in Update.ALL_TYPES}
+    index[None] = all_handlers
+    dispatcher._Dispatcher__handler_index = index  # type: ignore[attr-defined]
+
+
+async def route(dispatcher: Dispatcher, updates: List[Update]) -> float:
+    """Returns the mean time per update in microseconds."""
+    start = time.perf_counter()
+    for update in updates:
+        await dispatcher.process_update(update)
+    return (time.perf_counter() - start) / len(updates) * 1e6
+
+
+async def main() -> None:
+    bot = make_bot()
+    await bot.initialize()
+
+    indexed = make_dispatcher(bot=bot)
+    build_handler_table(indexed)
+    linear = make_dispatcher(bot=bot)
+    build_handler_table(linear)
+    disable_index(linear)
+
+    n_handlers = sum(len(handlers) for handlers in indexed.handlers.values())
+    print(f'{n_handlers} handlers in {len(indexed.groups)} groups, {N_UPDATES} updates\n')
+
+    updates = make_updates(bot)
+    # Warm up, e.g. the regex cache
+    await route(indexed, updates[:1000])
+    await route(linear, updates[:1000])
+
+    linear_us = await route(linear, updates)
+    indexed_us = await route(indexed, updates)
+    print_table(
+        ('dispatch', 'µs/update', 'speedup'),
+        [
+            ('linear', f'{linear_us:.1f}', '1.00x'),
+            ('indexed', f'{indexed_us:.1f}', f'{linear_us / indexed_us:.2f}x'),
+        ],
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+"""
+Measures the latency of concurrent requests over HTTP/1.1 and HTTP/2 against local HTTPS servers
+that speak enough of the Bot API: one ``sendDocument`` call, which takes ``UPLOAD_TIME`` seconds
+to simulate a slow upload, is followed by ``N_MESSAGES`` concurrent ``sendMessage`` calls, which
+take ``LATENCY`` seconds each.
+
+With HTTP/1.1, each connection carries one request at a time, so the messages queue for the few
+connections of the pool and the upload blocks one of them. With HTTP/2, all requests are
+multiplexed over a single connection. ``pool_timeout`` is disabled to measure the time spent
+waiting for a connection instead of getting ``TimedOut`` errors.
+
+The HTTP/1.1 server is the tornado based ``FakeBotAPIServer``, the HTTP/2 server is a minimal
+implementation on top of ``h2``. Both use a self-signed certificate, which is passed to httpx via
+the ``SSL_CERT_FILE`` environment variable. Requires ``pip install python-telegram-bot[http2]``
+and ``cryptography``.
+
+Usage:
+    python -m benchmarks.bench_http2
+"""
+import asyncio
+import datetime
+import ipaddress
+import json
+import os
+import ssl
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from telegram.ext import ExtBot
+from telegram.request._httpxrequest import HTTPXRequest
+
+from benchmarks.utils import TOKEN, FakeBotAPIServer, print_table, summarize
+
+UPLOAD_TIME = 1.0
+LATENCY = 0.02
+N_MESSAGES = 100
+POOL_SIZES = (1, 4, 16)
+
+
+def make_certificate(directory: str) -> Tuple[str, str]:
+    """Creates a self-signed certificate for 127.0.0.1 and returns the paths of the certificate
+    and the key."""
+    # pylint: disable=import-outside-toplevel
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, '127.0.0.1')])
+    now = datetime.datetime.utcnow()
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address('127.0.0.1'))]),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, 'cert.pem')
+    key_path = os.path.join(directory, 'key.pem')
+    with open(cert_path, 'wb') as file:
+        file.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, 'wb') as file:
+        file.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+    return cert_path, key_path
+
+
+class SlowUploadServer(FakeBotAPIServer):
+    """Takes ``UPLOAD_TIME`` seconds to answer ``sendDocument``."""
+
+    async def handle(self, method: str, params: Dict[str, str]) -> Tuple[int, dict]:
+        if method == 'sendDocument':
+            await asyncio.sleep(UPLOAD_TIME)
+        return await super().handle(method, params)
+
+
+class H2Protocol(asyncio.Protocol):
+    """Serves the requests of one HTTP/2 connection concurrently."""
+
+    def __init__(self, server: 'H2Server') -> None:
+        # pylint: disable=import-outside-toplevel
+        import h2.config
+        import h2.connection
+
+        self.server = server
+        self.connection = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding='utf-8')
+        )
+        self.transport: Optional[asyncio.Transport] = None
+        self.streams: Dict[int, Tuple[str, bytearray]] = {}
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+        self.connection.initiate_connection()
+        self.flush()
+
+    def flush(self) -> None:
+        if self.transport and not self.transport.is_closing():
+            self.transport.write(self.connection.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        # pylint: disable=import-outside-toplevel
+        from h2.events import DataReceived, RequestReceived, StreamEnded
+
+        for event in self.connection.receive_data(data):
+            if isinstance(event, RequestReceived):
+                self.streams[event.stream_id] = (dict(event.headers)[':path'], bytearray())
+            elif isinstance(event, DataReceived):
+                self.streams[event.stream_id][1].extend(event.data)
+                self.connection.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, StreamEnded):
+                asyncio.ensure_future(self.respond(event.stream_id))
+        self.flush()
+
+    async def respond(self, stream_id: int) -> None:
+        path, body = self.streams.pop(stream_id)
+        params = dict(parse_qsl(body.decode('utf-8')))
+        status, response = await self.server.handle(path.rsplit('/', 1)[-1], params)
+        payload = json.dumps(response).encode('utf-8')
+        self.connection.send_headers(
+            stream_id,
+            [
+                (':status', str(status)),
+                ('content-type', 'application/json'),
+                ('content-length', str(len(payload))),
+            ],
+        )
+        self.connection.send_data(stream_id, payload, end_stream=True)
+        self.flush()
+
+
+class H2Server(SlowUploadServer):
+    """The same server, but speaking HTTP/2 only."""
+
+    async def __aenter__(self) -> 'H2Server':
+        self._server = await asyncio.get_running_loop().create_server(
+            lambda: H2Protocol(self), '127.0.0.1', 0, ssl=self.ssl_context
+        )
+        self.port = self._server.sockets[0].getsockname()[1]  # type: ignore[attr-defined]
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        self._server.close()  # type: ignore[attr-defined]
+
+
+async def run(server: FakeBotAPIServer, pool_size: int, http2: bool) -> List[float]:
+    request = HTTPXRequest(connection_pool_size=pool_size, pool_timeout=None, http2=http2)
+    async with ExtBot(TOKEN, base_url=server.base_url, request=request) as bot:
+
+        async def send_message(chat_id: int) -> float:
+            start = time.perf_counter()
+            await bot.send_message(chat_id, 'Hello')
+            return time.perf_counter() - start
+
+        upload = asyncio.ensure_future(bot.send_document(1, 'file_id'))
+        await asyncio.sleep(0)
+        latencies = await asyncio.gather(*(send_message(i) for i in range(1, N_MESSAGES + 1)))
+        await upload
+        return latencies
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path, key_path = make_certificate(directory)
+        os.environ['SSL_CERT_FILE'] = cert_path
+
+        contexts = {}
+        for protocol in ('http/1.1', 'h2'):
+            context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            context.load_cert_chain(cert_path, key_path)
+            context.set_alpn_protocols([protocol])
+            contexts[protocol] = context
+
+        rows = []
+        async with SlowUploadServer(
+            latency=LATENCY, ssl_context=contexts['http/1.1']
+        ) as http1_server, H2Server(latency=LATENCY, ssl_context=contexts['h2']) as h2_server:
+            for pool_size in POOL_SIZES:
+                for name, server, http2 in (
+                    ('HTTP/1.1', http1_server, False),
+                    ('HTTP/2', h2_server, True),
+                ):
+                    start = time.perf_counter()
+                    latencies = await run(server, pool_size, http2)
+                    elapsed = time.perf_counter() - start
+                    p50, p99, mean = summarize(latencies)
+                    rows.append(
+                        (
+                            name,
+                            pool_size,
+                            f'{p50:.0f}',
+                            f'{p99:.0f}',
+                            f'{mean:.0f}',
+                            f'{elapsed:.2f}',
+                        )
+                    )
+
+    print(
+        f'{N_MESSAGES} concurrent sendMessage calls ({LATENCY * 1e3:.0f} ms each) while a '
+        f'sendDocument call takes {UPLOAD_TIME:.0f} s\n'
+    )
+    print_table(('protocol', 'pool size', 'p50 ms', 'p99 ms', 'mean ms', 'total s'), rows)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+"""
+Measures the throughput of the JSON codecs in ``telegram.request`` for
+
+* decoding a ``getUpdates`` response with 100 updates, as done by ``BaseRequest.post``
+* encoding the payload of a ``sendMessage`` request with entities and an inline keyboard, as done
+  by ``RequestData.json_payload``
+
+The previous implementation, which decoded the response to a string before parsing it and always
+encoded the payload to a string first, is included as baseline. Codecs whose library is not
+installed are skipped.
+
+Usage:
+    python -m benchmarks.bench_json_codec
+"""
+import json
+import random
+from typing import Callable, List, Tuple
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup, MessageEntity
+from telegram.request import BaseRequest, JSONCodec, OrjsonCodec, RequestData, UJSONCodec
+from telegram.request._requestparameter import RequestParameter
+
+from benchmarks.bench_de_json import SEED, make_response
+from benchmarks.utils import print_table, timeit
+
+DECODE_NUMBER = 300
+ENCODE_NUMBER = 20_000
+
+
+def available_codecs() -> List[Tuple[str, JSONCodec]]:
+    codecs = [('json', JSONCodec())]
+    for name, cls in (('ujson', UJSONCodec), ('orjson', OrjsonCodec)):
+        try:
+            codecs.append((name, cls()))
+        except RuntimeError:
+            print(f'{name} is not installed, skipping it')
+    return codecs
+
+
+def make_send_message_parameters() -> List[RequestParameter]:
+    keyboard = InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton(f'Option {row}.{col}', callback_data=f'option:{row}:{col}')
+                for col in range(3)
+            ]
+            for row in range(3)
+        ]
+    )
+    data = {
+        'chat_id': -100123456789,
+        'text': 'Please choose one of the options below. Bold and ünïcödé text included!',
+        'entities': [
+            MessageEntity(MessageEntity.BOLD, 0, 6),
+            MessageEntity(MessageEntity.ITALIC, 42, 4),
+        ],
+        'disable_notification': True,
+        'reply_to_message_id': 42,
+        'reply_markup': keyboard,
+    }
+    return [RequestParameter.from_input(key, value) for key, value in data.items()]
+
+
+def legacy_decode(payload: bytes) -> object:
+    return json.loads(payload.decode('utf-8', 'replace'))
+
+
+def legacy_encode(request_data: RequestData) -> bytes:
+    return json.dumps(request_data.json_parameters).encode('utf-8')
+
+
+def parse_payload(payload: bytes) -> dict:
+    """Parses the payload including the JSON encoded values, whose formatting differs between
+    the codecs."""
+    parsed = {}
+    for key, value in json.loads(payload).items():
+        try:
+            parsed[key] = json.loads(value)
+        except ValueError:
+            parsed[key] = value
+    return parsed
+
+
+def main() -> None:
+    response = make_response(random.Random(SEED))
+    parameters = make_send_message_parameters()
+    baseline_data = RequestData(parameters, json_codec=JSONCodec())
+    baseline_payload = parse_payload(legacy_encode(baseline_data))
+    payload_size = len(baseline_data.json_payload)
+
+    decode_cases: List[Tuple[str, Callable[[], object]]] = [
+        ('json, via str (previous)', lambda: legacy_decode(response))
+    ]
+    encode_cases: List[Tuple[str, Callable[[], object]]] = [
+        ('json, via str (previous)', lambda: legacy_encode(baseline_data))
+    ]
+    for name, codec in available_codecs():
+        # pylint: disable=protected-access,cell-var-from-loop
+        decode_cases.append(
+            (name, lambda codec=codec: BaseRequest._parse_json_response(response, codec))
+        )
+        request_data = RequestData(parameters, json_codec=codec)
+        assert parse_payload(request_data.json_payload) == baseline_payload
+        encode_cases.append((name, lambda request_data=request_data: request_data.json_payload))
+
+    response_title = f'getUpdates response, {len(response) // 1024} KiB'
+    payload_title = f'sendMessage payload, {payload_size} bytes'
+    for title, cases, number, size in (
+        (response_title, decode_cases, DECODE_NUMBER, len(response)),
+        (payload_title, encode_cases, ENCODE_NUMBER, payload_size),
+    ):
+        timings = [timeit(case, number) for _, case in cases]
+        print(f'\n{title}\n')
+        print_table(
+            ('codec', 'µs/call', 'MB/s', 'speedup'),
+            [
+                (name, f'{us:.1f}', f'{size / us:.0f}', f'{timings[0] / us:.2f}x')
+                for (name, _), us in zip(cases, timings)
+            ],
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+"""
+Measures saving the ``user_data`` of a single user with ``PicklePersistence`` for bots with 10k,
+100k and 1M users:
+
+* as before, i.e. pickling all data to the file again for every change
+* with ``append_only=True``, i.e. appending only the changed ``user_data``
+
+Also reports the time for loading the file, which in append only mode includes replaying the
+appended records, and for ``flush``, which in append only mode compacts the file.
+
+Usage:
+    python -m benchmarks.bench_persistence
+"""
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Sequence
+
+from telegram.ext import PicklePersistence
+
+from benchmarks.utils import print_table
+
+SIZES = (10_000, 100_000, 1_000_000)
+SEED = 1
+
+
+def make_user_data(user_id: int) -> dict:
+    return {'name': f'User {user_id}', 'language': 'en', 'counter': user_id, 'items': [1, 2, 3]}
+
+
+def write_file(path: Path, size: int) -> None:
+    persistence = PicklePersistence(path, on_flush=True)
+    persistence.get_user_data()
+    persistence.user_data.update(  # type: ignore[union-attr]
+        (i, make_user_data(i)) for i in range(size)
+    )
+    persistence.flush()
+
+
+def measure(path: Path, size: int, append_only: bool) -> Sequence[float]:
+    """Returns the times in milliseconds for loading, for one update and for flushing."""
+    start = time.perf_counter()
+    persistence = PicklePersistence(path, append_only=append_only)
+    persistence.get_user_data()
+    load = time.perf_counter() - start
+
+    # Fewer updates for the larger sizes, as each takes long without append_only
+    number = max(3, 1_000_000 // size // 10)
+    rng = random.Random(SEED)
+    user_ids = [rng.randrange(size) for _ in range(number)]
+    start = time.perf_counter()
+    for counter, user_id in enumerate(user_ids):
+        persistence.update_user_data(user_id, {**make_user_data(user_id), 'counter': -counter})
+    update = (time.perf_counter() - start) / number
+
+    start = time.perf_counter()
+    persistence.flush()
+    flush = time.perf_counter() - start
+    return load * 1e3, update * 1e3, flush * 1e3
+
+
+def main() -> None:
+    rows: List[Sequence[object]] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in SIZES:
+            for append_only in (False, True):
+                path = Path(directory) / f'{size}_{append_only}'
+                write_file(path, size)
+                load, update, flush = measure(path, size, append_only)
+                rows.append(
+                    (
+                        f'{size:,}',
+                        'append only' if append_only else 'rewrite',
+                        f'{update:.3f}',
+                        f'{load:.0f}',
+                        f'{flush:.0f}',
+                        f'{path.stat().st_size / 1024 ** 2:.1f}',
+                    )
+                )
+
+    print('PicklePersistence.update_user_data for a single user\n')
+    print_table(('users', 'mode', 'ms/update', 'load ms', 'flush ms', 'file MiB'), rows)
+
+
+if __name__ == '__main__':
+    main()
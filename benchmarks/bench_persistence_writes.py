@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+"""
+Measures the dispatch latency, i.e. the time from putting an update into the update queue until
+its handler is done, while the handlers change ``user_data`` and the bot uses a
+``PicklePersistence`` with ``USERS`` users, such that every write pickles all of them:
+
+* with the previous ``Dispatcher.update_persistence``, which is reproduced below: it wrote to the
+  persistence on the event loop after each update
+* with the background writer, which writes in a separate thread and coalesces the changes that
+  happen while a write is running
+* the same with ``persistence_write_delay = 0.5``
+
+The updates arrive at ``RATE`` updates per second. Each handler makes one request with a latency
+of 10 ms to ``MockRequest``.
+
+Usage:
+    python -m benchmarks.bench_persistence_writes
+"""
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from telegram import Update
+from telegram.ext import CallbackContext, Dispatcher, MessageHandler, PicklePersistence, filters
+from telegram.request import MockRequest
+
+from benchmarks.utils import make_bot, make_dispatcher, print_table, summarize
+
+USERS = 20_000
+RATE = 50
+N_UPDATES = 500
+
+
+class InlinePersistenceDispatcher(Dispatcher):
+    """``Dispatcher`` with the previous implementation of ``update_persistence``."""
+
+    __slots__ = ()
+
+    async def update_persistence(self, update: object = None) -> None:
+        if not self.persistence:
+            return
+        chat_ids = list(self.chat_data.keys())
+        user_ids = list(self.user_data.keys())
+        if isinstance(update, Update):
+            chat_ids = [update.effective_chat.id] if update.effective_chat else []
+            user_ids = [update.effective_user.id] if update.effective_user else []
+        if self.persistence.store_data.bot_data:
+            self.persistence.update_bot_data(self.bot_data)
+        if self.persistence.store_data.chat_data:
+            for chat_id in chat_ids:
+                self.persistence.update_chat_data(chat_id, self.chat_data[chat_id])
+        if self.persistence.store_data.user_data:
+            for user_id in user_ids:
+                self.persistence.update_user_data(user_id, self.user_data[user_id])
+
+
+def write_file(path: Path) -> None:
+    persistence = PicklePersistence(path, on_flush=True)
+    persistence.get_user_data()
+    persistence.user_data.update(  # type: ignore[union-attr]
+        (i, {'name': f'User {i}', 'counter': 0}) for i in range(USERS)
+    )
+    persistence.flush()
+
+
+def make_update(update_id: int) -> dict:
+    user = {'id': update_id % USERS, 'is_bot': False, 'first_name': 'User'}
+    return {
+        'update_id': update_id,
+        'message': {
+            'message_id': update_id,
+            'date': 0,
+            'chat': {'id': user['id'], 'type': 'private'},
+            'from': user,
+            'text': 'Hello',
+        },
+    }
+
+
+async def run(path: Path, inline: bool, delay: float) -> Sequence[float]:
+    bot = make_bot(MockRequest(latency=0.01, record=False))
+    dispatcher = make_dispatcher(
+        bot, workers=64, persistence=PicklePersistence(path, single_file=True)
+    )
+    if inline:
+        dispatcher.__class__ = InlinePersistenceDispatcher
+    dispatcher.process_asyncio = True
+    dispatcher.persistence_write_delay = delay
+
+    arrivals: Dict[int, float] = {}
+    latencies: List[float] = []
+
+    async def callback(update: Update, context: CallbackContext) -> None:
+        context.user_data['counter'] += 1  # type: ignore[index]
+        await update.effective_message.reply_text('Hi')  # type: ignore[union-attr]
+        latencies.append(time.perf_counter() - arrivals[update.update_id])
+
+    dispatcher.add_handler(MessageHandler(filters.TEXT, callback))
+    await dispatcher.start()
+    updates = [Update.de_json(make_update(i), bot) for i in range(N_UPDATES)]
+    start = time.perf_counter()
+    for index, update in enumerate(updates):
+        # Keep the arrival rate steady, even if the event loop was blocked in between
+        await asyncio.sleep(max(0.0, start + index / RATE - time.perf_counter()))
+        arrivals[update.update_id] = time.perf_counter()
+        await dispatcher.update_queue.put(update)
+    await dispatcher.stop()
+    return latencies
+
+
+async def main() -> None:
+    cases = [
+        ('inline, previous', True, 0.0),
+        ('background writer', False, 0.0),
+        ('background writer, 0.5 s delay', False, 0.5),
+    ]
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name, inline, delay in cases:
+            path = Path(directory) / name
+            write_file(path)
+            latencies = await run(path, inline, delay)
+            p50, p99, _ = summarize(latencies)
+            rows.append((name, f'{p50:.0f}', f'{p99:.0f}', f'{max(latencies) * 1e3:.0f}'))
+
+    print(
+        f'{N_UPDATES} updates at {RATE}/s, PicklePersistence with {USERS:,} users, '
+        'requests take 10 ms\n'
+    )
+    print_table(('persistence writes', 'p50 ms', 'p99 ms', 'max ms'), rows)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
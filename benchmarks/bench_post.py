@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+"""
+Measures the per-call overhead of ``Bot._post`` for a ``sendMessage`` request, i.e. everything but
+the network, such that regressions in the overhead get noticed:
+
+* with ``OfflineRequest``, which answers without any HTTP client, i.e. the overhead of PTB alone
+* with ``HTTPXRequest`` on top of an in-process ``httpx.MockTransport``
+* with the previous ``HTTPXRequest.do_request``, which is reproduced below: it built a new
+  ``httpx.Timeout`` and a new headers dict for every request
+
+Each case is measured without overriding a timeout and with ``read_timeout=10``.
+
+Usage:
+    python -m benchmarks.bench_post
+"""
+import asyncio
+import gc
+import json
+import time
+from typing import List, Optional, Tuple
+
+import httpx
+
+from telegram.ext import ExtBot
+from telegram.request import BaseRequest, RequestData
+from telegram.request._httpxrequest import HTTPXRequest
+
+from benchmarks.utils import BOT_USER, TOKEN, OfflineRequest, print_table
+
+NUMBER = 1000
+REPEAT = 15
+DATA = {'chat_id': 123456, 'text': 'Hello there!', 'disable_notification': True}
+RESPONSE = json.dumps(
+    {
+        'ok': True,
+        'result': {
+            'message_id': 1,
+            'date': 1635768000,
+            'chat': {'id': 123456, 'type': 'private', 'first_name': 'Jane'},
+            'from': BOT_USER,
+            'text': 'Hello there!',
+        },
+    }
+).encode('utf-8')
+
+
+class LegacyHTTPXRequest(HTTPXRequest):
+    """``HTTPXRequest`` with the previous implementation of ``do_request``."""
+
+    __slots__ = ()
+
+    async def do_request(
+        self,
+        method: str,
+        url: str,
+        request_data: RequestData = None,
+        connect_timeout: float = None,
+        read_timeout: float = None,
+        write_timeout: float = None,
+        pool_timeout: float = None,
+    ) -> Tuple[int, bytes]:
+        timeout = httpx.Timeout(
+            connect=self._client.timeout.connect,
+            read=self._client.timeout.read,
+            write=self._client.timeout.write,
+            pool=self._client.timeout.pool,
+        )
+        if read_timeout is not None:
+            timeout.read = read_timeout
+        if write_timeout is not None:
+            timeout.write = write_timeout
+        if connect_timeout is not None:
+            timeout.connect = connect_timeout
+        if pool_timeout is not None:
+            timeout.pool = pool_timeout
+
+        files = request_data.multipart_data if request_data else None
+        data = request_data.json_parameters if request_data else None
+        res = await self._client.request(
+            method=method,
+            url=url,
+            headers={'User-Agent': self.USER_AGENT},
+            timeout=timeout,
+            files=files,
+            data=data,
+        )
+        return res.status_code, res.content
+
+
+def with_mock_transport(request: HTTPXRequest, headers: Optional[httpx.Headers]) -> HTTPXRequest:
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=RESPONSE)
+
+    request._client = httpx.AsyncClient(  # pylint: disable=protected-access
+        transport=httpx.MockTransport(handler),
+        timeout=request._client.timeout,  # pylint: disable=protected-access
+        headers=headers,
+    )
+    return request
+
+
+async def time_post(bot: ExtBot, read_timeout: Optional[float]) -> float:
+    """Returns the per-call time in microseconds of one round of ``NUMBER`` calls."""
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(NUMBER):
+        await bot._post(  # pylint: disable=protected-access
+            'sendMessage', DATA.copy(), read_timeout=read_timeout
+        )
+    return (time.perf_counter() - start) / NUMBER * 1e6
+
+
+async def main() -> None:
+    def current() -> BaseRequest:
+        request = HTTPXRequest()
+        return with_mock_transport(request, request._client.headers)  # type: ignore
+
+    def legacy() -> BaseRequest:
+        return with_mock_transport(LegacyHTTPXRequest(), None)
+
+    names = ['OfflineRequest', 'HTTPXRequest, previous do_request', 'HTTPXRequest']
+    bots = [ExtBot(TOKEN, request=factory()) for factory in (OfflineRequest, legacy, current)]
+    cases = [(bot, read_timeout) for bot in bots for read_timeout in (None, 10)]
+
+    # The rounds of the cases are interleaved, so that all are affected alike by noise
+    timings: List[List[float]] = [[] for _ in cases]
+    for _ in range(REPEAT):
+        for timing, (bot, read_timeout) in zip(timings, cases):
+            timing.append(await time_post(bot, read_timeout))
+    for bot in bots:
+        await bot.request.stop()
+
+    best = [f'{min(timing):.1f}' for timing in timings]
+    print(f'Bot._post for sendMessage, best of {REPEAT} x {NUMBER} calls\n')
+    print_table(
+        ('request', 'µs/call', 'µs/call with read_timeout'),
+        [(name, *best[2 * index : 2 * index + 2]) for index, name in enumerate(names)],
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
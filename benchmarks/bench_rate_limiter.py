@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+"""
+Broadcasts messages to many private chats and a few groups through a local fake Bot API server
+that enforces Telegram's flood limits and answers with 429 ``RetryAfter`` when they are exceeded.
+All time periods of the limits are scaled by ``TIME_SCALE`` to keep the run short.
+
+Two strategies are compared:
+
+* ad hoc: all messages are sent at once and each caller sleeps for ``retry_after`` and retries
+  when it gets a ``RetryAfter``, which is what bots had to do without a rate limiter
+* ``telegram.ext.RateLimiter``, configured with the same (scaled) limits
+
+Usage:
+    python -m benchmarks.bench_rate_limiter
+"""
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Tuple, Union
+
+from telegram.error import RetryAfter
+from telegram.ext import ExtBot, RateLimiter
+from telegram.request._httpxrequest import HTTPXRequest
+
+from benchmarks.utils import TOKEN, FakeBotAPIServer, print_table
+
+TIME_SCALE = 0.1
+N_PRIVATE_CHATS = 150
+MESSAGES_PER_PRIVATE_CHAT = 2
+N_GROUPS = 3
+MESSAGES_PER_GROUP = 25
+CONNECTION_POOL_SIZE = 64
+
+ChatId = Union[int, str]
+Send = Callable[[ExtBot, ChatId, str], Awaitable[object]]
+
+
+def make_messages() -> List[Tuple[ChatId, str]]:
+    messages: List[Tuple[ChatId, str]] = []
+    for i in range(MESSAGES_PER_PRIVATE_CHAT):
+        messages.extend((chat_id, f'Message {i}') for chat_id in range(1, N_PRIVATE_CHATS + 1))
+    for i in range(MESSAGES_PER_GROUP):
+        messages.extend((-chat_id, f'Message {i}') for chat_id in range(1, N_GROUPS + 1))
+    return messages
+
+
+async def send_ad_hoc(bot: ExtBot, chat_id: ChatId, text: str) -> object:
+    while True:
+        try:
+            return await bot.send_message(chat_id, text)
+        except RetryAfter as exc:
+            await asyncio.sleep(exc.retry_after)
+
+
+async def send(bot: ExtBot, chat_id: ChatId, text: str) -> object:
+    return await bot.send_message(chat_id, text)
+
+
+async def broadcast(rate_limiter: RateLimiter = None) -> Tuple[float, int, int, int]:
+    send_message: Send = send if rate_limiter else send_ad_hoc
+    async with FakeBotAPIServer(time_scale=TIME_SCALE) as server:
+        request = HTTPXRequest(connection_pool_size=CONNECTION_POOL_SIZE, pool_timeout=None)
+        bot = ExtBot(TOKEN, base_url=server.base_url, request=request, rate_limiter=rate_limiter)
+        async with bot:
+            peak_queue_depth = 0
+
+            async def sample_queue_depth() -> None:
+                nonlocal peak_queue_depth
+                while rate_limiter:
+                    peak_queue_depth = max(peak_queue_depth, rate_limiter.queue_depth())
+                    await asyncio.sleep(0.01)
+
+            sampler = asyncio.create_task(sample_queue_depth())
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(send_message(bot, chat_id, text) for chat_id, text in make_messages())
+            )
+            elapsed = time.perf_counter() - start
+            sampler.cancel()
+
+    requests = server.stats['200'] + server.stats['429']
+    return elapsed, requests, server.stats['429'], peak_queue_depth
+
+
+async def main() -> None:
+    rate_limiter = RateLimiter(
+        overall_time_period=TIME_SCALE,
+        group_time_period=60 * TIME_SCALE,
+        private_time_period=TIME_SCALE,
+        max_retries=5,
+    )
+    n_messages = len(make_messages())
+    print(
+        f'{n_messages} messages to {N_PRIVATE_CHATS} private chats and {N_GROUPS} groups, '
+        f'time scale {TIME_SCALE}\n'
+    )
+    rows = []
+    for name, limiter in (('ad hoc retries', None), ('RateLimiter', rate_limiter)):
+        elapsed, requests, flooded, peak_queue_depth = await broadcast(limiter)
+        rows.append(
+            (
+                name,
+                f'{elapsed:.2f}',
+                requests,
+                flooded,
+                peak_queue_depth if limiter else '-',
+            )
+        )
+    print_table(('strategy', 'seconds', 'requests', '429s', 'peak queue depth'), rows)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
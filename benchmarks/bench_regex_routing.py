@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+"""
+Measures the time the Dispatcher needs to route an update through a handler group of 80 handlers
+with regex patterns, where at most one of the patterns matches each update.
+
+The same updates are routed twice: once with the patterns being checked against the update
+together by the dispatchers ``PatternRouter`` and once with every handler checking its pattern on
+its own, which is what the dispatcher did before the router was introduced.
+
+Usage:
+    python -m benchmarks.bench_regex_routing
+"""
+import asyncio
+import random
+from typing import List
+
+from telegram import Update
+from telegram.ext import CallbackQueryHandler, Dispatcher, MessageHandler, filters
+
+from benchmarks.bench_handler_index import CHAT, USER, disable_index, noop, route
+from benchmarks.utils import make_bot, make_dispatcher, print_table
+
+N_UPDATES = 20_000
+N_PATTERNS = 40
+SEED = 1
+
+
+def build_handler_table(dispatcher: Dispatcher) -> None:
+    for i in range(N_PATTERNS):
+        dispatcher.add_handler(CallbackQueryHandler(noop, pattern=rf'^item{i}:(\d+)$'))
+        dispatcher.add_handler(
+            MessageHandler(filters.Regex(rf'order #{i}\b') & ~filters.COMMAND, noop)
+        )
+
+
+def make_updates(bot: object) -> List[Update]:
+    rng = random.Random(SEED)
+    message = {'message_id': 1, 'date': 0, 'chat': CHAT, 'from': USER}
+    filler = 'lorem ipsum dolor sit amet ' * 4
+    updates = []
+    for i in range(N_UPDATES):
+        number = rng.randrange(2 * N_PATTERNS)
+        if rng.random() < 0.5:
+            payload = {
+                'callback_query': {
+                    'id': str(i),
+                    'from': USER,
+                    'chat_instance': '1',
+                    'data': f'item{number}:{i}',
+                    'message': message,
+                }
+            }
+        else:
+            payload = {'message': {**message, 'text': f'{filler}order #{number} {filler}'}}
+        updates.append(Update.de_json({'update_id': i, **payload}, bot))  # type: ignore
+    return updates
+
+
+async def main() -> None:
+    bot = make_bot()
+    await bot.initialize()
+
+    routed = make_dispatcher(bot=bot)
+    build_handler_table(routed)
+    linear = make_dispatcher(bot=bot)
+    build_handler_table(linear)
+    disable_index(linear)
+
+    print(f'{2 * N_PATTERNS} regex handlers, {N_UPDATES} updates\n')
+
+    updates = make_updates(bot)
+    # Warm up, e.g. the regex cache
+    await route(routed, updates[:1000])
+    await route(linear, updates[:1000])
+
+    linear_us = await route(linear, updates)
+    routed_us = await route(routed, updates)
+    print_table(
+        ('dispatch', 'µs/update', 'speedup'),
+        [
+            ('one pattern at a time', f'{linear_us:.1f}', '1.00x'),
+            ('pattern router', f'{routed_us:.1f}', f'{linear_us / routed_us:.2f}x'),
+        ],
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+"""
+Measures ``BasePersistence.replace_bot`` and ``BasePersistence.insert_bot``, which the persistence
+calls on every update and load of the data, for a ``bot_data`` of about 50 MB when pickled. Like a
+typical cache, it consists mostly of ints and strings in dicts, lists and tuples, and contains a
+single ``Bot``.
+
+Usage:
+    python -m benchmarks.bench_replace_bot
+"""
+import pickle
+import time
+from typing import Callable, List, Sequence
+
+from telegram.ext import DictPersistence
+
+from benchmarks.utils import make_bot, print_table
+
+N_USERS = 450_000
+REPEAT = 3
+
+
+def make_bot_data(bot: object) -> dict:
+    return {
+        'names': {user_id: f'User {user_id}' for user_id in range(N_USERS)},
+        'profiles': {
+            user_id: {'language': 'en', 'score': user_id * 3, 'tags': ['a', 'b', str(user_id)]}
+            for user_id in range(N_USERS)
+        },
+        'history': [(user_id, user_id * 2, 'message') for user_id in range(N_USERS)],
+        'scores': list(range(N_USERS * 5)),
+        'seen': set(range(N_USERS)),
+        'bot': bot,
+    }
+
+
+def measure(function: Callable[[], object]) -> float:
+    """Returns the fastest of ``REPEAT`` runs in milliseconds."""
+    times: List[float] = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3
+
+
+def main() -> None:
+    bot = make_bot()
+    persistence = DictPersistence()
+    persistence.set_bot(bot)
+    bot_data = make_bot_data(bot)
+    replaced = persistence.replace_bot(bot_data)
+    size = len(pickle.dumps(replaced)) / 1024**2
+
+    rows: List[Sequence[object]] = [
+        ('replace_bot', f'{measure(lambda: persistence.replace_bot(bot_data)):.0f}'),
+        ('insert_bot', f'{measure(lambda: persistence.insert_bot(replaced)):.0f}'),
+    ]
+    print(f'bot_data of {size:.0f} MB when pickled, fastest of {REPEAT} runs\n')
+    print_table(('method', 'ms'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+"""
+Measures ``TelegramObject.to_dict`` for a ``Message``, an ``InlineKeyboardMarkup`` and an
+``InlineQueryResultArticle``.
+
+The current implementation, which determines the attributes to serialize once per class, is
+compared to the previous one, which is reproduced below: it collected the slots of all classes in
+the MRO on every call and converted lists of nested objects in ``to_dict`` overrides of the
+subclasses.
+
+Usage:
+    python -m benchmarks.bench_to_dict
+"""
+import datetime
+from typing import Callable, Dict
+
+from telegram import (
+    Chat,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    InlineQueryResult,
+    InlineQueryResultArticle,
+    InputTextMessageContent,
+    Message,
+    MessageEntity,
+    TelegramObject,
+    User,
+)
+from telegram._utils.datetime import to_timestamp
+from telegram._utils.types import JSONDict
+
+from benchmarks.utils import print_table, timeit
+
+NUMBER = 20_000
+
+
+def _legacy_message(message: Message, data: JSONDict) -> None:
+    data['date'] = to_timestamp(message.date)
+    if message.forward_date:
+        data['forward_date'] = to_timestamp(message.forward_date)
+    if message.edit_date:
+        data['edit_date'] = to_timestamp(message.edit_date)
+    if message.photo:
+        data['photo'] = [legacy_to_dict(p) for p in message.photo]
+    if message.entities:
+        data['entities'] = [legacy_to_dict(e) for e in message.entities]
+    if message.caption_entities:
+        data['caption_entities'] = [legacy_to_dict(e) for e in message.caption_entities]
+    if message.new_chat_photo:
+        data['new_chat_photo'] = [legacy_to_dict(p) for p in message.new_chat_photo]
+    if message.new_chat_members:
+        data['new_chat_members'] = [legacy_to_dict(u) for u in message.new_chat_members]
+
+
+def _legacy_inline_keyboard_markup(markup: InlineKeyboardMarkup, data: JSONDict) -> None:
+    data['inline_keyboard'] = []
+    for row in markup.inline_keyboard:
+        data['inline_keyboard'].append([legacy_to_dict(x) for x in row])
+
+
+def _legacy_inline_query_result(result: InlineQueryResult, data: JSONDict) -> None:
+    if getattr(result, 'caption_entities', None):
+        data['caption_entities'] = [
+            legacy_to_dict(ce) for ce in result.caption_entities  # type: ignore[attr-defined]
+        ]
+
+
+def _legacy_input_text_message_content(content: InputTextMessageContent, data: JSONDict) -> None:
+    if content.entities:
+        data['entities'] = [legacy_to_dict(ce) for ce in content.entities]
+
+
+LEGACY_OVERRIDES: Dict[type, Callable] = {
+    Message: _legacy_message,
+    InlineKeyboardMarkup: _legacy_inline_keyboard_markup,
+    InlineQueryResultArticle: _legacy_inline_query_result,
+    InputTextMessageContent: _legacy_input_text_message_content,
+}
+
+
+def legacy_to_dict(obj: TelegramObject) -> JSONDict:
+    """The previous implementation of ``to_dict``."""
+    data = {}
+    attrs = {attr for cls in obj.__class__.__mro__[:-2] for attr in cls.__slots__}
+    for key in attrs:
+        if key == 'bot' or key.startswith('_'):
+            continue
+
+        value = getattr(obj, key, None)
+        if value is not None:
+            if hasattr(value, 'to_dict'):
+                data[key] = legacy_to_dict(value)
+            else:
+                data[key] = value
+
+    if data.get('from_user'):
+        data['from'] = data.pop('from_user', None)
+
+    override = LEGACY_OVERRIDES.get(type(obj))
+    if override:
+        override(obj, data)
+    return data
+
+
+def make_keyboard() -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton(f'Button {row}.{col}', callback_data=f'{row}:{col}')
+                for col in range(3)
+            ]
+            for row in range(3)
+        ]
+    )
+
+
+def make_message() -> Message:
+    user = User(42, 'Jane', False, last_name='Doe', username='jane', language_code='en')
+    chat = Chat(-100123, Chat.SUPERGROUP, title='Group', username='group')
+    date = datetime.datetime(2021, 11, 1, 12, tzinfo=datetime.timezone.utc)
+    reply_to = Message(1, date, chat, from_user=user, text='Hello there')
+    return Message(
+        2,
+        date,
+        chat,
+        from_user=user,
+        reply_to_message=reply_to,
+        text='/start hello @someone https://python-telegram-bot.org',
+        entities=[
+            MessageEntity(MessageEntity.BOT_COMMAND, 0, 6),
+            MessageEntity(MessageEntity.MENTION, 13, 8),
+            MessageEntity(MessageEntity.URL, 22, 31),
+        ],
+        reply_markup=make_keyboard(),
+    )
+
+
+def make_article() -> InlineQueryResultArticle:
+    return InlineQueryResultArticle(
+        'result-1',
+        'An article',
+        InputTextMessageContent(
+            'Some *text*',
+            entities=[MessageEntity(MessageEntity.BOLD, 5, 4)],
+            disable_web_page_preview=True,
+        ),
+        reply_markup=make_keyboard(),
+        url='https://python-telegram-bot.org',
+        description='A description',
+        thumb_url='https://python-telegram-bot.org/logo.png',
+    )
+
+
+def main() -> None:
+    rows = []
+    for name, obj in (  # pylint: disable=cell-var-from-loop
+        ('Message', make_message()),
+        ('InlineKeyboardMarkup', make_keyboard()),
+        ('InlineQueryResultArticle', make_article()),
+    ):
+        assert obj.to_dict() == legacy_to_dict(obj), name
+        legacy_us = timeit(lambda: legacy_to_dict(obj), NUMBER)
+        current_us = timeit(obj.to_dict, NUMBER)
+        rows.append(
+            (name, f'{legacy_us:.2f}', f'{current_us:.2f}', f'{legacy_us / current_us:.2f}x')
+        )
+    print_table(('object', 'previous µs', 'current µs', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+"""
+Measures the time that ``Dispatcher.update_persistence`` spends for ``N_UPDATES`` updates of
+``USERS`` users, each with a ``user_data`` of ``ITEMS`` entries, of which only every tenth update
+changes the ``user_data``:
+
+* with ``dict`` as type of ``user_data`` and ``chat_data``, for which every update copies the data
+  (``BasePersistence.replace_bot``) and compares it with the stored data
+* with ``TrackingDict``, for which the dispatcher skips the unchanged data
+
+The persistence is a ``PicklePersistence`` with ``append_only=True``, such that only the changed
+data is written to the file in both cases.
+
+Usage:
+    python -m benchmarks.bench_tracking_dict
+"""
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Type
+
+from telegram import Update
+from telegram.ext import (
+    CallbackContext,
+    ContextTypes,
+    MessageHandler,
+    PicklePersistence,
+    TrackingDict,
+    filters,
+)
+from telegram.request import MockRequest
+
+from benchmarks.utils import make_bot, make_dispatcher, print_table
+
+USERS = 1_000
+ITEMS = 200
+N_UPDATES = 5_000
+
+
+def make_update(update_id: int) -> dict:
+    user = {'id': update_id % USERS, 'is_bot': False, 'first_name': 'User'}
+    return {
+        'update_id': update_id,
+        'message': {
+            'message_id': update_id,
+            'date': 0,
+            'chat': {'id': user['id'], 'type': 'private'},
+            'from': user,
+            'text': 'Hello',
+        },
+    }
+
+
+async def run(path: Path, data_type: Type[dict]) -> float:
+    """Returns the time in seconds for processing the updates and writing the data."""
+    context_types = ContextTypes(user_data=data_type, chat_data=data_type)
+    bot = make_bot(MockRequest(record=False))
+    dispatcher = make_dispatcher(
+        bot,
+        persistence=PicklePersistence(path, append_only=True, context_types=context_types),
+        context_types=context_types,
+    )
+    for user_id in range(USERS):
+        dispatcher.user_data[user_id].update((f'item {i}', [i, str(i)]) for i in range(ITEMS))
+
+    async def callback(update: Update, context: CallbackContext) -> None:
+        if update.update_id % 10 == 0:
+            context.user_data['counter'] = update.update_id  # type: ignore[index]
+
+    dispatcher.add_handler(MessageHandler(filters.TEXT, callback))
+    await dispatcher.start()
+    # Write the initial data, such that only the updates are measured
+    await dispatcher.update_persistence()
+    await dispatcher.stop()
+
+    await dispatcher.start()
+    updates = [Update.de_json(make_update(i), bot) for i in range(N_UPDATES)]
+    start = time.perf_counter()
+    for update in updates:
+        await dispatcher.update_queue.put(update)
+    await dispatcher.stop()
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for data_type in (dict, TrackingDict):
+            seconds = await run(Path(directory) / data_type.__name__, data_type)
+            rows.append((data_type.__name__, f'{seconds:.2f}', f'{seconds / N_UPDATES * 1e6:.0f}'))
+
+    print(
+        f'{N_UPDATES:,} updates of {USERS:,} users with {ITEMS} items of user_data each, '
+        'every tenth update changes the user_data\n'
+    )
+    print_table(('user_data type', 'seconds', 'µs/update'), rows)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
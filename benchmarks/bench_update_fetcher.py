@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+"""
+Measures how the Dispatcher fetches updates from its update queue:
+
+* CPU usage of an idle dispatcher, i.e. one whose update queue stays empty
+* p50/p99 latency between putting an update into the queue and the handler callback being called,
+  for a steady stream of 1k and 10k updates per second and different values of
+  ``Dispatcher.update_batch_size``
+
+Usage:
+    python -m benchmarks.bench_update_fetcher
+"""
+import asyncio
+import time
+from typing import List
+
+from telegram.ext import TypeHandler
+
+from benchmarks.utils import make_dispatcher, print_table, summarize
+
+IDLE_SECONDS = 2.0
+LOAD_SECONDS = 2.0
+TICK = 0.001
+
+
+class Stamped:
+    __slots__ = ('sent',)
+
+    def __init__(self) -> None:
+        self.sent = time.perf_counter()
+
+
+async def idle_cpu() -> float:
+    dispatcher = make_dispatcher()
+    await dispatcher.start()
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    await asyncio.sleep(IDLE_SECONDS)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    await dispatcher.stop()
+    return cpu / wall * 100
+
+
+async def latency(rate: int, batch_size: int) -> List[float]:
+    latencies: List[float] = []
+
+    def callback(update: Stamped, _: object) -> None:
+        latencies.append(time.perf_counter() - update.sent)
+
+    dispatcher = make_dispatcher()
+    dispatcher.update_batch_size = batch_size
+    dispatcher.add_handler(TypeHandler(Stamped, callback))
+    await dispatcher.start()
+
+    # Put the updates into the queue in small bursts once per tick to reach the desired rate
+    start = time.perf_counter()
+    sent = 0
+    while time.perf_counter() - start < LOAD_SECONDS:
+        now = time.perf_counter()
+        due = int((now - start) * rate)
+        for _ in range(due - sent):
+            dispatcher.update_queue.put_nowait(Stamped())
+        sent = due
+        await asyncio.sleep(TICK)
+
+    await dispatcher.stop()
+    return latencies
+
+
+async def main() -> None:
+    print(f'Idle dispatcher CPU usage over {IDLE_SECONDS}s: {await idle_cpu():.1f}%\n')
+
+    rows = []
+    for rate in (1_000, 10_000):
+        for batch_size in (1, 32):
+            latencies = await latency(rate, batch_size)
+            p50, p99, mean = summarize(latencies)
+            rows.append(
+                (rate, batch_size, len(latencies), f'{p50:.3f}', f'{p99:.3f}', f'{mean:.3f}')
+            )
+    print_table(('updates/s', 'batch', 'handled', 'p50 ms', 'p99 ms', 'mean ms'), rows)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# This program is dedicated to the public domain under the CC0 license.
+"""Shared helpers for the benchmarks. Nothing in here talks to the real Bot API."""
+import asyncio
+import json
+import ssl
+import statistics
+import time
+import warnings
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from telegram.ext import ExtBot
+from telegram.request import BaseRequest, RequestData
+
+BOT_USER = {
+    'id': 1234567890,
+    'is_bot': True,
+    'first_name': 'Benchmark Bot',
+    'username': 'benchmark_bot',
+    'can_join_groups': True,
+    'can_read_all_group_messages': False,
+    'supports_inline_queries': False,
+}
+TOKEN = '1234567890:AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA'
+
+
+class OfflineRequest(BaseRequest):
+    """Answers every request with a canned response. ``responses`` maps endpoint names to the
+    ``result`` that should be returned. Unknown endpoints return :obj:`True`."""
+
+    __slots__ = ('responses',)
+
+    def __init__(self, responses: Dict[str, object] = None):
+        self.responses = {'getMe': BOT_USER}
+        self.responses.update(responses or {})
+
+    @property
+    def connection_pool_size(self) -> int:
+        return 256
+
+    async def initialize(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def do_request(
+        self,
+        method: str,
+        url: str,
+        request_data: RequestData = None,
+        connect_timeout: float = None,
+        read_timeout: float = None,
+        write_timeout: float = None,
+        pool_timeout: float = None,
+    ) -> Tuple[int, bytes]:
+        endpoint = url.rsplit('/', 1)[-1]
+        result = self.responses.get(endpoint, True)
+        return 200, json.dumps({'ok': True, 'result': result}).encode('utf-8')
+
+
+def make_bot(request: BaseRequest = None) -> ExtBot:
+    return ExtBot(TOKEN, request=request or OfflineRequest())
+
+
+def make_dispatcher(bot: ExtBot = None, **kwargs: object):  # type: ignore[no-untyped-def]
+    # pylint: disable=import-outside-toplevel
+    from telegram.ext import ContextTypes, Dispatcher
+
+    kwargs.setdefault('workers', 4)
+    with warnings.catch_warnings():
+        # We deliberately build the dispatcher directly to keep the setup minimal
+        warnings.simplefilter('ignore')
+        return Dispatcher(
+            bot=bot or make_bot(),
+            update_queue=asyncio.Queue(),
+            job_queue=None,
+            persistence=kwargs.pop('persistence', None),
+            context_types=kwargs.pop('context_types', None) or ContextTypes(),
+            **kwargs,
+        )
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def timeit(func, number: int, repeat: int = 5) -> float:  # type: ignore[no-untyped-def]
+    """Returns the best per-call time in microseconds."""
+    best: Optional[float] = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = (time.perf_counter() - start) / number * 1e6
+        best = elapsed if best is None else min(best, elapsed)
+    return best  # type: ignore[return-value]
+
+
+def print_table(header: Sequence[str], rows: List[Sequence[object]]) -> None:
+    widths = [
+        max(len(str(cell)) for cell in column) for column in zip(header, *rows)  # type: ignore
+    ]
+    for row in [header, *rows]:
+        print('  '.join(str(cell).rjust(width) for cell, width in zip(row, widths)))
+
+
+def summarize(latencies: Sequence[float]) -> Tuple[float, float, float]:
+    """p50, p99 and mean of the given latencies, converted from seconds to milliseconds."""
+    return (
+        percentile(latencies, 50) * 1e3,
+        percentile(latencies, 99) * 1e3,
+        statistics.mean(latencies) * 1e3 if latencies else float('nan'),
+    )
+
+
+class FloodControl:
+    """Models Telegram's flood limits on the server side as leaky buckets per key: at most
+    ``max_count`` requests at once, draining at ``max_count`` requests per ``period`` seconds.
+    Telegram doesn't document the exact algorithm, only the rates."""
+
+    def __init__(self) -> None:
+        self.levels: Dict[object, Tuple[float, float]] = {}
+
+    def allow(self, key: object, max_count: float, period: float, now: float) -> bool:
+        level, updated = self.levels.get(key, (0.0, now))
+        level = max(0.0, level - (now - updated) * max_count / period)
+        if level + 1 > max_count:
+            self.levels[key] = (level, now)
+            return False
+        self.levels[key] = (level + 1, now)
+        return True
+
+
+class FakeBotAPIServer:
+    """A local HTTP server that speaks enough of the Bot API for ``sendMessage`` and ``getMe``.
+
+    If ``time_scale`` is set, it enforces Telegram's documented flood limits (30 messages per
+    second overall, 1 per second per private chat and 20 per minute per group), with all time
+    periods multiplied by ``time_scale``. Requests exceeding the limits are answered with 429 and
+    ``retry_after``, which is scaled the same way. ``latency`` delays every response.
+
+    Use as ``async with FakeBotAPIServer() as server`` and point the bot to ``server.base_url``.
+    If ``ssl_context`` is passed, the server speaks HTTPS.
+    """
+
+    def __init__(
+        self,
+        time_scale: float = None,
+        latency: float = 0,
+        retry_after: float = 3,
+        ssl_context: ssl.SSLContext = None,
+    ) -> None:
+        self.time_scale = time_scale
+        self.latency = latency
+        self.retry_after = retry_after
+        self.ssl_context = ssl_context
+        self.flood_control = FloodControl()
+        self.stats: Counter = Counter()
+        self.port = 0
+        self._server = None
+
+    @property
+    def base_url(self) -> str:
+        scheme = 'https' if self.ssl_context else 'http'
+        return f'{scheme}://127.0.0.1:{self.port}/bot'
+
+    def _flood_limit(self, chat_id: Union[int, str], now: float) -> Optional[str]:
+        """Returns the name of the limit that the request exceeds, if any."""
+        if self.time_scale is None:
+            return None
+        scale = self.time_scale
+        if isinstance(chat_id, str) or chat_id < 0:
+            if not self.flood_control.allow(chat_id, 20, 60 * scale, now):
+                return 'group'
+        elif not self.flood_control.allow(chat_id, 1, 1 * scale, now):
+            return 'private'
+        if not self.flood_control.allow(None, 30, 1 * scale, now):
+            return 'overall'
+        return None
+
+    async def handle(self, method: str, params: Dict[str, str]) -> Tuple[int, dict]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if method == 'getMe':
+            return 200, {'ok': True, 'result': BOT_USER}
+
+        chat_id: Union[int, str] = params.get('chat_id', 0)
+        try:
+            chat_id = int(chat_id)
+        except ValueError:
+            pass
+        exceeded_limit = self._flood_limit(chat_id, asyncio.get_running_loop().time())
+        if exceeded_limit:
+            self.stats['429'] += 1
+            self.stats[f'429 {exceeded_limit}'] += 1
+            retry_after = self.retry_after * (self.time_scale or 1)
+            return 429, {
+                'ok': False,
+                'error_code': 429,
+                'description': f'Too Many Requests: retry after {retry_after}',
+                'parameters': {'retry_after': retry_after},
+            }
+
+        self.stats['200'] += 1
+        return 200, {
+            'ok': True,
+            'result': {
+                'message_id': self.stats['200'],
+                'date': int(time.time()),
+                'chat': {'id': chat_id, 'type': 'private' if str(chat_id).isdigit() else 'group'},
+                'from': BOT_USER,
+                'text': params.get('text', ''),
+            },
+        }
+
+    async def __aenter__(self) -> 'FakeBotAPIServer':
+        # pylint: disable=import-outside-toplevel
+        import logging
+
+        import tornado.web
+        from tornado.httpserver import HTTPServer
+        from tornado.netutil import bind_sockets
+
+        server = self
+
+        class Handler(tornado.web.RequestHandler):  # pylint: disable=abstract-method
+            async def post(self, method: str) -> None:
+                params = {key: self.get_body_argument(key) for key in self.request.body_arguments}
+                status, body = await server.handle(method, params)
+                self.set_status(status)
+                self.set_header('Content-Type', 'application/json')
+                self.finish(json.dumps(body))
+
+        # Don't log every request
+        logging.getLogger('tornado.access').setLevel(logging.WARNING + 1)
+        sockets = bind_sockets(0, '127.0.0.1')
+        self.port = sockets[0].getsockname()[1]
+        self._server = HTTPServer(
+            tornado.web.Application([(r'/bot[^/]+/(\w+)', Handler)]), ssl_options=self.ssl_context
+        )
+        self._server.add_sockets(sockets)  # type: ignore[attr-defined]
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        self._server.stop()  # type: ignore[attr-defined]
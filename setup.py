@@ -73,6 +73,7 @@ def get_setup_kwargs(raw=False):
         extras_require={
             'json': 'ujson',
             'socks': 'PySocks',
+            'http2': 'httpx[http2]',
             # 3.4-3.4.3 contained some cyclical import bugs
             'passport': 'cryptography!=3.4,!=3.4.1,!=3.4.2,!=3.4.3',
         },
@@ -20,6 +20,7 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an object that represents a Telegram Bot."""
 
+import asyncio
 import functools
 import logging
 from contextlib import AbstractAsyncContextManager
@@ -40,13 +41,12 @@ from typing import (
     Sequence,
     Any,
     Type,
+    AsyncIterator,
+    Awaitable,
+    Iterable,
+    Set,
 )
 
-try:
-    import ujson as json
-except ImportError:
-    import json  # type: ignore[no-redef]  # noqa: F723
-
 try:
     from cryptography.hazmat.backends import default_backend
     from cryptography.hazmat.primitives import serialization
@@ -96,11 +96,12 @@ from telegram import (
 )
 from telegram.error import InvalidToken, TelegramError
 from telegram.constants import InlineQueryLimit
-from telegram.request import BaseRequest, RequestData
+from telegram.request import BaseRequest, JSONCodec, PreparedRequest, RequestData
 from telegram.request._requestparameter import RequestParameter
 from telegram.request._httpxrequest import HTTPXRequest
 from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue
 from telegram._utils.files import is_local_file, parse_file_input
+from telegram._utils.jsoncodec import DEFAULT_JSON_CODEC
 from telegram._utils.types import FileInput, JSONDict, ODVInput, DVInput
 
 if TYPE_CHECKING:
@@ -167,6 +168,11 @@ class Bot(TelegramObject, AbstractAsyncContextManager):
             `httpx <https://www.python-httpx.org>`_ will be used.
         private_key (:obj:`bytes`, optional): Private key for decryption of telegram passport data.
         private_key_password (:obj:`bytes`, optional): Password for above private key.
+        json_codec (:class:`telegram.request.JSONCodec`, optional): The codec used to encode the
+            parameters of requests and to decode the responses. Defaults to using ``ujson``, if
+            installed, and :mod:`json` otherwise.
+
+            .. versionadded:: 14.0
 
     """
 
@@ -177,6 +183,7 @@ class Bot(TelegramObject, AbstractAsyncContextManager):
         'private_key',
         '_bot_user',
         '_request',
+        '_json_codec',
         'logger',
     )
 
@@ -188,6 +195,7 @@ class Bot(TelegramObject, AbstractAsyncContextManager):
         request: BaseRequest = None,
         private_key: bytes = None,
         private_key_password: bytes = None,
+        json_codec: JSONCodec = None,
     ):
         self.token = self._validate_token(token)
 
@@ -198,6 +206,7 @@ class Bot(TelegramObject, AbstractAsyncContextManager):
         self.logger = logging.getLogger(__name__)
 
         self._request = HTTPXRequest() if request is None else request
+        self._json_codec = json_codec or DEFAULT_JSON_CODEC
 
         if private_key:
             if not CRYPTO_INSTALLED:
@@ -278,11 +287,39 @@ class Bot(TelegramObject, AbstractAsyncContextManager):
         # Drop any None values because Telegram doesn't handle them well
         data = {key: value for key, value in data.items() if value is not None}
 
+        return await self._do_post(
+            endpoint,
+            data,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+        )
+
+    async def _do_post(
+        self,
+        endpoint: str,
+        data: JSONDict,
+        read_timeout: float = None,
+        write_timeout: float = None,
+        connect_timeout: float = None,
+        pool_timeout: float = None,
+    ) -> Union[bool, JSONDict, None]:
+        # This is a separate method so that subclasses can hook into the actual request, e.g.
+        # ExtBot to apply rate limits
+
         # This also converts datetimes into timestamps.
-        # We don't do this earlier so that _insert_defaults (see above) has a chance to convert
+        # We don't do this earlier so that _insert_defaults (see _post) has a chance to convert
         # to the default timezone in case this is called by ExtBot
+        # Parameters of a PreparedRequest are already converted
         request_data = RequestData(
-            [RequestParameter.from_input(key, value) for key, value in data.items()]
+            [
+                value
+                if isinstance(value, RequestParameter)
+                else RequestParameter.from_input(key, value)
+                for key, value in data.items()
+            ],
+            json_codec=self._json_codec,
         )
 
         return await self.request.post(
@@ -376,6 +413,15 @@ class Bot(TelegramObject, AbstractAsyncContextManager):
         """
         return self._request
 
+    @property
+    def json_codec(self) -> JSONCodec:
+        """The :class:`~telegram.request.JSONCodec` used by this bot to encode the parameters of
+        requests and to decode the responses.
+
+        .. versionadded:: 14.0
+        """
+        return self._json_codec
+
     @staticmethod
     def _validate_token(token: str) -> str:
         """A very basic validation on token."""
@@ -3077,6 +3123,56 @@ class Bot(TelegramObject, AbstractAsyncContextManager):
         Raises:
             :class:`telegram.error.TelegramError`
 
+        """
+        result = await self.get_updates_json(
+            offset=offset,
+            limit=limit,
+            timeout=timeout,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+            allowed_updates=allowed_updates,
+            api_kwargs=api_kwargs,
+        )
+        return Update.de_list(result, self, copy=False)  # type: ignore[return-value]
+
+    async def get_updates_json(
+        self,
+        offset: int = None,
+        limit: int = 100,
+        timeout: int = 0,
+        read_timeout: float = 2,
+        write_timeout: float = None,
+        connect_timeout: float = None,
+        pool_timeout: float = None,
+        allowed_updates: List[str] = None,
+        api_kwargs: JSONDict = None,
+    ) -> List[JSONDict]:
+        """Like :meth:`get_updates`, but returns the updates as received from Telegram, i.e.
+        without converting them to :class:`telegram.Update` objects. This allows e.g.
+        :class:`telegram.ext.Updater` to request the next updates before the current ones are
+        deserialized.
+
+        .. versionadded:: 14.0
+
+        Args:
+            offset (:obj:`int`, optional): See :meth:`get_updates`.
+            limit (:obj:`int`, optional): See :meth:`get_updates`.
+            timeout (:obj:`int`, optional): See :meth:`get_updates`.
+            read_timeout (:obj:`float` | :obj:`int`, optional): See :meth:`get_updates`.
+            write_timeout (:obj:`float`, optional): See :meth:`get_updates`.
+            connect_timeout (:obj:`float`, optional): See :meth:`get_updates`.
+            pool_timeout (:obj:`float`, optional): See :meth:`get_updates`.
+            allowed_updates (List[:obj:`str`]), optional): See :meth:`get_updates`.
+            api_kwargs (:obj:`dict`, optional): See :meth:`get_updates`.
+
+        Returns:
+            List[:obj:`dict`]: The JSON data of the updates.
+
+        Raises:
+            :class:`telegram.error.TelegramError`
+
         """
         data: JSONDict = {'timeout': timeout}
 
@@ -3110,7 +3206,7 @@ class Bot(TelegramObject, AbstractAsyncContextManager):
         else:
             self.logger.debug('No new updates found.')
 
-        return Update.de_list(result, self)  # type: ignore[return-value]
+        return result
 
     @_log
     async def set_webhook(
@@ -3873,7 +3969,7 @@ class Bot(TelegramObject, AbstractAsyncContextManager):
             if isinstance(provider_data, str):
                 data['provider_data'] = provider_data
             else:
-                data['provider_data'] = json.dumps(provider_data)
+                data['provider_data'] = self._json_codec.dumps(provider_data)
         if photo_url is not None:
             data['photo_url'] = photo_url
         if photo_size is not None:
@@ -6109,6 +6205,269 @@ class Bot(TelegramObject, AbstractAsyncContextManager):
         )
         return MessageId.de_json(result, self)  # type: ignore[return-value, arg-type]
 
+    async def map_requests(
+        self,
+        requests: Iterable[Tuple[Union[str, Callable[..., Awaitable]], Dict[str, Any]]],
+        max_concurrency: int = None,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """Makes many requests to the Bot API concurrently, e.g. to send a message to many chats.
+        At most :paramref:`max_concurrency` requests are in flight at a time and
+        :paramref:`requests` is only consumed as far as needed, so it may be a generator over a
+        large number of items.
+
+        Example:
+            .. code:: python
+
+                async for index, result in bot.map_requests(
+                    ('send_message', {'chat_id': chat_id, 'text': 'Hi!'}) for chat_id in chat_ids
+                ):
+                    if isinstance(result, Exception):
+                        print(f'Sending to {chat_ids[index]} failed: {result}')
+
+        Note:
+            If the iteration is stopped early, the requests that are still in flight are cancelled
+            once the iterator is closed, e.g. via :meth:`aclose` or by garbage collection.
+
+        .. versionadded:: 14.0
+
+        Args:
+            requests (Iterable[Tuple[:obj:`str` | :term:`coroutine function`, Dict[:obj:`str`, \
+                :obj:`object`]]]): The requests to make. Each item consists of the name of a
+                method of this bot, e.g. ``'send_message'``, or a coroutine function and the
+                keyword arguments to call it with.
+            max_concurrency (:obj:`int`, optional): The maximum number of requests in flight.
+                Defaults to one less than :attr:`telegram.request.BaseRequest.connection_pool_size`
+                of :attr:`request`, but at least ``1``. This way, no request waits for a free
+                connection, while one connection is left for other requests made in the meantime,
+                e.g. by handlers.
+
+        Yields:
+            Tuple[:obj:`int`, :obj:`object`]: The index of the request in :paramref:`requests`
+            and its result, in the order in which the requests complete. If a request raised an
+            exception, the exception is the result instead of aborting the remaining requests.
+        """
+        if max_concurrency is None:
+            max_concurrency = max(self.request.connection_pool_size - 1, 1)
+        if max_concurrency < 1:
+            raise ValueError('`max_concurrency` must be at least 1.')
+
+        async def make_request(
+            index: int, method: Union[str, Callable[..., Awaitable]], kwargs: Dict[str, Any]
+        ) -> Tuple[int, Any]:
+            try:
+                callback = getattr(self, method) if isinstance(method, str) else method
+                return index, await callback(**kwargs)
+            except asyncio.CancelledError:  # pylint: disable=try-except-raise
+                # Is a subclass of Exception on py3.7
+                raise
+            except Exception as exc:
+                return index, exc
+
+        items = enumerate(requests)
+        pending: Set[asyncio.Future] = set()
+
+        def fill() -> None:
+            while len(pending) < max_concurrency:  # type: ignore[operator]
+                try:
+                    index, (method, kwargs) = next(items)
+                except StopIteration:
+                    return
+                pending.add(asyncio.ensure_future(make_request(index, method, kwargs)))
+
+        try:
+            fill()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Start the next requests before handing out the results, so that the requests
+                # keep going while the caller processes them
+                fill()
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def send_many(
+        self,
+        chat_ids: Iterable[Union[int, str]],
+        text: str,
+        max_concurrency: int = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """Sends the same text message to many chats concurrently. The message is prepared only
+        once via :meth:`prepare_message`, such that only the ``chat_id`` is exchanged for each
+        request. This is roughly equivalent to::
+
+            bot.map_requests(
+                (
+                    ('send_message', {'chat_id': chat_id, 'text': text, **kwargs})
+                    for chat_id in chat_ids
+                ),
+                max_concurrency=max_concurrency,
+            )
+
+        For the documentation of the arguments, please see :meth:`map_requests` and
+        :meth:`send_message`.
+
+        .. versionadded:: 14.0
+
+        Returns:
+            AsyncIterator[Tuple[:obj:`int`, :class:`telegram.Message` | :obj:`Exception`]]: Yields
+            the index of the chat in :paramref:`chat_ids` and the sent message or the exception
+            raised while sending it.
+        """
+        send_kwargs = {
+            key: kwargs.pop(key)
+            for key in (
+                'reply_to_message_id',
+                'read_timeout',
+                'write_timeout',
+                'connect_timeout',
+                'pool_timeout',
+            )
+            if key in kwargs
+        }
+        prepared = self.prepare_message(text, **kwargs)
+        return self.map_requests(
+            (
+                (self.send_prepared, {'chat_id': chat_id, 'prepared': prepared, **send_kwargs})
+                for chat_id in chat_ids
+            ),
+            max_concurrency=max_concurrency,
+        )
+
+    def _prepare_request(
+        self, endpoint: str, data: JSONDict, api_kwargs: JSONDict = None
+    ) -> PreparedRequest:
+        # The same as _post, except for the actual request
+        if api_kwargs:
+            data.update(api_kwargs)
+        self._insert_defaults(data)
+        return PreparedRequest(
+            endpoint,
+            {key: value for key, value in data.items() if value is not None},
+            json_codec=self._json_codec,
+        )
+
+    def prepare_message(
+        self,
+        text: str,
+        parse_mode: ODVInput[str] = DEFAULT_NONE,
+        disable_web_page_preview: ODVInput[bool] = DEFAULT_NONE,
+        disable_notification: DVInput[bool] = DEFAULT_NONE,
+        reply_markup: ReplyMarkup = None,
+        allow_sending_without_reply: ODVInput[bool] = DEFAULT_NONE,
+        entities: Union[List['MessageEntity'], Tuple['MessageEntity', ...]] = None,
+        api_kwargs: JSONDict = None,
+    ) -> PreparedRequest:
+        """Prepares a text message for sending it to many chats via :meth:`send_prepared`. All
+        parameters are converted and JSON encoded once, instead of on every call of
+        :meth:`send_message`. This is useful e.g. for broadcasting a message with an inline
+        keyboard to many users.
+
+        Example:
+            .. code:: python
+
+                prepared = bot.prepare_message('Hello!', reply_markup=keyboard)
+                for chat_id in chat_ids:
+                    await bot.send_prepared(chat_id, prepared)
+
+        .. versionadded:: 14.0
+
+        Note:
+            Defaults are inserted when preparing the message and not when sending it.
+
+        Args:
+            text (:obj:`str`): Text of the message to be sent. Max
+                :tg-const:`telegram.constants.MessageLimit.TEXT_LENGTH` characters after entities
+                parsing.
+            parse_mode (:obj:`str`): Send Markdown or HTML, if you want Telegram apps to show bold,
+                italic, fixed-width text or inline URLs in your bot's message. See the constants in
+                :class:`telegram.constants.ParseMode` for the available modes.
+            entities (List[:class:`telegram.MessageEntity`], optional): List of special entities
+                that appear in message text, which can be specified instead of :attr:`parse_mode`.
+            disable_web_page_preview (:obj:`bool`, optional): Disables link previews for links in
+                this message.
+            disable_notification (:obj:`bool`, optional): Sends the message silently. Users will
+                receive a notification with no sound.
+            allow_sending_without_reply (:obj:`bool`, optional): Pass :obj:`True`, if the message
+                should be sent even if the specified replied-to message is not found.
+            reply_markup (:class:`telegram.ReplyMarkup`, optional): Additional interface options.
+                A JSON-serialized object for an inline keyboard, custom reply keyboard,
+                instructions to remove reply keyboard or to force a reply from the user.
+            api_kwargs (:obj:`dict`, optional): Arbitrary keyword arguments to be passed to the
+                Telegram API.
+
+        Returns:
+            :class:`telegram.request.PreparedRequest`: The prepared message.
+
+        """
+        data: JSONDict = {
+            'text': text,
+            'parse_mode': parse_mode,
+            'disable_web_page_preview': disable_web_page_preview,
+            'disable_notification': disable_notification,
+            'allow_sending_without_reply': allow_sending_without_reply,
+        }
+
+        if entities:
+            data['entities'] = entities
+        if reply_markup is not None:
+            data['reply_markup'] = reply_markup
+
+        return self._prepare_request('sendMessage', data, api_kwargs=api_kwargs)
+
+    @_log
+    async def send_prepared(
+        self,
+        chat_id: Union[int, str],
+        prepared: PreparedRequest,
+        reply_to_message_id: int = None,
+        read_timeout: float = None,
+        write_timeout: float = None,
+        connect_timeout: float = None,
+        pool_timeout: float = None,
+    ) -> Message:
+        """Use this method to send a message that was prepared with e.g. :meth:`prepare_message`.
+
+        .. versionadded:: 14.0
+
+        Args:
+            chat_id (:obj:`int` | :obj:`str`): Unique identifier for the target chat or username
+                of the target channel (in the format ``@channelusername``).
+            prepared (:class:`telegram.request.PreparedRequest`): The prepared message.
+            reply_to_message_id (:obj:`int`, optional): If the message is a reply, ID of the
+                original message.
+            read_timeout (:obj:`float`, optional): Value to pass to
+                :paramref:`telegram.request.BaseRequest.post.read_timeout`.
+            write_timeout (:obj:`float`, optional): Value to pass to
+                :paramref:`telegram.request.BaseRequest.post.write_timeout`.
+            connect_timeout (:obj:`float`, optional): Value to pass to
+                :paramref:`telegram.request.BaseRequest.post.connect_timeout`.
+            pool_timeout (:obj:`float`, optional): Value to pass to
+                :paramref:`telegram.request.BaseRequest.post.pool_timeout`.
+
+        Returns:
+            :class:`telegram.Message`: On success, the sent message is returned.
+
+        Raises:
+            :class:`telegram.error.TelegramError`
+
+        """
+        data: JSONDict = {'chat_id': chat_id, **prepared.parameters}
+        if reply_to_message_id is not None:
+            data['reply_to_message_id'] = reply_to_message_id
+
+        result = await self._do_post(
+            prepared.endpoint,
+            data,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+        )
+        return Message.de_json(result, self)  # type: ignore[return-value, arg-type]
+
     def to_dict(self) -> JSONDict:
         """See :meth:`telegram.TelegramObject.to_dict`."""
         data: JSONDict = {'id': self.id, 'username': self.username, 'first_name': self.first_name}
@@ -6187,6 +6546,8 @@ class Bot(TelegramObject, AbstractAsyncContextManager):
     """Alias for :meth:`edit_message_reply_markup`"""
     getUpdates = get_updates
     """Alias for :meth:`get_updates`"""
+    getUpdatesJson = get_updates_json
+    """Alias for :meth:`get_updates_json`"""
     setWebhook = set_webhook
     """Alias for :meth:`set_webhook`"""
     deleteWebhook = delete_webhook
@@ -6283,3 +6644,11 @@ class Bot(TelegramObject, AbstractAsyncContextManager):
     """Alias for :meth:`log_out`"""
     copyMessage = copy_message
     """Alias for :meth:`copy_message`"""
+    mapRequests = map_requests
+    """Alias for :meth:`map_requests`"""
+    sendMany = send_many
+    """Alias for :meth:`send_many`"""
+    prepareMessage = prepare_message
+    """Alias for :meth:`prepare_message`"""
+    sendPrepared = send_prepared
+    """Alias for :meth:`send_prepared`"""
@@ -17,20 +17,36 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an object that represents a Telegram File."""
+import asyncio
 import shutil
 import urllib.parse as urllib_parse
 from base64 import b64decode
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Any, Optional, Union
+from typing import IO, TYPE_CHECKING, Any, AsyncIterator, Optional, Union
 
 from telegram import TelegramObject
-from telegram._passport.credentials import decrypt
+from telegram._passport.credentials import decrypt_stream
 from telegram._utils.files import is_local_file
 from telegram._utils.types import FilePathInput
 
 if TYPE_CHECKING:
     from telegram import Bot, FileCredentials
 
+_LOCAL_CHUNK_SIZE = 64 * 1024
+
+
+async def _iter_local_file(path: Path, chunk_size: int) -> AsyncIterator[bytes]:
+    loop = asyncio.get_running_loop()
+    file = await loop.run_in_executor(None, path.open, 'rb')
+    try:
+        while True:
+            chunk = await loop.run_in_executor(None, file.read, chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        file.close()
+
 
 class File(TelegramObject):
     """
@@ -123,6 +139,11 @@ class File(TelegramObject):
             * ``custom_path`` parameter now also accepts :obj:`pathlib.Path` as argument.
             * Returns :obj:`pathlib.Path` object in cases where previously a :obj:`str` was
               returned.
+            * The file is downloaded in chunks instead of at once. Files are written without
+              blocking the event loop. See also :meth:`iter_bytes` and :meth:`download_to`.
+              If the download fails, :attr:`out` may contain the data received so far. Files
+              obtained from :attr:`telegram.PassportFile.get_file` are written to :attr:`out`
+              only after the decrypted data was verified.
 
         Args:
             custom_path (:obj:`pathlib.Path` | :obj:`str`, optional): Custom path.
@@ -144,48 +165,178 @@ class File(TelegramObject):
         if custom_path is not None and out is not None:
             raise ValueError('`custom_path` and `out` are mutually exclusive')
 
-        local_file = is_local_file(self.file_path)
-        url = None if local_file else self._get_encoded_url()
-        path = Path(self.file_path) if local_file else None
-
+        timeouts = dict(
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+        )
         if out:
-            if local_file:
-                buf = path.read_bytes()
+            chunks = self._iter_bytes(decrypt_local=False, **timeouts)
+            if self._credentials and not is_local_file(self.file_path):
+                # The hash of passport files can only be checked after the last chunk, so the
+                # decrypted data is written only after it was verified. Passport files are small
+                buf = bytearray()
+                async for chunk in chunks:
+                    buf.extend(chunk)
+                out.write(buf)
             else:
-                buf = await self.get_bot().request.retrieve(url)
-                if self._credentials:
-                    buf = decrypt(
-                        b64decode(self._credentials.secret), b64decode(self._credentials.hash), buf
-                    )
-            out.write(buf)
+                async for chunk in chunks:
+                    out.write(chunk)
             return out
 
-        if custom_path is not None and local_file:
-            shutil.copyfile(self.file_path, str(custom_path))
-            return Path(custom_path)
-
         if custom_path:
             filename = Path(custom_path)
-        elif local_file:
+        elif is_local_file(self.file_path):
             return Path(self.file_path)
         elif self.file_path:
             filename = Path(Path(self.file_path).name)
         else:
             filename = Path.cwd() / self.file_id
 
-        buf = await self.get_bot().request.retrieve(
-            url,
+        return await self._download_to(filename, decrypt_local=False, **timeouts)
+
+    async def iter_bytes(
+        self,
+        chunk_size: int = None,
+        read_timeout: float = None,
+        connect_timeout: float = None,
+        write_timeout: float = None,
+        pool_timeout: float = None,
+    ) -> AsyncIterator[bytes]:
+        """Download this file in chunks, such that it never has to be in memory at once.
+
+        Example:
+            .. code:: python
+
+                async for chunk in file.iter_bytes():
+                    digest.update(chunk)
+
+        Note:
+            If this file was obtained from :attr:`telegram.PassportFile.get_file`, it is decrypted
+            while downloading. Whether the decrypted data is valid can only be checked after the
+            last chunk, in which case :class:`telegram.error.PassportDecryptionError` is raised
+            only after all chunks were yielded.
+
+        .. versionadded:: 14.0
+
+        Args:
+            chunk_size (:obj:`int`, optional): The maximum size of the chunks in bytes. By default,
+                the chunks are yielded as they arrive.
+            read_timeout (:obj:`float`, optional): If this value is specified, use it as the read
+                timeout from the server (instead of the one specified during creation of the
+                connection pool).
+            connect_timeout (:obj:`float`, optional): See :paramref:`read_timeout`.
+            write_timeout (:obj:`float`, optional): See :paramref:`read_timeout`.
+            pool_timeout (:obj:`float`, optional): See :paramref:`read_timeout`.
+
+        Yields:
+            :obj:`bytes`: The chunks of the file.
+
+        """
+        chunks = self._iter_bytes(
+            chunk_size=chunk_size,
             read_timeout=read_timeout,
+            connect_timeout=connect_timeout,
             write_timeout=write_timeout,
+            pool_timeout=pool_timeout,
+        )
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    async def download_to(
+        self,
+        path: FilePathInput,
+        chunk_size: int = None,
+        read_timeout: float = None,
+        connect_timeout: float = None,
+        write_timeout: float = None,
+        pool_timeout: float = None,
+    ) -> Path:
+        """Download this file to :paramref:`path`, without having the file in memory at once and
+        without blocking the event loop while writing. If :attr:`file_path` is the path of a local
+        file (which is the case when a Bot API Server is running in local mode), the file is
+        copied instead.
+
+        Note:
+            If the download fails, the partially written file is removed.
+
+        .. versionadded:: 14.0
+
+        Args:
+            path (:obj:`pathlib.Path` | :obj:`str`): The path to write the file to.
+            chunk_size (:obj:`int`, optional): The maximum size of the chunks in bytes that are
+                downloaded and written at once. By default, the chunks are written as they arrive.
+            read_timeout (:obj:`float`, optional): If this value is specified, use it as the read
+                timeout from the server (instead of the one specified during creation of the
+                connection pool).
+            connect_timeout (:obj:`float`, optional): See :paramref:`read_timeout`.
+            write_timeout (:obj:`float`, optional): See :paramref:`read_timeout`.
+            pool_timeout (:obj:`float`, optional): See :paramref:`read_timeout`.
+
+        Returns:
+            :obj:`pathlib.Path`: The path the file was written to.
+
+        """
+        return await self._download_to(
+            Path(path),
+            chunk_size=chunk_size,
+            read_timeout=read_timeout,
             connect_timeout=connect_timeout,
+            write_timeout=write_timeout,
             pool_timeout=pool_timeout,
         )
-        if self._credentials:
-            buf = decrypt(
-                b64decode(self._credentials.secret), b64decode(self._credentials.hash), buf
+
+    async def _iter_bytes(
+        self, chunk_size: int = None, decrypt_local: bool = True, **timeouts: Optional[float]
+    ) -> AsyncIterator[bytes]:
+        # Files of a Bot API Server in local mode used to be returned without decryption by
+        # `download`, which is kept for backwards compatibility
+        if is_local_file(self.file_path):
+            chunks = _iter_local_file(Path(self.file_path), chunk_size or _LOCAL_CHUNK_SIZE)
+            decrypt = decrypt_local
+        else:
+            chunks = self.get_bot().request.stream(
+                self._get_encoded_url(), chunk_size=chunk_size, **timeouts
+            )
+            decrypt = True
+        if decrypt and self._credentials:
+            chunks = decrypt_stream(
+                b64decode(self._credentials.secret), b64decode(self._credentials.hash), chunks
             )
-        filename.write_bytes(buf)
-        return filename
+
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    async def _download_to(
+        self,
+        path: Path,
+        chunk_size: int = None,
+        decrypt_local: bool = True,
+        **timeouts: Optional[float],
+    ) -> Path:
+        loop = asyncio.get_running_loop()
+        if is_local_file(self.file_path) and not (decrypt_local and self._credentials):
+            # copyfile uses efficient OS level copying where available, e.g. os.sendfile
+            await loop.run_in_executor(None, shutil.copyfile, self.file_path, str(path))
+            return path
+
+        file = await loop.run_in_executor(None, path.open, 'wb')
+        try:
+            async for chunk in self._iter_bytes(chunk_size, decrypt_local, **timeouts):
+                await loop.run_in_executor(None, file.write, chunk)
+        except BaseException:
+            file.close()
+            path.unlink()
+            raise
+        await loop.run_in_executor(None, file.close)
+        return path
 
     def _get_encoded_url(self) -> str:
         """Convert any UTF-8 char in :obj:`File.file_path` into a url encoded ASCII string."""
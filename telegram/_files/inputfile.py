@@ -22,6 +22,7 @@
 import imghdr
 import logging
 import mimetypes
+import os
 from pathlib import Path
 from typing import IO, Optional, Union
 from uuid import uuid4
@@ -29,12 +30,48 @@ from uuid import uuid4
 from telegram._utils.types import FieldTuple
 
 _DEFAULT_MIME_TYPE = 'application/octet-stream'
+_SNIFF_SIZE = 4096
 logger = logging.getLogger(__name__)
 
 
+class _FileStream:
+    """Wraps a seekable file such that it appears to start at the position that the file had
+    when it was wrapped. httpx seeks to the start of a file before uploading it, so this makes
+    sure that the upload starts at the right position - also when the request is retried.
+    """
+
+    __slots__ = ('_file', '_start')
+
+    def __init__(self, file: IO[bytes]):
+        self._file = file
+        self._start = file.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            offset += self._start
+        return self._file.seek(offset, whence) - self._start
+
+    def tell(self) -> int:
+        return self._file.tell() - self._start
+
+
 class InputFile:
     """This object represents a Telegram InputFile.
 
+    Files that support seeking, e.g. files opened via ``open(path, 'rb')``, are not read into
+    memory. Instead, they are read in chunks while uploading, starting at the position they have
+    when passed to this class. Other files are read completely.
+
+    .. versionchanged:: 14.0
+        Seekable files are streamed instead of being read completely.
+
+    Note:
+        Streamed files must stay open until the upload is complete and must not be read from
+        elsewhere in the meantime.
+
     Args:
         obj (:obj:`File handler` | :obj:`bytes`): An open file descriptor or the files content as
             bytes.
@@ -44,20 +81,30 @@ class InputFile:
         TelegramError
 
     Attributes:
-        input_file_content (:obj:`bytes`): The binary content of the file to send.
         attach_name (:obj:`str`): Attach name.
         filename (:obj:`str`): Optional. Filename for the file to be sent.
-        mimetype (:obj:`str`): Optional. The mimetype inferred from the file to be sent.
+        mimetype (:obj:`str`): Optional. The mimetype inferred from the file to be sent. Only the
+            first few KB of the file are inspected.
 
     """
 
-    __slots__ = ('filename', 'attach_name', 'input_file_content', 'mimetype')
+    __slots__ = ('filename', 'attach_name', '_content', '_stream', 'mimetype')
 
     def __init__(self, obj: Union[IO, bytes], filename: str = None):
+        self._content: Optional[Union[bytes, str]] = None
+        self._stream: Optional[_FileStream] = None
         if isinstance(obj, bytes):
-            self.input_file_content = obj
+            self._content = head = obj
+        elif self._is_seekable(obj):
+            self._stream = _FileStream(obj)
+            head = self._stream.read(_SNIFF_SIZE)
+            self._stream.seek(0)
+            if not isinstance(head, bytes):
+                # httpx can't stream files opened in text mode
+                self._content = self._stream.read()
+                self._stream = None
         else:
-            self.input_file_content = obj.read()
+            self._content = head = obj.read()
         self.attach_name = 'attached' + uuid4().hex
 
         if (
@@ -67,7 +114,7 @@ class InputFile:
         ):
             filename = Path(obj.name).name  # type: ignore[union-attr]
 
-        image_mime_type = self.is_image(self.input_file_content)
+        image_mime_type = self.is_image(head)  # type: ignore[arg-type]
         if image_mime_type:
             self.mimetype = image_mime_type
         elif filename:
@@ -77,9 +124,33 @@ class InputFile:
 
         self.filename = filename or self.mimetype.replace('/', '.')
 
+    @staticmethod
+    def _is_seekable(obj: IO) -> bool:
+        try:
+            return obj.seekable()
+        except (AttributeError, ValueError):
+            # ValueError is raised for closed files
+            return False
+
+    @property
+    def input_file_content(self) -> bytes:
+        """:obj:`bytes`: The binary content of the file to send. For streamed files, accessing
+        this reads the whole file into memory.
+        """
+        if self._stream is None:
+            return self._content  # type: ignore[return-value]
+        self._stream.seek(0)
+        content = self._stream.read()
+        self._stream.seek(0)
+        return content
+
     @property
     def field_tuple(self) -> FieldTuple:  # skipcq: PY-D0003
-        return self.filename, self.input_file_content, self.mimetype
+        return (
+            self.filename,
+            self._content if self._stream is None else self._stream,  # type: ignore[return-value]
+            self.mimetype,
+        )
 
     @staticmethod
     def is_image(stream: bytes) -> Optional[str]:
@@ -31,7 +31,7 @@ from telegram import (
 )
 from telegram._utils.defaultvalue import DEFAULT_NONE
 from telegram._utils.files import parse_file_input
-from telegram._utils.types import FileInput, JSONDict, ODVInput
+from telegram._utils.types import FileInput, ODVInput
 from telegram.constants import InputMediaType
 
 MediaType = Union[Animation, Audio, Document, PhotoSize, Video]
@@ -88,17 +88,6 @@ class InputMedia(TelegramObject):
         self.caption_entities = caption_entities
         self.parse_mode = parse_mode
 
-    def to_dict(self) -> JSONDict:
-        """See :meth:`telegram.TelegramObject.to_dict`."""
-        data = super().to_dict()
-
-        if self.caption_entities:
-            data['caption_entities'] = [
-                ce.to_dict() for ce in self.caption_entities  # pylint: disable=not-an-iterable
-            ]
-
-        return data
-
     @staticmethod
     def _parse_thumb_input(thumb: Optional[FileInput]) -> Optional[Union[str, InputFile]]:
         return parse_file_input(thumb) if thumb is not None else thumb
@@ -186,14 +186,6 @@ class StickerSet(TelegramObject):
 
         return cls(bot=bot, **data)
 
-    def to_dict(self) -> JSONDict:
-        """See :meth:`telegram.TelegramObject.to_dict`."""
-        data = super().to_dict()
-
-        data['stickers'] = [s.to_dict() for s in data.get('stickers')]  # type: ignore[union-attr]
-
-        return data
-
 
 class MaskPosition(TelegramObject):
     """This object describes the position on faces where a mask should be placed by default.
@@ -22,7 +22,6 @@
 from typing import Any
 
 from telegram import TelegramObject
-from telegram._utils.types import JSONDict
 
 
 class InlineQueryResult(TelegramObject):
@@ -54,18 +53,3 @@ class InlineQueryResult(TelegramObject):
         self.id = str(id)  # pylint: disable=invalid-name
 
         self._id_attrs = (self.id,)
-
-    def to_dict(self) -> JSONDict:
-        """See :meth:`telegram.TelegramObject.to_dict`."""
-        data = super().to_dict()
-
-        # pylint: disable=no-member
-        if (
-            hasattr(self, 'caption_entities')
-            and self.caption_entities  # type: ignore[attr-defined]
-        ):
-            data['caption_entities'] = [
-                ce.to_dict() for ce in self.caption_entities  # type: ignore[attr-defined]
-            ]
-
-        return data
@@ -22,7 +22,7 @@ from typing import Any, Union, Tuple, List
 
 from telegram import InputMessageContent, MessageEntity
 from telegram._utils.defaultvalue import DEFAULT_NONE
-from telegram._utils.types import JSONDict, ODVInput
+from telegram._utils.types import ODVInput
 
 
 class InputTextMessageContent(InputMessageContent):
@@ -79,12 +79,3 @@ class InputTextMessageContent(InputMessageContent):
         self.disable_web_page_preview = disable_web_page_preview
 
         self._id_attrs = (self.message_text,)
-
-    def to_dict(self) -> JSONDict:
-        """See :meth:`telegram.TelegramObject.to_dict`."""
-        data = super().to_dict()
-
-        if self.entities:
-            data['entities'] = [ce.to_dict() for ce in self.entities]
-
-        return data
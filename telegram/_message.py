@@ -58,6 +58,7 @@ from telegram.constants import ParseMode, MessageAttachmentType
 from telegram.helpers import escape_markdown
 from telegram._utils.datetime import from_timestamp, to_timestamp
 from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue
+from telegram._utils.dejson import NESTED, PLAIN, WITH_BOT, Fields, convert_fields, make_lazy
 from telegram._utils.types import JSONDict, FileInput, ODVInput, DVInput
 
 if TYPE_CHECKING:
@@ -382,6 +383,7 @@ class Message(TelegramObject):
         'invoice',
         'video_note',
         '_effective_attachment',
+        '_parsed_commands',
         'message_auto_delete_timer_changed',
         'voice_chat_ended',
         'voice_chat_participants_invited',
@@ -511,6 +513,10 @@ class Message(TelegramObject):
         self.set_bot(bot)
 
         self._effective_attachment = DEFAULT_NONE
+        # The results of parsing the text for commands together with the text, entity and bot
+        # username they were parsed from. Used by telegram.ext.CommandHandler and
+        # telegram.ext.PrefixHandler, such that the text is parsed only once per message
+        self._parsed_commands: Optional[Dict[str, object]] = None
 
         self._id_attrs = (self.message_id, self.chat)
 
@@ -534,62 +540,35 @@ class Message(TelegramObject):
         return None
 
     @classmethod
-    def de_json(cls, data: Optional[JSONDict], bot: 'Bot') -> Optional['Message']:
-        """See :meth:`telegram.TelegramObject.de_json`."""
-        data = cls._parse_data(data)
+    def de_json(
+        cls, data: Optional[JSONDict], bot: 'Bot', lazy: bool = False, copy: bool = True
+    ) -> Optional['Message']:
+        """See :meth:`telegram.TelegramObject.de_json`.
+
+        .. versionchanged:: 14.0
+            Added the parameters :paramref:`lazy` and :paramref:`copy`.
+
+        Args:
+            data (Dict[:obj:`str`, ...]): The JSON data.
+            bot (:class:`telegram.Bot`): The bot associated with this object.
+            lazy (:obj:`bool`, optional): Whether to convert the nested objects of the message only
+                when they are accessed for the first time. The returned message then is an
+                instance of a subclass of :class:`telegram.Message`, which turns into a
+                :class:`telegram.Message` when it is pickled or copied. Defaults to :obj:`False`.
+            copy (:obj:`bool`, optional): Whether to copy :paramref:`data` before processing it.
+                Pass :obj:`False` only if :paramref:`data` is not used anymore afterwards, as it
+                will be modified. Defaults to :obj:`True`.
+        """
+        if copy:
+            data = cls._parse_data(data)
 
         if not data:
             return None
 
-        data['from_user'] = User.de_json(data.get('from'), bot)
-        data['sender_chat'] = Chat.de_json(data.get('sender_chat'), bot)
-        data['date'] = from_timestamp(data['date'])
-        data['chat'] = Chat.de_json(data.get('chat'), bot)
-        data['entities'] = MessageEntity.de_list(data.get('entities'), bot)
-        data['caption_entities'] = MessageEntity.de_list(data.get('caption_entities'), bot)
-        data['forward_from'] = User.de_json(data.get('forward_from'), bot)
-        data['forward_from_chat'] = Chat.de_json(data.get('forward_from_chat'), bot)
-        data['forward_date'] = from_timestamp(data.get('forward_date'))
-        data['reply_to_message'] = Message.de_json(data.get('reply_to_message'), bot)
-        data['edit_date'] = from_timestamp(data.get('edit_date'))
-        data['audio'] = Audio.de_json(data.get('audio'), bot)
-        data['document'] = Document.de_json(data.get('document'), bot)
-        data['animation'] = Animation.de_json(data.get('animation'), bot)
-        data['game'] = Game.de_json(data.get('game'), bot)
-        data['photo'] = PhotoSize.de_list(data.get('photo'), bot)
-        data['sticker'] = Sticker.de_json(data.get('sticker'), bot)
-        data['video'] = Video.de_json(data.get('video'), bot)
-        data['voice'] = Voice.de_json(data.get('voice'), bot)
-        data['video_note'] = VideoNote.de_json(data.get('video_note'), bot)
-        data['contact'] = Contact.de_json(data.get('contact'), bot)
-        data['location'] = Location.de_json(data.get('location'), bot)
-        data['venue'] = Venue.de_json(data.get('venue'), bot)
-        data['new_chat_members'] = User.de_list(data.get('new_chat_members'), bot)
-        data['left_chat_member'] = User.de_json(data.get('left_chat_member'), bot)
-        data['new_chat_photo'] = PhotoSize.de_list(data.get('new_chat_photo'), bot)
-        data['message_auto_delete_timer_changed'] = MessageAutoDeleteTimerChanged.de_json(
-            data.get('message_auto_delete_timer_changed'), bot
-        )
-        data['pinned_message'] = Message.de_json(data.get('pinned_message'), bot)
-        data['invoice'] = Invoice.de_json(data.get('invoice'), bot)
-        data['successful_payment'] = SuccessfulPayment.de_json(data.get('successful_payment'), bot)
-        data['passport_data'] = PassportData.de_json(data.get('passport_data'), bot)
-        data['poll'] = Poll.de_json(data.get('poll'), bot)
-        data['dice'] = Dice.de_json(data.get('dice'), bot)
-        data['via_bot'] = User.de_json(data.get('via_bot'), bot)
-        data['proximity_alert_triggered'] = ProximityAlertTriggered.de_json(
-            data.get('proximity_alert_triggered'), bot
-        )
-        data['reply_markup'] = InlineKeyboardMarkup.de_json(data.get('reply_markup'), bot)
-        data['voice_chat_scheduled'] = VoiceChatScheduled.de_json(
-            data.get('voice_chat_scheduled'), bot
-        )
-        data['voice_chat_started'] = VoiceChatStarted.de_json(data.get('voice_chat_started'), bot)
-        data['voice_chat_ended'] = VoiceChatEnded.de_json(data.get('voice_chat_ended'), bot)
-        data['voice_chat_participants_invited'] = VoiceChatParticipantsInvited.de_json(
-            data.get('voice_chat_participants_invited'), bot
-        )
-        return cls(bot=bot, **data)
+        # __init__ needs the chat
+        convert_fields(data, bot, _MESSAGE_FIELDS, lazy, copy, eager=('chat',))
+        message = cls(bot=bot, **data)
+        return make_lazy(message, _MESSAGE_FIELDS) if lazy else message
 
     @property
     def effective_attachment(
@@ -664,16 +643,6 @@ class Message(TelegramObject):
             data['forward_date'] = to_timestamp(self.forward_date)
         if self.edit_date:
             data['edit_date'] = to_timestamp(self.edit_date)
-        if self.photo:
-            data['photo'] = [p.to_dict() for p in self.photo]
-        if self.entities:
-            data['entities'] = [e.to_dict() for e in self.entities]
-        if self.caption_entities:
-            data['caption_entities'] = [e.to_dict() for e in self.caption_entities]
-        if self.new_chat_photo:
-            data['new_chat_photo'] = [p.to_dict() for p in self.new_chat_photo]
-        if self.new_chat_members:
-            data['new_chat_members'] = [u.to_dict() for u in self.new_chat_members]
 
         return data
 
@@ -3075,3 +3044,60 @@ class Message(TelegramObject):
         return self._parse_markdown(
             self.caption, self.parse_caption_entities(), urled=True, version=2
         )
+
+
+# The fields of Message.de_json that hold nested objects
+_MESSAGE_FIELDS: Fields = {
+    'from': ('from_user', User.de_json, WITH_BOT),
+    'sender_chat': ('sender_chat', Chat.de_json, WITH_BOT),
+    'date': ('date', from_timestamp, PLAIN),
+    'chat': ('chat', Chat.de_json, WITH_BOT),
+    'entities': ('entities', MessageEntity.de_list, WITH_BOT),
+    'caption_entities': ('caption_entities', MessageEntity.de_list, WITH_BOT),
+    'forward_from': ('forward_from', User.de_json, WITH_BOT),
+    'forward_from_chat': ('forward_from_chat', Chat.de_json, WITH_BOT),
+    'forward_date': ('forward_date', from_timestamp, PLAIN),
+    'reply_to_message': ('reply_to_message', Message.de_json, NESTED),
+    'edit_date': ('edit_date', from_timestamp, PLAIN),
+    'audio': ('audio', Audio.de_json, WITH_BOT),
+    'document': ('document', Document.de_json, WITH_BOT),
+    'animation': ('animation', Animation.de_json, WITH_BOT),
+    'game': ('game', Game.de_json, WITH_BOT),
+    'photo': ('photo', PhotoSize.de_list, WITH_BOT),
+    'sticker': ('sticker', Sticker.de_json, WITH_BOT),
+    'video': ('video', Video.de_json, WITH_BOT),
+    'voice': ('voice', Voice.de_json, WITH_BOT),
+    'video_note': ('video_note', VideoNote.de_json, WITH_BOT),
+    'contact': ('contact', Contact.de_json, WITH_BOT),
+    'location': ('location', Location.de_json, WITH_BOT),
+    'venue': ('venue', Venue.de_json, WITH_BOT),
+    'new_chat_members': ('new_chat_members', User.de_list, WITH_BOT),
+    'left_chat_member': ('left_chat_member', User.de_json, WITH_BOT),
+    'new_chat_photo': ('new_chat_photo', PhotoSize.de_list, WITH_BOT),
+    'message_auto_delete_timer_changed': (
+        'message_auto_delete_timer_changed',
+        MessageAutoDeleteTimerChanged.de_json,
+        WITH_BOT,
+    ),
+    'pinned_message': ('pinned_message', Message.de_json, NESTED),
+    'invoice': ('invoice', Invoice.de_json, WITH_BOT),
+    'successful_payment': ('successful_payment', SuccessfulPayment.de_json, WITH_BOT),
+    'passport_data': ('passport_data', PassportData.de_json, WITH_BOT),
+    'poll': ('poll', Poll.de_json, WITH_BOT),
+    'dice': ('dice', Dice.de_json, WITH_BOT),
+    'via_bot': ('via_bot', User.de_json, WITH_BOT),
+    'proximity_alert_triggered': (
+        'proximity_alert_triggered',
+        ProximityAlertTriggered.de_json,
+        WITH_BOT,
+    ),
+    'reply_markup': ('reply_markup', InlineKeyboardMarkup.de_json, WITH_BOT),
+    'voice_chat_scheduled': ('voice_chat_scheduled', VoiceChatScheduled.de_json, WITH_BOT),
+    'voice_chat_started': ('voice_chat_started', VoiceChatStarted.de_json, WITH_BOT),
+    'voice_chat_ended': ('voice_chat_ended', VoiceChatEnded.de_json, WITH_BOT),
+    'voice_chat_participants_invited': (
+        'voice_chat_participants_invited',
+        VoiceChatParticipantsInvited.de_json,
+        WITH_BOT,
+    ),
+}
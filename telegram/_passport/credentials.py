@@ -17,11 +17,6 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 # pylint: disable=missing-module-docstring,  redefined-builtin
-try:
-    import ujson as json
-except ImportError:
-    import json  # type: ignore[no-redef]
-
 from base64 import b64decode
 from typing import TYPE_CHECKING, Any, List, Optional, no_type_check
 
@@ -43,6 +38,7 @@ except ImportError:
 
 from telegram import TelegramObject
 from telegram.error import PassportDecryptionError
+from telegram._utils.jsoncodec import DEFAULT_JSON_CODEC
 from telegram._utils.types import JSONDict
 
 if TYPE_CHECKING:
@@ -71,6 +67,74 @@ def decrypt(secret, hash, data):
         :obj:`bytes`: The decrypted data as bytes.
 
     """
+    decryptor = _get_decryptor(secret, hash)
+    data = decryptor.update(data) + decryptor.finalize()
+    # Calculate SHA256 hash of the decrypted data
+    digest = Hash(SHA256(), backend=default_backend())
+    digest.update(data)
+    data_hash = digest.finalize()
+    # If the newly calculated hash did not match the one telegram gave us
+    if data_hash != hash:
+        # Raise a error that is caught inside telegram.PassportData and transformed into a warning
+        raise PassportDecryptionError(f"Hashes are not equal! {data_hash} != {hash}")
+    # Return data without padding
+    return data[data[0] :]
+
+
+@no_type_check
+async def decrypt_stream(secret, hash, chunks):
+    """
+    Like :func:`decrypt`, but decrypts the data chunk by chunk, such that it never has to be in
+    memory at once.
+
+    Args:
+        secret (:obj:`bytes`): The encryption secret.
+        hash (:obj:`bytes`): The hash.
+        chunks (AsyncIterator[:obj:`bytes`]): The data to decrypt.
+
+    Raises:
+        :class:`PassportDecryptionError`: Given hash does not match hash of decrypted data. Note
+            that this can only be checked after the last chunk was yielded.
+
+    Yields:
+        :obj:`bytes`: The decrypted data.
+
+    """
+    decryptor = _get_decryptor(secret, hash)
+    digest = Hash(SHA256(), backend=default_backend())
+    # The first byte of the decrypted data is the length of the padding to remove
+    padding = None
+
+    def process(data):
+        nonlocal padding
+        digest.update(data)
+        if padding is None and data:
+            padding = data[0]
+        if padding:
+            removed = min(padding, len(data))
+            data = data[removed:]
+            padding -= removed
+        return data
+
+    try:
+        async for chunk in chunks:
+            data = process(decryptor.update(chunk))
+            if data:
+                yield data
+    finally:
+        if hasattr(chunks, 'aclose'):
+            await chunks.aclose()
+
+    data = process(decryptor.finalize())
+    data_hash = digest.finalize()
+    if data_hash != hash:
+        raise PassportDecryptionError(f"Hashes are not equal! {data_hash} != {hash}")
+    if data:
+        yield data
+
+
+@no_type_check
+def _get_decryptor(secret, hash):
     if not CRYPTO_INSTALLED:
         raise RuntimeError(
             'To use Telegram Passports, PTB must be installed via `pip install '
@@ -84,24 +148,13 @@ def decrypt(secret, hash, data):
     key, init_vector = secret_hash_hash[:32], secret_hash_hash[32 : 32 + 16]
     # Init a AES-CBC cipher and decrypt the data
     cipher = Cipher(AES(key), CBC(init_vector), backend=default_backend())
-    decryptor = cipher.decryptor()
-    data = decryptor.update(data) + decryptor.finalize()
-    # Calculate SHA256 hash of the decrypted data
-    digest = Hash(SHA256(), backend=default_backend())
-    digest.update(data)
-    data_hash = digest.finalize()
-    # If the newly calculated hash did not match the one telegram gave us
-    if data_hash != hash:
-        # Raise a error that is caught inside telegram.PassportData and transformed into a warning
-        raise PassportDecryptionError(f"Hashes are not equal! {data_hash} != {hash}")
-    # Return data without padding
-    return data[data[0] :]
+    return cipher.decryptor()
 
 
 @no_type_check
 def decrypt_json(secret, hash, data):
     """Decrypts data using secret and hash and then decodes utf-8 string and loads json"""
-    return json.loads(decrypt(secret, hash, data).decode('utf-8'))
+    return DEFAULT_JSON_CODEC.loads(decrypt(secret, hash, data))
 
 
 class EncryptedCredentials(TelegramObject):
@@ -399,15 +452,6 @@ class SecureValue(TelegramObject):
 
         return cls(bot=bot, **data)
 
-    def to_dict(self) -> JSONDict:
-        """See :meth:`telegram.TelegramObject.to_dict`."""
-        data = super().to_dict()
-
-        data['files'] = [p.to_dict() for p in self.files]  # type: ignore[union-attr]
-        data['translation'] = [p.to_dict() for p in self.translation]  # type: ignore[union-attr]
-
-        return data
-
 
 class _CredentialsBase(TelegramObject):
     """Base class for DataCredentials and FileCredentials."""
@@ -251,14 +251,3 @@ class EncryptedPassportElement(TelegramObject):
             )
 
         return cls(bot=bot, **data)
-
-    def to_dict(self) -> JSONDict:
-        """See :meth:`telegram.TelegramObject.to_dict`."""
-        data = super().to_dict()
-
-        if self.files:
-            data['files'] = [p.to_dict() for p in self.files]
-        if self.translation:
-            data['translation'] = [p.to_dict() for p in self.translation]
-
-        return data
@@ -80,14 +80,6 @@ class PassportData(TelegramObject):
 
         return cls(bot=bot, **data)
 
-    def to_dict(self) -> JSONDict:
-        """See :meth:`telegram.TelegramObject.to_dict`."""
-        data = super().to_dict()
-
-        data['data'] = [e.to_dict() for e in self.data]
-
-        return data
-
     @property
     def decrypted_data(self) -> List[EncryptedPassportElement]:
         """
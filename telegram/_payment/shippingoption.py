@@ -21,7 +21,6 @@
 from typing import TYPE_CHECKING, Any, List
 
 from telegram import TelegramObject
-from telegram._utils.types import JSONDict
 
 if TYPE_CHECKING:
     from telegram import LabeledPrice  # noqa
@@ -60,11 +59,3 @@ class ShippingOption(TelegramObject):
         self.prices = prices
 
         self._id_attrs = (self.id,)
-
-    def to_dict(self) -> JSONDict:
-        """See :meth:`telegram.TelegramObject.to_dict`."""
-        data = super().to_dict()
-
-        data['prices'] = [p.to_dict() for p in self.prices]
-
-        return data
@@ -217,9 +217,6 @@ class Poll(TelegramObject):
         """See :meth:`telegram.TelegramObject.to_dict`."""
         data = super().to_dict()
 
-        data['options'] = [x.to_dict() for x in self.options]
-        if self.explanation_entities:
-            data['explanation_entities'] = [e.to_dict() for e in self.explanation_entities]
         data['close_date'] = to_timestamp(data.get('close_date'))
 
         return data
@@ -21,7 +21,6 @@
 from typing import Any, List, Union, Sequence
 
 from telegram import KeyboardButton, ReplyMarkup
-from telegram._utils.types import JSONDict
 
 
 class ReplyKeyboardMarkup(ReplyMarkup):
@@ -117,15 +116,6 @@ class ReplyKeyboardMarkup(ReplyMarkup):
 
         self._id_attrs = (self.keyboard,)
 
-    def to_dict(self) -> JSONDict:
-        """See :meth:`telegram.TelegramObject.to_dict`."""
-        data = super().to_dict()
-
-        data['keyboard'] = []
-        for row in self.keyboard:
-            data['keyboard'].append([button.to_dict() for button in row])
-        return data
-
     @classmethod
     def from_button(
         cls,
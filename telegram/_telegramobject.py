@@ -17,13 +17,10 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """Base class for Telegram Objects."""
-try:
-    import ujson as json
-except ImportError:
-    import json  # type: ignore[no-redef]
-
-from typing import TYPE_CHECKING, List, Optional, Type, TypeVar, Tuple
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, ClassVar, List, Optional, Type, TypeVar, Tuple
 
+from telegram._utils.jsoncodec import DEFAULT_JSON_CODEC
 from telegram._utils.types import JSONDict
 from telegram._utils.warnings import warn
 
@@ -33,6 +30,23 @@ if TYPE_CHECKING:
 TO = TypeVar('TO', bound='TelegramObject', covariant=True)
 
 
+_PLAIN_TYPES = frozenset((str, int, float, bool))
+
+
+def _to_dict_value(value: object) -> object:
+    """Converts an attribute value for :meth:`TelegramObject.to_dict`."""
+    value_type = value.__class__
+    if value_type in _PLAIN_TYPES:
+        return value
+    if value_type is list:
+        return [_to_dict_value(item) for item in value]  # type: ignore[attr-defined]
+    if value_type is tuple:
+        return tuple(_to_dict_value(item) for item in value)  # type: ignore[attr-defined]
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()  # type: ignore[attr-defined]
+    return value
+
+
 class TelegramObject:
     """Base class for most Telegram objects.
 
@@ -51,6 +65,16 @@ class TelegramObject:
     if TYPE_CHECKING:
         _id_attrs: Tuple[object, ...]
         _bot: Optional['Bot']
+
+    # The attributes that are serialized by to_dict, the keys they are stored under and a function
+    # returning the values of `_id_attrs`, `_bot` and of the attributes. Computed once per class in
+    # __init_subclass__.
+    _to_dict_attrs: ClassVar[Tuple[str, ...]] = ()
+    _to_dict_keys: ClassVar[Tuple[str, ...]] = ()
+    _to_dict_getter: ClassVar[Callable[[object], Tuple[object, ...]]] = attrgetter(
+        '_id_attrs', '_bot'
+    )
+
     # Adding slots reduces memory usage & allows for faster attribute access.
     # Only instance variables should be added to __slots__.
     __slots__ = (
@@ -67,6 +91,24 @@ class TelegramObject:
         instance._bot = None
         return instance
 
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)  # type: ignore[call-arg]
+        # We want to get all attributes for the class, using cls.__slots__ only includes the
+        # attributes used by that class itself, and not its superclass(es). Hence we get its MRO
+        # and then get their attributes. The `[:-2]` slice excludes the `object` class & the
+        # TelegramObject class itself. dict.fromkeys removes duplicates while keeping the order.
+        attrs = dict.fromkeys(
+            attr
+            for klass in reversed(cls.__mro__[:-2])
+            for attr in klass.__dict__.get('__slots__', ())
+            if attr != 'bot' and not attr.startswith('_')
+        )
+        cls._to_dict_attrs = tuple(attrs)
+        cls._to_dict_keys = tuple('from' if attr == 'from_user' else attr for attr in attrs)
+        # `_id_attrs` and `_bot` are always set in __new__. Adding them ensures that the getter
+        # returns a tuple even for less than two attributes.
+        cls._to_dict_getter = attrgetter('_id_attrs', '_bot', *attrs)  # type: ignore[assignment]
+
     def __str__(self) -> str:
         return str(self.to_dict())
 
@@ -129,34 +171,30 @@ class TelegramObject:
         Returns:
             :obj:`str`
         """
-        return json.dumps(self.to_dict())
+        return DEFAULT_JSON_CODEC.dumps(self.to_dict())
 
     def to_dict(self) -> JSONDict:
         """Gives representation of object as :obj:`dict`.
 
+        .. versionchanged:: 14.0
+            Nested Telegram objects are converted also if they are contained in (nested) lists.
+            The attributes to serialize are determined only once per class.
+
         Returns:
             :obj:`dict`
         """
-        data = {}
+        try:
+            values = self._to_dict_getter(self)[2:]
+        except AttributeError:
+            # Not all attributes are set
+            values = tuple(getattr(self, attr, None) for attr in self._to_dict_attrs)
 
-        # We want to get all attributes for the class, using self.__slots__ only includes the
-        # attributes used by that class itself, and not its superclass(es). Hence we get its MRO
-        # and then get their attributes. The `[:-2]` slice excludes the `object` class & the
-        # TelegramObject class itself.
-        attrs = {attr for cls in self.__class__.__mro__[:-2] for attr in cls.__slots__}
-        for key in attrs:
-            if key == 'bot' or key.startswith('_'):
+        data = {}
+        for key, value in zip(self._to_dict_keys, values):
+            if value is None:
                 continue
-
-            value = getattr(self, key, None)
-            if value is not None:
-                if hasattr(value, 'to_dict'):
-                    data[key] = value.to_dict()
-                else:
-                    data[key] = value
-
-        if data.get('from_user'):
-            data['from'] = data.pop('from_user', None)
+            # Checking for plain values here saves a function call for most attributes
+            data[key] = value if value.__class__ in _PLAIN_TYPES else _to_dict_value(value)
         return data
 
     def get_bot(self) -> 'Bot':
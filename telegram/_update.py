@@ -35,6 +35,7 @@ from telegram import (
     ChatJoinRequest,
 )
 
+from telegram._utils.dejson import NESTED, WITH_BOT, Fields, convert_fields, make_lazy
 from telegram._utils.types import JSONDict
 
 if TYPE_CHECKING:
@@ -389,28 +390,77 @@ class Update(TelegramObject):
         return message
 
     @classmethod
-    def de_json(cls, data: Optional[JSONDict], bot: 'Bot') -> Optional['Update']:
-        """See :meth:`telegram.TelegramObject.de_json`."""
-        data = cls._parse_data(data)
+    def de_json(
+        cls, data: Optional[JSONDict], bot: 'Bot', lazy: bool = False, copy: bool = True
+    ) -> Optional['Update']:
+        """See :meth:`telegram.TelegramObject.de_json`.
+
+        .. versionchanged:: 14.0
+            Added the parameters :paramref:`lazy` and :paramref:`copy`.
+
+        Args:
+            data (Dict[:obj:`str`, ...]): The JSON data.
+            bot (:class:`telegram.Bot`): The bot associated with this object.
+            lazy (:obj:`bool`, optional): Whether to convert the nested objects of the update
+                only when they are accessed for the first time. Messages are deserialized lazily
+                as well, see :meth:`telegram.Message.de_json`. The returned update then is an
+                instance of a subclass of :class:`telegram.Update`, which turns into a
+                :class:`telegram.Update` when it is pickled or copied. Defaults to :obj:`False`.
+            copy (:obj:`bool`, optional): Whether to copy :paramref:`data` before processing it.
+                Pass :obj:`False` only if :paramref:`data` is not used anymore afterwards, as it
+                will be modified. Defaults to :obj:`True`.
+        """
+        if copy:
+            data = cls._parse_data(data)
 
         if not data:
             return None
 
-        data['message'] = Message.de_json(data.get('message'), bot)
-        data['edited_message'] = Message.de_json(data.get('edited_message'), bot)
-        data['inline_query'] = InlineQuery.de_json(data.get('inline_query'), bot)
-        data['chosen_inline_result'] = ChosenInlineResult.de_json(
-            data.get('chosen_inline_result'), bot
-        )
-        data['callback_query'] = CallbackQuery.de_json(data.get('callback_query'), bot)
-        data['shipping_query'] = ShippingQuery.de_json(data.get('shipping_query'), bot)
-        data['pre_checkout_query'] = PreCheckoutQuery.de_json(data.get('pre_checkout_query'), bot)
-        data['channel_post'] = Message.de_json(data.get('channel_post'), bot)
-        data['edited_channel_post'] = Message.de_json(data.get('edited_channel_post'), bot)
-        data['poll'] = Poll.de_json(data.get('poll'), bot)
-        data['poll_answer'] = PollAnswer.de_json(data.get('poll_answer'), bot)
-        data['my_chat_member'] = ChatMemberUpdated.de_json(data.get('my_chat_member'), bot)
-        data['chat_member'] = ChatMemberUpdated.de_json(data.get('chat_member'), bot)
-        data['chat_join_request'] = ChatJoinRequest.de_json(data.get('chat_join_request'), bot)
-
-        return cls(**data)
+        convert_fields(data, bot, _UPDATE_FIELDS, lazy, copy)
+        update = cls(**data)
+        return make_lazy(update, _UPDATE_FIELDS) if lazy else update
+
+    @classmethod
+    def de_list(
+        cls,
+        data: Optional[List[JSONDict]],
+        bot: 'Bot',
+        lazy: bool = False,
+        copy: bool = True,
+    ) -> List[Optional['Update']]:
+        """See :meth:`telegram.TelegramObject.de_list`.
+
+        .. versionchanged:: 14.0
+            Added the parameters :paramref:`lazy` and :paramref:`copy`, see :meth:`de_json`.
+
+        Args:
+            data (List[Dict[:obj:`str`, ...]]): The JSON data.
+            bot (:class:`telegram.Bot`): The bot associated with these objects.
+            lazy (:obj:`bool`, optional): Whether to deserialize the updates lazily.
+                Defaults to :obj:`False`.
+            copy (:obj:`bool`, optional): Whether to copy the data of the updates before
+                processing it. Defaults to :obj:`True`.
+        """
+        if not data:
+            return []
+
+        return [cls.de_json(update, bot, lazy=lazy, copy=copy) for update in data]
+
+
+# The fields of Update.de_json that hold nested objects
+_UPDATE_FIELDS: Fields = {
+    'message': ('message', Message.de_json, NESTED),
+    'edited_message': ('edited_message', Message.de_json, NESTED),
+    'inline_query': ('inline_query', InlineQuery.de_json, WITH_BOT),
+    'chosen_inline_result': ('chosen_inline_result', ChosenInlineResult.de_json, WITH_BOT),
+    'callback_query': ('callback_query', CallbackQuery.de_json, WITH_BOT),
+    'shipping_query': ('shipping_query', ShippingQuery.de_json, WITH_BOT),
+    'pre_checkout_query': ('pre_checkout_query', PreCheckoutQuery.de_json, WITH_BOT),
+    'channel_post': ('channel_post', Message.de_json, NESTED),
+    'edited_channel_post': ('edited_channel_post', Message.de_json, NESTED),
+    'poll': ('poll', Poll.de_json, WITH_BOT),
+    'poll_answer': ('poll_answer', PollAnswer.de_json, WITH_BOT),
+    'my_chat_member': ('my_chat_member', ChatMemberUpdated.de_json, WITH_BOT),
+    'chat_member': ('chat_member', ChatMemberUpdated.de_json, WITH_BOT),
+    'chat_join_request': ('chat_join_request', ChatJoinRequest.de_json, WITH_BOT),
+}
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains helpers for deserializing Telegram objects, which convert only the fields
+present in the JSON data and optionally do so lazily, i.e. only when the attribute is accessed for
+the first time.
+
+.. versionadded:: 14.0
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, Optional, Tuple, TypeVar
+
+from telegram._utils.types import JSONDict
+
+if TYPE_CHECKING:
+    from telegram import Bot, TelegramObject
+
+TO = TypeVar('TO', bound='TelegramObject')
+
+# How the value of a field is passed to the function converting it
+PLAIN = 0  # func(value)
+WITH_BOT = 1  # func(value, bot)
+NESTED = 2  # func(value, bot, lazy, copy), for objects that support lazy deserialization
+
+Fields = Dict[str, Tuple[str, Callable[..., object], int]]
+"""JSON key -> (name of the attribute, function converting the value, one of :data:`PLAIN`,
+:data:`WITH_BOT` and :data:`NESTED`)"""
+
+
+class Deferred:
+    """The JSON data of an attribute that is yet to be converted.
+
+    Args:
+        func (Callable): The function converting the data.
+        *args: The arguments to pass to :paramref:`func`.
+    """
+
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func: Callable[..., object], *args: object):
+        self.func = func
+        self.args = args
+
+    def resolve(self) -> object:
+        """Converts the data.
+
+        Returns:
+            The converted data.
+        """
+        return self.func(*self.args)
+
+
+def convert_fields(
+    data: JSONDict,
+    bot: 'Bot',
+    fields: Fields,
+    lazy: bool = False,
+    copy: bool = True,
+    eager: Collection[str] = (),
+) -> None:
+    """Converts the values of the keys of ``data`` that are listed in ``fields`` in place and
+    stores them under the name of the attribute. Keys that are not present in ``data`` are
+    skipped, i.e. the attributes must default to :obj:`None` or an empty list.
+
+    Args:
+        data (Dict[:obj:`str`, ...]): The JSON data.
+        bot (:class:`telegram.Bot`): The bot to pass to the conversion functions.
+        fields (:data:`Fields`): The fields to convert.
+        lazy (:obj:`bool`, optional): Whether to defer the conversions, see :class:`Deferred`.
+            The object created from the data must be passed to :func:`make_lazy` then.
+        copy (:obj:`bool`, optional): Passed on to the functions of :data:`NESTED` fields.
+        eager (Collection[:obj:`str`], optional): Keys that are always converted directly, e.g.
+            because ``__init__`` of the class needs the converted value.
+    """
+    for key in tuple(data):
+        field = fields.get(key)
+        if field is None:
+            continue
+        attr, func, arguments = field
+        value = data.pop(key)
+
+        args: Tuple[object, ...]
+        if arguments == WITH_BOT:
+            args = (value, bot)
+        elif arguments == PLAIN:
+            args = (value,)
+        else:
+            args = (value, bot, lazy, copy)
+        if lazy and value is not None and key not in eager:
+            data[attr] = Deferred(func, *args)
+        else:
+            data[attr] = func(*args)
+
+
+class LazyAttribute:
+    """Descriptor that converts :class:`Deferred` values of an attribute on first access and
+    stores the result.
+
+    Args:
+        slot: The descriptor of the slot storing the value.
+    """
+
+    __slots__ = ('slot',)
+
+    def __init__(self, slot: Any):
+        self.slot = slot
+
+    def __get__(self, instance: object, owner: type = None) -> object:
+        if instance is None:
+            return self
+        value = self.slot.__get__(instance, owner)
+        if value.__class__ is Deferred:
+            value = value.resolve()
+            self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance: object, value: object) -> None:
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance: object) -> None:
+        self.slot.__delete__(instance)
+
+
+def _materialize(instance: 'TelegramObject') -> None:
+    """Converts all deferred attributes of ``instance`` and turns it back into an instance of its
+    original class."""
+    for attr in instance._lazy_attrs:  # type: ignore[attr-defined]
+        getattr(instance, attr)
+    # The lazy class has the same layout as its base class, so this is safe
+    instance.__class__ = instance.__class__.__bases__[0]
+
+
+def _reduce_ex(self: 'TelegramObject', protocol: int) -> Tuple:  # type: ignore[type-arg]
+    # Pickling & copying objects work with the original class
+    _materialize(self)
+    return self.__reduce_ex__(protocol)
+
+
+def _hash(self: 'TelegramObject') -> int:
+    # Must be the same as for instances of the original class, which compare as equal
+    base = self.__class__.__bases__[0]
+    if self._id_attrs:  # pylint: disable=protected-access
+        return hash((base, self._id_attrs))  # pylint: disable=protected-access
+    return object.__hash__(self)
+
+
+_LAZY_CLASSES: Dict[type, type] = {}
+
+
+def make_lazy(instance: TO, fields: Fields) -> TO:
+    """Turns ``instance`` into an instance of a subclass of its class, whose attributes listed in
+    ``fields`` may hold :class:`Deferred` values, which are converted on first access. Otherwise,
+    the instance behaves as before. When it is pickled or copied, it is turned back into an
+    instance of its original class.
+
+    Note:
+        The class of the instance must not declare any ``__slots__`` beyond those of its base
+        classes, and ``fields`` must be the same for all instances of a class.
+
+    Args:
+        instance (:class:`telegram.TelegramObject`): The instance.
+        fields (:data:`Fields`): The fields that may hold deferred values.
+
+    Returns:
+        :class:`telegram.TelegramObject`: The instance.
+    """
+    cls = instance.__class__
+    lazy_cls: Optional[type] = _LAZY_CLASSES.get(cls)
+    if lazy_cls is None:
+        attrs = tuple(attr for attr, _, _ in fields.values())
+        namespace: Dict[str, object] = {
+            '__slots__': (),
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+            '__reduce_ex__': _reduce_ex,
+            '__hash__': _hash,
+            '_lazy_attrs': attrs,
+        }
+        for attr in attrs:
+            namespace[attr] = LazyAttribute(getattr(cls, attr))
+        lazy_cls = _LAZY_CLASSES[cls] = type(cls.__name__, (cls,), namespace)
+    instance.__class__ = lazy_cls
+    return instance
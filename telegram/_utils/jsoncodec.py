@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the classes that encode and decode JSON for the library.
+
+The implementations are exposed via :mod:`telegram.request`. They live here, so that modules like
+``telegram._telegramobject`` can use them without importing :mod:`telegram.request`.
+
+.. versionadded:: 14.0
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import ujson
+
+    UJSON_AVAILABLE = True
+except ImportError:
+    ujson = None
+    UJSON_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+class JSONCodec:
+    """Encodes and decodes JSON for python-telegram-bot. This implementation uses the
+    :mod:`json` module of the standard library. Subclasses can override :meth:`loads`,
+    :meth:`dumps` and :meth:`dumps_bytes` to use a different JSON library.
+
+    .. versionadded:: 14.0
+    """
+
+    __slots__ = ()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decodes JSON.
+
+        Args:
+            data (:obj:`str` | :obj:`bytes`): The JSON document. :obj:`bytes` must be UTF-8
+                encoded.
+
+        Returns:
+            The decoded object.
+
+        Raises:
+            :exc:`ValueError`: If :paramref:`data` is not valid JSON.
+        """
+        return json.loads(data)
+
+    def dumps(self, obj: object) -> str:
+        """Encodes an object as JSON.
+
+        Args:
+            obj (:obj:`object`): The object to encode.
+
+        Returns:
+            :obj:`str`: The JSON document.
+        """
+        return json.dumps(obj)
+
+    def dumps_bytes(self, obj: object) -> bytes:
+        """Encodes an object as UTF-8 encoded JSON. By default, this encodes the return value of
+        :meth:`dumps`. Implementations that can create :obj:`bytes` directly should override this.
+
+        Args:
+            obj (:obj:`object`): The object to encode.
+
+        Returns:
+            :obj:`bytes`: The JSON document.
+        """
+        return self.dumps(obj).encode('utf-8')
+
+
+class UJSONCodec(JSONCodec):
+    """Encodes and decodes JSON with `ujson <https://pypi.org/project/ujson/>`_. This is the
+    default, if ``ujson`` is installed.
+
+    .. versionadded:: 14.0
+
+    Raises:
+        :exc:`RuntimeError`: If ``ujson`` is not installed.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        if not UJSON_AVAILABLE:
+            raise RuntimeError(
+                'To use `UJSONCodec`, PTB must be installed via `pip install '
+                'python-telegram-bot[json]`.'
+            )
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """See :meth:`JSONCodec.loads`."""
+        return ujson.loads(data)
+
+    def dumps(self, obj: object) -> str:
+        """See :meth:`JSONCodec.dumps`."""
+        return ujson.dumps(obj)
+
+
+class OrjsonCodec(JSONCodec):
+    """Encodes and decodes JSON with `orjson <https://pypi.org/project/orjson/>`_, which works
+    on :obj:`bytes` directly.
+
+    Note:
+        Unlike :mod:`json`, ``orjson`` doesn't escape non-ASCII characters and only supports
+        integers in the 64-bit range. Keys of dictionaries that are not strings are converted
+        to strings, just like :mod:`json` does.
+
+    .. versionadded:: 14.0
+
+    Raises:
+        :exc:`RuntimeError`: If ``orjson`` is not installed.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        if not ORJSON_AVAILABLE:
+            raise RuntimeError('To use `OrjsonCodec`, `orjson` must be installed.')
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """See :meth:`JSONCodec.loads`."""
+        return orjson.loads(data)
+
+    def dumps(self, obj: object) -> str:
+        """See :meth:`JSONCodec.dumps`."""
+        return self.dumps_bytes(obj).decode('utf-8')
+
+    def dumps_bytes(self, obj: object) -> bytes:
+        """See :meth:`JSONCodec.dumps_bytes`."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+DEFAULT_JSON_CODEC: JSONCodec = UJSONCodec() if UJSON_AVAILABLE else JSONCodec()
+""":class:`JSONCodec`: The codec used, if none is specified. Uses ``ujson``, if installed."""
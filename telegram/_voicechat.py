@@ -112,14 +112,6 @@ class VoiceChatParticipantsInvited(TelegramObject):
         data['users'] = User.de_list(data.get('users', []), bot)
         return cls(**data)
 
-    def to_dict(self) -> JSONDict:
-        """See :meth:`telegram.TelegramObject.to_dict`."""
-        data = super().to_dict()
-
-        if self.users is not None:
-            data["users"] = [u.to_dict() for u in self.users]
-        return data
-
     def __hash__(self) -> int:
         return hash(None) if self.users is None else hash(tuple(self.users))
 
@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Load test for the :class:`telegram.ext.Dispatcher`, which doesn't need network access.
+
+A stream of synthetic updates - text messages, commands and callback queries of many users - is
+put into the update queue of a dispatcher, whose handlers answer them via
+:class:`telegram.request.MockRequest`. Reports the throughput in updates per second, the p50/p99
+latency of the handler callbacks, the number of errors and, in a separate run
+with :mod:`tracemalloc`, the memory allocated while processing the updates.
+
+Usage::
+
+    python -m telegram.bench [--updates N] [--workers N] [--latency SECONDS] [--error-rate RATE]
+"""
+import argparse
+import asyncio
+import random
+import time
+import tracemalloc
+import warnings
+from typing import Awaitable, Callable, Dict, List, Sequence, Tuple
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
+from telegram.ext import (
+    CallbackContext,
+    CallbackQueryHandler,
+    CommandHandler,
+    ContextTypes,
+    Dispatcher,
+    ExtBot,
+    MessageHandler,
+    filters,
+)
+from telegram.request import MockRequest
+
+_TOKEN = '1234567890:AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA'
+_KEYBOARD = InlineKeyboardMarkup.from_row(
+    [InlineKeyboardButton(f'Option {i}', callback_data=f'option:{i}') for i in range(3)]
+)
+
+
+def make_updates(number: int, users: int = 1000, seed: int = 0) -> List[dict]:
+    """Returns ``number`` updates in the form of Bot API responses: 60% text messages, 20%
+    commands and 20% callback queries, each from one of ``users`` users."""
+    rng = random.Random(seed)
+    updates = []
+    for update_id in range(number):
+        user_id = rng.randint(1, users)
+        user = {'id': user_id, 'is_bot': False, 'first_name': f'User {user_id}'}
+        message = {
+            'message_id': update_id,
+            'date': int(time.time()),
+            'chat': {'id': user_id, 'type': 'private', 'first_name': user['first_name']},
+            'from': user,
+            'text': f'Hello there, this is message {update_id}',
+        }
+        kind = rng.random()
+        if kind < 0.6:
+            updates.append({'update_id': update_id, 'message': message})
+        elif kind < 0.8:
+            message['text'] = '/start'
+            message['entities'] = [{'type': 'bot_command', 'offset': 0, 'length': 6}]
+            updates.append({'update_id': update_id, 'message': message})
+        else:
+            updates.append(
+                {
+                    'update_id': update_id,
+                    'callback_query': {
+                        'id': str(update_id),
+                        'from': user,
+                        'chat_instance': str(user_id),
+                        'data': f'option:{rng.randrange(3)}',
+                        'message': {**message, 'reply_markup': _KEYBOARD.to_dict()},
+                    },
+                }
+            )
+    return updates
+
+
+async def _start(update: Update, _: CallbackContext) -> None:
+    await update.effective_message.reply_text(  # type: ignore[union-attr]
+        'Please choose:', reply_markup=_KEYBOARD
+    )
+
+
+async def _echo(update: Update, _: CallbackContext) -> None:
+    await update.effective_message.reply_text(update.effective_message.text)  # type: ignore
+
+
+async def _button(update: Update, _: CallbackContext) -> None:
+    await update.callback_query.answer(  # type: ignore[union-attr]
+        f'You chose {update.callback_query.data}'  # type: ignore[union-attr]
+    )
+
+
+def _timed(
+    callback: Callable[[Update, CallbackContext], Awaitable[None]], latencies: List[float]
+) -> Callable[[Update, CallbackContext], Awaitable[None]]:
+    async def wrapper(update: Update, context: CallbackContext) -> None:
+        start = time.perf_counter()
+        try:
+            await callback(update, context)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    return wrapper
+
+
+async def run(
+    updates: Sequence[dict],
+    workers: int = 4,
+    latency: float = 0,
+    error_rate: float = 0,
+    trace_memory: bool = False,
+) -> Dict[str, float]:
+    """Processes the ``updates`` with a dispatcher and returns the measured figures."""
+    request = MockRequest(latency=latency, error_rate=error_rate, record=False, seed=0)
+    with warnings.catch_warnings():
+        # The dispatcher is built directly to keep the setup minimal
+        warnings.simplefilter('ignore')
+        dispatcher: Dispatcher = Dispatcher(
+            bot=ExtBot(_TOKEN, request=request),
+            update_queue=asyncio.Queue(),
+            job_queue=None,
+            workers=workers,
+            persistence=None,
+            context_types=ContextTypes(),
+        )
+    # Process the updates concurrently, up to `workers` at a time
+    dispatcher.process_asyncio = True
+
+    latencies: List[float] = []
+    errors: List[Exception] = []
+
+    async def error_handler(_: object, context: CallbackContext) -> None:
+        errors.append(context.error)  # type: ignore[arg-type]
+
+    dispatcher.add_handler(CommandHandler('start', _timed(_start, latencies)))
+    dispatcher.add_handler(
+        MessageHandler(filters.TEXT & ~filters.COMMAND, _timed(_echo, latencies))
+    )
+    dispatcher.add_handler(CallbackQueryHandler(_timed(_button, latencies)))
+    dispatcher.add_error_handler(error_handler)
+
+    await dispatcher.start()
+    objects = [Update.de_json(update, dispatcher.bot) for update in updates]
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    for update in objects:
+        await dispatcher.update_queue.put(update)
+    await dispatcher.stop()
+    elapsed = time.perf_counter() - start
+
+    results = {
+        'updates': len(objects),
+        'seconds': elapsed,
+        'updates/s': len(objects) / elapsed,
+        'p50': _percentile(latencies, 50),
+        'p99': _percentile(latencies, 99),
+        'errors': len(errors),
+    }
+    if trace_memory:
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results['peak KiB'] = peak / 1024
+        results['retained B/update'] = current / len(objects)
+    return results
+
+
+def _percentile(values: Sequence[float], pct: float) -> float:
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+def _parse_args(args: Sequence[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='python -m telegram.bench',
+        description='Measures the throughput of a dispatcher with a mocked Bot API.',
+    )
+    parser.add_argument('--updates', type=int, default=10000, help='number of updates')
+    parser.add_argument('--workers', type=int, default=4, help='concurrently handled updates')
+    parser.add_argument(
+        '--latency', type=float, default=0, help='duration of each Bot API request in seconds'
+    )
+    parser.add_argument(
+        '--error-rate',
+        type=float,
+        default=0,
+        help='probability of a Bot API request to fail with 429, 502 or a timeout',
+    )
+    parser.add_argument(
+        '--no-memory', action='store_true', help='skip the run that measures the allocations'
+    )
+    return parser.parse_args(args)
+
+
+def main(args: Sequence[str] = None) -> None:  # skipcq: PY-D0003
+    options = _parse_args(args)
+    updates = make_updates(options.updates)
+    kwargs = dict(workers=options.workers, latency=options.latency, error_rate=options.error_rate)
+
+    results = asyncio.run(run(updates, **kwargs))  # type: ignore[arg-type]
+    rows: List[Tuple[str, str]] = [
+        ('updates', str(options.updates)),
+        ('workers', str(options.workers)),
+        ('updates/s', f"{results['updates/s']:.0f}"),
+        ('p50 handler latency', f"{results['p50'] * 1e3:.2f} ms"),
+        ('p99 handler latency', f"{results['p99'] * 1e3:.2f} ms"),
+        ('handler errors', str(results['errors'])),
+    ]
+    if not options.no_memory:
+        # tracemalloc slows everything down, so the allocations are measured separately
+        memory = asyncio.run(run(updates, trace_memory=True, **kwargs))  # type: ignore[arg-type]
+        rows.append(('peak traced memory', f"{memory['peak KiB']:.0f} KiB"))
+        rows.append(('retained memory', f"{memory['retained B/update']:.0f} B/update"))
+
+    width = max(len(name) for name, _ in rows)
+    for name, value in rows:
+        print(f'{name.ljust(width)}  {value}')
+
+
+if __name__ == '__main__':
+    main()
@@ -20,6 +20,7 @@
 
 __all__ = (
     'BasePersistence',
+    'BaseRateLimiter',
     'CallbackContext',
     'CallbackDataCache',
     'CallbackQueryHandler',
@@ -48,18 +49,24 @@ __all__ = (
     'PollHandler',
     'PreCheckoutQueryHandler',
     'PrefixHandler',
+    'RateLimiter',
     'ShippingQueryHandler',
+    'SQLitePersistence',
     'StringCommandHandler',
     'StringRegexHandler',
+    'TrackingDict',
     'TypeHandler',
     'Updater',
     'UpdaterBuilder',
 )
 
+from ._ratelimiter import BaseRateLimiter, RateLimiter
 from ._extbot import ExtBot
+from ._trackingdict import TrackingDict
 from ._basepersistence import BasePersistence, PersistenceInput
 from ._picklepersistence import PicklePersistence
 from ._dictpersistence import DictPersistence
+from ._sqlitepersistence import SQLitePersistence
 from ._handler import Handler
 from ._callbackcontext import CallbackContext
 from ._contexttypes import ContextTypes
@@ -17,12 +17,30 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the BasePersistence class."""
+import datetime
 from abc import ABC, abstractmethod
 from copy import copy
-from typing import Dict, Optional, Tuple, cast, ClassVar, Generic, DefaultDict, NamedTuple
+from decimal import Decimal
+from enum import Enum
+from fractions import Fraction
+from operator import is_
+from typing import (
+    Collection,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+    ClassVar,
+    Generic,
+    DefaultDict,
+    NamedTuple,
+)
 
 from telegram import Bot
 from telegram.ext import ExtBot
+from telegram.ext._trackingdict import TrackingDict
 
 from telegram.warnings import PTBRuntimeWarning
 from telegram._utils.warnings import warn
@@ -56,6 +74,29 @@ class PersistenceInput(NamedTuple):  # skipcq: PYL-E0239
     callback_data: bool = True
 
 
+# Instances of these types never contain a bot and can't be changed, so replace_bot and insert_bot
+# can return them as they are. Subclasses are not included, as they may have additional attributes
+_ATOMIC_TYPES = frozenset(
+    (
+        type(None),
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        range,
+        Decimal,
+        Fraction,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        datetime.timedelta,
+        datetime.timezone,
+    )
+)
+
+
 class BasePersistence(Generic[UD, CD, BD], ABC):
     """Interface class for adding persistence to your bot.
     Subclass this object for different implementations of a persistent bot.
@@ -86,7 +127,9 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
         insert the bot set with :meth:`set_bot` upon loading of the data. This is to ensure that
         changes to the bot apply to the saved objects, too. If you change the bots token, this may
         lead to e.g. ``Chat not found`` errors. For the limitations on replacing bots see
-        :meth:`replace_bot` and :meth:`insert_bot`.
+        :meth:`replace_bot` and :meth:`insert_bot`. Classes whose instances never contain a bot
+        can set the class attribute ``__ptb_no_bot__ = True``, such that their instances are
+        stored as they are without being copied and searched for bots.
 
     Note:
          :meth:`replace_bot` and :meth:`insert_bot` are used *independently* of the implementation
@@ -112,6 +155,10 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
         '__dict__',  # __dict__ is included because we replace methods in the __new__
     )
 
+    # Cache the types whose instances replace_bot and insert_bot can and can't skip, respectively
+    _no_bot_types: ClassVar[Set[type]] = set()
+    _bot_types: ClassVar[Set[type]] = set()
+
     def __new__(
         cls, *args: object, **kwargs: object  # pylint: disable=unused-argument
     ) -> 'BasePersistence':
@@ -200,6 +247,18 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
         ``copy.copy``. If the parsing of an object fails, the object will be returned unchanged and
         the error will be logged.
 
+        Objects that can't be changed and never contain a bot, i.e. :obj:`None`, :obj:`bool`,
+        :obj:`int`, :obj:`float`, :obj:`complex`, :obj:`str`, :obj:`bytes`, :obj:`range`,
+        :class:`decimal.Decimal`, :class:`fractions.Fraction`, the types of :mod:`datetime` and
+        :class:`enum.Enum` members, are returned as they are. The same holds for ``tuple`` and
+        ``frozenset`` objects that only contain such objects, while ``list``, ``set`` and ``dict``
+        objects that only contain such objects are copied without inspecting their items.
+        Instances of classes with the class attribute ``__ptb_no_bot__ = True`` are returned as
+        they are, too.
+
+        .. versionchanged:: 14.0
+            Skips objects that never contain a bot.
+
         Args:
             obj (:obj:`object`): The object
 
@@ -212,25 +271,47 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
     def _replace_bot(  # pylint: disable=too-many-return-statements
         cls, obj: object, memo: Dict[int, object]
     ) -> object:
+        if cls._is_no_bot_type(type(obj)):
+            return obj
         obj_id = id(obj)
         if obj_id in memo:
             return memo[obj_id]
 
-        if isinstance(obj, Bot):
-            memo[obj_id] = cls.REPLACED_BOT
-            return cls.REPLACED_BOT
         if isinstance(obj, (list, set)):
             # We copy the iterable here for thread safety, i.e. make sure the object we iterate
             # over doesn't change its length during the iteration
             temp_iterable = obj.copy()
-            new_iterable = obj.__class__(cls._replace_bot(item, memo) for item in temp_iterable)
+            if cls._all_contain_no_bot(temp_iterable):
+                new_iterable = cls._copy_iterable(obj, temp_iterable)
+            else:
+                no_bot_types = cls._no_bot_types
+                new_iterable = obj.__class__(
+                    item if type(item) in no_bot_types else cls._replace_bot(item, memo)
+                    for item in temp_iterable
+                )
             memo[obj_id] = new_iterable
             return new_iterable
         if isinstance(obj, (tuple, frozenset)):
             # tuples and frozensets are immutable so we don't need to worry about thread safety
-            new_immutable = obj.__class__(cls._replace_bot(item, memo) for item in obj)
+            if cls._all_contain_no_bot(obj):
+                memo[obj_id] = obj
+                return obj
+            no_bot_types = cls._no_bot_types
+            new_items = [
+                item if type(item) in no_bot_types else cls._replace_bot(item, memo)
+                for item in obj
+            ]
+            # Nested immutables without bots are returned as they are, too
+            if all(map(is_, new_items, obj)):
+                new_immutable = obj
+            else:
+                new_immutable = obj.__class__(new_items)
             memo[obj_id] = new_immutable
             return new_immutable
+        # Bots are checked after the containers, as isinstance checks against Bot are slower
+        if isinstance(obj, Bot):
+            memo[obj_id] = cls.REPLACED_BOT
+            return cls.REPLACED_BOT
         if isinstance(obj, type):
             # classes usually do have a __dict__, but it's not writable
             warn(
@@ -258,10 +339,17 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
             new_obj = cast(dict, new_obj)
             # We can't iterate over obj.items() due to thread safety, i.e. the dicts length may
             # change during the iteration
-            temp_dict = new_obj.copy()
-            new_obj.clear()
-            for k, val in temp_dict.items():
-                new_obj[cls._replace_bot(k, memo)] = cls._replace_bot(val, memo)
+            if not cls._all_contain_no_bot(new_obj):
+                temp_dict = new_obj.copy()
+                new_obj.clear()
+                for k, val in temp_dict.items():
+                    new_obj[cls._replace_bot(k, memo)] = cls._replace_bot(val, memo)
+            elif not cls._all_contain_no_bot(new_obj.values()):
+                # Only the values need to be replaced, which keeps the keys and their order
+                no_bot_types = cls._no_bot_types
+                for k, val in list(new_obj.items()):
+                    if type(val) not in no_bot_types:
+                        new_obj[k] = cls._replace_bot(val, memo)
             memo[obj_id] = new_obj
             return new_obj
         try:
@@ -294,6 +382,44 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
         memo[obj_id] = obj
         return obj
 
+    @classmethod
+    def _is_no_bot_type(cls, obj_type: type) -> bool:
+        # Whether instances of obj_type can be returned as they are by replace_bot and
+        # insert_bot, i.e. whether they can't be changed and never contain a bot. Strings equal to
+        # REPLACED_BOT are handled by insert_bot before
+        if obj_type in cls._no_bot_types:
+            return True
+        if obj_type in cls._bot_types:
+            return False
+        if (
+            obj_type in _ATOMIC_TYPES
+            or issubclass(obj_type, Enum)
+            or getattr(obj_type, '__ptb_no_bot__', False) is True
+        ):
+            cls._no_bot_types.add(obj_type)
+            return True
+        cls._bot_types.add(obj_type)
+        return False
+
+    @classmethod
+    def _all_contain_no_bot(cls, objs: Collection[object], replaced_bot: bool = False) -> bool:
+        # Checks the items of a container, which is much cheaper than traversing them one by one.
+        # Pass replaced_bot=True to also check for strings equal to REPLACED_BOT
+        if not cls._no_bot_types.issuperset(map(type, objs)) and not all(
+            map(cls._is_no_bot_type, map(type, objs))
+        ):
+            return False
+        # Only atomic objects are left, so comparing them is cheap
+        return not (replaced_bot and cls.REPLACED_BOT in objs)
+
+    @staticmethod
+    def _copy_iterable(obj: Iterable[object], temp_iterable: Iterable[object]) -> object:
+        # temp_iterable is a copy of obj made with obj.copy(), which is of type list or set also
+        # for subclasses
+        if type(obj) is type(temp_iterable):
+            return temp_iterable
+        return obj.__class__(temp_iterable)  # type: ignore[call-arg]
+
     def insert_bot(self, obj: object) -> object:
         """
         Replaces all instances of :attr:`REPLACED_BOT` that occur within the passed object with
@@ -303,6 +429,18 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
         ``copy.copy``. If the parsing of an object fails, the object will be returned unchanged and
         the error will be logged.
 
+        Objects that can't be changed and never contain a bot, i.e. :obj:`None`, :obj:`bool`,
+        :obj:`int`, :obj:`float`, :obj:`complex`, :obj:`str`, :obj:`bytes`, :obj:`range`,
+        :class:`decimal.Decimal`, :class:`fractions.Fraction`, the types of :mod:`datetime` and
+        :class:`enum.Enum` members, are returned as they are. The same holds for ``tuple`` and
+        ``frozenset`` objects that only contain such objects, while ``list``, ``set`` and ``dict``
+        objects that only contain such objects are copied without inspecting their items.
+        Instances of classes with the class attribute ``__ptb_no_bot__ = True`` are returned as
+        they are, too.
+
+        .. versionchanged:: 14.0
+            Skips objects that never contain a bot.
+
         Args:
             obj (:obj:`object`): The object
 
@@ -313,28 +451,53 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
 
     # pylint: disable=too-many-return-statements
     def _insert_bot(self, obj: object, memo: Dict[int, object]) -> object:
+        if isinstance(obj, str) and obj == self.REPLACED_BOT:
+            return self.bot
+        if self._is_no_bot_type(type(obj)):
+            return obj
         obj_id = id(obj)
         if obj_id in memo:
             return memo[obj_id]
 
-        if isinstance(obj, Bot):
-            memo[obj_id] = self.bot
-            return self.bot
-        if isinstance(obj, str) and obj == self.REPLACED_BOT:
-            memo[obj_id] = self.bot
-            return self.bot
         if isinstance(obj, (list, set)):
             # We copy the iterable here for thread safety, i.e. make sure the object we iterate
             # over doesn't change its length during the iteration
             temp_iterable = obj.copy()
-            new_iterable = obj.__class__(self._insert_bot(item, memo) for item in temp_iterable)
+            if self._all_contain_no_bot(temp_iterable, replaced_bot=True):
+                new_iterable = self._copy_iterable(obj, temp_iterable)
+            else:
+                no_bot_types = self._no_bot_types
+                new_iterable = obj.__class__(
+                    item
+                    if type(item) in no_bot_types and item != self.REPLACED_BOT
+                    else self._insert_bot(item, memo)
+                    for item in temp_iterable
+                )
             memo[obj_id] = new_iterable
             return new_iterable
         if isinstance(obj, (tuple, frozenset)):
             # tuples and frozensets are immutable so we don't need to worry about thread safety
-            new_immutable = obj.__class__(self._insert_bot(item, memo) for item in obj)
+            if self._all_contain_no_bot(obj, replaced_bot=True):
+                memo[obj_id] = obj
+                return obj
+            no_bot_types = self._no_bot_types
+            new_items = [
+                item
+                if type(item) in no_bot_types and item != self.REPLACED_BOT
+                else self._insert_bot(item, memo)
+                for item in obj
+            ]
+            # Nested immutables without bots are returned as they are, too
+            if all(map(is_, new_items, obj)):
+                new_immutable = obj
+            else:
+                new_immutable = obj.__class__(new_items)
             memo[obj_id] = new_immutable
             return new_immutable
+        # Bots are checked after the containers, as isinstance checks against Bot are slower
+        if isinstance(obj, Bot):
+            memo[obj_id] = self.bot
+            return self.bot
         if isinstance(obj, type):
             # classes usually do have a __dict__, but it's not writable
             warn(
@@ -361,10 +524,20 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
             new_obj = cast(dict, new_obj)
             # We can't iterate over obj.items() due to thread safety, i.e. the dicts length may
             # change during the iteration
-            temp_dict = new_obj.copy()
-            new_obj.clear()
-            for k, val in temp_dict.items():
-                new_obj[self._insert_bot(k, memo)] = self._insert_bot(val, memo)
+            if not self._all_contain_no_bot(new_obj, replaced_bot=True):
+                temp_dict = new_obj.copy()
+                new_obj.clear()
+                for k, val in temp_dict.items():
+                    new_obj[self._insert_bot(k, memo)] = self._insert_bot(val, memo)
+            elif not self._all_contain_no_bot(new_obj.values(), replaced_bot=True):
+                # Only the values need to be replaced, which keeps the keys and their order
+                no_bot_types = self._no_bot_types
+                for k, val in list(new_obj.items()):
+                    if type(val) not in no_bot_types or val == self.REPLACED_BOT:
+                        new_obj[k] = self._insert_bot(val, memo)
+            if isinstance(new_obj, TrackingDict):
+                # Loading the data is not a change
+                new_obj.mark_unchanged()
             memo[obj_id] = new_obj
             return new_obj
         try:
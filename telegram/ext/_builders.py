@@ -21,9 +21,9 @@
 # flake8: noqa: E501
 # pylint: disable=line-too-long
 """This module contains the Builder classes for the telegram.ext module."""
+import asyncio
 import logging
 from pathlib import Path
-from queue import Queue
 from threading import Event
 from typing import (
     TypeVar,
@@ -45,12 +45,13 @@ from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue, DEFAULT_FAL
 from telegram.ext import Dispatcher, JobQueue, Updater, ExtBot, ContextTypes, CallbackContext
 from telegram.request._httpxrequest import HTTPXRequest
 from telegram.ext._utils.types import CCT, UD, CD, BD, BT, JQ, PT
-from telegram.request import BaseRequest
+from telegram.request import BaseRequest, JSONCodec
 
 if TYPE_CHECKING:
     from telegram.ext import (
         Defaults,
         BasePersistence,
+        BaseRateLimiter,
     )
 
 # Type hinting is a bit complicated here because we try to get to a sane level of
@@ -108,11 +109,13 @@ _BOT_CHECKS = [
     ('dispatcher', 'Dispatcher instance'),
     ('request', 'Request instance'),
     ('request_kwargs', 'request_kwargs'),
+    ('json_codec', 'JSONCodec instance'),
     ('base_file_url', 'base_file_url'),
     ('base_url', 'base_url'),
     ('token', 'token'),
     ('defaults', 'Defaults instance'),
     ('arbitrary_callback_data', 'arbitrary_callback_data'),
+    ('rate_limiter', 'RateLimiter instance'),
     ('private_key', 'private_key'),
 ]
 
@@ -142,10 +145,12 @@ class _BaseBuilder(Generic[ODT, BT, CCT, UD, CD, BD, JQ, PT]):
         '_base_file_url',
         '_request_kwargs',
         '_request',
+        '_json_codec',
         '_private_key',
         '_private_key_password',
         '_defaults',
         '_arbitrary_callback_data',
+        '_rate_limiter',
         '_bot',
         '_update_queue',
         '_workers',
@@ -168,12 +173,14 @@ class _BaseBuilder(Generic[ODT, BT, CCT, UD, CD, BD, JQ, PT]):
         self._base_file_url: DVInput[str] = DefaultValue('https://api.telegram.org/file/bot')
         self._request_kwargs: DVInput[Dict[str, Any]] = DefaultValue({})
         self._request: ODVInput['BaseRequest'] = DEFAULT_NONE
+        self._json_codec: ODVInput['JSONCodec'] = DEFAULT_NONE
         self._private_key: ODVInput[bytes] = DEFAULT_NONE
         self._private_key_password: ODVInput[bytes] = DEFAULT_NONE
         self._defaults: ODVInput['Defaults'] = DEFAULT_NONE
         self._arbitrary_callback_data: DVInput[Union[bool, int]] = DEFAULT_FALSE
+        self._rate_limiter: ODVInput['BaseRateLimiter'] = DEFAULT_NONE
         self._bot: Bot = DEFAULT_NONE  # type: ignore[assignment]
-        self._update_queue: DVInput[Queue] = DefaultValue(Queue())
+        self._update_queue: DVInput[asyncio.Queue] = DefaultValue(asyncio.Queue())
         self._workers: DVInput[int] = DefaultValue(4)
         self._exception_event: DVInput[Event] = DefaultValue(Event())
         self._job_queue: ODVInput['JobQueue'] = DefaultValue(JobQueue())
@@ -224,6 +231,8 @@ class _BaseBuilder(Generic[ODT, BT, CCT, UD, CD, BD, JQ, PT]):
             defaults=DefaultValue.get_value(self._defaults),
             arbitrary_callback_data=DefaultValue.get_value(self._arbitrary_callback_data),
             request=request,
+            json_codec=DefaultValue.get_value(self._json_codec),
+            rate_limiter=DefaultValue.get_value(self._rate_limiter),
         )
 
     def _build_dispatcher(
@@ -362,6 +371,14 @@ class _BaseBuilder(Generic[ODT, BT, CCT, UD, CD, BD, JQ, PT]):
         self._request = request
         return self
 
+    def _set_json_codec(self: BuilderType, json_codec: JSONCodec) -> BuilderType:
+        if self._bot is not DEFAULT_NONE:
+            raise RuntimeError(_TWO_ARGS_REQ.format('json_codec', 'bot instance'))
+        if self._dispatcher_check:
+            raise RuntimeError(_TWO_ARGS_REQ.format('json_codec', 'Dispatcher instance'))
+        self._json_codec = json_codec
+        return self
+
     def _set_private_key(
         self: BuilderType,
         private_key: Union[bytes, FilePathInput],
@@ -402,6 +419,14 @@ class _BaseBuilder(Generic[ODT, BT, CCT, UD, CD, BD, JQ, PT]):
         self._arbitrary_callback_data = arbitrary_callback_data
         return self
 
+    def _set_rate_limiter(self: BuilderType, rate_limiter: 'BaseRateLimiter') -> BuilderType:
+        if self._bot is not DEFAULT_NONE:
+            raise RuntimeError(_TWO_ARGS_REQ.format('rate_limiter', 'bot instance'))
+        if self._dispatcher_check:
+            raise RuntimeError(_TWO_ARGS_REQ.format('rate_limiter', 'Dispatcher instance'))
+        self._rate_limiter = rate_limiter
+        return self
+
     def _set_bot(
         self: '_BaseBuilder[Dispatcher[BT, CCT, UD, CD, BD, JQ, PT], BT, CCT, UD, CD, BD, '
         'JQ, PT]',
@@ -417,7 +442,7 @@ class _BaseBuilder(Generic[ODT, BT, CCT, UD, CD, BD, JQ, PT]):
         self._bot = bot
         return self  # type: ignore[return-value]
 
-    def _set_update_queue(self: BuilderType, update_queue: Queue) -> BuilderType:
+    def _set_update_queue(self: BuilderType, update_queue: asyncio.Queue) -> BuilderType:
         if self._dispatcher_check:
             raise RuntimeError(_TWO_ARGS_REQ.format('update_queue', 'Dispatcher instance'))
         self._update_queue = update_queue
@@ -631,6 +656,22 @@ class DispatcherBuilder(_BaseBuilder[ODT, BT, CCT, UD, CD, BD, JQ, PT]):
         """
         return self._set_request(request)
 
+    def json_codec(self: BuilderType, json_codec: JSONCodec) -> BuilderType:
+        """Sets a :class:`telegram.request.JSONCodec` to be used for :attr:`telegram.ext.Dispatcher.bot`. If not
+        called, ``ujson`` will be used if installed and :mod:`json` otherwise.
+
+        .. seealso:: :attr:`telegram.Bot.json_codec`
+
+        .. versionadded:: 14.0
+
+        Args:
+            json_codec (:class:`telegram.request.JSONCodec`): The codec.
+
+        Returns:
+            :class:`DispatcherBuilder`: The same builder with the updated argument.
+        """
+        return self._set_json_codec(json_codec)
+
     def private_key(
         self: BuilderType,
         private_key: Union[bytes, FilePathInput],
@@ -690,6 +731,23 @@ class DispatcherBuilder(_BaseBuilder[ODT, BT, CCT, UD, CD, BD, JQ, PT]):
         """
         return self._set_arbitrary_callback_data(arbitrary_callback_data)
 
+    def rate_limiter(self: BuilderType, rate_limiter: 'BaseRateLimiter') -> BuilderType:
+        """Sets a :class:`telegram.ext.BaseRateLimiter` to be used for :attr:`telegram.ext.Dispatcher.bot`, e.g.
+        :class:`telegram.ext.RateLimiter`. If not called, the requests of the bot will not be
+        throttled.
+
+        .. seealso:: :attr:`telegram.ext.ExtBot.rate_limiter`
+
+        .. versionadded:: 14.0
+
+        Args:
+            rate_limiter (:class:`telegram.ext.BaseRateLimiter`): The rate limiter.
+
+        Returns:
+            :class:`DispatcherBuilder`: The same builder with the updated argument.
+        """
+        return self._set_rate_limiter(rate_limiter)
+
     def bot(
         self: 'DispatcherBuilder[Dispatcher[BT, CCT, UD, CD, BD, JQ, PT], BT, CCT, UD, CD, BD, '
         'JQ, PT]',
@@ -707,8 +765,8 @@ class DispatcherBuilder(_BaseBuilder[ODT, BT, CCT, UD, CD, BD, JQ, PT]):
         """
         return self._set_bot(bot)  # type: ignore[return-value]
 
-    def update_queue(self: BuilderType, update_queue: Queue) -> BuilderType:
-        """Sets a :class:`queue.Queue` instance to be used for
+    def update_queue(self: BuilderType, update_queue: asyncio.Queue) -> BuilderType:
+        """Sets a :class:`asyncio.Queue` instance to be used for
         :attr:`telegram.ext.Dispatcher.update_queue`, i.e. the queue that the dispatcher will fetch
         updates from. If not called, a queue will be instantiated.
 
@@ -716,7 +774,7 @@ class DispatcherBuilder(_BaseBuilder[ODT, BT, CCT, UD, CD, BD, JQ, PT]):
              :meth:`telegram.ext.UpdaterBuilder.update_queue`
 
         Args:
-            update_queue (:class:`queue.Queue`): The queue.
+            update_queue (:class:`asyncio.Queue`): The queue.
 
         Returns:
             :class:`DispatcherBuilder`: The same builder with the updated argument.
@@ -989,6 +1047,22 @@ class UpdaterBuilder(_BaseBuilder[ODT, BT, CCT, UD, CD, BD, JQ, PT]):
         """
         return self._set_request(request)
 
+    def json_codec(self: BuilderType, json_codec: JSONCodec) -> BuilderType:
+        """Sets a :class:`telegram.request.JSONCodec` to be used for :attr:`telegram.ext.Updater.bot`. If not
+        called, ``ujson`` will be used if installed and :mod:`json` otherwise.
+
+        .. seealso:: :attr:`telegram.Bot.json_codec`
+
+        .. versionadded:: 14.0
+
+        Args:
+            json_codec (:class:`telegram.request.JSONCodec`): The codec.
+
+        Returns:
+            :class:`UpdaterBuilder`: The same builder with the updated argument.
+        """
+        return self._set_json_codec(json_codec)
+
     def private_key(
         self: BuilderType,
         private_key: Union[bytes, FilePathInput],
@@ -1048,6 +1122,23 @@ class UpdaterBuilder(_BaseBuilder[ODT, BT, CCT, UD, CD, BD, JQ, PT]):
         """
         return self._set_arbitrary_callback_data(arbitrary_callback_data)
 
+    def rate_limiter(self: BuilderType, rate_limiter: 'BaseRateLimiter') -> BuilderType:
+        """Sets a :class:`telegram.ext.BaseRateLimiter` to be used for :attr:`telegram.ext.Updater.bot`, e.g.
+        :class:`telegram.ext.RateLimiter`. If not called, the requests of the bot will not be
+        throttled.
+
+        .. seealso:: :attr:`telegram.ext.ExtBot.rate_limiter`
+
+        .. versionadded:: 14.0
+
+        Args:
+            rate_limiter (:class:`telegram.ext.BaseRateLimiter`): The rate limiter.
+
+        Returns:
+            :class:`UpdaterBuilder`: The same builder with the updated argument.
+        """
+        return self._set_rate_limiter(rate_limiter)
+
     def bot(
         self: 'UpdaterBuilder[Dispatcher[BT, CCT, UD, CD, BD, JQ, PT], BT, CCT, UD, CD, BD, '
         'JQ, PT]',
@@ -1065,8 +1156,8 @@ class UpdaterBuilder(_BaseBuilder[ODT, BT, CCT, UD, CD, BD, JQ, PT]):
         """
         return self._set_bot(bot)  # type: ignore[return-value]
 
-    def update_queue(self: BuilderType, update_queue: Queue) -> BuilderType:
-        """Sets a :class:`queue.Queue` instance to be used for
+    def update_queue(self: BuilderType, update_queue: asyncio.Queue) -> BuilderType:
+        """Sets a :class:`asyncio.Queue` instance to be used for
         :attr:`telegram.ext.Updater.update_queue`, i.e. the queue that the fetched updates will
         be queued into. If not called, a queue will be instantiated.
         If :meth:`dispatcher` is not called, this queue will also be used for
@@ -1076,7 +1167,7 @@ class UpdaterBuilder(_BaseBuilder[ODT, BT, CCT, UD, CD, BD, JQ, PT]):
              :meth:`telegram.ext.DispatcherBuilder.update_queue`
 
         Args:
-            update_queue (:class:`queue.Queue`): The queue.
+            update_queue (:class:`asyncio.Queue`): The queue.
 
         Returns:
             :class:`UpdaterBuilder`: The same builder with the updated argument.
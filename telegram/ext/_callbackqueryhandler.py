@@ -28,6 +28,7 @@ from typing import (
     TypeVar,
     Union,
     cast,
+    FrozenSet,
 )
 
 from telegram import Update
@@ -117,6 +118,15 @@ class CallbackQueryHandler(Handler[Update, CCT]):
 
         self.pattern = pattern
 
+    @property
+    def update_types(self) -> FrozenSet[str]:
+        """FrozenSet[:obj:`str`]: ``{'callback_query'}``. See
+        :attr:`telegram.ext.Handler.update_types`.
+
+        .. versionadded:: 14.0
+        """
+        return frozenset((Update.CALLBACK_QUERY,))
+
     def check_update(self, update: object) -> Optional[Union[bool, object]]:
         """Determines whether an update should be passed to this handlers :attr:`callback`.
 
@@ -19,6 +19,8 @@
 """This module contains the ChatJoinRequestHandler class."""
 
 
+from typing import FrozenSet
+
 from telegram import Update
 
 from telegram.ext import Handler
@@ -54,6 +56,15 @@ class ChatJoinRequestHandler(Handler[Update, CCT]):
 
     __slots__ = ()
 
+    @property
+    def update_types(self) -> FrozenSet[str]:
+        """FrozenSet[:obj:`str`]: ``{'chat_join_request'}``. See
+        :attr:`telegram.ext.Handler.update_types`.
+
+        .. versionadded:: 14.0
+        """
+        return frozenset((Update.CHAT_JOIN_REQUEST,))
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handlers :attr:`callback`.
 
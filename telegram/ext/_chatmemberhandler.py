@@ -17,7 +17,7 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the ChatMemberHandler classes."""
-from typing import ClassVar, TypeVar, Union
+from typing import ClassVar, FrozenSet, TypeVar, Union
 
 from telegram import Update
 from telegram.ext import Handler
@@ -81,6 +81,19 @@ class ChatMemberHandler(Handler[Update, CCT]):
 
         self.chat_member_types = chat_member_types
 
+    @property
+    def update_types(self) -> FrozenSet[str]:
+        """FrozenSet[:obj:`str`]: ``{'my_chat_member'}``, ``{'chat_member'}`` or both, depending
+        on :attr:`chat_member_types`. See :attr:`telegram.ext.Handler.update_types`.
+
+        .. versionadded:: 14.0
+        """
+        if self.chat_member_types == self.ANY_CHAT_MEMBER:
+            return frozenset((Update.MY_CHAT_MEMBER, Update.CHAT_MEMBER))
+        if self.chat_member_types == self.CHAT_MEMBER:
+            return frozenset((Update.CHAT_MEMBER,))
+        return frozenset((Update.MY_CHAT_MEMBER,))
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handlers :attr:`callback`.
 
@@ -18,7 +18,17 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the ChosenInlineResultHandler class."""
 import re
-from typing import Optional, TypeVar, Union, Callable, TYPE_CHECKING, Pattern, Match, cast
+from typing import (
+    Optional,
+    TypeVar,
+    Union,
+    Callable,
+    TYPE_CHECKING,
+    Pattern,
+    Match,
+    cast,
+    FrozenSet,
+)
 
 from telegram import Update
 from telegram.ext import Handler
@@ -82,6 +92,15 @@ class ChosenInlineResultHandler(Handler[Update, CCT]):
 
         self.pattern = pattern
 
+    @property
+    def update_types(self) -> FrozenSet[str]:
+        """FrozenSet[:obj:`str`]: ``{'chosen_inline_result'}``. See
+        :attr:`telegram.ext.Handler.update_types`.
+
+        .. versionadded:: 14.0
+        """
+        return frozenset((Update.CHOSEN_INLINE_RESULT,))
+
     def check_update(self, update: object) -> Optional[Union[bool, object]]:
         """Determines whether an update should be passed to this handlers :attr:`callback`.
 
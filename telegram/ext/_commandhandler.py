@@ -18,10 +18,24 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the CommandHandler and PrefixHandler classes."""
 import re
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, TypeVar, Union
-
-from telegram import MessageEntity, Update
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from telegram import Message, MessageEntity, Update
 from telegram.ext import filters as filters_module, Handler
+from telegram.ext._handler import MESSAGE_UPDATE_TYPES
 from telegram._utils.types import SLT
 from telegram._utils.defaultvalue import DefaultValue, DEFAULT_FALSE
 from telegram.ext._utils.types import CCT, HandlerCallback
@@ -31,6 +45,71 @@ if TYPE_CHECKING:
 
 RT = TypeVar('RT')
 
+_ParsedCommand = Optional[Tuple[str, Tuple[str, ...]]]
+
+
+def _cached_parse(
+    message: Message, kind: str, key: object, parser: Callable[[Message], _ParsedCommand]
+) -> _ParsedCommand:
+    """Parses the message with the parser, unless the result for this kind of command is already
+    cached on the message. All handlers checking the same update (and the CommandRouter) share the
+    result instead of parsing the text again. ``key`` holds everything the parser reads, such
+    that the message is parsed again, if e.g. a handler changed its text.
+    """
+    # pylint: disable=protected-access
+    cache = message._parsed_commands
+    if cache is None:
+        cache = message._parsed_commands = {}
+    else:
+        cached = cache.get(kind)
+        # Comparing the text is cheap, as it's usually the very same string object
+        if cached is not None and cached[0] == key:
+            return cached[1]
+    result = parser(message)
+    cache[kind] = (key, result)
+    return result
+
+
+def _parse_command_uncached(message: Message) -> _ParsedCommand:
+    text = cast(str, message.text)
+    username = message.get_bot().username
+    command_parts = text[1 : message.entities[0].length].split('@')
+    command_parts.append(username)
+    if command_parts[1].lower() == username.lower():
+        return command_parts[0].lower(), tuple(text.split()[1:])
+    return None
+
+
+def _parse_command(message: Message) -> _ParsedCommand:
+    """Parses the bot command at the start of the message text. Returns the lower cased command
+    and the arguments, or :obj:`None` if the message doesn't start with a command or the command
+    is directed at another bot.
+    """
+    if (
+        message.entities
+        and message.entities[0].type == MessageEntity.BOT_COMMAND
+        and message.entities[0].offset == 0
+        and message.text
+        and message.get_bot()
+    ):
+        key = (message.text, message.entities[0].length, message.get_bot().username)
+        return _cached_parse(message, 'command', key, _parse_command_uncached)
+    return None
+
+
+def _parse_prefix_command_uncached(message: Message) -> _ParsedCommand:
+    text_list = message.text.split() if message.text else None
+    if text_list:
+        return text_list[0].lower(), tuple(text_list[1:])
+    return None
+
+
+def _parse_prefix_command(message: Message) -> _ParsedCommand:
+    """Splits the message text into the lower cased first word and the remaining words. Returns
+    :obj:`None`, if the message has no text.
+    """
+    return _cached_parse(message, 'prefix', message.text, _parse_prefix_command_uncached)
+
 
 class CommandHandler(Handler[Update, CCT]):
     """Handler class to handle Telegram commands.
@@ -71,16 +150,17 @@ class CommandHandler(Handler[Update, CCT]):
         ValueError: when command is too long or has illegal chars.
 
     Attributes:
-        command (:obj:`str` | Tuple[:obj:`str`] | List[:obj:`str`]):
-            The command or list of commands this handler should listen for.
-            Limitations are the same as described here https://core.telegram.org/bots#commands
         callback (:obj:`callable`): The callback function for this handler.
         filters (:class:`telegram.ext.BaseFilter`): Optional. Only allow updates with these
             Filters.
         run_async (:obj:`bool`): Determines whether the callback will run asynchronously.
     """
 
-    __slots__ = ('command', 'filters')
+    __slots__ = ('_command', 'filters')
+
+    # Increased whenever the commands of any CommandHandler or PrefixHandler are set, such that
+    # CommandRouter knows when to look up the commands again
+    _command_changes: ClassVar[int] = 0
 
     def __init__(
         self,
@@ -91,15 +171,46 @@ class CommandHandler(Handler[Update, CCT]):
     ):
         super().__init__(callback, run_async=run_async)
 
+        self.command = command  # type: ignore[assignment]
+        self.filters = filters if filters is not None else filters_module.UpdateType.MESSAGES
+
+    @property
+    def command(self) -> List[str]:
+        """
+        The list of commands this handler should listen for. Limitations are the same as
+        described here https://core.telegram.org/bots#commands
+
+        .. versionchanged:: 14.0
+            Setting a single command is converted to a list and the commands are validated. The
+            list should be replaced rather than modified in place, as modifications are not
+            picked up by the :class:`telegram.ext.Dispatcher`.
+
+        Returns:
+            List[:obj:`str`]
+        """
+        return self._command
+
+    @command.setter
+    def command(self, command: SLT[str]) -> None:
         if isinstance(command, str):
-            self.command = [command.lower()]
+            commands = [command.lower()]
         else:
-            self.command = [x.lower() for x in command]
-        for comm in self.command:
+            commands = [x.lower() for x in command]
+        for comm in commands:
             if not re.match(r'^[\da-z_]{1,32}$', comm):
                 raise ValueError('Command is not a valid bot command')
+        self._command = commands
+        CommandHandler._command_changes += 1
 
-        self.filters = filters if filters is not None else filters_module.UpdateType.MESSAGES
+    @property
+    def update_types(self) -> FrozenSet[str]:
+        """FrozenSet[:obj:`str`]: The kinds of updates that contain a message, i.e.
+        ``{'message', 'edited_message', 'channel_post', 'edited_channel_post'}``. See
+        :attr:`telegram.ext.Handler.update_types`.
+
+        .. versionadded:: 14.0
+        """
+        return MESSAGE_UPDATE_TYPES
 
     def check_update(
         self, update: object
@@ -114,29 +225,15 @@ class CommandHandler(Handler[Update, CCT]):
 
         """
         if isinstance(update, Update) and update.effective_message:
-            message = update.effective_message
-
-            if (
-                message.entities
-                and message.entities[0].type == MessageEntity.BOT_COMMAND
-                and message.entities[0].offset == 0
-                and message.text
-                and message.get_bot()
-            ):
-                command = message.text[1 : message.entities[0].length]
-                args = message.text.split()[1:]
-                command_parts = command.split('@')
-                command_parts.append(message.get_bot().username)
-
-                if not (
-                    command_parts[0].lower() in self.command
-                    and command_parts[1].lower() == message.get_bot().username.lower()
-                ):
+            parsed = _parse_command(update.effective_message)
+            if parsed:
+                command, args = parsed
+                if command not in self.command:
                     return None
 
                 filter_result = self.filters.check_update(update)
                 if filter_result:
-                    return args, filter_result
+                    return list(args), filter_result
                 return False
         return None
 
@@ -223,8 +320,9 @@ class PrefixHandler(CommandHandler):
 
     """
 
-    # 'prefix' is a class property, & 'command' is included in the superclass, so they're left out.
-    __slots__ = ('_prefix', '_command', '_commands')
+    # 'prefix' & 'command' are class properties, & '_command' is included in the superclass, so
+    # they're left out.
+    __slots__ = ('_prefix', '_commands')
 
     def __init__(
         self,
@@ -288,6 +386,7 @@ class PrefixHandler(CommandHandler):
 
     def _build_commands(self) -> None:
         self._commands = [x.lower() + y.lower() for x in self.prefix for y in self.command]
+        CommandHandler._command_changes += 1  # pylint: disable=protected-access
 
     def check_update(
         self, update: object
@@ -302,14 +401,118 @@ class PrefixHandler(CommandHandler):
 
         """
         if isinstance(update, Update) and update.effective_message:
-            message = update.effective_message
-
-            if message.text:
-                text_list = message.text.split()
-                if text_list[0].lower() not in self._commands:
+            parsed = _parse_prefix_command(update.effective_message)
+            if parsed:
+                command, args = parsed
+                if command not in self._commands:
                     return None
                 filter_result = self.filters.check_update(update)
                 if filter_result:
-                    return text_list[1:], filter_result
+                    return list(args), filter_result
                 return False
         return None
+
+
+class CommandRouter:
+    """Routes message updates to the candidate handlers of one handler group of the
+    :class:`telegram.ext.Dispatcher`. :class:`CommandHandler` and :class:`PrefixHandler` instances
+    are looked up by the command of the message in a hash map, such that only handlers that are
+    listening for that command are checked. All other handlers are always candidates. The order
+    of the handlers is preserved.
+
+    Note:
+        The commands of the handlers are read again, whenever :attr:`CommandHandler.command`,
+        :attr:`PrefixHandler.command` or :attr:`PrefixHandler.prefix` of any handler is set.
+        Modifying these lists in place is not detected. Subclasses of :class:`CommandHandler` and
+        :class:`PrefixHandler` that override ``check_update`` are always candidates.
+
+    .. versionadded:: 14.0
+
+    Args:
+        handlers (List[:class:`telegram.ext.Handler`]): The handlers of the group.
+
+    Attributes:
+        handlers (List[:class:`telegram.ext.Handler`]): The handlers of the group.
+    """
+
+    __slots__ = ('handlers', '_commands', '_prefix_commands', '_candidates', '_command_changes')
+
+    def __init__(self, handlers: List[Handler]):
+        self.handlers = handlers
+        self._commands: Set[str] = set()
+        self._prefix_commands: Set[str] = set()
+        self._candidates: Dict[Tuple[Optional[str], Optional[str]], List[Handler]] = {}
+        self._command_changes = -1
+        self._read_commands()
+
+    def _read_commands(self) -> None:
+        self._command_changes = CommandHandler._command_changes  # pylint: disable=protected-access
+        self._commands.clear()
+        self._prefix_commands.clear()
+        self._candidates.clear()
+        for handler in self.handlers:
+            if self._is_command_handler(handler):
+                self._commands.update(handler.command)  # type: ignore[attr-defined]
+            elif self._is_prefix_handler(handler):
+                self._prefix_commands.update(handler._commands)  # type: ignore[attr-defined]
+
+    @staticmethod
+    def _is_command_handler(handler: Handler) -> bool:
+        return type(handler).check_update is CommandHandler.check_update
+
+    @staticmethod
+    def _is_prefix_handler(handler: Handler) -> bool:
+        return type(handler).check_update is PrefixHandler.check_update
+
+    @staticmethod
+    def is_routable(handler: Handler) -> bool:
+        """Whether the handler is looked up by its commands.
+
+        Args:
+            handler (:class:`telegram.ext.Handler`): The handler.
+        """
+        return CommandRouter._is_command_handler(handler) or CommandRouter._is_prefix_handler(
+            handler
+        )
+
+    def candidates(self, update: object) -> List[Handler]:
+        """Returns the handlers that may handle the update, in order.
+
+        Args:
+            update (:class:`telegram.Update` | :obj:`object`): The update.
+
+        Returns:
+            List[:class:`telegram.ext.Handler`]
+        """
+        # pylint: disable=protected-access
+        if self._command_changes != CommandHandler._command_changes:
+            self._read_commands()
+
+        message = update.effective_message if isinstance(update, Update) else None
+        command = prefix_command = None
+        if message:
+            parsed = _parse_command(message) if self._commands else None
+            if parsed and parsed[0] in self._commands:
+                command = parsed[0]
+            parsed = _parse_prefix_command(message) if self._prefix_commands else None
+            if parsed and parsed[0] in self._prefix_commands:
+                prefix_command = parsed[0]
+
+        # The number of keys is bounded by the number of commands of the handlers
+        key = (command, prefix_command)
+        candidates = self._candidates.get(key)
+        if candidates is None:
+            candidates = self._candidates[key] = [
+                handler
+                for handler in self.handlers
+                if not self.is_routable(handler)
+                or (
+                    self._is_command_handler(handler)
+                    and command in handler.command  # type: ignore[attr-defined]
+                )
+                or (
+                    self._is_prefix_handler(handler)
+                    and prefix_command in handler._commands  # type: ignore[attr-defined]
+                )
+            ]
+        return candidates
@@ -47,6 +47,10 @@ class ContextTypes(Generic[CCT, UD, CD, BD]):
             (error-)handler callbacks and job callbacks. Defaults to :obj:`dict`. Must support
             instantiating without arguments.
 
+    Tip:
+        Use :class:`telegram.ext.TrackingDict` for ``bot_data``, ``chat_data`` and ``user_data``
+        to write only the changed data to the persistence.
+
     """
 
     __slots__ = ('_context', '_bot_data', '_chat_data', '_user_data')
@@ -26,9 +26,11 @@ from threading import Lock
 from typing import (  # pylint: disable=unused-import  # for the "Any" import
     TYPE_CHECKING,
     Dict,
+    FrozenSet,
     List,
     NoReturn,
     Optional,
+    Set,
     Union,
     Tuple,
     cast,
@@ -49,6 +51,7 @@ from telegram.ext import (
     StringRegexHandler,
     TypeHandler,
 )
+from telegram.ext._trackingdict import TrackingDict
 from telegram._utils.warnings import warn
 from telegram.ext._utils.types import ConversationDict
 from telegram.ext._utils.types import CCT
@@ -172,7 +175,13 @@ class ConversationHandler(Handler[Update, CCT]):
         name (:obj:`str`, optional): The name for this conversationhandler. Required for
             persistence.
         persistent (:obj:`bool`, optional): If the conversations dict for this handler should be
-            saved. Name is required and persistence has to be set in :class:`telegram.ext.Updater`
+            saved. Name is required and persistence has to be set in :class:`telegram.ext.Updater`.
+            The changed conversations are written together with the other data in
+            :meth:`telegram.ext.Dispatcher.update_persistence`.
+
+            .. versionchanged:: 14.0
+                The conversations are written in the persistence thread of the
+                :class:`telegram.ext.Dispatcher` instead of on every state change.
         map_to_parent (Dict[:obj:`object`, :obj:`object`], optional): A :obj:`dict` that can be
             used to instruct a nested conversationhandler to transition into a mapped state on
             its parent conversationhandler in place of a specified nested state.
@@ -501,6 +510,9 @@ class ConversationHandler(Handler[Update, CCT]):
 
     @conversations.setter
     def conversations(self, value: ConversationDict) -> None:
+        if self.persistent and not isinstance(value, TrackingDict):
+            # The dispatcher writes the changed conversations to the persistence
+            value = TrackingDict(value)
         self._conversations = value
         # Set conversations for nested conversations
         for handlers in self.states.values():
@@ -567,6 +579,27 @@ class ConversationHandler(Handler[Update, CCT]):
                 )
                 self.logger.exception("%s", exc)
 
+    @property
+    def update_types(self) -> Optional[FrozenSet[str]]:
+        """Optional[FrozenSet[:obj:`str`]]: The union of the kinds of updates handled by the
+        handlers in :attr:`entry_points`, :attr:`states` and :attr:`fallbacks`, excluding channel
+        posts. :obj:`None`, if any of those handlers may handle any kind of update. See
+        :attr:`telegram.ext.Handler.update_types`.
+
+        .. versionadded:: 14.0
+        """
+        update_types: Set[str] = set()
+        handlers = self.entry_points + self.fallbacks
+        for state_handlers in self.states.values():
+            handlers += state_handlers
+        for handler in handlers:
+            if handler.update_types is None:
+                return None
+            update_types.update(handler.update_types)
+        # Channel posts are never handled by a ConversationHandler
+        update_types.difference_update((Update.CHANNEL_POST, Update.EDITED_CHANNEL_POST))
+        return frozenset(update_types)
+
     # pylint: disable=too-many-return-statements
     def check_update(self, update: object) -> CheckUpdateType:
         """
@@ -729,16 +762,10 @@ class ConversationHandler(Handler[Update, CCT]):
                 if key in self.conversations:
                     # If there is no key in conversations, nothing is done.
                     del self.conversations[key]
-                    if self.persistent and self.persistence and self.name:
-                        self.persistence.update_conversation(self.name, key, None)
 
         elif isinstance(new_state, Promise):
             with self._conversations_lock:
                 self.conversations[key] = (self.conversations.get(key), new_state)
-                if self.persistent and self.persistence and self.name:
-                    self.persistence.update_conversation(
-                        self.name, key, (self.conversations.get(key), new_state)
-                    )
 
         elif new_state is not None:
             if new_state not in self.states:
@@ -748,8 +775,6 @@ class ConversationHandler(Handler[Update, CCT]):
                 )
             with self._conversations_lock:
                 self.conversations[key] = new_state
-                if self.persistent and self.persistence and self.name:
-                    self.persistence.update_conversation(self.name, key, new_state)
 
     def _trigger_timeout(self, context: CallbackContext) -> None:
         self.logger.debug('conversation timeout was triggered!')
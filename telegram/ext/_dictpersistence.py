@@ -22,14 +22,10 @@ from typing import DefaultDict, Dict, Optional, Tuple, cast
 from collections import defaultdict
 
 from telegram.ext import BasePersistence, PersistenceInput
+from telegram._utils.jsoncodec import DEFAULT_JSON_CODEC
 from telegram._utils.types import JSONDict
 from telegram.ext._utils.types import ConversationDict, CDCData
 
-try:
-    import ujson as json
-except ImportError:
-    import json  # type: ignore[no-redef]
-
 
 class DictPersistence(BasePersistence):
     """Using Python's :obj:`dict` and ``json`` for making your bot persistent.
@@ -121,7 +117,7 @@ class DictPersistence(BasePersistence):
                 raise TypeError("Unable to deserialize chat_data_json. Not valid JSON") from exc
         if bot_data_json:
             try:
-                self._bot_data = json.loads(bot_data_json)
+                self._bot_data = DEFAULT_JSON_CODEC.loads(bot_data_json)
                 self._bot_data_json = bot_data_json
             except (ValueError, AttributeError) as exc:
                 raise TypeError("Unable to deserialize bot_data_json. Not valid JSON") from exc
@@ -129,7 +125,7 @@ class DictPersistence(BasePersistence):
                 raise TypeError("bot_data_json must be serialized dict")
         if callback_data_json:
             try:
-                data = json.loads(callback_data_json)
+                data = DEFAULT_JSON_CODEC.loads(callback_data_json)
             except (ValueError, AttributeError) as exc:
                 raise TypeError(
                     "Unable to deserialize callback_data_json. Not valid JSON"
@@ -175,7 +171,7 @@ class DictPersistence(BasePersistence):
         """:obj:`str`: The user_data serialized as a JSON-string."""
         if self._user_data_json:
             return self._user_data_json
-        return json.dumps(self.user_data)
+        return DEFAULT_JSON_CODEC.dumps(self.user_data)
 
     @property
     def chat_data(self) -> Optional[DefaultDict[int, Dict]]:
@@ -187,7 +183,7 @@ class DictPersistence(BasePersistence):
         """:obj:`str`: The chat_data serialized as a JSON-string."""
         if self._chat_data_json:
             return self._chat_data_json
-        return json.dumps(self.chat_data)
+        return DEFAULT_JSON_CODEC.dumps(self.chat_data)
 
     @property
     def bot_data(self) -> Optional[Dict]:
@@ -199,7 +195,7 @@ class DictPersistence(BasePersistence):
         """:obj:`str`: The bot_data serialized as a JSON-string."""
         if self._bot_data_json:
             return self._bot_data_json
-        return json.dumps(self.bot_data)
+        return DEFAULT_JSON_CODEC.dumps(self.bot_data)
 
     @property
     def callback_data(self) -> Optional[CDCData]:
@@ -218,7 +214,7 @@ class DictPersistence(BasePersistence):
         """
         if self._callback_data_json:
             return self._callback_data_json
-        return json.dumps(self.callback_data)
+        return DEFAULT_JSON_CODEC.dumps(self.callback_data)
 
     @property
     def conversations(self) -> Optional[Dict[str, ConversationDict]]:
@@ -404,8 +400,8 @@ class DictPersistence(BasePersistence):
         for handler, states in conversations.items():
             tmp[handler] = {}
             for key, state in states.items():
-                tmp[handler][json.dumps(key)] = state
-        return json.dumps(tmp)
+                tmp[handler][DEFAULT_JSON_CODEC.dumps(key)] = state
+        return DEFAULT_JSON_CODEC.dumps(tmp)
 
     @staticmethod
     def _decode_conversations_from_json(json_string: str) -> Dict[str, Dict[Tuple, object]]:
@@ -418,12 +414,12 @@ class DictPersistence(BasePersistence):
         Returns:
             :obj:`dict`: The conversations dict after decoding
         """
-        tmp = json.loads(json_string)
+        tmp = DEFAULT_JSON_CODEC.loads(json_string)
         conversations: Dict[str, Dict[Tuple, object]] = {}
         for handler, states in tmp.items():
             conversations[handler] = {}
             for key, state in states.items():
-                conversations[handler][tuple(json.loads(key))] = state
+                conversations[handler][tuple(DEFAULT_JSON_CODEC.loads(key))] = state
         return conversations
 
     @staticmethod
@@ -438,7 +434,7 @@ class DictPersistence(BasePersistence):
             :obj:`dict`: The user/chat_data defaultdict after decoding
         """
         tmp: DefaultDict[int, Dict[object, object]] = defaultdict(dict)
-        decoded_data = json.loads(data)
+        decoded_data = DEFAULT_JSON_CODEC.loads(data)
         for user, user_data in decoded_data.items():
             user = int(user)
             tmp[user] = {}
@@ -21,14 +21,20 @@ import asyncio
 import inspect
 import logging
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from threading import Event, Lock
+from threading import Event
 from typing import (
     Callable,
     DefaultDict,
     Dict,
+    FrozenSet,
+    Iterable,
     List,
     Optional,
+    Set,
+    Tuple,
     Union,
     Generic,
     TypeVar,
@@ -36,21 +42,28 @@ from typing import (
     Coroutine,
     Sequence,
     Any,
+    cast,
 )
 
 from telegram import Update
 from telegram.error import TelegramError
 from telegram.ext import BasePersistence, ContextTypes, ExtBot
-from telegram.ext._handler import Handler
+from telegram.ext._handler import Handler, MESSAGE_UPDATE_TYPES
+from telegram.ext._commandhandler import CommandRouter
+from telegram.ext._utils.regexset import PatternRouter
 from telegram.ext._callbackdatacache import CallbackDataCache
+from telegram.ext._trackingdict import TrackingDict
 from telegram._utils.defaultvalue import DefaultValue, DEFAULT_FALSE
 from telegram._utils.warnings import warn
 from telegram.ext._utils.types import CCT, UD, CD, BD, BT, JQ, PT, HandlerCallback
 from telegram.ext._utils.stack import was_called_by
+from telegram.ext._utils.filtercache import cache_filter_results
+from telegram.ext._utils.handlerdict import HandlerDict
 
 if TYPE_CHECKING:
     from telegram.ext._jobqueue import Job
     from telegram.ext._builders import InitDispatcherBuilder
+    from telegram.ext._conversationhandler import ConversationHandler
 
 DEFAULT_GROUP: int = 0
 
@@ -59,6 +72,10 @@ PooledRT = TypeVar('PooledRT')
 
 _logger = logging.getLogger(__name__)
 
+_STOP_SIGNAL = object()
+"""Put into :attr:`Dispatcher.update_queue` by :meth:`Dispatcher.stop` to signal the update
+fetcher that it should stop."""
+
 
 class DispatcherHandlerStop(Exception):
     """
@@ -114,7 +131,15 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
         persistence (:class:`telegram.ext.BasePersistence`): Optional. The persistence class to
             store data that should be persistent over restarts.
         handlers (Dict[:obj:`int`, List[:class:`telegram.ext.Handler`]]): A dictionary mapping each
-            handler group to the list of handlers registered to that group.
+            handler group to the list of handlers registered to that group. Please use
+            :meth:`add_handler` and :meth:`remove_handler` instead of modifying this directly.
+            Direct changes to the dict, to its lists or to :attr:`groups` are picked up before
+            the next update is processed. Note that lists set as values of the dict (and dicts
+            set as :attr:`handlers`) are *copied*, i.e. later changes of the list you passed are
+            not picked up. Change ``dispatcher.handlers[group]`` instead.
+
+            .. versionchanged:: 14.0
+                Lists and dicts set directly are copied.
 
             .. seealso::
                 :meth:`add_handler`
@@ -132,6 +157,18 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
 
             .. seealso::
                 :meth:`start`, :meth:`stop`
+        update_batch_size (:obj:`int`): The maximum number of updates that are fetched from
+            :attr:`update_queue` at once. The dispatcher waits until at least one update is
+            available and then takes up to this many updates that are already in the queue.
+            Defaults to ``1``.
+
+            .. versionadded:: 14.0
+        persistence_write_delay (:obj:`float`): The time in seconds that changes are collected
+            before they are written to :attr:`persistence`, see :meth:`update_persistence`.
+            Defaults to ``0``, i.e. the changes are written right away, but changes that happen
+            while a previous write is still running are collected.
+
+            .. versionadded:: 14.0
 
     """
 
@@ -145,19 +182,29 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
         'user_data',
         'chat_data',
         'bot_data',
-        '_update_persistence_lock',
+        '__persistence_executor',
+        '__persistence_task',
+        '__persistence_pending',
+        '__pending_user_ids',
+        '__pending_chat_ids',
+        '__persistent_conversation_handlers',
         'handlers',
         'groups',
+        '__handler_index',
+        '__indexed_handlers',
+        '__indexed_groups',
+        '__index_version',
         'error_handlers',
         'running',
         '__pool_semaphore',
         '__run_asyncio_task_counter',
         '__run_asyncio_task_condition',
         '__update_fetcher_task',
-        '__stop_event',
         'bot',
         'context_types',
         'process_asyncio',
+        'update_batch_size',
+        'persistence_write_delay',
     )
 
     def __init__(
@@ -185,6 +232,8 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
         self.workers = workers
         self.context_types = context_types
         self.process_asyncio = False
+        self.update_batch_size = 1
+        self.persistence_write_delay = 0.0
 
         if self.job_queue:
             self.job_queue.set_dispatcher(self)
@@ -199,12 +248,22 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
         self.chat_data: DefaultDict[int, CD] = defaultdict(self.context_types.chat_data)
         self.bot_data = self.context_types.bot_data()
         self.persistence: Optional[BasePersistence] = None
-        self._update_persistence_lock = Lock()
+        self.__persistence_executor: Optional[ThreadPoolExecutor] = None
+        self.__persistence_task: Optional[asyncio.Task] = None
+        self.__persistence_pending = False
+        self.__pending_user_ids: Set[int] = set()
+        self.__pending_chat_ids: Set[int] = set()
+        self.__persistent_conversation_handlers: List['ConversationHandler'] = []
         if persistence:
             if not isinstance(persistence, BasePersistence):
                 raise TypeError("persistence must be based on telegram.ext.BasePersistence")
 
             self.persistence = persistence
+            # Writing to the persistence may block, so it's done in a thread. A single thread
+            # makes sure that the writes happen in order.
+            self.__persistence_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='Dispatcher:persistence'
+            )
             # This raises an exception if persistence.store_data.callback_data is True
             # but self.bot is not an instance of ExtBot - so no need to check that later on
             self.persistence.set_bot(self.bot)
@@ -238,8 +297,18 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
         else:
             self.persistence = None
 
-        self.handlers: Dict[int, List[Handler]] = {}
+        # HandlerDict counts the changes, such that the index can be rebuilt lazily
+        self.handlers: Dict[int, List[Handler]] = HandlerDict()
         self.groups: List[int] = []
+        # Maps the kind of an update to the candidate handlers for each group, see
+        # __rebuild_handler_index. `None` is used for custom updates & updates of unknown kind
+        self.__handler_index: Dict[
+            Optional[str], List[Union[List[Handler], CommandRouter, PatternRouter]]
+        ] = {}
+        # The state of handlers and groups that the index was built for
+        self.__indexed_handlers: Optional[HandlerDict] = None
+        self.__indexed_groups: List[int] = []
+        self.__index_version = -1
         self.error_handlers: Dict[Callable, Union[bool, DefaultValue]] = {}
 
         # A number of low-level helpers for the internal logic
@@ -248,7 +317,6 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
         self.__update_fetcher_task: Optional[asyncio.Task] = None
         self.__run_asyncio_task_counter = 0
         self.__run_asyncio_task_condition = asyncio.Condition()
-        self.__stop_event = asyncio.Event()
 
     async def __increment_run_asyncio_task_counter(self) -> None:
         async with self.__run_asyncio_task_condition:
@@ -295,7 +363,7 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
         try:
             result = await func(*args, **kwargs)
 
-            self.update_persistence(update=update)
+            await self.update_persistence(update=update)
             return result
 
         except Exception as exception:
@@ -394,16 +462,17 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
     async def stop(self) -> None:
         """Stops the process after processing any pending updates or tasks created by
         :meth:`run_asyncio`. Also stops :attr:`job_queue`, if set.
-        Finally, calls :meth:`update_persistence` and :meth:`BasePersistence.flush` on
-        :attr:`persistence`, if set.
+        Finally, calls :meth:`update_persistence`, waits for all pending writes and calls
+        :meth:`BasePersistence.flush` on :attr:`persistence`, if set.
         """
         # Only relevant if the dispatcher is running
         if self.running:
 
-            # Stop listening for new updates and handle all pending ones
-            self.__stop_event.set()
-            await self.update_queue.join()
+            # Stop listening for new updates and handle all pending ones. Since the queue is
+            # FIFO, the fetcher will only see the stop signal after all pending updates
+            await self.update_queue.put(_STOP_SIGNAL)
             await self.__update_fetcher_task if self.__update_fetcher_task else None
+            await self.update_queue.join()
             _logger.debug("Dispatcher stopped fetching of updates.")
 
             # Wait for pending `run_asyncio` tasks
@@ -415,9 +484,13 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
             self.running = False
 
         # Things that need to be done even if `start()` was not called
-        self.update_persistence()
+        await self.update_persistence()
         if self.persistence:
-            self.persistence.flush()
+            if self.__persistence_task:
+                await self.__persistence_task
+            await asyncio.get_running_loop().run_in_executor(
+                self.__persistence_executor, self.persistence.flush
+            )
             _logger.debug('Updated and flushed persistence')
 
         if self.job_queue:
@@ -429,21 +502,33 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
         await self.bot.shutdown()
 
     async def _update_fetcher(self) -> None:
-        # Continuously fetch updates from the queue. Exit only if the queue is empty and the
-        # __stop_event has been set, otherwise keep fetching
+        # Continuously fetch updates from the queue. Waiting for the queue is done by awaiting
+        # `get`, so that an idle dispatcher doesn't consume CPU time. Exit only if the stop
+        # signal is fetched, which `stop` puts into the queue.
         while True:
-            try:
-                update = self.update_queue.get_nowait()
-                _logger.debug('Processing update %s', update)
+            updates = await self._fetch_updates()
+            for update in updates:
+                if update is _STOP_SIGNAL:
+                    _logger.debug('Stopping fetching updates')
+                    self.update_queue.task_done()
+                    return
 
+                _logger.debug('Processing update %s', update)
                 if self.process_asyncio:
                     asyncio.create_task(self.__process_update_wrapper(update))
                 else:
                     await self.__process_update_wrapper(update)
+
+    async def _fetch_updates(self) -> List[object]:
+        # Blocks until at least one update is available. Afterwards, drains up to
+        # `update_batch_size` updates that are ready without waiting for further ones
+        updates = [await self.update_queue.get()]
+        while len(updates) < self.update_batch_size and updates[-1] is not _STOP_SIGNAL:
+            try:
+                updates.append(self.update_queue.get_nowait())
             except asyncio.QueueEmpty:
-                if self.__stop_event.is_set():
-                    _logger.debug('Stopping fetching updates')
-                    return
+                break
+        return updates
 
     async def __process_update_wrapper(self, update: object) -> None:
         await self.process_update(update)
@@ -458,6 +543,10 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
             synchronous handlers are done. Each asynchronously running handler will trigger
             :meth:`update_persistence` on its own.
 
+        .. versionchanged:: 14.0
+            While the update is processed, the results of filters are cached, see
+            :class:`telegram.ext.filters.BaseFilter`.
+
         Args:
             update (:class:`telegram.Update` | :obj:`object` | \
                 :class:`telegram.error.TelegramError`):
@@ -466,7 +555,9 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
         """
         # Use the semaphore to throttle the number of tasks running in parallel
         async with self.__pool_semaphore:
-            return await self.__process_update(update)
+            # Filters shared by multiple handlers are evaluated only once per update
+            with cache_filter_results(update):
+                return await self.__process_update(update)
 
     async def __process_update(self, update: object) -> None:
         # An error happened while polling
@@ -478,9 +569,11 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
         handled = False
         sync_modes = []
 
-        for group in self.groups:
+        for candidates in self.__get_handler_index().get(self._get_update_type(update), []):
             try:
-                for handler in self.handlers[group]:
+                if not isinstance(candidates, list):
+                    candidates = candidates.candidates(update)
+                for handler in candidates:
                     check = handler.check_update(update)
                     if check is not None and check is not False:
                         if not context:
@@ -494,7 +587,7 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
             # Stop processing with any other handler.
             except DispatcherHandlerStop:
                 _logger.debug('Stopping further handlers due to DispatcherHandlerStop')
-                self.update_persistence(update=update)
+                await self.update_persistence(update=update)
                 break
 
             # Dispatch any error.
@@ -515,7 +608,7 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
                 handled_only_async = self.bot.defaults.run_async
             # If update was only handled by async handlers, we don't need to update here
             if not handled_only_async:
-                self.update_persistence(update=update)
+                await self.update_persistence(update=update)
 
     def add_handler(self, handler: Handler[UT, CCT], group: int = DEFAULT_GROUP) -> None:
         """Register a handler.
@@ -537,6 +630,14 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
             group will not be used. The order in which handlers were added to the group defines the
             priority.
 
+        Handlers that declare the kinds of updates they can handle via
+        :attr:`telegram.ext.Handler.update_types` are only checked for updates of those kinds.
+
+        .. versionchanged:: 14.0
+            The dispatcher keeps an index of the handlers by their
+            :attr:`telegram.ext.Handler.update_types`, which is rebuilt before the next update is
+            processed, whenever :attr:`handlers` or :attr:`groups` were changed.
+
         Args:
             handler (:class:`telegram.ext.Handler`): A Handler instance.
             group (:obj:`int`, optional): The group identifier. Default is 0.
@@ -566,6 +667,7 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
             handler.conversations = (  # type: ignore[attr-defined]
                 self.persistence.get_conversations(handler.name)  # type: ignore[attr-defined]
             )
+            self.__add_persistent_conversation_handler(handler)  # type: ignore[arg-type]
 
         if group not in self.handlers:
             self.handlers[group] = []
@@ -588,59 +690,277 @@ class Dispatcher(Generic[BT, CCT, UD, CD, BD, JQ, PT]):
                 del self.handlers[group]
                 self.groups.remove(group)
 
-    def update_persistence(self, update: object = None) -> None:
+    @staticmethod
+    def _get_update_type(update: object) -> Optional[str]:
+        """Returns the kind of the update, i.e. the first of :attr:`telegram.Update.ALL_TYPES`
+        that is set, or :obj:`None` for custom updates.
+        """
+        if isinstance(update, Update):
+            for update_type in Update.ALL_TYPES:
+                if getattr(update, update_type) is not None:
+                    return update_type
+        return None
+
+    def __get_handler_index(
+        self,
+    ) -> Dict[Optional[str], List[Union[List[Handler], CommandRouter, PatternRouter]]]:
+        handlers = self.handlers
+        if not isinstance(handlers, HandlerDict):
+            # handlers was replaced by a plain dict
+            handlers = self.handlers = HandlerDict(handlers)
+        if (
+            handlers is not self.__indexed_handlers
+            or handlers.version != self.__index_version
+            or self.groups != self.__indexed_groups
+        ):
+            self.__rebuild_handler_index()
+        return self.__handler_index
+
+    def __rebuild_handler_index(self) -> None:
+        # For each kind of update, we keep the handlers of each group that can possibly handle
+        # it, preserving the order of the groups and of the handlers within each group. Groups
+        # without candidates are left out entirely. For messages, CommandHandlers and
+        # PrefixHandlers are additionally looked up by command, see CommandRouter. Handlers with
+        # regex patterns are looked up by pattern, see PatternRouter.
+        index: Dict[Optional[str], List[Union[List[Handler], CommandRouter, PatternRouter]]] = {}
+        handlers = cast(HandlerDict, self.handlers)
+        self.__indexed_handlers = handlers
+        self.__index_version = handlers.version
+        self.__indexed_groups = list(self.groups)
+        handler_types = {
+            group: [(handler, handler.update_types) for handler in handlers.get(group, [])]
+            for group in self.groups
+        }
+        for update_type in [None, *Update.ALL_TYPES]:
+            index[update_type] = []
+            for group in self.groups:
+                candidates = [
+                    handler
+                    for handler, types in handler_types[group]
+                    if types is None or update_type in types
+                ]
+                router: Optional[Union[CommandRouter, PatternRouter]] = None
+                if update_type in MESSAGE_UPDATE_TYPES and any(
+                    CommandRouter.is_routable(handler) for handler in candidates
+                ):
+                    router = CommandRouter(candidates)
+                if any(PatternRouter.is_routable(handler) for handler in candidates):
+                    router = PatternRouter(candidates, source=router)
+                if router:
+                    index[update_type].append(router)
+                elif candidates:
+                    index[update_type].append(candidates)
+        self.__handler_index = index
+
+    async def update_persistence(self, update: object = None) -> None:
         """Update :attr:`user_data`, :attr:`chat_data` and :attr:`bot_data` in :attr:`persistence`.
 
+        The data is not written right away. Instead, the users and chats whose data needs to be
+        written are collected and a background task writes them by calling the methods of
+        :attr:`persistence` in a separate thread, such that slow writes don't block the event
+        loop. The data is copied with :meth:`BasePersistence.replace_bot` before it's passed to
+        the thread. The changed conversations of persistent
+        :class:`telegram.ext.ConversationHandler` instances are written in the same
+        thread. Changes of the same user or chat within :attr:`persistence_write_delay` seconds or
+        while a previous write is still running are written only once. Exceptions raised by
+        :attr:`persistence` are passed to the error handlers without an update. :meth:`stop`
+        waits for all pending writes. Data of type :class:`telegram.ext.TrackingDict` is only
+        written, if it was changed since the last write.
+
+        .. versionchanged:: 14.0
+            This method is now a coroutine and the data is written in the background.
+
         Args:
             update (:class:`telegram.Update`, optional): The update to process. If passed, only the
                 corresponding ``user_data`` and ``chat_data`` will be updated.
         """
-        with self._update_persistence_lock:
-            self.__update_persistence(update)
+        if not self.persistence:
+            return
 
-    def __update_persistence(self, update: object = None) -> None:
-        if self.persistence:
-            # We use list() here in order to decouple chat_ids from self.chat_data, as dict view
-            # objects will change, when the dict does and we want to loop over chat_ids
-            chat_ids = list(self.chat_data.keys())
-            user_ids = list(self.user_data.keys())
-
-            if isinstance(update, Update):
-                if update.effective_chat:
-                    chat_ids = [update.effective_chat.id]
-                else:
-                    chat_ids = []
-                if update.effective_user:
-                    user_ids = [update.effective_user.id]
-                else:
-                    user_ids = []
+        if isinstance(update, Update):
+            if update.effective_chat:
+                self.__pending_chat_ids.add(update.effective_chat.id)
+            if update.effective_user:
+                self.__pending_user_ids.add(update.effective_user.id)
+        else:
+            self.__pending_chat_ids.update(self.chat_data.keys())
+            self.__pending_user_ids.update(self.user_data.keys())
+        # bot_data and callback_data are written on every write
+        self.__persistence_pending = True
+
+        if self.__persistence_task is None or self.__persistence_task.done():
+            self.__persistence_task = asyncio.create_task(
+                self.__persistence_writer(), name='Dispatcher:persistence_writer'
+            )
 
-            if self.persistence.store_data.callback_data:
-                try:
-                    # Mypy doesn't know that persistence.set_bot (see above) already checks that
-                    # self.bot is an instance of ExtBot if callback_data should be stored ...
-                    self.persistence.update_callback_data(
-                        self.bot.callback_data_cache.persistence_data  # type: ignore[attr-defined]
+    async def __persistence_writer(self) -> None:
+        if self.persistence_write_delay:
+            await asyncio.sleep(self.persistence_write_delay)
+
+        loop = asyncio.get_running_loop()
+        while self.__persistence_pending and self.persistence:
+            writes = self.__collect_writes()
+            self.__pending_chat_ids.clear()
+            self.__pending_user_ids.clear()
+            self.__persistence_pending = False
+
+            errors = await loop.run_in_executor(
+                self.__persistence_executor, self.__write_persistence, writes
+            )
+            for error, restore in errors:
+                # The data is written again with the next write
+                restore()
+                await self.dispatch_error(None, error)
+
+    def __collect_writes(self) -> List[Tuple[Callable[[], None], Callable[[], None]]]:
+        # Collects the data on the event loop, such that only the writing happens in the thread.
+        # Changes that happen in the meantime are collected for the next write. The data is
+        # copied with replace_bot here, as handlers may change it while it's being written.
+        # Returns pairs of a function that writes the data and a function that marks the data
+        # as changed again, in case writing it fails.
+        persistence = cast(BasePersistence, self.persistence)
+        # The data is already copied, so the methods of the class are called instead of the
+        # wrappers that BasePersistence.__new__ sets on the instance
+        persistence_type = type(persistence)
+        store_data = persistence.store_data
+        writes: List[Tuple[Callable[[], None], Callable[[], None]]] = []
+
+        if store_data.callback_data:
+            # Mypy doesn't know that persistence.set_bot (see __init__) already checks that
+            # self.bot is an instance of ExtBot if callback_data should be stored ...
+            obj_data, queue = self.bot.callback_data_cache.persistence_data  # type: ignore
+            writes.append(
+                (
+                    partial(
+                        persistence_type.update_callback_data,
+                        persistence,
+                        (persistence.replace_bot(obj_data), queue),
+                    ),
+                    # callback_data is written on every write anyway
+                    lambda: None,
+                )
+            )
+        if store_data.bot_data:
+            changed_keys = self.__mark_unchanged(self.bot_data)
+            if changed_keys is not None:
+                writes.append(
+                    (
+                        partial(
+                            persistence_type.update_bot_data,
+                            persistence,
+                            persistence.replace_bot(self.bot_data),
+                        ),
+                        partial(self.__mark_changed, self.bot_data, changed_keys),
                     )
-                except Exception as exc:
-                    self.dispatch_error(update, exc)
-            if self.persistence.store_data.bot_data:
-                try:
-                    self.persistence.update_bot_data(self.bot_data)
-                except Exception as exc:
-                    self.dispatch_error(update, exc)
-            if self.persistence.store_data.chat_data:
-                for chat_id in chat_ids:
-                    try:
-                        self.persistence.update_chat_data(chat_id, self.chat_data[chat_id])
-                    except Exception as exc:
-                        self.dispatch_error(update, exc)
-            if self.persistence.store_data.user_data:
-                for user_id in user_ids:
-                    try:
-                        self.persistence.update_user_data(user_id, self.user_data[user_id])
-                    except Exception as exc:
-                        self.dispatch_error(update, exc)
+                )
+        for store, data_dict, pending_ids, update_data in (
+            (
+                store_data.chat_data,
+                self.chat_data,
+                self.__pending_chat_ids,
+                persistence_type.update_chat_data,
+            ),
+            (
+                store_data.user_data,
+                self.user_data,
+                self.__pending_user_ids,
+                persistence_type.update_user_data,
+            ),
+        ):
+            if not store:
+                continue
+            for id_ in pending_ids:
+                data = data_dict[id_]
+                changed_keys = self.__mark_unchanged(data)
+                if changed_keys is not None:
+                    writes.append(
+                        (
+                            partial(update_data, persistence, id_, persistence.replace_bot(data)),
+                            partial(self.__mark_changed, data, changed_keys, pending_ids, id_),
+                        )
+                    )
+
+        for handler in self.__persistent_conversation_handlers:
+            # Conversation timeouts change the conversations from other threads
+            with handler._conversations_lock:  # pylint: disable=protected-access
+                # Persistent conversation handlers keep their conversations in a TrackingDict
+                conversations = cast(TrackingDict, handler.conversations)
+                for key in conversations.changed_keys:
+                    writes.append(
+                        (
+                            # Ended conversations are deleted and passed as None
+                            partial(
+                                persistence.update_conversation,
+                                cast(str, handler.name),
+                                key,
+                                conversations.get(key),
+                            ),
+                            partial(self.__mark_conversation_changed, handler, key),
+                        )
+                    )
+                conversations.mark_unchanged()
+        return writes
+
+    @staticmethod
+    def __mark_unchanged(data: object) -> Optional[FrozenSet[object]]:
+        # Returns the keys that were changed or None, if the data doesn't have to be written.
+        # Only a TrackingDict knows whether it was changed, any other data is always written
+        if isinstance(data, TrackingDict):
+            changed_keys = data.changed_keys
+            if not changed_keys:
+                return None
+            data.mark_unchanged()
+            return changed_keys
+        return frozenset()
+
+    @staticmethod
+    def __mark_changed(
+        data: object,
+        changed_keys: FrozenSet[object],
+        pending_ids: Set[int] = None,
+        id_: int = None,
+    ) -> None:
+        if isinstance(data, TrackingDict):
+            data.mark_changed(*changed_keys)
+        if pending_ids is not None:
+            pending_ids.add(cast(int, id_))
+
+    @staticmethod
+    def __mark_conversation_changed(handler: 'ConversationHandler', key: Tuple[int, ...]) -> None:
+        with handler._conversations_lock:  # pylint: disable=protected-access
+            cast(TrackingDict, handler.conversations).mark_changed(key)
+
+    def __add_persistent_conversation_handler(self, handler: 'ConversationHandler') -> None:
+        # Registers the handler and its nested persistent conversation handlers, whose changed
+        # conversations are written by __persistence_writer
+        # pylint: disable=import-outside-toplevel
+        from telegram.ext._conversationhandler import ConversationHandler
+
+        if handler not in self.__persistent_conversation_handlers:
+            self.__persistent_conversation_handlers.append(handler)
+        for handlers in handler.states.values():
+            for nested_handler in handlers:
+                if (
+                    isinstance(nested_handler, ConversationHandler)
+                    and nested_handler.persistent
+                    and nested_handler.name
+                ):
+                    self.__add_persistent_conversation_handler(nested_handler)
+
+    @staticmethod
+    def __write_persistence(
+        writes: Iterable[Tuple[Callable[[], None], Callable[[], None]]]
+    ) -> List[Tuple[Exception, Callable[[], None]]]:
+        # Runs in the persistence thread, which is the only thread that calls the update_*
+        # methods of the persistence. Returns the raised exceptions together with the functions
+        # that mark the data as changed again, so that they can be handled on the event loop.
+        errors = []
+        for write, restore in writes:
+            try:
+                write()
+            except Exception as exc:
+                errors.append((exc, restore))
+        return errors
 
     def add_error_handler(
         self,
@@ -52,11 +52,11 @@ from telegram._utils.types import JSONDict, ODVInput, DVInput
 from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue
 from telegram._utils.datetime import to_timestamp
 from telegram.ext._callbackdatacache import CallbackDataCache
-from telegram.request import BaseRequest
+from telegram.request import BaseRequest, JSONCodec, PreparedRequest
 
 if TYPE_CHECKING:
     from telegram import InlineQueryResult, MessageEntity
-    from telegram.ext import Defaults
+    from telegram.ext import Defaults, BaseRateLimiter
 
 HandledTypes = TypeVar('HandledTypes', bound=Union[Message, CallbackQuery, Chat])
 
@@ -79,6 +79,10 @@ class ExtBot(Bot):
             allow arbitrary objects as callback data for :class:`telegram.InlineKeyboardButton`.
             Pass an integer to specify the maximum number of objects cached in memory. For more
             details, please see our `wiki <https://git.io/JGBDI>`_. Defaults to :obj:`False`.
+        rate_limiter (:class:`telegram.ext.BaseRateLimiter`, optional): A rate limiter that all
+            requests of this bot are passed through, e.g. :class:`telegram.ext.RateLimiter`.
+
+            .. versionadded:: 14.0
 
     Attributes:
         arbitrary_callback_data (:obj:`bool` | :obj:`int`): Whether this bot instance
@@ -89,7 +93,7 @@ class ExtBot(Bot):
 
     """
 
-    __slots__ = ('arbitrary_callback_data', 'callback_data_cache', '_defaults')
+    __slots__ = ('arbitrary_callback_data', 'callback_data_cache', '_defaults', '_rate_limiter')
 
     def __init__(
         self,
@@ -101,6 +105,8 @@ class ExtBot(Bot):
         private_key_password: bytes = None,
         defaults: 'Defaults' = None,
         arbitrary_callback_data: Union[bool, int] = False,
+        json_codec: JSONCodec = None,
+        rate_limiter: 'BaseRateLimiter' = None,
     ):
         super().__init__(
             token=token,
@@ -109,8 +115,10 @@ class ExtBot(Bot):
             request=request,
             private_key=private_key,
             private_key_password=private_key_password,
+            json_codec=json_codec,
         )
         self._defaults = defaults
+        self._rate_limiter = rate_limiter
 
         # set up callback_data
         if not isinstance(arbitrary_callback_data, bool):
@@ -127,6 +135,52 @@ class ExtBot(Bot):
         # This is a property because defaults shouldn't be changed at runtime
         return self._defaults
 
+    @property
+    def rate_limiter(self) -> Optional['BaseRateLimiter']:
+        """The :class:`telegram.ext.BaseRateLimiter` used by this bot, if any.
+
+        .. versionadded:: 14.0
+        """
+        return self._rate_limiter
+
+    async def initialize(self) -> None:
+        """See :meth:`telegram.Bot.initialize`. Also initializes :attr:`rate_limiter`, if set."""
+        if self._rate_limiter:
+            await self._rate_limiter.initialize()
+        await super().initialize()
+
+    async def shutdown(self) -> None:
+        """See :meth:`telegram.Bot.shutdown`. Also shuts down :attr:`rate_limiter`, if set."""
+        await super().shutdown()
+        if self._rate_limiter:
+            await self._rate_limiter.shutdown()
+
+    async def _do_post(
+        self,
+        endpoint: str,
+        data: JSONDict,
+        read_timeout: float = None,
+        write_timeout: float = None,
+        connect_timeout: float = None,
+        pool_timeout: float = None,
+    ) -> Union[bool, JSONDict, None]:
+        kwargs = {
+            'read_timeout': read_timeout,
+            'write_timeout': write_timeout,
+            'connect_timeout': connect_timeout,
+            'pool_timeout': pool_timeout,
+        }
+        if not self._rate_limiter:
+            return await super()._do_post(endpoint, data, **kwargs)
+
+        return await self._rate_limiter.process_request(
+            callback=super()._do_post,
+            args=(endpoint, data),
+            kwargs=kwargs,
+            endpoint=endpoint,
+            data=data,
+        )
+
     def _insert_defaults(self, data: Dict[str, object]) -> None:
         """Inserts the defaults values for optional kwargs for which tg.ext.Defaults provides
         convenience functionality, i.e. the kwargs with a tg.utils.helpers.DefaultValue default
@@ -432,6 +486,51 @@ class ExtBot(Bot):
         )
         return self._insert_callback_data(result)
 
+    def prepare_message(
+        self,
+        text: str,
+        parse_mode: ODVInput[str] = DEFAULT_NONE,
+        disable_web_page_preview: ODVInput[bool] = DEFAULT_NONE,
+        disable_notification: DVInput[bool] = DEFAULT_NONE,
+        reply_markup: ReplyMarkup = None,
+        allow_sending_without_reply: ODVInput[bool] = DEFAULT_NONE,
+        entities: Union[List['MessageEntity'], Tuple['MessageEntity', ...]] = None,
+        api_kwargs: JSONDict = None,
+    ) -> PreparedRequest:
+        # We override this method to call self._replace_keyboard
+        return super().prepare_message(
+            text=text,
+            parse_mode=parse_mode,
+            disable_web_page_preview=disable_web_page_preview,
+            disable_notification=disable_notification,
+            reply_markup=self._replace_keyboard(reply_markup),
+            allow_sending_without_reply=allow_sending_without_reply,
+            entities=entities,
+            api_kwargs=api_kwargs,
+        )
+
+    async def send_prepared(
+        self,
+        chat_id: Union[int, str],
+        prepared: PreparedRequest,
+        reply_to_message_id: int = None,
+        read_timeout: float = None,
+        write_timeout: float = None,
+        connect_timeout: float = None,
+        pool_timeout: float = None,
+    ) -> Message:
+        # We override this method to call self._insert_callback_data
+        result = await super().send_prepared(
+            chat_id=chat_id,
+            prepared=prepared,
+            reply_to_message_id=reply_to_message_id,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+        )
+        return self._insert_callback_data(result)
+
     # updated camelCase aliases
     getChat = get_chat
     """Alias for :meth:`get_chat`"""
@@ -441,3 +540,7 @@ class ExtBot(Bot):
     """Alias for :meth:`get_updates`"""
     stopPoll = stop_poll
     """Alias for :meth:`stop_poll`"""
+    prepareMessage = prepare_message
+    """Alias for :meth:`prepare_message`"""
+    sendPrepared = send_prepared
+    """Alias for :meth:`send_prepared`"""
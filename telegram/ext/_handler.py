@@ -19,8 +19,19 @@
 """This module contains the base class for handlers as used by the Dispatcher."""
 import asyncio
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union, Generic, cast, Coroutine
-
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    FrozenSet,
+    Optional,
+    TypeVar,
+    Union,
+    Generic,
+    cast,
+    Coroutine,
+)
+
+from telegram.constants import UpdateType
 from telegram._utils.asyncio import is_coroutine_function
 from telegram._utils.defaultvalue import DefaultValue, DEFAULT_FALSE
 from telegram._utils.warnings import warn
@@ -33,6 +44,17 @@ if TYPE_CHECKING:
 RT = TypeVar('RT')
 UT = TypeVar('UT')
 
+MESSAGE_UPDATE_TYPES: FrozenSet[str] = frozenset(
+    (
+        UpdateType.MESSAGE,
+        UpdateType.EDITED_MESSAGE,
+        UpdateType.CHANNEL_POST,
+        UpdateType.EDITED_CHANNEL_POST,
+    )
+)
+"""FrozenSet[:obj:`str`]: The kinds of updates that contain a :class:`telegram.Message`, i.e. the
+ones accepted by :meth:`telegram.ext.filters.BaseFilter.check_update`."""
+
 
 class Handler(Generic[UT, CCT], ABC):
     """The base class for all update handlers. Create custom handlers by inheriting from it.
@@ -76,6 +98,26 @@ class Handler(Generic[UT, CCT], ABC):
                 f'{self.callback.__qualname__} is not a coroutine function.'
             )
 
+    @property
+    def update_types(self) -> Optional[FrozenSet[str]]:
+        """Optional[FrozenSet[:obj:`str`]]: The kinds of updates (see
+        :attr:`telegram.Update.ALL_TYPES`) that this handler can possibly handle. The
+        :class:`telegram.ext.Dispatcher` uses this to skip handlers that could never handle an
+        incoming update, i.e. :meth:`check_update` will only be called for updates of one of
+        these kinds. :obj:`None` means that :meth:`check_update` is called for every update,
+        including custom updates that are not instances of :class:`telegram.Update`.
+
+        Defaults to :obj:`None`. Custom handlers that only handle specific kinds of updates may
+        override this to speed up the dispatching.
+
+        Note:
+            This is evaluated when the dispatcher rebuilds its index of the handlers, i.e. before
+            the first update after :attr:`telegram.ext.Dispatcher.handlers` was changed.
+
+        .. versionadded:: 14.0
+        """
+        return None
+
     @abstractmethod
     def check_update(self, update: object) -> Optional[Union[bool, object]]:
         """
@@ -27,6 +27,7 @@ from typing import (
     Union,
     cast,
     List,
+    FrozenSet,
 )
 
 from telegram import Update
@@ -100,6 +101,15 @@ class InlineQueryHandler(Handler[Update, CCT]):
         self.pattern = pattern
         self.chat_types = chat_types
 
+    @property
+    def update_types(self) -> FrozenSet[str]:
+        """FrozenSet[:obj:`str`]: ``{'inline_query'}``. See
+        :attr:`telegram.ext.Handler.update_types`.
+
+        .. versionadded:: 14.0
+        """
+        return frozenset((Update.INLINE_QUERY,))
+
     def check_update(self, update: object) -> Optional[Union[bool, Match]]:
         """
         Determines whether an update should be passed to this handlers :attr:`callback`.
@@ -525,7 +525,7 @@ class Job:
         except Exception as exc:
             await dispatcher.dispatch_error(None, exc, job=self)
         finally:
-            dispatcher.update_persistence(None)
+            await dispatcher.update_persistence(None)
 
     async def __call__(self, dispatcher: 'Dispatcher') -> None:
         """Shortcut for::
@@ -17,10 +17,11 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the MessageHandler class."""
-from typing import TYPE_CHECKING, Dict, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Dict, FrozenSet, Optional, TypeVar, Union
 
 from telegram import Update
 from telegram.ext import filters as filters_module, Handler
+from telegram.ext._handler import MESSAGE_UPDATE_TYPES
 from telegram._utils.defaultvalue import DefaultValue, DEFAULT_FALSE
 
 from telegram.ext._utils.types import CCT, HandlerCallback
@@ -79,18 +80,37 @@ class MessageHandler(Handler[Update, CCT]):
         super().__init__(callback, run_async=run_async)
         self.filters = filters if filters is not None else filters_module.ALL
 
+    @property
+    def update_types(self) -> FrozenSet[str]:
+        """FrozenSet[:obj:`str`]: The kinds of updates that contain a message, i.e.
+        ``{'message', 'edited_message', 'channel_post', 'edited_channel_post'}``. See
+        :attr:`telegram.ext.Handler.update_types`.
+
+        .. versionadded:: 14.0
+        """
+        return MESSAGE_UPDATE_TYPES
+
     def check_update(self, update: object) -> Optional[Union[bool, Dict[str, list]]]:
         """Determines whether an update should be passed to this handlers :attr:`callback`.
 
         Args:
             update (:class:`telegram.Update` | :obj:`object`): Incoming update.
 
+        .. versionchanged:: 14.0
+            Returns :obj:`False` instead of the result of :attr:`filters`, if that result is
+            falsy. Previously, a data filter that returned an empty :obj:`dict`, e.g. a
+            :class:`telegram.ext.filters.Regex` filter that didn't match, led to the update
+            being handled by this handler.
+
         Returns:
-            :obj:`bool`
+            :obj:`bool` | Dict[:obj:`str`, :obj:`list`]: The result of :attr:`filters`, if it is
+            truthy, :obj:`False` otherwise.
 
         """
         if isinstance(update, Update):
-            return self.filters.check_update(update)
+            # A falsy result like an empty dict returned by a data filter that didn't match must
+            # not count as handled, see Dispatcher.process_update
+            return self.filters.check_update(update) or False
         return None
 
     def collect_additional_context(
@@ -17,6 +17,8 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the PicklePersistence class."""
+import logging
+import os
 import pickle
 from collections import defaultdict
 from pathlib import Path
@@ -28,6 +30,7 @@ from typing import (
     overload,
     cast,
     DefaultDict,
+    BinaryIO,
 )
 
 from telegram._utils.types import FilePathInput
@@ -35,6 +38,12 @@ from telegram.ext import BasePersistence, PersistenceInput
 from telegram.ext._contexttypes import ContextTypes
 from telegram.ext._utils.types import UD, CD, BD, ConversationDict, CDCData
 
+_logger = logging.getLogger(__name__)
+
+# In append only mode, the log is compacted once the appended records take up more space than the
+# last snapshot, but not before they take up this many bytes
+_MIN_COMPACTION_SIZE = 1024 * 1024
+
 
 class PicklePersistence(BasePersistence[UD, CD, BD]):
     """Using python's builtin pickle for making your bot persistent.
@@ -53,6 +62,7 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         * The parameters and attributes ``store_*_data`` were replaced by :attr:`store_data`.
         * The parameter and attribute ``filename`` were replaced by :attr:`filepath`.
         * :attr:`filepath` now also accepts :obj:`pathlib.Path` as argument.
+        * Added the append only mode, see :paramref:`append_only`.
 
 
     Args:
@@ -74,6 +84,22 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             :class:`telegram.ext.ContextTypes` will be used.
 
             .. versionadded:: 13.6
+        append_only (:obj:`bool`, optional): When :obj:`True`, a change is saved by appending
+            only the changed entry, e.g. the ``user_data`` of one user, to the file instead of
+            pickling all the data again. This keeps the cost of saving a change independent of
+            the number of users and chats. Once the appended entries take up more space than
+            the rest of the file, the file is compacted, i.e. all the data is pickled to a new
+            file, which then atomically replaces the old one. :meth:`flush` compacts the file,
+            too. Loading the file replays the appended entries. If the bot crashed while writing
+            an entry, the incomplete entry is discarded. Requires :attr:`single_file` to be
+            :obj:`True`. Default is :obj:`False`.
+
+            Note:
+                Files written in this mode can only be read in this mode, unless :meth:`flush`
+                was called afterwards. Files written with ``append_only=False`` can be read in
+                this mode.
+
+            .. versionadded:: 14.0
 
     Attributes:
         filepath (:obj:`str` | :obj:`pathlib.Path`): The filepath for storing the pickle files.
@@ -91,6 +117,13 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             in the ``context`` interface.
 
             .. versionadded:: 13.6
+        append_only (:obj:`bool`): Whether changes are saved by appending them to the file.
+
+            .. versionadded:: 14.0
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`append_only` is :obj:`True`, but :paramref:`single_file`
+            is :obj:`False`.
     """
 
     __slots__ = (
@@ -103,6 +136,10 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         'callback_data',
         'conversations',
         'context_types',
+        'append_only',
+        '_log_file',
+        '_log_size',
+        '_snapshot_size',
     )
 
     @overload
@@ -112,6 +149,7 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         store_data: PersistenceInput = None,
         single_file: bool = True,
         on_flush: bool = False,
+        append_only: bool = False,
     ):
         ...
 
@@ -123,6 +161,7 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         single_file: bool = True,
         on_flush: bool = False,
         context_types: ContextTypes[Any, UD, CD, BD] = None,
+        append_only: bool = False,
     ):
         ...
 
@@ -133,7 +172,10 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         single_file: bool = True,
         on_flush: bool = False,
         context_types: ContextTypes[Any, UD, CD, BD] = None,
+        append_only: bool = False,
     ):
+        if append_only and not single_file:
+            raise ValueError('`append_only` requires `single_file` to be `True`.')
         super().__init__(store_data=store_data)
         self.filepath = Path(filepath)
         self.single_file = single_file
@@ -144,8 +186,16 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         self.callback_data: Optional[CDCData] = None
         self.conversations: Optional[Dict[str, Dict[Tuple, object]]] = None
         self.context_types = cast(ContextTypes[Any, UD, CD, BD], context_types or ContextTypes())
+        self.append_only = append_only
+        self._log_file: Optional[BinaryIO] = None
+        # The sizes in bytes of the snapshot at the start of the file and of the appended records
+        self._log_size = 0
+        self._snapshot_size = 0
 
     def _load_singlefile(self) -> None:
+        if self.append_only:
+            self._load_log()
+            return
         try:
             with self.filepath.open("rb") as file:
                 data = pickle.load(file)
@@ -167,6 +217,113 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         except Exception as exc:
             raise TypeError(f"Something went wrong unpickling {self.filepath.name}") from exc
 
+    def _load_log(self) -> None:
+        # The file starts with a snapshot of all data in the same format as `_dump_singlefile`,
+        # followed by pickled (kind, key, value) records, each describing a single change
+        self.user_data = defaultdict(self.context_types.user_data)
+        self.chat_data = defaultdict(self.context_types.chat_data)
+        self.bot_data = self.context_types.bot_data()
+        self.callback_data = None
+        self.conversations = {}
+        self._snapshot_size = self._log_size = 0
+        try:
+            file = self.filepath.open("rb")
+        except OSError:
+            return
+
+        with file:
+            size = os.fstat(file.fileno()).st_size
+            try:
+                data = pickle.load(file)
+            except pickle.UnpicklingError as exc:
+                raise TypeError(
+                    f"File {self.filepath.name} does not contain valid pickle data"
+                ) from exc
+            except Exception as exc:
+                raise TypeError(f"Something went wrong unpickling {self.filepath.name}") from exc
+            self.user_data.update(data.get('user_data') or {})
+            self.chat_data.update(data.get('chat_data') or {})
+            if data.get('bot_data') is not None:
+                self.bot_data = data['bot_data']
+            self.callback_data = data.get('callback_data')
+            self.conversations = data.get('conversations') or {}
+            valid_size = self._snapshot_size = file.tell()
+
+            while valid_size < size:
+                try:
+                    self._apply_record(*pickle.load(file))
+                except Exception:  # pylint: disable=broad-except
+                    _logger.warning(
+                        'Discarding the incomplete end of %s. This may be due to a crash while '
+                        'writing to it.',
+                        self.filepath.name,
+                        exc_info=True,
+                    )
+                    break
+                valid_size = file.tell()
+
+        # Make sure that the next record is not appended to an incomplete one
+        if valid_size < size:
+            os.truncate(self.filepath, valid_size)
+        self._log_size = valid_size - self._snapshot_size
+
+    def _apply_record(self, kind: str, key: Any, value: Any) -> None:
+        if kind == 'user_data':
+            self.user_data[key] = value  # type: ignore[index]
+        elif kind == 'chat_data':
+            self.chat_data[key] = value  # type: ignore[index]
+        elif kind == 'bot_data':
+            self.bot_data = value
+        elif kind == 'callback_data':
+            self.callback_data = value
+        elif kind == 'conversations':
+            name, conversation_key = key
+            self.conversations.setdefault(name, {})[conversation_key] = value  # type: ignore
+        else:
+            raise ValueError(f'Unknown record type {kind}')
+
+    def _append_record(self, kind: str, key: Any, value: Any) -> None:
+        if self._log_file is None:
+            if not self.filepath.exists():
+                # The log needs a snapshot to start with. This already includes the change.
+                self._compact()
+                return
+            self._log_file = self.filepath.open("ab")
+
+        record = pickle.dumps((kind, key, value))
+        self._log_file.write(record)
+        self._log_file.flush()
+        self._log_size += len(record)
+        if self._log_size > max(_MIN_COMPACTION_SIZE, self._snapshot_size):
+            self._compact()
+
+    def _compact(self) -> None:
+        # Write the snapshot to a temporary file first, so that a crash while writing it doesn't
+        # corrupt the file. Renaming it afterwards is atomic.
+        temp_path = self.filepath.with_name(f'{self.filepath.name}.tmp')
+        with temp_path.open("wb") as file:
+            pickle.dump(
+                {
+                    'conversations': self.conversations,
+                    'user_data': self.user_data,
+                    'chat_data': self.chat_data,
+                    'bot_data': self.bot_data,
+                    'callback_data': self.callback_data,
+                },
+                file,
+            )
+            file.flush()
+            os.fsync(file.fileno())
+            self._snapshot_size = file.tell()
+        self._close_log()
+        os.replace(temp_path, self.filepath)
+        self._log_size = 0
+
+    def _close_log(self) -> None:
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
     @staticmethod
     def _load_file(filepath: Path) -> Any:
         try:
@@ -313,7 +470,9 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             return
         self.conversations[name][key] = new_state
         if not self.on_flush:
-            if not self.single_file:
+            if self.append_only:
+                self._append_record('conversations', (name, key), new_state)
+            elif not self.single_file:
                 self._dump_file(Path(f"{self.filepath}_conversations"), self.conversations)
             else:
                 self._dump_singlefile()
@@ -332,7 +491,9 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             return
         self.user_data[user_id] = data
         if not self.on_flush:
-            if not self.single_file:
+            if self.append_only:
+                self._append_record('user_data', user_id, data)
+            elif not self.single_file:
                 self._dump_file(Path(f"{self.filepath}_user_data"), self.user_data)
             else:
                 self._dump_singlefile()
@@ -351,7 +512,9 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             return
         self.chat_data[chat_id] = data
         if not self.on_flush:
-            if not self.single_file:
+            if self.append_only:
+                self._append_record('chat_data', chat_id, data)
+            elif not self.single_file:
                 self._dump_file(Path(f"{self.filepath}_chat_data"), self.chat_data)
             else:
                 self._dump_singlefile()
@@ -367,7 +530,9 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             return
         self.bot_data = data
         if not self.on_flush:
-            if not self.single_file:
+            if self.append_only:
+                self._append_record('bot_data', None, self.bot_data)
+            elif not self.single_file:
                 self._dump_file(Path(f"{self.filepath}_bot_data"), self.bot_data)
             else:
                 self._dump_singlefile()
@@ -387,7 +552,9 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             return
         self.callback_data = (data[0], data[1].copy())
         if not self.on_flush:
-            if not self.single_file:
+            if self.append_only:
+                self._append_record('callback_data', None, self.callback_data)
+            elif not self.single_file:
                 self._dump_file(Path(f"{self.filepath}_callback_data"), self.callback_data)
             else:
                 self._dump_singlefile()
@@ -414,8 +581,19 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         """
 
     def flush(self) -> None:
-        """Will save all data in memory to pickle file(s)."""
-        if self.single_file:
+        """Will save all data in memory to pickle file(s). In append only mode, compacts the
+        file."""
+        if self.append_only:
+            if (
+                self.user_data
+                or self.chat_data
+                or self.bot_data
+                or self.callback_data
+                or self.conversations
+            ):
+                self._compact()
+            self._close_log()
+        elif self.single_file:
             if (
                 self.user_data
                 or self.chat_data
@@ -19,6 +19,8 @@
 """This module contains the PollAnswerHandler class."""
 
 
+from typing import FrozenSet
+
 from telegram import Update
 
 from telegram.ext import Handler
@@ -50,6 +52,15 @@ class PollAnswerHandler(Handler[Update, CCT]):
 
     __slots__ = ()
 
+    @property
+    def update_types(self) -> FrozenSet[str]:
+        """FrozenSet[:obj:`str`]: ``{'poll_answer'}``. See
+        :attr:`telegram.ext.Handler.update_types`.
+
+        .. versionadded:: 14.0
+        """
+        return frozenset((Update.POLL_ANSWER,))
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handlers :attr:`callback`.
 
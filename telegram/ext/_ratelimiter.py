@@ -0,0 +1,305 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the classes that limit the rate of the requests made by a bot."""
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Coroutine, Dict, Optional, Sequence, Union
+
+from telegram.error import RetryAfter
+from telegram._utils.types import JSONDict
+
+_logger = logging.getLogger(__name__)
+
+RLRT = Union[bool, JSONDict, None]
+
+
+class BaseRateLimiter(ABC):
+    """Interface class for rate limiters, which can be passed to :class:`telegram.ext.ExtBot`
+    to throttle the requests it makes to the Bot API.
+
+    All methods must be overridden by subclasses.
+
+    .. versionadded:: 14.0
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    async def initialize(self) -> None:
+        """Initialize resources used by this class. Called by
+        :meth:`telegram.ext.ExtBot.initialize`.
+        """
+
+    @abstractmethod
+    async def shutdown(self) -> None:
+        """Stop & clear resources used by this class. Called by
+        :meth:`telegram.ext.ExtBot.shutdown`.
+        """
+
+    @abstractmethod
+    async def process_request(
+        self,
+        callback: Callable[..., Coroutine[Any, Any, RLRT]],
+        args: Sequence[object],
+        kwargs: Dict[str, object],
+        endpoint: str,
+        data: JSONDict,
+    ) -> RLRT:
+        """Process a request. Must make the request by awaiting ``callback(*args, **kwargs)``,
+        e.g. after waiting until the request can be made without exceeding the rate limits, and
+        return its result. May retry the request, e.g. on :exc:`telegram.error.RetryAfter`.
+
+        Args:
+            callback (Callable[..., :term:`coroutine function`]): The coroutine function making
+                the request.
+            args (Sequence[:obj:`object`]): The positional arguments for :paramref:`callback`.
+            kwargs (Dict[:obj:`str`, :obj:`object`]): The keyword arguments for
+                :paramref:`callback`.
+            endpoint (:obj:`str`): The endpoint of the Bot API that is called, e.g.
+                ``'sendMessage'``.
+            data (Dict[:obj:`str`, :obj:`object`]): The parameters of the request. Must not be
+                modified.
+
+        Returns:
+            :obj:`bool` | Dict[:obj:`str`, :obj:`object`] | :obj:`None`: The result of
+            :paramref:`callback`.
+        """
+
+
+class _TokenBucket:
+    """A token bucket that holds up to ``max_rate`` tokens and is refilled with ``max_rate``
+    tokens per ``time_period``. Requests acquire the tokens in the order they arrive.
+    """
+
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated', 'paused_until', 'waiting', 'lock')
+
+    def __init__(self, max_rate: float, time_period: float, now: float):
+        self.rate = max_rate / time_period
+        self.capacity = max_rate
+        self.tokens = float(max_rate)
+        self.updated = now
+        self.paused_until = 0.0
+        self.waiting = 0
+        self.lock = asyncio.Lock()
+
+    def delay(self, now: float) -> float:
+        """Refills the bucket and returns the time until a token is available."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    async def acquire(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.waiting += 1
+        try:
+            async with self.lock:
+                delay = self.delay(loop.time())
+                while delay > 0:
+                    await asyncio.sleep(delay)
+                    delay = self.delay(loop.time())
+                self.tokens -= 1
+        finally:
+            self.waiting -= 1
+
+    def pause(self, seconds: float, now: float) -> None:
+        self.paused_until = max(self.paused_until, now + seconds)
+
+    def is_idle(self, now: float) -> bool:
+        """Whether the bucket is full and no one is waiting for it, i.e. whether it can be
+        discarded.
+        """
+        return not self.waiting and self.delay(now) == 0 and self.tokens >= self.capacity
+
+
+class RateLimiter(BaseRateLimiter):
+    """Rate limiter that enforces the flood limits of Telegram with token buckets:
+
+    * an overall limit for all requests of the bot
+    * a limit per group, supergroup or channel, applied to requests with a ``chat_id`` that is
+      negative or a username
+    * a limit per private chat, applied to requests with a positive ``chat_id``
+
+    Requests to the same chat are made in the order they were issued. If Telegram nevertheless
+    responds with :exc:`telegram.error.RetryAfter`, all further requests to the affected chat are
+    paused for :attr:`telegram.error.RetryAfter.retry_after` seconds. Requests to other chats are
+    not affected, unless the request had no ``chat_id``, in which case all requests are paused.
+
+    Note:
+        The limits published by Telegram are not exact and Telegram may apply additional
+        limits, so :exc:`telegram.error.RetryAfter` can not be ruled out.
+
+    .. seealso:: `Telegram Bots FAQ <https://core.telegram.org/bots/faq\
+        #my-bot-is-hitting-limits-how-do-i-avoid-this>`_
+
+    .. versionadded:: 14.0
+
+    Args:
+        overall_max_rate (:obj:`float`, optional): The maximum number of requests the bot may
+            make per :paramref:`overall_time_period`. Pass ``0`` to disable the limit. Defaults
+            to ``30``.
+        overall_time_period (:obj:`float`, optional): The time period in seconds for
+            :paramref:`overall_max_rate`. Defaults to ``1``.
+        group_max_rate (:obj:`float`, optional): The maximum number of requests the bot may make
+            per :paramref:`group_time_period` to a single group, supergroup or channel. Pass
+            ``0`` to disable the limit. Defaults to ``20``.
+        group_time_period (:obj:`float`, optional): The time period in seconds for
+            :paramref:`group_max_rate`. Defaults to ``60``.
+        private_max_rate (:obj:`float`, optional): The maximum number of requests the bot may
+            make per :paramref:`private_time_period` to a single private chat. Pass ``0`` to
+            disable the limit. Defaults to ``1``.
+        private_time_period (:obj:`float`, optional): The time period in seconds for
+            :paramref:`private_max_rate`. Defaults to ``1``.
+        max_retries (:obj:`int`, optional): How often a request is retried after
+            :exc:`telegram.error.RetryAfter` was raised. Defaults to ``0``, i.e. the exception is
+            re-raised right away.
+    """
+
+    __slots__ = (
+        '_overall_limit',
+        '_group_limit',
+        '_private_limit',
+        '_max_retries',
+        '_overall_bucket',
+        '_chat_buckets',
+        '_waiting',
+    )
+
+    _PURGE_THRESHOLD = 1000
+    """:obj:`int`: The number of chat buckets after which full ones are discarded"""
+
+    def __init__(
+        self,
+        overall_max_rate: float = 30,
+        overall_time_period: float = 1,
+        group_max_rate: float = 20,
+        group_time_period: float = 60,
+        private_max_rate: float = 1,
+        private_time_period: float = 1,
+        max_retries: int = 0,
+    ):
+        self._overall_limit = (overall_max_rate, overall_time_period)
+        self._group_limit = (group_max_rate, group_time_period)
+        self._private_limit = (private_max_rate, private_time_period)
+        self._max_retries = max_retries
+        self._overall_bucket: Optional[_TokenBucket] = None
+        self._chat_buckets: Dict[Union[int, str], _TokenBucket] = {}
+        self._waiting = 0
+
+    async def initialize(self) -> None:
+        """Does nothing. See :meth:`BaseRateLimiter.initialize`."""
+
+    async def shutdown(self) -> None:
+        """Discards the state of the limits. See :meth:`BaseRateLimiter.shutdown`."""
+        self._overall_bucket = None
+        self._chat_buckets.clear()
+
+    def queue_depth(self, chat_id: Union[int, str] = None) -> int:
+        """Gives the number of requests that are waiting until they can be made without exceeding
+        the rate limits.
+
+        Args:
+            chat_id (:obj:`int` | :obj:`str`, optional): Pass to get only the number of requests
+                to this chat.
+
+        Returns:
+            :obj:`int`: The number of waiting requests.
+        """
+        if chat_id is None:
+            return self._waiting
+        bucket = self._chat_buckets.get(chat_id)
+        return bucket.waiting if bucket else 0
+
+    def _get_overall_bucket(self, now: float) -> Optional[_TokenBucket]:
+        if self._overall_bucket is None and self._overall_limit[0] > 0:
+            self._overall_bucket = _TokenBucket(*self._overall_limit, now)
+        return self._overall_bucket
+
+    def _get_chat_bucket(self, chat_id: object, now: float) -> Optional[_TokenBucket]:
+        if not isinstance(chat_id, (int, str)):
+            return None
+
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            if isinstance(chat_id, str) or chat_id < 0:
+                max_rate, time_period = self._group_limit
+            else:
+                max_rate, time_period = self._private_limit
+            if max_rate <= 0:
+                return None
+
+            if len(self._chat_buckets) >= self._PURGE_THRESHOLD:
+                for key in [key for key, val in self._chat_buckets.items() if val.is_idle(now)]:
+                    del self._chat_buckets[key]
+            bucket = self._chat_buckets[chat_id] = _TokenBucket(max_rate, time_period, now)
+        return bucket
+
+    async def process_request(
+        self,
+        callback: Callable[..., Coroutine[Any, Any, RLRT]],
+        args: Sequence[object],
+        kwargs: Dict[str, object],
+        endpoint: str,
+        data: JSONDict,
+    ) -> RLRT:
+        """Waits until the request can be made without exceeding the rate limits, makes the
+        request and retries it on :exc:`telegram.error.RetryAfter` up to :paramref:`max_retries`
+        times. See :meth:`BaseRateLimiter.process_request`.
+        """
+        loop = asyncio.get_running_loop()
+        chat_id = data.get('chat_id')
+        if isinstance(chat_id, str) and chat_id.lstrip('-').isdigit():
+            chat_id = int(chat_id)
+        retries = 0
+
+        while True:
+            now = loop.time()
+            chat_bucket = self._get_chat_bucket(chat_id, now)
+            overall_bucket = self._get_overall_bucket(now)
+
+            self._waiting += 1
+            try:
+                if chat_bucket:
+                    await chat_bucket.acquire(loop)
+                if overall_bucket:
+                    await overall_bucket.acquire(loop)
+            finally:
+                self._waiting -= 1
+
+            try:
+                return await callback(*args, **kwargs)
+            except RetryAfter as exc:
+                # Pause only the chat the request was made to, if any
+                paused_bucket = chat_bucket or overall_bucket
+                if paused_bucket:
+                    paused_bucket.pause(exc.retry_after, loop.time())
+                if retries >= self._max_retries:
+                    raise
+                retries += 1
+                _logger.info(
+                    'Rate limit hit for %s (chat_id %s). Retrying after %s seconds.',
+                    endpoint,
+                    chat_id,
+                    exc.retry_after,
+                )
+                if not paused_bucket:
+                    await asyncio.sleep(exc.retry_after)
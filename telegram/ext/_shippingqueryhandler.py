@@ -19,6 +19,8 @@
 """This module contains the ShippingQueryHandler class."""
 
 
+from typing import FrozenSet
+
 from telegram import Update
 from telegram.ext import Handler
 from telegram.ext._utils.types import CCT
@@ -49,6 +51,15 @@ class ShippingQueryHandler(Handler[Update, CCT]):
 
     __slots__ = ()
 
+    @property
+    def update_types(self) -> FrozenSet[str]:
+        """FrozenSet[:obj:`str`]: ``{'shipping_query'}``. See
+        :attr:`telegram.ext.Handler.update_types`.
+
+        .. versionadded:: 14.0
+        """
+        return frozenset((Update.SHIPPING_QUERY,))
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handlers :attr:`callback`.
 
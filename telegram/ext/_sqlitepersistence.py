@@ -0,0 +1,410 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the SQLitePersistence class."""
+import json
+import pickle
+import sqlite3
+import time
+from collections import defaultdict
+from threading import Lock
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+    overload,
+)
+
+from telegram._utils.types import FilePathInput
+from telegram.ext import BasePersistence, PersistenceInput
+from telegram.ext._contexttypes import ContextTypes
+from telegram.ext._utils.types import UD, CD, BD, ConversationDict, CDCData
+
+_KT = TypeVar('_KT')
+_VT = TypeVar('_VT')
+
+_NOT_FOUND = object()
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS user_data (id INTEGER PRIMARY KEY, data BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS chat_data (id INTEGER PRIMARY KEY, data BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS bot_data (name TEXT PRIMARY KEY, data BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS conversations (
+    name TEXT NOT NULL, key TEXT NOT NULL, state BLOB NOT NULL, PRIMARY KEY (name, key)
+);
+'''
+
+
+def _encode_conversation_key(key: Tuple[int, ...]) -> str:
+    # The stored key must not depend on which JSON library is installed, so the standard library
+    # is used with a fixed format
+    return json.dumps(key, separators=(',', ':'))
+
+
+class _LazyDefaultDict(DefaultDict[_KT, _VT]):
+    """A :obj:`defaultdict`, which tries to load missing keys with ``load`` before falling back
+    to ``default_factory``. ``load`` returns ``_NOT_FOUND`` for unknown keys. Only item access
+    loads keys, i.e. ``in``, ``get``, ``len`` and iterating only take the loaded keys into
+    account."""
+
+    __slots__ = ('_load',)
+
+    def __init__(
+        self,
+        default_factory: Optional[Callable[[], _VT]],
+        load: Callable[[_KT], object],
+        data: Iterable[Tuple[_KT, _VT]] = (),
+    ):
+        super().__init__(default_factory, data)
+        self._load = load
+
+    def __missing__(self, key: _KT) -> _VT:
+        value = self._load(key)
+        if value is _NOT_FOUND:
+            return super().__missing__(key)
+        self[key] = cast(_VT, value)
+        return cast(_VT, value)
+
+    def copy(self) -> '_LazyDefaultDict[_KT, _VT]':
+        """Returns a shallow copy, which loads missing keys in the same way."""
+        return type(self)(self.default_factory, self._load, self.items())
+
+    __copy__ = copy
+
+    def __reduce__(self) -> Tuple:
+        # Pickled as plain defaultdict, as the loading can't be pickled
+        return defaultdict, (self.default_factory,), None, None, iter(self.items())
+
+
+class SQLitePersistence(BasePersistence[UD, CD, BD]):
+    """Using an SQLite database for making your bot persistent.
+
+    In contrast to :class:`telegram.ext.PicklePersistence`, the data of each user, chat and
+    conversation is stored in a row of its own. The ``user_data`` and ``chat_data`` are not loaded
+    at startup. Instead, :meth:`get_user_data` and :meth:`get_chat_data` return a
+    :obj:`defaultdict` that loads the data of a user or chat from the database when it is first
+    accessed, e.g. when a :class:`telegram.ext.CallbackContext` is created for an update of the
+    user. Hence, startup time and memory usage depend on the number of active users and chats
+    instead of all users and chats that the bot ever saw. Note that this :obj:`defaultdict`
+    loads missing keys only on item access, i.e. ``in``, ``get``, ``len`` and iteration take into
+    account only the data that was already loaded.
+
+    Changes are written in batches, each in a single transaction: Once :paramref:`batch_size`
+    changes are pending or the last write was more than :paramref:`flush_interval` seconds ago,
+    all pending changes are written. :meth:`flush` writes all pending changes. Several changes
+    of the same key are merged. The database uses SQLite's write-ahead log, so that reads are not
+    blocked by writes.
+
+    The data is pickled, so it has the same requirements and limitations as for
+    :class:`telegram.ext.PicklePersistence`.
+
+    .. versionadded:: 14.0
+
+    Warning:
+        :class:`SQLitePersistence` will try to replace :class:`telegram.Bot` instances by
+        :attr:`REPLACED_BOT` and insert the bot set with
+        :meth:`telegram.ext.BasePersistence.set_bot` upon loading of the data. This is to ensure
+        that changes to the bot apply to the saved objects, too. If you change the bots token, this
+        may lead to e.g. ``Chat not found`` errors. For the limitations on replacing bots see
+        :meth:`telegram.ext.BasePersistence.replace_bot` and
+        :meth:`telegram.ext.BasePersistence.insert_bot`.
+
+    Args:
+        filepath (:obj:`str` | :obj:`pathlib.Path`): The path of the database file. It is
+            created, if it doesn't exist.
+        store_data (:class:`PersistenceInput`, optional): Specifies which kinds of data will be
+            saved by this persistence instance. By default, all available kinds of data will be
+            saved.
+        batch_size (:obj:`int`, optional): The number of pending changes, that triggers a write.
+            Defaults to ``100``.
+        flush_interval (:obj:`float`, optional): The time in seconds after which pending changes
+            are written at the next change. Defaults to ``1``.
+        context_types (:class:`telegram.ext.ContextTypes`, optional): Pass an instance
+            of :class:`telegram.ext.ContextTypes` to customize the types used in the
+            ``context`` interface. If not passed, the defaults documented in
+            :class:`telegram.ext.ContextTypes` will be used.
+
+    Attributes:
+        filepath (:obj:`pathlib.Path`): The path of the database file.
+        store_data (:class:`PersistenceInput`): Specifies which kinds of data will be saved by this
+            persistence instance.
+        batch_size (:obj:`int`): The number of pending changes, that triggers a write.
+        flush_interval (:obj:`float`): The time in seconds after which pending changes are
+            written at the next change.
+        context_types (:class:`telegram.ext.ContextTypes`): Container for the types used
+            in the ``context`` interface.
+    """
+
+    __slots__ = (
+        'filepath',
+        'batch_size',
+        'flush_interval',
+        'context_types',
+        '_connection',
+        '_pending',
+        '_pending_count',
+        '_last_write',
+        '_lock',
+    )
+
+    @overload
+    def __init__(
+        self: 'SQLitePersistence[Dict, Dict, Dict]',
+        filepath: FilePathInput,
+        store_data: PersistenceInput = None,
+        batch_size: int = 100,
+        flush_interval: float = 1,
+    ):
+        ...
+
+    @overload
+    def __init__(
+        self: 'SQLitePersistence[UD, CD, BD]',
+        filepath: FilePathInput,
+        store_data: PersistenceInput = None,
+        batch_size: int = 100,
+        flush_interval: float = 1,
+        context_types: ContextTypes[Any, UD, CD, BD] = None,
+    ):
+        ...
+
+    def __init__(
+        self,
+        filepath: FilePathInput,
+        store_data: PersistenceInput = None,
+        batch_size: int = 100,
+        flush_interval: float = 1,
+        context_types: ContextTypes[Any, UD, CD, BD] = None,
+    ):
+        super().__init__(store_data=store_data)
+        self.filepath = Path(filepath)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.context_types = cast(ContextTypes[Any, UD, CD, BD], context_types or ContextTypes())
+
+        # The dispatcher writes to the persistence in a separate thread, while the data is
+        # loaded on the event loop. The lock serializes the usage of the connection.
+        self._connection = sqlite3.connect(self.filepath, check_same_thread=False)
+        self._lock = Lock()
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        # With WAL, this is still safe against corruption, but a power loss may lose the last
+        # transactions
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(_SCHEMA)
+        # Maps the table to the pending rows by primary key. For conversations, the key is a
+        # tuple of the handlers name and the JSON encoded conversation key
+        self._pending: Dict[str, Dict[Any, bytes]] = {
+            'user_data': {},
+            'chat_data': {},
+            'bot_data': {},
+            'conversations': {},
+        }
+        self._pending_count = 0
+        self._last_write = time.monotonic()
+
+    def _load(self, table: str, key: Any) -> object:
+        with self._lock:
+            data = self._pending[table].get(key)
+            if data is None:
+                column = 'name' if table == 'bot_data' else 'id'
+                row = self._connection.execute(
+                    f'SELECT data FROM {table} WHERE {column} = ?', (key,)  # nosec
+                ).fetchone()
+                if row is None:
+                    return _NOT_FOUND
+                data = row[0]
+        return self.insert_bot(pickle.loads(data))
+
+    def _store(self, table: str, key: Any, value: object) -> None:
+        data = pickle.dumps(value)
+        with self._lock:
+            pending = self._pending[table]
+            if key not in pending:
+                self._pending_count += 1
+            pending[key] = data
+            if (
+                self._pending_count >= self.batch_size
+                or time.monotonic() - self._last_write >= self.flush_interval
+            ):
+                self._write()
+
+    def _write(self) -> None:
+        # Must be called while holding the lock
+        with self._connection:
+            for table, column in (('user_data', 'id'), ('chat_data', 'id'), ('bot_data', 'name')):
+                self._connection.executemany(
+                    f'INSERT OR REPLACE INTO {table} ({column}, data) VALUES (?, ?)',  # nosec
+                    self._pending[table].items(),
+                )
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO conversations (name, key, state) VALUES (?, ?, ?)',
+                (
+                    (name, key, state)
+                    for (name, key), state in self._pending['conversations'].items()
+                ),
+            )
+        for pending in self._pending.values():
+            pending.clear()
+        self._pending_count = 0
+        self._last_write = time.monotonic()
+
+    def get_user_data(self) -> DefaultDict[int, UD]:
+        """Returns a :obj:`defaultdict`, which loads the ``user_data`` of a user from the
+        database, when it's accessed for the first time.
+
+        Returns:
+            DefaultDict[:obj:`int`, :obj:`dict` | :attr:`telegram.ext.ContextTypes.user_data`]:
+                The restored user data.
+        """
+        return _LazyDefaultDict(
+            self.context_types.user_data, lambda user_id: self._load('user_data', user_id)
+        )
+
+    def get_chat_data(self) -> DefaultDict[int, CD]:
+        """Returns a :obj:`defaultdict`, which loads the ``chat_data`` of a chat from the
+        database, when it's accessed for the first time.
+
+        Returns:
+            DefaultDict[:obj:`int`, :obj:`dict` | :attr:`telegram.ext.ContextTypes.chat_data`]:
+                The restored chat data.
+        """
+        return _LazyDefaultDict(
+            self.context_types.chat_data, lambda chat_id: self._load('chat_data', chat_id)
+        )
+
+    def get_bot_data(self) -> BD:
+        """Returns the bot_data from the database if it exists or an empty object of type
+        :obj:`dict` | :attr:`telegram.ext.ContextTypes.bot_data`.
+
+        Returns:
+            :obj:`dict` | :attr:`telegram.ext.ContextTypes.bot_data`: The restored bot data.
+        """
+        data = self._load('bot_data', 'bot_data')
+        if data is _NOT_FOUND:
+            return self.context_types.bot_data()
+        return cast(BD, data)
+
+    def get_callback_data(self) -> Optional[CDCData]:
+        """Returns the callback data from the database if it exists or :obj:`None`.
+
+        Returns:
+            Optional[Tuple[List[Tuple[:obj:`str`, :obj:`float`, \
+                Dict[:obj:`str`, :obj:`Any`]]], Dict[:obj:`str`, :obj:`str`]]:
+                The restored meta data or :obj:`None`, if no data was stored.
+        """
+        data = self._load('bot_data', 'callback_data')
+        if data is _NOT_FOUND:
+            return None
+        return cast(CDCData, data)
+
+    def get_conversations(self, name: str) -> ConversationDict:
+        """Returns the conversations of the given handler from the database.
+
+        Args:
+            name (:obj:`str`): The handlers name.
+
+        Returns:
+            :obj:`dict`: The restored conversations for the handler.
+        """
+        with self._lock:
+            self._write()
+            rows = self._connection.execute(
+                'SELECT key, state FROM conversations WHERE name = ?', (name,)
+            ).fetchall()
+        return {tuple(json.loads(key)): pickle.loads(state) for key, state in rows}
+
+    def update_conversation(
+        self, name: str, key: Tuple[int, ...], new_state: Optional[object]
+    ) -> None:
+        """Will update the conversations for the given handler.
+
+        Args:
+            name (:obj:`str`): The handler's name.
+            key (:obj:`tuple`): The key the state is changed for.
+            new_state (:obj:`tuple` | :obj:`Any`): The new state for the given key.
+        """
+        self._store('conversations', (name, _encode_conversation_key(key)), new_state)
+
+    def update_user_data(self, user_id: int, data: UD) -> None:
+        """Will update the user_data of the given user.
+
+        Args:
+            user_id (:obj:`int`): The user the data might have been changed for.
+            data (:obj:`dict` | :attr:`telegram.ext.ContextTypes.user_data`): The
+                :attr:`telegram.ext.Dispatcher.user_data` ``[user_id]``.
+        """
+        self._store('user_data', user_id, data)
+
+    def update_chat_data(self, chat_id: int, data: CD) -> None:
+        """Will update the chat_data of the given chat.
+
+        Args:
+            chat_id (:obj:`int`): The chat the data might have been changed for.
+            data (:obj:`dict` | :attr:`telegram.ext.ContextTypes.chat_data`): The
+                :attr:`telegram.ext.Dispatcher.chat_data` ``[chat_id]``.
+        """
+        self._store('chat_data', chat_id, data)
+
+    def update_bot_data(self, data: BD) -> None:
+        """Will update the bot_data.
+
+        Args:
+            data (:obj:`dict` | :attr:`telegram.ext.ContextTypes.bot_data`): The
+                :attr:`telegram.ext.Dispatcher.bot_data`.
+        """
+        self._store('bot_data', 'bot_data', data)
+
+    def update_callback_data(self, data: CDCData) -> None:
+        """Will update the callback_data.
+
+        Args:
+            data (Tuple[List[Tuple[:obj:`str`, :obj:`float`, \
+                Dict[:obj:`str`, :obj:`Any`]]], Dict[:obj:`str`, :obj:`str`]]):
+                The relevant data to restore :class:`telegram.ext.CallbackDataCache`.
+        """
+        self._store('bot_data', 'callback_data', data)
+
+    def refresh_user_data(self, user_id: int, user_data: UD) -> None:
+        """Does nothing. The data of a user is loaded, when it's accessed for the first time.
+
+        .. seealso:: :meth:`telegram.ext.BasePersistence.refresh_user_data`
+        """
+
+    def refresh_chat_data(self, chat_id: int, chat_data: CD) -> None:
+        """Does nothing. The data of a chat is loaded, when it's accessed for the first time.
+
+        .. seealso:: :meth:`telegram.ext.BasePersistence.refresh_chat_data`
+        """
+
+    def refresh_bot_data(self, bot_data: BD) -> None:
+        """Does nothing.
+
+        .. seealso:: :meth:`telegram.ext.BasePersistence.refresh_bot_data`
+        """
+
+    def flush(self) -> None:
+        """Writes all pending changes to the database."""
+        with self._lock:
+            self._write()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the TrackingDict class."""
+from typing import Any, Dict, FrozenSet, Mapping, Set, Tuple, TypeVar, Union, Iterable
+
+_KT = TypeVar('_KT')
+_VT = TypeVar('_VT')
+_T = TypeVar('_T')
+
+
+class TrackingDict(Dict[_KT, _VT]):
+    """A :obj:`dict` that records which of its keys were changed. Pass it to
+    :class:`telegram.ext.ContextTypes` as type of ``user_data``, ``chat_data`` and ``bot_data``
+    to make :meth:`telegram.ext.Dispatcher.update_persistence` skip the data that didn't change,
+    which saves copying, comparing and writing it:
+
+    .. code:: python
+
+        context_types = ContextTypes(
+            user_data=TrackingDict, chat_data=TrackingDict, bot_data=TrackingDict
+        )
+
+    All methods that change the dict record the changed keys in :attr:`changed_keys`. Data
+    loaded from the persistence is unchanged.
+
+    .. versionadded:: 14.0
+
+    Warning:
+        Only changes of the dict itself are recorded. Changes *within* the values are not, e.g.
+        ``context.user_data['list'].append(1)`` does not mark ``'list'`` as changed. Assign the
+        value again after changing it, e.g. ``context.user_data['list'] = my_list``, to record
+        the change.
+
+    Args:
+        *args: Passed to :obj:`dict`.
+        **kwargs: Passed to :obj:`dict`.
+    """
+
+    __slots__ = ('_changed_keys',)
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._changed_keys: Set[_KT] = set()
+
+    @property
+    def changed_keys(self) -> FrozenSet[_KT]:
+        """FrozenSet[:obj:`object`]: The keys that were set or deleted since the creation or
+        the last call of :meth:`mark_unchanged`."""
+        return frozenset(self._changed_keys)
+
+    def mark_unchanged(self) -> None:
+        """Clears :attr:`changed_keys`. Called by :class:`telegram.ext.Dispatcher` when it passes
+        the data on to the persistence."""
+        self._changed_keys.clear()
+
+    def mark_changed(self, *keys: _KT) -> None:
+        """Adds the passed keys to :attr:`changed_keys`. Called by
+        :class:`telegram.ext.Dispatcher`, if passing the data on to the persistence failed, such
+        that it's passed on again with the next write.
+
+        Args:
+            *keys (:obj:`object`): The keys to mark as changed.
+        """
+        self._changed_keys.update(keys)
+
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        super().__setitem__(key, value)
+        self._changed_keys.add(key)
+
+    def __delitem__(self, key: _KT) -> None:
+        super().__delitem__(key)
+        self._changed_keys.add(key)
+
+    def __ior__(self, other: Any) -> 'TrackingDict[_KT, _VT]':  # type: ignore[override]
+        self.update(other)
+        return self
+
+    def update(  # type: ignore[override]
+        self, other: Union[Mapping[_KT, _VT], Iterable[Tuple[_KT, _VT]]] = (), **kwargs: _VT
+    ) -> None:
+        """Like :meth:`dict.update`, but records the changed keys."""
+        items = other.items() if isinstance(other, Mapping) else other
+        for key, value in items:
+            self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value  # type: ignore[index]
+
+    def setdefault(self, key: _KT, default: _VT = None) -> _VT:  # type: ignore[assignment]
+        """Like :meth:`dict.setdefault`, but records the key, if it is inserted."""
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: _KT, *default: Union[_VT, _T]) -> Union[_VT, _T]:
+        """Like :meth:`dict.pop`, but records the key, if it is removed."""
+        if key in self:
+            self._changed_keys.add(key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> Tuple[_KT, _VT]:
+        """Like :meth:`dict.popitem`, but records the removed key."""
+        key, value = super().popitem()
+        self._changed_keys.add(key)
+        return key, value
+
+    def clear(self) -> None:
+        """Like :meth:`dict.clear`, but records the removed keys."""
+        self._changed_keys.update(self)
+        super().clear()
+
+    def copy(self) -> 'TrackingDict[_KT, _VT]':
+        """Returns a shallow copy without changed keys."""
+        return type(self)(self)
+
+    def __reduce__(self) -> Tuple:
+        # Copies and unpickled instances have no changed keys
+        return type(self), (dict(self),)
@@ -17,17 +17,17 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the class Updater, which tries to make creating Telegram bots intuitive."""
+import asyncio
 import inspect
 import logging
 import ssl
 import signal
 from pathlib import Path
-from queue import Queue
-from threading import Event, Lock, Thread, current_thread
-from time import sleep
+from threading import Event
 from typing import (
     Any,
     Callable,
+    Coroutine,
     List,
     Optional,
     Tuple,
@@ -38,10 +38,11 @@ from typing import (
     TYPE_CHECKING,
 )
 
+from telegram import Update
 from telegram.error import InvalidToken, RetryAfter, TimedOut, Forbidden, TelegramError
 from telegram._utils.warnings import warn
-from telegram.ext import Dispatcher
-from telegram.ext._utils.webhookhandler import WebhookAppClass, WebhookServer
+from telegram.ext import Dispatcher, ExtBot
+from telegram.ext._utils.webhookhandler import WebhookAppClass, WebhookASGIApp, WebhookServer
 from telegram.ext._utils.stack import was_called_by
 from telegram.ext._utils.types import BT
 
@@ -56,10 +57,11 @@ class Updater(Generic[BT, DT]):
     """
     This class, which employs the :class:`telegram.ext.Dispatcher`, provides a frontend to
     :class:`telegram.Bot` to the programmer, so they can focus on coding the bot. Its purpose is to
-    receive the updates from Telegram and to deliver them to said dispatcher. It also runs in a
-    separate thread, so the user can interact with the bot, for example on the command line. The
-    dispatcher supports handlers for different kinds of data: Updates from Telegram, basic text
-    commands and even arbitrary types. The updater can be started as a polling service or, for
+    receive the updates from Telegram and to deliver them to said dispatcher. Fetching updates runs
+    in a background :class:`asyncio.Task` on the same event loop as the dispatcher, so the user
+    can interact with the bot, for example on the command line. The dispatcher supports handlers
+    for different kinds of data: Updates from Telegram, basic text commands and even arbitrary
+    types. The updater can be started as a polling service or, for
     production, use a webhook to receive updates. This is achieved using the WebhookServer and
     WebhookHandler classes.
 
@@ -73,6 +75,10 @@ class Updater(Generic[BT, DT]):
         * Renamed ``user_sig_handler`` to :attr:`user_signal_handler`.
         * Removed the attributes ``job_queue``, and ``persistence`` - use the corresponding
           attributes of :attr:`dispatcher` instead.
+        * Polling for updates and the webhook server no longer run in separate threads, but on
+          the event loop of the :attr:`dispatcher`. Accordingly, :meth:`start_polling`,
+          :meth:`start_webhook`, :meth:`stop` and :meth:`idle` are now coroutine functions.
+        * Added :meth:`asgi_app`.
 
     Attributes:
         bot (:class:`telegram.Bot`): The bot used with this Updater.
@@ -81,7 +87,7 @@ class Updater(Generic[BT, DT]):
 
             .. versionchanged:: 14.0
                 Renamed ``user_sig_handler`` to ``user_signal_handler``.
-        update_queue (:obj:`Queue`): Queue for the updates.
+        update_queue (:class:`asyncio.Queue`): Queue for the updates.
         dispatcher (:class:`telegram.ext.Dispatcher`): Optional. Dispatcher that handles the
             updates and dispatches them to the handlers.
         running (:obj:`bool`): Indicates if the updater is running.
@@ -105,7 +111,8 @@ class Updater(Generic[BT, DT]):
         'is_idle',
         'httpd',
         '__lock',
-        '__threads',
+        '__tasks',
+        '__signal',
     )
 
     def __init__(
@@ -114,7 +121,7 @@ class Updater(Generic[BT, DT]):
         user_signal_handler: Callable[[int, object], Any] = None,
         dispatcher: DT = None,
         bot: BT = None,
-        update_queue: Queue = None,
+        update_queue: asyncio.Queue = None,
         exception_event: Event = None,
     ):
         if not was_called_by(
@@ -140,8 +147,9 @@ class Updater(Generic[BT, DT]):
         self.running = False
         self.is_idle = False
         self.httpd = None
-        self.__lock = Lock()
-        self.__threads: List[Thread] = []
+        self.__lock = asyncio.Lock()
+        self.__tasks: List[asyncio.Task] = []
+        self.__signal: Optional[Tuple[int, object]] = None
         self.logger = logging.getLogger(__name__)
 
     @staticmethod
@@ -155,28 +163,36 @@ class Updater(Generic[BT, DT]):
 
         return UpdaterBuilder()
 
-    def _init_thread(self, target: Callable, name: str, *args: object, **kwargs: object) -> None:
-        thr = Thread(
-            target=self._thread_wrapper,
-            name=f"Bot:{self.bot.id}:{name}",
-            args=(target,) + args,
-            kwargs=kwargs,
-        )
-        thr.start()
-        self.__threads.append(thr)
+    def _init_task(self, coroutine: Coroutine, name: str) -> asyncio.Task:
+        task = asyncio.create_task(self._task_wrapper(coroutine), name=f"Bot:{self.bot.id}:{name}")
+        self.__tasks.append(task)
+        return task
 
-    def _thread_wrapper(self, target: Callable, *args: object, **kwargs: object) -> None:
-        thr_name = current_thread().name
-        self.logger.debug('%s - started', thr_name)
+    @staticmethod
+    async def _wait_until_ready(task: asyncio.Task, ready: asyncio.Event) -> None:
+        # Wait until `ready` is set, but don't hang forever if `task` fails before that
+        ready_task = asyncio.create_task(ready.wait())
+        await asyncio.wait({task, ready_task}, return_when=asyncio.FIRST_COMPLETED)
+        if not ready_task.done():
+            ready_task.cancel()
+            # Reraises the exception that made the task end prematurely
+            task.result()
+
+    async def _task_wrapper(self, coroutine: Coroutine) -> None:
+        task_name = asyncio.current_task().get_name()  # type: ignore[union-attr]
+        self.logger.debug('%s - started', task_name)
         try:
-            target(*args, **kwargs)
+            await coroutine
+        except asyncio.CancelledError:
+            self.logger.debug('%s - cancelled', task_name)
+            raise
         except Exception:
             self.exception_event.set()
-            self.logger.exception('unhandled exception in %s', thr_name)
+            self.logger.exception('unhandled exception in %s', task_name)
             raise
-        self.logger.debug('%s - ended', thr_name)
+        self.logger.debug('%s - ended', task_name)
 
-    def start_polling(
+    async def start_polling(
         self,
         poll_interval: float = 0.0,
         timeout: float = 10,
@@ -184,11 +200,21 @@ class Updater(Generic[BT, DT]):
         read_timeout: float = 2.0,
         allowed_updates: List[str] = None,
         drop_pending_updates: bool = None,
-    ) -> Optional[Queue]:
+    ) -> Optional[asyncio.Queue]:
         """Starts polling updates from Telegram.
 
+        Note:
+            If ``poll_interval`` is ``0`` and Telegram returned updates, the next call to
+            :meth:`telegram.Bot.get_updates` is already made once the current batch of updates is
+            in :attr:`update_queue`, while the dispatcher is still processing it. This avoids idle
+            gaps between two polls under heavy traffic.
+
         .. versionchanged:: 14.0
-            Removed the ``clean`` argument in favor of ``drop_pending_updates``.
+
+            * This method is now a coroutine function.
+            * Removed the ``clean`` argument in favor of ``drop_pending_updates``.
+            * Polling now runs in an :class:`asyncio.Task` and no longer in a separate thread.
+              The updates are put directly into :attr:`update_queue`.
 
         Args:
             poll_interval (:obj:`float`, optional): Time to wait between polling updates from
@@ -212,42 +238,45 @@ class Updater(Generic[BT, DT]):
                 timeout from server (Default: ``2``).
 
         Returns:
-            :obj:`Queue`: The update queue that can be filled from the main thread.
+            :class:`asyncio.Queue`: The update queue that can be filled from the main thread.
 
         """
-        with self.__lock:
+        async with self.__lock:
             if not self.running:
                 self.running = True
 
-                # Create & start threads
-                dispatcher_ready = Event()
-                polling_ready = Event()
-
                 if self.dispatcher:
-                    self._init_thread(self.dispatcher.start, "dispatcher", ready=dispatcher_ready)
-                self._init_thread(
-                    self._start_polling,
+                    self.logger.debug('Starting Dispatcher')
+                    await self.dispatcher.start()
+                else:
+                    await self.bot.initialize()
+
+                polling_ready = asyncio.Event()
+                polling_task = self._init_task(
+                    self._start_polling(
+                        poll_interval,
+                        timeout,
+                        read_timeout,
+                        bootstrap_retries,
+                        drop_pending_updates,
+                        allowed_updates,
+                        ready=polling_ready,
+                    ),
                     "updater",
-                    poll_interval,
-                    timeout,
-                    read_timeout,
-                    bootstrap_retries,
-                    drop_pending_updates,
-                    allowed_updates,
-                    ready=polling_ready,
                 )
 
                 self.logger.debug('Waiting for polling to start')
-                polling_ready.wait()
-                if self.dispatcher:
-                    self.logger.debug('Waiting for Dispatcher to start')
-                    dispatcher_ready.wait()
+                try:
+                    await self._wait_until_ready(polling_task, polling_ready)
+                except Exception as exc:
+                    self.running = False
+                    raise exc
 
                 # Return the update queue so the main thread can insert updates
                 return self.update_queue
             return None
 
-    def start_webhook(
+    async def start_webhook(
         self,
         listen: str = '127.0.0.1',
         port: int = 80,
@@ -260,7 +289,8 @@ class Updater(Generic[BT, DT]):
         drop_pending_updates: bool = None,
         ip_address: str = None,
         max_connections: int = 40,
-    ) -> Optional[Queue]:
+        high_water_mark: int = None,
+    ) -> Optional[asyncio.Queue]:
         """
         Starts a small http server to listen for updates via webhook. If :attr:`cert`
         and :attr:`key` are not provided, the webhook will be started directly on
@@ -273,8 +303,13 @@ class Updater(Generic[BT, DT]):
             ``webhook_url`` instead of calling ``updater.bot.set_webhook(webhook_url)`` manually.
 
         .. versionchanged:: 14.0
-            Removed the ``clean`` argument in favor of ``drop_pending_updates`` and removed the
-            deprecated argument ``force_event_loop``.
+
+            * This method is now a coroutine function.
+            * Removed the ``clean`` argument in favor of ``drop_pending_updates`` and removed the
+              deprecated argument ``force_event_loop``.
+            * The webhook server now runs on the same event loop as the :attr:`dispatcher` and
+              no longer in a separate thread. Updates are put directly into
+              :attr:`update_queue`.
 
         Args:
             listen (:obj:`str`, optional): IP-Address to listen on. Default ``127.0.0.1``.
@@ -306,50 +341,107 @@ class Updater(Generic[BT, DT]):
                 :meth:`telegram.Bot.set_webhook`.
 
                 .. versionadded:: 13.6
+            high_water_mark (:obj:`int`, optional): If passed, the webhook server rejects updates
+                with status code ``503`` while :attr:`update_queue` holds at least this many
+                updates. Telegram will then try to deliver them again later on instead of
+                the updates piling up in memory. By default, all updates are accepted.
+
+                .. versionadded:: 14.0
 
         Returns:
-            :obj:`Queue`: The update queue that can be filled from the main thread.
+            :class:`asyncio.Queue`: The update queue that can be filled from the main thread.
 
         """
-        with self.__lock:
+        async with self.__lock:
             if not self.running:
                 self.running = True
 
-                # Create & start threads
-                webhook_ready = Event()
-                dispatcher_ready = Event()
-
                 if self.dispatcher:
-                    self._init_thread(self.dispatcher.start, "dispatcher", dispatcher_ready)
-                self._init_thread(
-                    self._start_webhook,
+                    self.logger.debug('Starting Dispatcher')
+                    await self.dispatcher.start()
+                else:
+                    await self.bot.initialize()
+
+                webhook_ready = asyncio.Event()
+                webhook_task = self._init_task(
+                    self._start_webhook(
+                        listen,
+                        port,
+                        url_path,
+                        cert,
+                        key,
+                        bootstrap_retries,
+                        drop_pending_updates,
+                        webhook_url,
+                        allowed_updates,
+                        ready=webhook_ready,
+                        ip_address=ip_address,
+                        max_connections=max_connections,
+                        high_water_mark=high_water_mark,
+                    ),
                     "updater",
-                    listen,
-                    port,
-                    url_path,
-                    cert,
-                    key,
-                    bootstrap_retries,
-                    drop_pending_updates,
-                    webhook_url,
-                    allowed_updates,
-                    ready=webhook_ready,
-                    ip_address=ip_address,
-                    max_connections=max_connections,
                 )
 
                 self.logger.debug('Waiting for webhook to start')
-                webhook_ready.wait()
-                if self.dispatcher:
-                    self.logger.debug('Waiting for Dispatcher to start')
-                    dispatcher_ready.wait()
+                try:
+                    await self._wait_until_ready(webhook_task, webhook_ready)
+                except Exception as exc:
+                    self.running = False
+                    raise exc
 
                 # Return the update queue so the main thread can insert updates
                 return self.update_queue
             return None
 
+    def asgi_app(self, url_path: str = '', high_water_mark: int = None) -> WebhookASGIApp:
+        """Builds an `ASGI <https://asgi.readthedocs.io>`_ application that receives updates via
+        webhook. Use this instead of :meth:`start_webhook`, if you want to run the bot behind an
+        existing ASGI server like uvicorn or hypercorn, e.g. to share the process with a web
+        application. The updates are put into :attr:`update_queue` on the event loop of the ASGI
+        server.
+
+        The application handles the ASGI lifespan protocol: On startup, it starts the
+        :attr:`dispatcher` (or initializes :attr:`bot`, if there is no dispatcher) and on shutdown
+        it calls :meth:`stop`.
+
+        Note:
+            In contrast to :meth:`start_webhook`, this does *not* call
+            :meth:`telegram.Bot.set_webhook`, as the URL under which the application is reachable
+            is determined by the ASGI server.
+
+        .. versionadded:: 14.0
+
+        Args:
+            url_path (:obj:`str`, optional): Path inside url under which the application accepts
+                updates. Requests to other paths are answered with status code ``404``.
+            high_water_mark (:obj:`int`, optional): See :meth:`start_webhook`.
+
+        Returns:
+            An ASGI application.
+        """
+        if not url_path.startswith('/'):
+            url_path = f'/{url_path}'
+
+        return WebhookASGIApp(
+            url_path,
+            self.bot,
+            self.update_queue,
+            high_water_mark=high_water_mark,
+            on_startup=self._start_asgi,
+            on_shutdown=self.stop,
+        )
+
+    async def _start_asgi(self) -> None:
+        async with self.__lock:
+            if not self.running:
+                self.running = True
+                if self.dispatcher:
+                    await self.dispatcher.start()
+                else:
+                    await self.bot.initialize()
+
     @no_type_check
-    def _start_polling(
+    async def _start_polling(
         self,
         poll_interval,
         timeout,
@@ -359,13 +451,12 @@ class Updater(Generic[BT, DT]):
         allowed_updates,
         ready=None,
     ):  # pragma: no cover
-        # Thread target of thread 'updater'. Runs in background, pulls
-        # updates from Telegram and inserts them in the update queue of the
-        # Dispatcher.
+        # Target of the task 'updater'. Runs in background, pulls updates from Telegram and
+        # inserts them in the update queue of the Dispatcher.
 
-        self.logger.debug('Updater thread started (polling)')
+        self.logger.debug('Updater started (polling)')
 
-        self._bootstrap(
+        await self._bootstrap(
             bootstrap_retries,
             drop_pending_updates=drop_pending_updates,
             webhook_url='',
@@ -374,47 +465,74 @@ class Updater(Generic[BT, DT]):
 
         self.logger.debug('Bootstrap done')
 
-        def polling_action_cb():
-            updates = self.bot.get_updates(
-                self.last_update_id,
-                timeout=timeout,
-                read_timeout=read_timeout,
-                allowed_updates=allowed_updates,
+        # The next call to getUpdates, if it was already started before the current batch was
+        # processed
+        pending_fetch = None
+
+        def fetch_updates(offset):
+            # The updates are deserialized by polling_action_cb, such that the next offset is
+            # known before the current batch is processed
+            return asyncio.create_task(
+                self.bot.get_updates_json(
+                    offset=offset,
+                    timeout=timeout,
+                    read_timeout=read_timeout,
+                    allowed_updates=allowed_updates,
+                )
             )
 
-            if updates:
+        async def polling_action_cb():
+            nonlocal pending_fetch
+            fetch, pending_fetch = pending_fetch or fetch_updates(self.last_update_id), None
+            updates_json = await fetch
+
+            if updates_json:
                 if not self.running:
                     self.logger.debug('Updates ignored and will be pulled again on restart')
                 else:
-                    for update in updates:
-                        self.update_queue.put(update)
-                    self.last_update_id = updates[-1].update_id + 1
+                    for update in Update.de_list(updates_json, self.bot, copy=False):
+                        # handle arbitrary callback data, if necessary
+                        if isinstance(self.bot, ExtBot):
+                            self.bot.insert_callback_data(update)
+                        await self.update_queue.put(update)
+
+                    # Requesting the next offset confirms the batch to Telegram, so this must
+                    # only happen once all of its updates are in the update queue. Without a poll
+                    # interval, the next batch is already requested while the dispatcher
+                    # processes the current one
+                    self.last_update_id = updates_json[-1]['update_id'] + 1
+                    if not poll_interval:
+                        pending_fetch = fetch_updates(self.last_update_id)
 
             return True
 
-        def polling_onerr_cb(exc):
+        async def polling_onerr_cb(exc):
             # Put the error into the update queue and let the Dispatcher
             # broadcast it
-            self.update_queue.put(exc)
+            await self.update_queue.put(exc)
 
         if ready is not None:
             ready.set()
 
-        self._network_loop_retry(
-            polling_action_cb, polling_onerr_cb, 'getting Updates', poll_interval
-        )
+        try:
+            await self._network_loop_retry(
+                polling_action_cb, polling_onerr_cb, 'getting Updates', poll_interval
+            )
+        finally:
+            if pending_fetch is not None:
+                pending_fetch.cancel()
 
     @no_type_check
-    def _network_loop_retry(self, action_cb, onerr_cb, description, interval):
+    async def _network_loop_retry(self, action_cb, onerr_cb, description, interval):
         """Perform a loop calling `action_cb`, retrying after network errors.
 
         Stop condition for loop: `self.running` evaluates :obj:`False` or return value of
         `action_cb` evaluates :obj:`False`.
 
         Args:
-            action_cb (:obj:`callable`): Network oriented callback function to call.
-            onerr_cb (:obj:`callable`): Callback to call when TelegramError is caught. Receives the
-                exception object as a parameter.
+            action_cb (:obj:`coroutine function`): Network oriented callback function to call.
+            onerr_cb (:obj:`coroutine function`): Callback to call when TelegramError is caught.
+                Receives the exception object as a parameter.
             description (:obj:`str`): Description text to use for logs and exception raised.
             interval (:obj:`float` | :obj:`int`): Interval to sleep between each call to
                 `action_cb`.
@@ -424,7 +542,7 @@ class Updater(Generic[BT, DT]):
         cur_interval = interval
         while self.running:
             try:
-                if not action_cb():
+                if not await action_cb():
                     break
             except RetryAfter as exc:
                 self.logger.info('%s', exc)
@@ -438,13 +556,13 @@ class Updater(Generic[BT, DT]):
                 raise pex
             except TelegramError as telegram_exc:
                 self.logger.error('Error while %s: %s', description, telegram_exc)
-                onerr_cb(telegram_exc)
+                await onerr_cb(telegram_exc)
                 cur_interval = self._increase_poll_interval(cur_interval)
             else:
                 cur_interval = interval
 
             if cur_interval:
-                sleep(cur_interval)
+                await asyncio.sleep(cur_interval)
 
     @staticmethod
     def _increase_poll_interval(current_interval: float) -> float:
@@ -458,7 +576,7 @@ class Updater(Generic[BT, DT]):
         return current_interval
 
     @no_type_check
-    def _start_webhook(
+    async def _start_webhook(
         self,
         listen,
         port,
@@ -472,8 +590,9 @@ class Updater(Generic[BT, DT]):
         ready=None,
         ip_address=None,
         max_connections: int = 40,
+        high_water_mark=None,
     ):
-        self.logger.debug('Updater thread started (webhook)')
+        self.logger.debug('Updater started (webhook)')
 
         # Note that we only use the SSL certificate for the WebhookServer, if the key is also
         # present. This is because the WebhookServer may not actually be in charge of performing
@@ -484,7 +603,7 @@ class Updater(Generic[BT, DT]):
             url_path = f'/{url_path}'
 
         # Create Tornado app instance
-        app = WebhookAppClass(url_path, self.bot, self.update_queue)
+        app = WebhookAppClass(url_path, self.bot, self.update_queue, high_water_mark)
 
         # Form SSL Context
         # An SSLError is raised if the private key does not match with the certificate
@@ -506,7 +625,7 @@ class Updater(Generic[BT, DT]):
         # We pass along the cert to the webhook if present.
         if cert is not None:
             with open(cert, 'rb') as cert_file:
-                self._bootstrap(
+                await self._bootstrap(
                     cert=cert_file,
                     max_retries=bootstrap_retries,
                     drop_pending_updates=drop_pending_updates,
@@ -516,7 +635,7 @@ class Updater(Generic[BT, DT]):
                     max_connections=max_connections,
                 )
         else:
-            self._bootstrap(
+            await self._bootstrap(
                 max_retries=bootstrap_retries,
                 drop_pending_updates=drop_pending_updates,
                 webhook_url=webhook_url,
@@ -525,14 +644,14 @@ class Updater(Generic[BT, DT]):
                 max_connections=max_connections,
             )
 
-        self.httpd.serve_forever(ready=ready)
+        await self.httpd.serve_forever(ready=ready)
 
     @staticmethod
     def _gen_webhook_url(listen: str, port: int, url_path: str) -> str:
         return f'https://{listen}:{port}{url_path}'
 
     @no_type_check
-    def _bootstrap(
+    async def _bootstrap(
         self,
         max_retries,
         drop_pending_updates,
@@ -545,18 +664,18 @@ class Updater(Generic[BT, DT]):
     ):
         retries = [0]
 
-        def bootstrap_del_webhook():
+        async def bootstrap_del_webhook():
             self.logger.debug('Deleting webhook')
             if drop_pending_updates:
                 self.logger.debug('Dropping pending updates from Telegram server')
-            self.bot.delete_webhook(drop_pending_updates=drop_pending_updates)
+            await self.bot.delete_webhook(drop_pending_updates=drop_pending_updates)
             return False
 
-        def bootstrap_set_webhook():
+        async def bootstrap_set_webhook():
             self.logger.debug('Setting webhook')
             if drop_pending_updates:
                 self.logger.debug('Dropping pending updates from Telegram server')
-            self.bot.set_webhook(
+            await self.bot.set_webhook(
                 url=webhook_url,
                 certificate=cert,
                 allowed_updates=allowed_updates,
@@ -566,7 +685,7 @@ class Updater(Generic[BT, DT]):
             )
             return False
 
-        def bootstrap_onerr_cb(exc):
+        async def bootstrap_onerr_cb(exc):
             if not isinstance(exc, Forbidden) and (max_retries < 0 or retries[0] < max_retries):
                 retries[0] += 1
                 self.logger.warning(
@@ -581,7 +700,7 @@ class Updater(Generic[BT, DT]):
         # sure that no webhook is configured in case of polling, so we just always call
         # delete_webhook for polling
         if drop_pending_updates or not webhook_url:
-            self._network_loop_retry(
+            await self._network_loop_retry(
                 bootstrap_del_webhook,
                 bootstrap_onerr_cb,
                 'bootstrap del webhook',
@@ -592,7 +711,7 @@ class Updater(Generic[BT, DT]):
         # Restore/set webhook settings, if needed. Again, we don't know ahead if a webhook is set,
         # so we set it anyhow.
         if webhook_url:
-            self._network_loop_retry(
+            await self._network_loop_retry(
                 bootstrap_set_webhook,
                 bootstrap_onerr_cb,
                 'bootstrap set webhook',
@@ -600,18 +719,22 @@ class Updater(Generic[BT, DT]):
             )
 
     async def stop(self) -> None:
-        """Stops the polling/webhook thread, the dispatcher and the job queue."""
-        with self.__lock:
-            if self.running or (self.dispatcher and self.dispatcher.has_running_threads):
+        """Stops the polling/webhook task, the dispatcher and the job queue.
+
+        .. versionchanged:: 14.0
+            This method is now a coroutine function.
+        """
+        async with self.__lock:
+            if self.running or (self.dispatcher and self.dispatcher.running):
                 self.logger.debug(
                     'Stopping Updater %s...', 'and Dispatcher ' if self.dispatcher else ''
                 )
 
                 self.running = False
 
-                self._stop_httpd()
-                self._stop_dispatcher()
-                self._join_threads()
+                await self._stop_tasks()
+                await self._stop_httpd()
+                await self._stop_dispatcher()
 
                 # Clear the connection pool only if the bot is managed by the Updater
                 # Otherwise `dispatcher.stop()` already does that
@@ -619,29 +742,27 @@ class Updater(Generic[BT, DT]):
                     await self.bot.shutdown()
 
     @no_type_check
-    def _stop_httpd(self) -> None:
+    async def _stop_tasks(self) -> None:
+        # The polling task may be waiting for a long polling request to return, so we don't wait
+        # for it to end by itself
+        for task in self.__tasks:
+            self.logger.debug('Cancelling task %s', task.get_name())
+            task.cancel()
+        await asyncio.gather(*self.__tasks, return_exceptions=True)
+        self.__tasks = []
+
+    @no_type_check
+    async def _stop_httpd(self) -> None:
         if self.httpd:
-            self.logger.debug(
-                'Waiting for current webhook connection to be '
-                'closed... Send a Telegram message to the bot to exit '
-                'immediately.'
-            )
-            self.httpd.shutdown()
+            self.logger.debug('Waiting for current webhook connections to be closed')
+            await self.httpd.shutdown()
             self.httpd = None
 
     @no_type_check
-    def _stop_dispatcher(self) -> None:
+    async def _stop_dispatcher(self) -> None:
         if self.dispatcher:
             self.logger.debug('Requesting Dispatcher to stop...')
-            self.dispatcher.stop()
-
-    @no_type_check
-    def _join_threads(self) -> None:
-        for thr in self.__threads:
-            self.logger.debug('Waiting for %s thread to end', thr.name)
-            thr.join()
-            self.logger.debug('%s thread has ended', thr.name)
-        self.__threads = []
+            await self.dispatcher.stop()
 
     @no_type_check
     def _signal_handler(self, signum, frame) -> None:
@@ -655,9 +776,8 @@ class Updater(Generic[BT, DT]):
                 # https://bugs.python.org/issue28206
                 signal.Signals(signum),  # pylint: disable=no-member
             )
-            self.stop()
-            if self.user_signal_handler:
-                self.user_signal_handler(signum, frame)
+            # We can't await `stop` in here, so `idle` takes care of that
+            self.__signal = (signum, frame)
         else:
             self.logger.warning('Exiting immediately!')
             # pylint: disable=import-outside-toplevel, protected-access
@@ -665,11 +785,14 @@ class Updater(Generic[BT, DT]):
 
             os._exit(1)
 
-    def idle(
+    async def idle(
         self, stop_signals: Union[List, Tuple] = (signal.SIGINT, signal.SIGTERM, signal.SIGABRT)
     ) -> None:
         """Blocks until one of the signals are received and stops the updater.
 
+        .. versionchanged:: 14.0
+            This method is now a coroutine function.
+
         Args:
             stop_signals (:obj:`list` | :obj:`tuple`): List containing signals from the signal
                 module that should be subscribed to. :meth:`Updater.stop()` will be called on
@@ -680,6 +803,12 @@ class Updater(Generic[BT, DT]):
             signal.signal(sig, self._signal_handler)
 
         self.is_idle = True
+        self.__signal = None
 
         while self.is_idle:
-            sleep(1)
+            await asyncio.sleep(1)
+
+        if self.__signal is not None:
+            await self.stop()
+            if self.user_signal_handler:
+                self.user_signal_handler(*self.__signal)
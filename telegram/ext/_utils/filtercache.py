@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a cache for the results of filters for a single update.
+
+.. versionadded:: 14.0
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+
+class FilterCache:
+    """Holds the results of the filters that were evaluated for :attr:`update`, keyed by the
+    ``id`` of the filter.
+
+    Args:
+        update (:obj:`object`): The update.
+    """
+
+    __slots__ = ('update', 'results')
+
+    def __init__(self, update: object):
+        self.update = update
+        self.results: Dict[int, object] = {}
+
+
+CURRENT_FILTER_CACHE: ContextVar[Optional[FilterCache]] = ContextVar(
+    'CURRENT_FILTER_CACHE', default=None
+)
+"""The cache for the update that is currently being processed in this context, if any."""
+
+
+@contextmanager
+def cache_filter_results(update: object) -> Iterator[FilterCache]:
+    """Caches the results of the filters evaluated for ``update`` while the context is active.
+    As :class:`contextvars.ContextVar` is used, concurrently processed updates don't interfere.
+
+    Args:
+        update (:obj:`object`): The update.
+    """
+    cache = FilterCache(update)
+    token = CURRENT_FILTER_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        CURRENT_FILTER_CACHE.reset(token)
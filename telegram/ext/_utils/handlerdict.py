@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the container for the handlers of the dispatcher, which counts the
+changes made to it, such that the dispatcher knows when to rebuild its handler index.
+
+.. versionadded:: 14.0
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Tuple
+
+if TYPE_CHECKING:
+    from telegram.ext import Handler
+
+
+class HandlerDict(Dict[int, List['Handler']]):
+    """A :obj:`dict` mapping groups to lists of handlers. Increases :attr:`version` on every
+    change of itself or of one of its lists. Lists that are set as values are converted to
+    :class:`HandlerList`.
+
+    Args:
+        handlers (Mapping[:obj:`int`, List[:class:`telegram.ext.Handler`]], optional): The
+            initial handlers.
+
+    Attributes:
+        version (:obj:`int`): The number of changes.
+    """
+
+    __slots__ = ('version',)
+
+    def __init__(self, handlers: Mapping[int, Iterable['Handler']] = None):
+        super().__init__()
+        self.version = 0
+        for group, group_handlers in (handlers or {}).items():
+            self[group] = group_handlers  # type: ignore[assignment]
+
+    def changed(self) -> None:
+        """Increases :attr:`version`."""
+        self.version += 1
+
+    def __setitem__(self, group: int, handlers: Iterable['Handler']) -> None:  # type: ignore
+        super().__setitem__(group, HandlerList(self, handlers))
+        self.changed()
+
+    def __delitem__(self, group: int) -> None:
+        super().__delitem__(group)
+        self.changed()
+
+    def __ior__(self, other: Any) -> 'HandlerDict':  # type: ignore[override]
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # pylint: disable=arguments-differ
+        """Like :meth:`dict.update`, but converts the values to :class:`HandlerList`."""
+        for group, handlers in dict(*args, **kwargs).items():
+            self[group] = handlers
+
+    def setdefault(self, group: int, default: Iterable['Handler'] = ()) -> List['Handler']:
+        """Like :meth:`dict.setdefault`, but converts the value to :class:`HandlerList`."""
+        if group not in self:
+            self[group] = default
+        return self[group]
+
+    def pop(self, *args: Any) -> Any:  # pylint: disable=arguments-differ
+        """Like :meth:`dict.pop`."""
+        result = super().pop(*args)
+        self.changed()
+        return result
+
+    def popitem(self) -> Tuple[int, List['Handler']]:
+        """Like :meth:`dict.popitem`."""
+        result = super().popitem()
+        self.changed()
+        return result
+
+    def clear(self) -> None:
+        """Like :meth:`dict.clear`."""
+        super().clear()
+        self.changed()
+
+
+def _changing(name: str) -> Any:
+    method = getattr(list, name)
+
+    def wrapper(self: 'HandlerList', *args: Any, **kwargs: Any) -> Any:
+        result = method(self, *args, **kwargs)
+        self.owner.changed()
+        return result
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+class HandlerList(List['Handler']):
+    """A :obj:`list` of handlers that notifies its :class:`HandlerDict` of every change.
+
+    Args:
+        owner (:class:`HandlerDict`): The dict containing the list.
+        handlers (Iterable[:class:`telegram.ext.Handler`]): The handlers.
+
+    Attributes:
+        owner (:class:`HandlerDict`): The dict containing the list.
+    """
+
+    __slots__ = ('owner',)
+
+    def __init__(self, owner: HandlerDict, handlers: Iterable['Handler'] = ()):
+        super().__init__(handlers)
+        self.owner = owner
+
+    append = _changing('append')
+    extend = _changing('extend')
+    insert = _changing('insert')
+    remove = _changing('remove')
+    pop = _changing('pop')
+    clear = _changing('clear')
+    sort = _changing('sort')
+    reverse = _changing('reverse')
+    __setitem__ = _changing('__setitem__')
+    __delitem__ = _changing('__delitem__')
+    __iadd__ = _changing('__iadd__')
+    __imul__ = _changing('__imul__')
@@ -0,0 +1,358 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains helper classes to check many regex patterns against a text at once and
+to route updates to the handlers whose patterns may match them.
+
+.. versionadded:: 14.0
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import re
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from telegram import Update
+from telegram.ext import filters
+from telegram.ext._callbackqueryhandler import CallbackQueryHandler
+from telegram.ext._choseninlineresulthandler import ChosenInlineResultHandler
+from telegram.ext._commandhandler import CommandRouter
+from telegram.ext._handler import Handler
+from telegram.ext._inlinequeryhandler import InlineQueryHandler
+from telegram.ext._messagehandler import MessageHandler
+from telegram.ext._stringregexhandler import StringRegexHandler
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse  # type: ignore
+except ImportError:  # Python < 3.11
+    import sre_constants  # pylint: disable=deprecated-module
+    import sre_parse  # pylint: disable=deprecated-module
+
+
+def _literal_prefilter(pattern: Pattern, search: bool) -> Tuple[bool, str]:
+    """Finds a literal string that must be contained in every text the pattern matches.
+
+    Returns:
+        Tuple[:obj:`bool`, :obj:`str`]: Whether the literal must be at the start of the text and
+        the literal. The literal is empty if none could be found.
+    """
+    if not isinstance(pattern.pattern, str) or pattern.flags & re.IGNORECASE:
+        return False, ''
+    try:
+        items = list(sre_parse.parse(pattern.pattern, pattern.flags))
+    except Exception:  # pylint: disable=broad-except
+        return False, ''
+
+    anchored = not search
+    if items and items[0] in (
+        (sre_constants.AT, sre_constants.AT_BEGINNING),
+        (sre_constants.AT, sre_constants.AT_BEGINNING_STRING),
+    ):
+        # With MULTILINE, `^` also matches after each newline
+        if (
+            anchored
+            or items[0][1] == sre_constants.AT_BEGINNING_STRING
+            or not pattern.flags & re.MULTILINE
+        ):
+            anchored = True
+            items = items[1:]
+
+    runs = []
+    current: List[str] = []
+    for operator, argument in items:
+        if operator == sre_constants.LITERAL:
+            current.append(chr(argument))
+            continue
+        runs.append(''.join(current))
+        current = []
+        if anchored:
+            # Only the literal at the very start can be checked with `startswith`
+            break
+    runs.append(''.join(current))
+
+    if anchored:
+        return True, runs[0]
+    return False, max(runs, key=len)
+
+
+class RegexSet:
+    """A set of regex patterns that are checked against a text together.
+
+    For each pattern, a literal that is contained in all texts the pattern matches is determined
+    once. :meth:`candidates` then rules out all patterns whose literal is not contained in the
+    text without running the patterns themselves. Literals that texts must start with are looked
+    up by the first character of the text, so checking many patterns that start with different
+    literals is almost as cheap as checking one of them.
+
+    Args:
+        patterns (Sequence[:obj:`str` | :obj:`re.Pattern`]): The patterns.
+        search (:obj:`bool`, optional): Whether the patterns are used with :func:`re.search`.
+            Defaults to :obj:`False`, i.e. :func:`re.match`.
+
+    Attributes:
+        patterns (List[:obj:`re.Pattern`]): The compiled patterns.
+        search (:obj:`bool`): Whether the patterns are used with :func:`re.search`.
+    """
+
+    __slots__ = ('patterns', 'search', '_unfiltered', '_prefixes', '_literals')
+
+    def __init__(self, patterns: Sequence[Union[str, Pattern]], search: bool = False):
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+        self.search = search
+        # Patterns without a literal are always candidates
+        self._unfiltered: Set[int] = set()
+        # first character -> (prefix, index of pattern)
+        self._prefixes: Dict[str, List[Tuple[str, int]]] = {}
+        self._literals: List[Tuple[str, int]] = []
+
+        for index, pattern in enumerate(self.patterns):
+            anchored, literal = _literal_prefilter(pattern, search)
+            if not literal:
+                self._unfiltered.add(index)
+            elif anchored:
+                self._prefixes.setdefault(literal[0], []).append((literal, index))
+            else:
+                self._literals.append((literal, index))
+
+    def candidates(self, text: str) -> Set[int]:
+        """Returns the indices of the patterns that may match the text. All other patterns
+        certainly don't match.
+
+        Args:
+            text (:obj:`str`): The text.
+
+        Returns:
+            Set[:obj:`int`]
+        """
+        candidates = set(self._unfiltered)
+        if text:
+            for prefix, index in self._prefixes.get(text[0], ()):
+                if text.startswith(prefix):
+                    candidates.add(index)
+        for literal, index in self._literals:
+            if literal in text:
+                candidates.add(index)
+        return candidates
+
+    def matches(self, text: str) -> Dict[int, Match]:
+        """Returns the matches of all patterns that match the text. The match objects are the
+        same as the ones returned by :func:`re.match` or :func:`re.search` for the single
+        patterns.
+
+        Args:
+            text (:obj:`str`): The text.
+
+        Returns:
+            Dict[:obj:`int`, :obj:`re.Match`]: The matches by index of the pattern.
+        """
+        matches = {}
+        for index in sorted(self.candidates(text)):
+            pattern = self.patterns[index]
+            match: Optional[Match] = pattern.search(text) if self.search else pattern.match(text)
+            if match:
+                matches[index] = match
+        return matches
+
+
+def _callback_data(update: object) -> object:
+    if isinstance(update, Update) and update.callback_query:
+        return update.callback_query.data
+    return None
+
+
+def _inline_query(update: object) -> Optional[str]:
+    if isinstance(update, Update) and update.inline_query:
+        # Empty queries are never matched against the pattern
+        return update.inline_query.query or None
+    return None
+
+
+def _chosen_inline_result(update: object) -> Optional[str]:
+    if isinstance(update, Update) and update.chosen_inline_result:
+        return update.chosen_inline_result.result_id
+    return None
+
+
+def _string(update: object) -> Optional[str]:
+    return update if isinstance(update, str) else None
+
+
+def _text(update: object) -> Optional[str]:
+    if isinstance(update, Update) and update.effective_message:
+        # filters.Regex doesn't match empty texts
+        return update.effective_message.text or None
+    return None
+
+
+def _caption(update: object) -> Optional[str]:
+    if isinstance(update, Update) and update.effective_message:
+        return update.effective_message.caption or None
+    return None
+
+
+# field -> (whether the pattern is used with `re.search`, function extracting the field)
+# The functions return `None`, if the handler can't handle the update regardless of its pattern.
+# If they return something other than a string, the pattern can't be checked in advance.
+_FIELDS: Dict[str, Tuple[bool, Callable[[object], object]]] = {
+    'callback_data': (False, _callback_data),
+    'inline_query': (False, _inline_query),
+    'chosen_inline_result': (False, _chosen_inline_result),
+    'string': (False, _string),
+    'text': (True, _text),
+    'caption': (True, _caption),
+}
+
+_PATTERN_HANDLERS = (
+    (CallbackQueryHandler, 'callback_data'),
+    (InlineQueryHandler, 'inline_query'),
+    (ChosenInlineResultHandler, 'chosen_inline_result'),
+    (StringRegexHandler, 'string'),
+)
+
+
+def _and_chain(filter_: filters.BaseFilter) -> Iterator[filters.BaseFilter]:
+    """Yields the filters that must all pass for ``filter_`` to pass."""
+    # pylint: disable=protected-access
+    if isinstance(filter_, filters._MergedFilter) and filter_.and_filter is not None:
+        yield from _and_chain(filter_.base_filter)
+        yield from _and_chain(filter_.and_filter)
+    else:
+        yield filter_
+
+
+def _routing_key(handler: Handler) -> Optional[Tuple[str, Pattern]]:
+    """Returns the field of the update the handler matches its pattern against and the pattern,
+    or :obj:`None`, if the handler has no such pattern."""
+    check_update = type(handler).check_update
+    for handler_type, field in _PATTERN_HANDLERS:
+        if check_update is handler_type.check_update:
+            pattern = handler.pattern  # type: ignore[attr-defined]
+            return (field, pattern) if isinstance(pattern, re.Pattern) else None
+    if check_update is MessageHandler.check_update:
+        for filter_ in _and_chain(handler.filters):  # type: ignore[attr-defined]
+            if type(filter_) is filters.Regex:  # pylint: disable=unidiomatic-typecheck
+                return 'text', filter_.pattern  # type: ignore[attr-defined]
+            if type(filter_) is filters.CaptionRegex:  # pylint: disable=unidiomatic-typecheck
+                return 'caption', filter_.pattern  # type: ignore[attr-defined]
+    return None
+
+
+class PatternRouter:
+    """Routes updates to the candidate handlers of one handler group of the
+    :class:`telegram.ext.Dispatcher`. The regex patterns of the handlers are checked against the
+    update with one :class:`RegexSet` per field of the update, such that handlers whose pattern
+    can't match are not checked at all. All other handlers are always candidates. The order of the
+    handlers is preserved.
+
+    The handlers that are left still check the update themselves, so the matches in
+    :attr:`telegram.ext.CallbackContext.matches` are exactly the same as without routing.
+
+    Routed are
+
+    * :class:`telegram.ext.CallbackQueryHandler`, :class:`telegram.ext.InlineQueryHandler`,
+      :class:`telegram.ext.ChosenInlineResultHandler` and :class:`telegram.ext.StringRegexHandler`
+      with a regex pattern
+    * :class:`telegram.ext.MessageHandler` whose filter is a :class:`telegram.ext.filters.Regex`
+      or :class:`telegram.ext.filters.CaptionRegex` filter, or combines one of them with other
+      filters using ``&``. The other filters are not evaluated, if the pattern can't match.
+
+    Note:
+        The patterns are read on initialization. Subclasses of the above handlers that override
+        ``check_update`` are always candidates.
+
+    Args:
+        handlers (List[:class:`telegram.ext.Handler`]): The handlers of the group.
+        source (:class:`telegram.ext.CommandRouter`, optional): If passed, the candidates of this
+            router are filtered instead of :paramref:`handlers`.
+
+    Attributes:
+        handlers (List[:class:`telegram.ext.Handler`]): The handlers of the group.
+        source (:class:`telegram.ext.CommandRouter`): Optional. The router whose candidates are
+            filtered.
+    """
+
+    __slots__ = ('handlers', 'source', '_sets')
+
+    def __init__(self, handlers: List[Handler], source: CommandRouter = None):
+        self.handlers = handlers
+        self.source = source
+
+        patterns: Dict[str, Tuple[List[Pattern], List[int]]] = {}
+        for handler in handlers:
+            key = _routing_key(handler)
+            if key:
+                field_patterns, handler_ids = patterns.setdefault(key[0], ([], []))
+                field_patterns.append(key[1])
+                handler_ids.append(id(handler))
+
+        # field -> (function extracting the field, patterns, ids of the handlers by pattern)
+        self._sets: List[Tuple[Callable[[object], object], RegexSet, List[int]]] = [
+            (_FIELDS[field][1], RegexSet(field_patterns, search=_FIELDS[field][0]), handler_ids)
+            for field, (field_patterns, handler_ids) in patterns.items()
+        ]
+
+    @staticmethod
+    def is_routable(handler: Handler) -> bool:
+        """Whether the handler is looked up by its pattern.
+
+        Args:
+            handler (:class:`telegram.ext.Handler`): The handler.
+        """
+        return _routing_key(handler) is not None
+
+    def candidates(self, update: object) -> List[Handler]:
+        """Returns the handlers that may handle the update, in order.
+
+        Args:
+            update (:class:`telegram.Update` | :obj:`object`): The update.
+
+        Returns:
+            List[:class:`telegram.ext.Handler`]
+        """
+        handlers = self.source.candidates(update) if self.source is not None else self.handlers
+
+        excluded: Set[int] = set()
+        for extract, regex_set, handler_ids in self._sets:
+            value = extract(update)
+            if value is None:
+                excluded.update(handler_ids)
+            elif isinstance(value, str):
+                possible = regex_set.candidates(value)
+                excluded.update(
+                    handler_id
+                    for index, handler_id in enumerate(handler_ids)
+                    if index not in possible
+                )
+
+        if not excluded:
+            return handlers
+        return [handler for handler in handlers if id(handler) not in excluded]
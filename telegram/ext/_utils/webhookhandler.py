@@ -18,16 +18,15 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 # pylint: disable=missing-module-docstring
 
+import asyncio
 import logging
-from queue import Queue
+from http import HTTPStatus
 from ssl import SSLContext
-from threading import Event, Lock
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import tornado.web
 from tornado import httputil
 from tornado.httpserver import HTTPServer
-from tornado.ioloop import IOLoop
 
 from telegram import Update
 from telegram.ext import ExtBot
@@ -36,10 +35,47 @@ from telegram._utils.types import JSONDict
 if TYPE_CHECKING:
     from telegram import Bot
 
-try:
-    import ujson as json
-except ImportError:
-    import json  # type: ignore[no-redef]
+_logger = logging.getLogger(__name__)
+
+
+def process_webhook_payload(
+    payload: bytes,
+    bot: 'Bot',
+    update_queue: asyncio.Queue,
+    high_water_mark: Optional[int],
+) -> HTTPStatus:
+    """Deserializes the payload of a webhook call and puts the update into the update queue.
+    This is shared by all the webhook servers.
+
+    Returns:
+        :class:`http.HTTPStatus`: The status code that should be used for the response.
+        ``SERVICE_UNAVAILABLE`` means that the update was *not* accepted because the update queue
+        is too full. In that case Telegram will retry to deliver the update later on.
+
+    Raises:
+        :exc:`ValueError`: If the payload is not valid JSON.
+    """
+    # Check the backpressure first so that we don't even deserialize updates that we will
+    # reject anyway
+    if high_water_mark is not None and update_queue.qsize() >= high_water_mark:
+        _logger.debug('Update queue is above the high-water mark. Rejecting update.')
+        return HTTPStatus.SERVICE_UNAVAILABLE
+
+    data = bot.json_codec.loads(payload)
+    _logger.debug('Webhook received data: %s', data)
+
+    update = Update.de_json(data, bot, copy=False)
+    if update:
+        _logger.debug('Received Update with ID %d on Webhook', update.update_id)
+        # handle arbitrary callback data, if necessary
+        if isinstance(bot, ExtBot):
+            bot.insert_callback_data(update)
+        try:
+            update_queue.put_nowait(update)
+        except asyncio.QueueFull:
+            _logger.debug('Update queue is full. Rejecting update.')
+            return HTTPStatus.SERVICE_UNAVAILABLE
+    return HTTPStatus.OK
 
 
 class WebhookServer:
@@ -47,7 +83,6 @@ class WebhookServer:
         'http_server',
         'listen',
         'port',
-        'loop',
         'logger',
         'is_running',
         'server_lock',
@@ -60,47 +95,46 @@ class WebhookServer:
         self.http_server = HTTPServer(webhook_app, ssl_options=ssl_ctx)
         self.listen = listen
         self.port = port
-        self.loop: Optional[IOLoop] = None
         self.logger = logging.getLogger(__name__)
         self.is_running = False
-        self.server_lock = Lock()
-        self.shutdown_lock = Lock()
+        self.server_lock = asyncio.Lock()
+        self.shutdown_lock = asyncio.Lock()
 
-    def serve_forever(self, ready: Event = None) -> None:
-        with self.server_lock:
-            IOLoop().make_current()
+    async def serve_forever(self, ready: asyncio.Event = None) -> None:
+        # Tornado runs on top of asyncio, so listening attaches the server to the running event
+        # loop. The loop then serves the requests until `shutdown` is called.
+        async with self.server_lock:
+            self.http_server.listen(self.port, address=self.listen)
             self.is_running = True
             self.logger.debug('Webhook Server started.')
-            self.loop = IOLoop.current()
-            self.http_server.listen(self.port, address=self.listen)
 
             if ready is not None:
                 ready.set()
 
-            self.loop.start()
-            self.logger.debug('Webhook Server stopped.')
-            self.is_running = False
-
-    def shutdown(self) -> None:
-        with self.shutdown_lock:
+    async def shutdown(self) -> None:
+        async with self.shutdown_lock:
             if not self.is_running:
                 self.logger.warning('Webhook Server already stopped.')
                 return
-            self.loop.add_callback(self.loop.stop)  # type: ignore
-
-    # pylint: disable=unused-argument
-    def handle_error(self, request: object, client_address: str) -> None:
-        """Handle an error gracefully."""
-        self.logger.debug(
-            'Exception happened during processing of request from %s',
-            client_address,
-            exc_info=True,
-        )
+            self.http_server.stop()
+            await self.http_server.close_all_connections()
+            self.is_running = False
+            self.logger.debug('Webhook Server stopped.')
 
 
 class WebhookAppClass(tornado.web.Application):
-    def __init__(self, webhook_path: str, bot: 'Bot', update_queue: Queue):
-        self.shared_objects = {"bot": bot, "update_queue": update_queue}
+    def __init__(
+        self,
+        webhook_path: str,
+        bot: 'Bot',
+        update_queue: asyncio.Queue,
+        high_water_mark: int = None,
+    ):
+        self.shared_objects = {
+            "bot": bot,
+            "update_queue": update_queue,
+            "high_water_mark": high_water_mark,
+        }
         handlers = [(rf"{webhook_path}/?", WebhookHandler, self.shared_objects)]  # noqa
         tornado.web.Application.__init__(self, handlers)  # type: ignore
 
@@ -122,28 +156,26 @@ class WebhookHandler(tornado.web.RequestHandler):
         super().__init__(application, request, **kwargs)
         self.logger = logging.getLogger(__name__)
 
-    def initialize(self, bot: 'Bot', update_queue: Queue) -> None:
+    def initialize(
+        self, bot: 'Bot', update_queue: asyncio.Queue, high_water_mark: Optional[int]
+    ) -> None:
         # pylint: disable=attribute-defined-outside-init
         self.bot = bot
         self.update_queue = update_queue
+        self.high_water_mark = high_water_mark
 
     def set_default_headers(self) -> None:
         self.set_header("Content-Type", 'application/json; charset="utf-8"')
 
-    def post(self) -> None:
+    async def post(self) -> None:
         self.logger.debug('Webhook triggered')
         self._validate_post()
-        json_string = self.request.body.decode()
-        data = json.loads(json_string)
-        self.set_status(200)
-        self.logger.debug('Webhook received data: %s', json_string)
-        update = Update.de_json(data, self.bot)
-        if update:
-            self.logger.debug('Received Update with ID %d on Webhook', update.update_id)
-            # handle arbitrary callback data, if necessary
-            if isinstance(self.bot, ExtBot):
-                self.bot.insert_callback_data(update)
-            self.update_queue.put(update)
+        status = process_webhook_payload(
+            self.request.body, self.bot, self.update_queue, self.high_water_mark
+        )
+        self.set_status(status)
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            self.set_header('Retry-After', '1')
 
     def _validate_post(self) -> None:
         ct_header = self.request.headers.get("Content-Type", None)
@@ -171,3 +203,121 @@ class WebhookHandler(tornado.web.RequestHandler):
             "Exception in WebhookHandler",
             exc_info=kwargs['exc_info'],
         )
+
+
+ASGIScope = Dict[str, Any]
+ASGIReceive = Callable[[], Awaitable[Dict[str, Any]]]
+ASGISend = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class WebhookASGIApp:
+    """Minimal ASGI application that accepts webhook calls. It can be mounted behind any ASGI
+    server, e.g. uvicorn or hypercorn, and then puts the updates into the update queue on the
+    event loop of that server. Use :meth:`telegram.ext.Updater.asgi_app` to create an instance.
+    """
+
+    __slots__ = (
+        'webhook_path',
+        'bot',
+        'update_queue',
+        'high_water_mark',
+        'on_startup',
+        'on_shutdown',
+        'logger',
+    )
+
+    def __init__(
+        self,
+        webhook_path: str,
+        bot: 'Bot',
+        update_queue: asyncio.Queue,
+        high_water_mark: int = None,
+        on_startup: Callable[[], Awaitable[object]] = None,
+        on_shutdown: Callable[[], Awaitable[object]] = None,
+    ):
+        self.webhook_path = webhook_path.rstrip('/')
+        self.bot = bot
+        self.update_queue = update_queue
+        self.high_water_mark = high_water_mark
+        self.on_startup = on_startup
+        self.on_shutdown = on_shutdown
+        self.logger = logging.getLogger(__name__)
+
+    async def __call__(self, scope: ASGIScope, receive: ASGIReceive, send: ASGISend) -> None:
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._http(scope, receive, send)
+        else:
+            raise ValueError(f"Unsupported ASGI scope type {scope['type']!r}")
+
+    async def _lifespan(self, receive: ASGIReceive, send: ASGISend) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                try:
+                    if self.on_startup:
+                        await self.on_startup()
+                except Exception as exc:
+                    # Report the failure to the ASGI server, which then exits
+                    self.logger.exception('Startup of the webhook application failed')
+                    await send({'type': 'lifespan.startup.failed', 'message': repr(exc)})
+                    return
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                try:
+                    if self.on_shutdown:
+                        await self.on_shutdown()
+                except Exception as exc:
+                    self.logger.exception('Shutdown of the webhook application failed')
+                    await send({'type': 'lifespan.shutdown.failed', 'message': repr(exc)})
+                    return
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _http(self, scope: ASGIScope, receive: ASGIReceive, send: ASGISend) -> None:
+        if scope['path'].rstrip('/') != self.webhook_path:
+            await self._respond(send, HTTPStatus.NOT_FOUND)
+            return
+        if scope['method'] != 'POST':
+            await self._respond(send, HTTPStatus.METHOD_NOT_ALLOWED)
+            return
+        headers = dict(scope['headers'])
+        if headers.get(b'content-type') != b'application/json':
+            await self._respond(send, HTTPStatus.FORBIDDEN)
+            return
+
+        self.logger.debug('Webhook triggered')
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunks.append(message.get('body', b''))
+            more_body = message.get('more_body', False)
+
+        try:
+            status = process_webhook_payload(
+                b''.join(chunks), self.bot, self.update_queue, self.high_water_mark
+            )
+        except ValueError:
+            self.logger.debug('Webhook received invalid JSON', exc_info=True)
+            status = HTTPStatus.BAD_REQUEST
+
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            await self._respond(send, status, [(b'retry-after', b'1')])
+        else:
+            await self._respond(send, status)
+
+    @staticmethod
+    async def _respond(
+        send: ASGISend, status: HTTPStatus, headers: List[Tuple[bytes, bytes]] = None
+    ) -> None:
+        await send(
+            {
+                'type': 'http.response.start',
+                'status': int(status),
+                'headers': [(b'content-type', b'application/json; charset="utf-8"')]
+                + (headers or []),
+            }
+        )
+        await send({'type': 'http.response.body', 'body': b''})
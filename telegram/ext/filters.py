@@ -33,6 +33,9 @@ This module contains filters for use with :class:`telegram.ext.MessageHandler`,
         * Filters which need to be initialized are now in CamelCase. E.g. ``filters.User(...)``.
         * Filters which do both (like ``Filters.text``) are now split as ready-to-use version
           ``filters.TEXT`` and class version ``filters.Text(...)``.
+    #. While the :class:`telegram.ext.Dispatcher` processes an update, the results of filters are
+       cached, such that filters shared by multiple handlers are evaluated only once. See
+       :class:`BaseFilter` for details.
 
 """
 
@@ -92,6 +95,9 @@ import re
 from abc import ABC, abstractmethod
 from threading import Lock
 from typing import (
+    Any,
+    Callable,
+    ClassVar,
     Dict,
     FrozenSet,
     List,
@@ -109,8 +115,11 @@ from telegram import Chat as TGChat, Message, MessageEntity, Update, User as TGU
 
 from telegram._utils.types import SLT
 from telegram.constants import DiceEmoji as DiceEmojiEnum
+from telegram.ext._utils.filtercache import CURRENT_FILTER_CACHE
 
 DataDict = Dict[str, list]
+_Plan = Callable[[Update], Optional[Union[bool, DataDict]]]
+_NOT_CACHED = object()
 
 
 class BaseFilter:
@@ -160,6 +169,15 @@ class BaseFilter:
     will be the class name. If you want to overwrite this assign a better name to the :attr:`name`
     class variable.
 
+    While the :class:`telegram.ext.Dispatcher` processes an update, the results of the filters
+    in this module are cached. If the same filter is used by multiple handlers, it is hence
+    evaluated at most once per update. Combined filters are compiled on first use such that they
+    directly evaluate the filters they consist of. The results of your own filters are not cached
+    by default. If the result of your filter derived from :class:`MessageFilter` or
+    :class:`UpdateFilter` depends only on the update, you can set :attr:`memoize` to :obj:`True`
+    in your subclass to have it cached as well. How often a filter was evaluated can be inspected
+    via :attr:`evaluations` and :attr:`cache_hits`.
+
     .. versionadded:: 14.0
         Added the arguments :attr:`name` and :attr:`data_filter`.
 
@@ -173,13 +191,25 @@ class BaseFilter:
     Attributes:
         name (:obj:`str`): Name for this filter.
         data_filter (:obj:`bool`): Whether this filter is a data filter.
+        memoize (:obj:`bool`): Class variable. Whether the result of this filter may be cached
+            while an update is being processed. Defaults to :obj:`None`, which means that only
+            the results of the filters defined in this module are cached. Set this to
+            :obj:`True` only if the result of the filter doesn't change while one update is being
+            processed, i.e. if the filter has no side effects and doesn't depend on state that
+            handlers may change.
+
+            .. versionadded:: 14.0
     """
 
-    __slots__ = ('_name', '_data_filter')
+    __slots__ = ('_name', '_data_filter', '_evaluations', '_cache_hits')
+
+    memoize: ClassVar[Optional[bool]] = None
 
     def __init__(self, name: str = None, data_filter: bool = False):
         self._name = self.__class__.__name__ if name is None else name
         self._data_filter = data_filter
+        self._evaluations = 0
+        self._cache_hits = 0
 
     # pylint: disable=no-self-use
     def check_update(self, update: Update) -> Optional[Union[bool, DataDict]]:
@@ -221,10 +251,96 @@ class BaseFilter:
     def name(self, name: str) -> None:
         self._name = name
 
+    @property
+    def evaluations(self) -> int:
+        """:obj:`int`: How often this filter was actually evaluated. For combined filters, this
+        is the number of times the combination was checked directly.
+
+        .. versionadded:: 14.0
+        """
+        return self._evaluations
+
+    @property
+    def cache_hits(self) -> int:
+        """:obj:`int`: How often the result of this filter was taken from the cache instead of
+        evaluating the filter again for the same update.
+
+        .. versionadded:: 14.0
+        """
+        return self._cache_hits
+
+    def reset_statistics(self) -> None:
+        """Resets :attr:`evaluations` and :attr:`cache_hits` to ``0``.
+
+        .. versionadded:: 14.0
+        """
+        self._evaluations = 0
+        self._cache_hits = 0
+
     def __repr__(self) -> str:
         return self.name
 
 
+def _run_filter(
+    filter_: Union['MessageFilter', 'UpdateFilter'], update: Update, obj: Any
+) -> Optional[Union[bool, DataDict]]:
+    """Returns ``filter_.filter(obj)``. The result is taken from the cache of the update that is
+    currently processed, if possible."""
+    cache = CURRENT_FILTER_CACHE.get()
+    if cache is None or cache.update is not update or not _memoizes(filter_):
+        filter_._evaluations += 1  # pylint: disable=protected-access
+        return filter_.filter(obj)
+
+    result = cache.results.get(id(filter_), _NOT_CACHED)
+    if result is _NOT_CACHED:
+        filter_._evaluations += 1  # pylint: disable=protected-access
+        result = cache.results[id(filter_)] = filter_.filter(obj)
+    else:
+        filter_._cache_hits += 1  # pylint: disable=protected-access
+
+    # _MergedFilter merges data dicts in place, so the cached one must not be handed out
+    if result and isinstance(result, dict):
+        return {
+            key: value.copy() if isinstance(value, list) else value
+            for key, value in result.items()
+        }
+    return result  # type: ignore[return-value]
+
+
+def _memoizes(filter_: BaseFilter) -> bool:
+    """Whether the results of ``filter_.filter`` may be cached, see :attr:`BaseFilter.memoize`."""
+    memoize = filter_.memoize
+    if memoize is None:
+        # Only the filters of this module are known not to change their result during an update
+        return type(filter_).__module__ == __name__
+    return memoize
+
+
+def _is_memoizable(filter_: BaseFilter) -> bool:
+    if isinstance(filter_, _CombinedFilter):
+        filter_.ensure_compiled()
+    elif type(filter_).check_update not in (MessageFilter.check_update, UpdateFilter.check_update):
+        # We can't know what a custom check_update does
+        return False
+    return _memoizes(filter_)
+
+
+def _compile(filter_: BaseFilter) -> _Plan:
+    """Returns a function that evaluates ``filter_`` for an update that is already known to
+    pass :meth:`BaseFilter.check_update`."""
+    if isinstance(filter_, _CombinedFilter):
+        filter_.ensure_compiled()
+        return lambda update: _run_filter(filter_, update, update)
+    check_update = type(filter_).check_update
+    if check_update is MessageFilter.check_update:
+        return lambda update: _run_filter(
+            filter_, update, update.effective_message  # type: ignore[arg-type]
+        )
+    if check_update is UpdateFilter.check_update:
+        return lambda update: _run_filter(filter_, update, update)  # type: ignore[arg-type]
+    return filter_.check_update
+
+
 class MessageFilter(BaseFilter):
     """Base class for all Message Filters. In contrast to :class:`UpdateFilter`, the object passed
     to :meth:`filter` is :obj:`telegram.Update.effective_message`.
@@ -244,7 +360,7 @@ class MessageFilter(BaseFilter):
 
     def check_update(self, update: Update) -> Optional[Union[bool, DataDict]]:
         if super().check_update(update):
-            return self.filter(update.effective_message)  # type: ignore[arg-type]
+            return _run_filter(self, update, update.effective_message)
         return False
 
     @abstractmethod
@@ -280,7 +396,7 @@ class UpdateFilter(BaseFilter):
     __slots__ = ()
 
     def check_update(self, update: Update) -> Optional[Union[bool, DataDict]]:
-        return self.filter(update) if super().check_update(update) else False
+        return _run_filter(self, update, update) if super().check_update(update) else False
 
     @abstractmethod
     def filter(self, update: Update) -> Optional[Union[bool, DataDict]]:
@@ -295,7 +411,49 @@ class UpdateFilter(BaseFilter):
         """
 
 
-class _InvertedFilter(UpdateFilter):
+class _CombinedFilter(UpdateFilter, ABC):
+    """Base class for filters that are combinations of other filters. On first use, the
+    combination is compiled into a function that directly evaluates the combined filters, skipping
+    the message check of the intermediate combinations. The combination is cached like any other
+    filter, if all the filters it consists of can be cached.
+    """
+
+    __slots__ = ('_plan', 'memoize')
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._plan: Optional[_Plan] = None
+        self.memoize = False  # type: ignore[misc]
+
+    def check_update(self, update: Update) -> Optional[Union[bool, DataDict]]:
+        if not BaseFilter.check_update(self, update):
+            return False
+        self.ensure_compiled()
+        return _run_filter(self, update, update)
+
+    def filter(self, update: Update) -> Optional[Union[bool, DataDict]]:
+        self.ensure_compiled()
+        return self._plan(update)  # type: ignore[misc]
+
+    def ensure_compiled(self) -> None:
+        if self._plan is None:
+            self.memoize = all(  # type: ignore[misc]
+                _is_memoizable(filter_) for filter_ in self.combined_filters
+            )
+            self._plan = self.compile()
+
+    @property
+    @abstractmethod
+    def combined_filters(self) -> List[BaseFilter]:
+        """The filters this combination consists of."""
+
+    @abstractmethod
+    def compile(self) -> _Plan:
+        """Returns a function that evaluates this combination for an update that passed
+        :meth:`BaseFilter.check_update`."""
+
+
+class _InvertedFilter(_CombinedFilter):
     """Represents a filter that has been inverted.
 
     Args:
@@ -309,8 +467,13 @@ class _InvertedFilter(UpdateFilter):
         super().__init__()
         self.inv_filter = f
 
-    def filter(self, update: Update) -> bool:
-        return not bool(self.inv_filter.check_update(update))
+    @property
+    def combined_filters(self) -> List[BaseFilter]:
+        return [self.inv_filter]
+
+    def compile(self) -> _Plan:
+        inv_plan = _compile(self.inv_filter)
+        return lambda update: not bool(inv_plan(update))
 
     @property
     def name(self) -> str:
@@ -321,7 +484,7 @@ class _InvertedFilter(UpdateFilter):
         raise RuntimeError('Cannot set name for combined filters.')
 
 
-class _MergedFilter(UpdateFilter):
+class _MergedFilter(_CombinedFilter):
     """Represents a filter consisting of two other filters.
 
     Args:
@@ -368,34 +531,63 @@ class _MergedFilter(UpdateFilter):
                 base[k] = comp_value
         return base
 
-    # pylint: disable=too-many-return-statements
-    def filter(self, update: Update) -> Union[bool, DataDict]:
-        base_output = self.base_filter.check_update(update)
+    @property
+    def combined_filters(self) -> List[BaseFilter]:
+        return [
+            filter_
+            for filter_ in (self.base_filter, self.and_filter, self.or_filter)
+            if filter_ is not None
+        ]
+
+    def compile(self) -> _Plan:
+        base_plan = _compile(self.base_filter)
+        data_filter = self.data_filter
+        merge = self._merge
         # We need to check if the filters are data filters and if so return the merged data.
         # If it's not a data filter or an or_filter but no matches return bool
         if self.and_filter:
-            # And filter needs to short circuit if base is falsy
-            if base_output:
-                comp_output = self.and_filter.check_update(update)
+            and_plan = _compile(self.and_filter)
+
+            def and_filter(update: Update) -> Union[bool, DataDict]:
+                # And filter needs to short circuit if base is falsy
+                base_output = base_plan(update)
+                if base_output:
+                    comp_output = and_plan(update)
+                    if comp_output:
+                        if data_filter:
+                            merged = merge(base_output, comp_output)
+                            if merged:
+                                return merged
+                        return True
+                return False
+
+            return and_filter
+
+        if self.or_filter:
+            or_plan = _compile(self.or_filter)
+
+            def or_filter(update: Update) -> Union[bool, DataDict]:
+                # Or filter needs to short circuit if base is truthy
+                base_output = base_plan(update)
+                if base_output:
+                    if data_filter:
+                        return base_output
+                    return True
+
+                comp_output = or_plan(update)
                 if comp_output:
-                    if self.data_filter:
-                        merged = self._merge(base_output, comp_output)
-                        if merged:
-                            return merged
+                    if data_filter:
+                        return comp_output
                     return True
-        elif self.or_filter:
-            # Or filter needs to short circuit if base is truthy
-            if base_output:
-                if self.data_filter:
-                    return base_output
-                return True
-
-            comp_output = self.or_filter.check_update(update)
-            if comp_output:
-                if self.data_filter:
-                    return comp_output
-                return True
-        return False
+                return False
+
+            return or_filter
+
+        def base_only(update: Update) -> bool:
+            base_plan(update)
+            return False
+
+        return base_only
 
     @property
     def name(self) -> str:
@@ -409,7 +601,7 @@ class _MergedFilter(UpdateFilter):
         raise RuntimeError('Cannot set name for combined filters.')
 
 
-class _XORFilter(UpdateFilter):
+class _XORFilter(_CombinedFilter):
     """Convenience filter acting as wrapper for :class:`MergedFilter` representing the an XOR gate
     for two filters.
 
@@ -427,8 +619,12 @@ class _XORFilter(UpdateFilter):
         self.xor_filter = xor_filter
         self.merged_filter = (base_filter & ~xor_filter) | (~base_filter & xor_filter)
 
-    def filter(self, update: Update) -> Optional[Union[bool, DataDict]]:
-        return self.merged_filter.check_update(update)
+    @property
+    def combined_filters(self) -> List[BaseFilter]:
+        return [self.merged_filter]
+
+    def compile(self) -> _Plan:
+        return _compile(self.merged_filter)
 
     @property
     def name(self) -> str:
@@ -588,6 +784,9 @@ class _ChatUserBaseFilter(MessageFilter, ABC):
         '_usernames',
     )
 
+    # The chat ids & usernames may be changed by handlers while an update is processed
+    memoize: ClassVar[bool] = False
+
     def __init__(
         self,
         chat_id: SLT[int] = None,
@@ -17,7 +17,20 @@
 #  along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains classes that handle the networking backend of ``python-telegram-bot``."""
 
+from telegram._utils.jsoncodec import JSONCodec, OrjsonCodec, UJSONCodec
+from ._preparedrequest import PreparedRequest
 from ._requestdata import RequestData
+from ._retrypolicy import RetryPolicy
 from ._baserequest import BaseRequest
+from ._mockrequest import MockRequest
 
-__all__ = ('BaseRequest', 'RequestData')
+__all__ = (
+    'BaseRequest',
+    'JSONCodec',
+    'MockRequest',
+    'OrjsonCodec',
+    'PreparedRequest',
+    'RequestData',
+    'RetryPolicy',
+    'UJSONCodec',
+)
@@ -18,18 +18,24 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an abstract class to make POST and GET requests."""
 import abc
+import asyncio
+import logging
 from contextlib import AbstractAsyncContextManager
 from http import HTTPStatus
 from types import TracebackType
-from typing import Union, Tuple, Type, Optional, ClassVar, TypeVar
-
-try:
-    import ujson as json
-except ImportError:
-    import json  # type: ignore[no-redef]
+from typing import (
+    AsyncIterator,
+    ClassVar,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from telegram._version import __version__ as ptb_ver
-from telegram.request import RequestData
+from telegram.request import RequestData, RetryPolicy
 
 from telegram.error import (
     TelegramError,
@@ -41,10 +47,13 @@ from telegram.error import (
     RetryAfter,
     Forbidden,
 )
+from telegram._utils.jsoncodec import DEFAULT_JSON_CODEC, JSONCodec
 from telegram._utils.types import JSONDict
 
 RT = TypeVar('RT', bound='BaseRequest')
 
+_logger = logging.getLogger(__name__)
+
 
 class BaseRequest(
     AbstractAsyncContextManager,
@@ -86,6 +95,15 @@ class BaseRequest(
         """
         raise NotImplementedError
 
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """The policy describing which failed requests are retried. Override this property to
+        enable retries. By default returns :obj:`None`, i.e. failed requests are not retried.
+
+        .. versionadded:: 14.0
+        """
+        return None
+
     async def __aenter__(self: RT) -> RT:
         try:
             await self.initialize()
@@ -159,7 +177,9 @@ class BaseRequest(
             connect_timeout=connect_timeout,
             pool_timeout=pool_timeout,
         )
-        json_data = self._parse_json_response(result)
+        json_data = self._parse_json_response(
+            result, request_data.json_codec if request_data else None
+        )
         # For successful requests, the results are in the 'result' entry
         # see https://core.telegram.org/bots/api#making-requests
         return json_data['result']
@@ -197,6 +217,71 @@ class BaseRequest(
             pool_timeout=pool_timeout,
         )
 
+    async def stream(
+        self,
+        url: str,
+        chunk_size: int = None,
+        read_timeout: float = None,
+        connect_timeout: float = None,
+        write_timeout: float = None,
+        pool_timeout: float = None,
+    ) -> AsyncIterator[bytes]:
+        """Retrieve the contents of a file by its URL in chunks, such that the file never has to be
+        in memory at once. Unlike :meth:`retrieve`, failed requests are not retried according to
+        :attr:`retry_policy`.
+
+        Warning:
+            This method will be called by the methods of :class:`telegram.File` and should *not*
+            be called manually.
+
+        .. versionadded:: 14.0
+
+        Args:
+            url (:obj:`str`): The web location we want to retrieve.
+            chunk_size (:obj:`int`, optional): The maximum size of the chunks in bytes. By default,
+                the chunks are yielded as they arrive.
+            read_timeout (:obj:`float`, optional): If this value is specified, use it as the read
+                timeout from the server (instead of the one specified during creation of the
+                connection pool).
+            connect_timeout (:obj:`float`, optional): See :paramref:`read_timeout`.
+            write_timeout (:obj:`float`, optional): See :paramref:`read_timeout`.
+            pool_timeout (:obj:`float`, optional): See :paramref:`read_timeout`.
+
+        Yields:
+            :obj:`bytes`: The chunks of the file.
+
+        Raises:
+            TelegramError
+
+        """
+        try:
+            code, chunks = await self.do_stream_request(
+                'GET',
+                url,
+                chunk_size=chunk_size,
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            )
+        except TelegramError as exc:
+            raise exc
+        except Exception as exc:
+            raise NetworkError(f"Unknown error in HTTP implementation: {exc}") from exc
+
+        try:
+            if not HTTPStatus.OK <= code <= 299:
+                self._raise_for_error_response(code, b''.join([chunk async for chunk in chunks]))
+            async for chunk in chunks:
+                yield chunk
+        except TelegramError as exc:
+            raise exc
+        except Exception as exc:
+            raise NetworkError(f"Unknown error in HTTP implementation: {exc}") from exc
+        finally:
+            if hasattr(chunks, 'aclose'):
+                await chunks.aclose()  # type: ignore[attr-defined]
+
     async def _request_wrapper(
         self,
         method: str,
@@ -210,6 +295,7 @@ class BaseRequest(
         """Wraps the real implementation request method.
 
         Performs the following tasks:
+        * Retry failed attempts according to :attr:`retry_policy`.
         * Handle the various HTTP response codes.
         * Parse the Telegram server response.
 
@@ -230,26 +316,68 @@ class BaseRequest(
         # TGs response also has the fields 'ok' and 'error_code'.
         # However, we rather rely on the HTTP status code for now.
 
-        try:
-            code, payload = await self.do_request(
-                method,
-                url,
-                request_data=request_data,
-                read_timeout=read_timeout,
-                write_timeout=write_timeout,
-                connect_timeout=connect_timeout,
-                pool_timeout=pool_timeout,
+        retry_policy = self.retry_policy
+        policy = None
+        if retry_policy is not None:
+            # Only files are downloaded via GET. Their names are not useful to look up policies
+            endpoint = url.rsplit('/', 1)[-1] if method == 'POST' else 'file'
+            policy = retry_policy.get_policy(method, endpoint)
+        attempt = 0
+
+        while True:
+            attempt += 1
+            error: Optional[TelegramError] = None
+            try:
+                code, payload = await self.do_request(
+                    method,
+                    url,
+                    request_data=request_data,
+                    read_timeout=read_timeout,
+                    write_timeout=write_timeout,
+                    connect_timeout=connect_timeout,
+                    pool_timeout=pool_timeout,
+                )
+            except TelegramError as exc:
+                error = exc
+            except Exception as exc:
+                error = NetworkError(f"Unknown error in HTTP implementation: {exc}")
+                error.__cause__ = exc
+
+            retryable = policy is not None and policy.is_retryable(
+                status_code=None if error else code, exception=error
             )
-        except TelegramError as exc:
-            raise exc
-        except Exception as exc:
-            raise NetworkError(f"Unknown error in HTTP implementation: {exc}") from exc
+            if retryable and attempt < policy.max_attempts:  # type: ignore[union-attr]
+                delay = policy.get_delay(attempt)  # type: ignore[union-attr]
+                retry_policy.retries[endpoint] += 1  # type: ignore[union-attr]
+                _logger.debug(
+                    'Attempt %d to call %s failed (%s). Retrying in %.2f seconds.',
+                    attempt,
+                    endpoint,
+                    error or f'status code {code}',
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            if retryable:
+                retry_policy.failures[endpoint] += 1  # type: ignore[union-attr]
+            if error:
+                raise error
+            break
 
         if HTTPStatus.OK <= code <= 299:
             # 200-299 range are HTTP success statuses
             return payload
 
-        response_data = self._parse_json_response(payload)
+        self._raise_for_error_response(
+            code, payload, request_data.json_codec if request_data else None
+        )
+
+    def _raise_for_error_response(
+        self, code: int, payload: bytes, json_codec: JSONCodec = None
+    ) -> NoReturn:
+        """Raises the exception matching an error response of the Bot API."""
+        response_data = self._parse_json_response(payload, json_codec)
 
         # In some special cases, we ca raise more informative exceptions:
         # see https://core.telegram.org/bots/api#responseparameters and
@@ -287,18 +415,32 @@ class BaseRequest(
         raise NetworkError(f'{message} ({code})')
 
     @staticmethod
-    def _parse_json_response(json_payload: bytes) -> JSONDict:
+    def _parse_json_response(json_payload: bytes, json_codec: JSONCodec = None) -> JSONDict:
         """Try and parse the JSON returned from Telegram.
 
+        Args:
+            json_payload (:obj:`bytes`): The UTF-8 encoded JSON.
+            json_codec (:class:`telegram.request.JSONCodec`, optional): The codec to decode the
+                JSON with.
+
         Returns:
             dict: A JSON parsed as Python dict with results.
 
         Raises:
             TelegramError: If the data could not be json_loaded
         """
+        json_codec = json_codec or DEFAULT_JSON_CODEC
+        try:
+            # Decoding the bytes directly avoids creating an intermediate string
+            return json_codec.loads(json_payload)
+        except ValueError:
+            pass
+
+        # Clients can send arbitrary bytes e.g. in callback data, so replace invalid characters
+        # and try again
         decoded_s = json_payload.decode('utf-8', 'replace')
         try:
-            return json.loads(decoded_s)
+            return json_codec.loads(decoded_s)
         except ValueError as exc:
             raise TelegramError('Invalid server response') from exc
 
@@ -335,3 +477,55 @@ class BaseRequest(
             Tuple[:obj:`int`, :obj:`bytes`]: The HTTP return code & the payload part of the server
             response.
         """
+
+    async def do_stream_request(
+        self,
+        method: str,
+        url: str,
+        chunk_size: int = None,
+        connect_timeout: float = None,
+        read_timeout: float = None,
+        write_timeout: float = None,
+        pool_timeout: float = None,
+    ) -> Tuple[int, AsyncIterator[bytes]]:
+        """Makes a request to the Bot API without reading the whole response into memory. By
+        default, this calls :meth:`do_request` and yields the payload in chunks. Override this
+        method to support streaming downloads.
+
+        Warning:
+            This method will be called by :meth:`stream`. It should *not* be called manually.
+
+        .. versionadded:: 14.0
+
+        Args:
+            method (:obj:`str`): HTTP method (i.e. ``'POST'``, ``'GET'``, etc.).
+            url (:obj:`str`): The request's URL.
+            chunk_size (:obj:`int`, optional): The maximum size of the chunks in bytes. By default,
+                the chunks are yielded as they arrive.
+            read_timeout (:obj:`float`, optional): If this value is specified, use it as the read
+                timeout from the server (instead of the one specified during creation of the
+                connection pool).
+            write_timeout (:obj:`float`, optional): If this value is specified, use it as the write
+                timeout from the server (instead of the one specified during creation of the
+                connection pool).
+
+        Returns:
+            Tuple[:obj:`int`, AsyncIterator[:obj:`bytes`]]: The HTTP return code & an iterator
+            over the chunks of the payload part of the server response. If the iterator has an
+            ``aclose`` method, it is called once the response is no longer needed.
+        """
+        code, payload = await self.do_request(
+            method,
+            url,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+        )
+
+        async def chunks() -> AsyncIterator[bytes]:
+            step = chunk_size or len(payload) or 1
+            for start in range(0, len(payload), step):
+                yield payload[start : start + step]
+
+        return code, chunks()
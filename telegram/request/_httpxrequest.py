@@ -34,12 +34,33 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains methods to make POST and GET requests using the httpx library."""
-from typing import Tuple, Optional
+import asyncio
+import logging
+import socket
+import weakref
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
 
+try:
+    import h2  # noqa: F401  # pylint: disable=unused-import
+
+    H2_INSTALLED = True
+except ImportError:
+    H2_INSTALLED = False
+
 from telegram.error import TimedOut, NetworkError
-from telegram.request import BaseRequest, RequestData
+from telegram.request import BaseRequest, RequestData, RetryPolicy
+
+_logger = logging.getLogger(__name__)
+
+# Detect connections that were silently dropped, e.g. by a NAT, after two minutes of idleness and
+# give up after eight unanswered probes. TCP_KEEPIDLE & co. are not available on all platforms
+_TCP_KEEPALIVE_OPTIONS: List[Tuple[int, int]] = [
+    (getattr(socket, name), value)
+    for name, value in (('TCP_KEEPIDLE', 120), ('TCP_KEEPINTVL', 30), ('TCP_KEEPCNT', 8))
+    if hasattr(socket, name)
+]
 
 
 class HTTPXRequest(BaseRequest):
@@ -48,7 +69,9 @@ class HTTPXRequest(BaseRequest):
 
     Args:
         connection_pool_size (:obj:`int`, optional): Number of connections to keep in the
-            connection pool. Default to :obj:`1`.
+            connection pool. Default to :obj:`1`. With :paramref:`http2`, this is the maximum
+            number of connections, but requests are sent over a single connection as long as the
+            server accepts more concurrent requests on it.
         proxy_url (:obj:`str`, optional): The URL to the proxy server. For example
             ``'http://127.0.0.1:3128'``. Defaults to :obj:`None`.
         connect_timeout (:obj:`float`, optional): The maximum amount of time (in seconds) to wait
@@ -64,10 +87,57 @@ class HTTPXRequest(BaseRequest):
         pool_timeout (:obj:`float`, optional): Timeout waiting for a connection object to become
             available and returned from the connection pool. :obj:`None` will set an infinite
             timeout. Defaults to ``1.0``.
+        retry_policy (:class:`telegram.request.RetryPolicy`, optional): Describes which failed
+            requests are retried. Defaults to :obj:`None`, i.e. failed requests are not retried.
+
+            .. versionadded:: 14.0
+        http2 (:obj:`bool`, optional): Whether to use HTTP/2 instead of HTTP/1.1. With HTTP/2,
+            many concurrent requests are multiplexed over one connection, so that e.g. a slow
+            upload doesn't block the other requests. Defaults to :obj:`False`.
+
+            Note:
+                To use this, PTB must be installed via
+                ``pip install python-telegram-bot[http2]``.
+
+            .. versionadded:: 14.0
+        warmup_connections (:obj:`int`, optional): Number of connections to open in
+            :meth:`initialize` by sending ``HEAD`` requests to :paramref:`warmup_url`, such that
+            the first requests don't have to wait for the connections to be established. Must not
+            be larger than :paramref:`connection_pool_size`. With :paramref:`http2`, a single
+            connection is opened. Defaults to ``0``.
+
+            .. versionadded:: 14.0
+        warmup_url (:obj:`str`, optional): The URL used to open connections. Should be on the
+            same host as the requests of the bot. Defaults to ``'https://api.telegram.org'``.
+
+            .. versionadded:: 14.0
+        keepalive_interval (:obj:`float`, optional): If passed, the connections opened by
+            :meth:`initialize` are kept open by sending ``HEAD`` requests to :paramref:`warmup_url`
+            every :paramref:`keepalive_interval` seconds in the background. Idle connections are
+            kept in the pool for at least twice this time. Defaults to :obj:`None`.
+
+            .. versionadded:: 14.0
+
+    Note:
+        All connections are opened with TCP keepalive enabled. Where available, the first probe
+        is sent after two minutes of idleness and the connection is considered broken after
+        eight unanswered probes in intervals of 30 seconds.
 
     """
 
-    __slots__ = ('_client', '_connection_pool_size')
+    __slots__ = (
+        '_client',
+        '_connection_pool_size',
+        '_retry_policy',
+        '_http2',
+        '_warmup_connections',
+        '_warmup_url',
+        '_keepalive_interval',
+        '_keepalive_task',
+        '_known_streams',
+        '_pool_hits',
+        '_pool_misses',
+    )
 
     def __init__(
         self,
@@ -77,7 +147,22 @@ class HTTPXRequest(BaseRequest):
         read_timeout: Optional[float] = 5.0,
         write_timeout: Optional[float] = 5.0,
         pool_timeout: Optional[float] = 1.0,
+        retry_policy: RetryPolicy = None,
+        http2: bool = False,
+        warmup_connections: int = 0,
+        warmup_url: str = 'https://api.telegram.org',
+        keepalive_interval: float = None,
     ):
+        if http2 and not H2_INSTALLED:
+            raise RuntimeError(
+                'To use HTTP/2, PTB must be installed via '
+                '`pip install python-telegram-bot[http2]`.'
+            )
+        if not 0 <= warmup_connections <= connection_pool_size:
+            raise ValueError('`warmup_connections` must be between 0 and `connection_pool_size`.')
+        if keepalive_interval is not None and keepalive_interval <= 0:
+            raise ValueError('`keepalive_interval` must be positive.')
+
         timeout = httpx.Timeout(
             connect=connect_timeout,
             read=read_timeout,
@@ -85,8 +170,33 @@ class HTTPXRequest(BaseRequest):
             pool=pool_timeout,
         )
         self._connection_pool_size = connection_pool_size
+        self._retry_policy = retry_policy
+        self._http2 = http2
+        self._warmup_connections = warmup_connections
+        self._warmup_url = warmup_url
+        self._keepalive_interval = keepalive_interval
+        self._keepalive_task: Optional[asyncio.Task] = None
+        # The network streams of the open HTTP/1.1 connections, see _track_connection
+        self._known_streams: weakref.WeakSet = weakref.WeakSet()
+        self._pool_hits = 0
+        self._pool_misses = 0
+
+        if http2:
+            # All requests share one connection unless the server limits the number of concurrent
+            # streams. Connections opened beyond that during bursts need not be kept around, but
+            # the shared one is worth keeping alive longer than httpx' default of 5 seconds
+            max_keepalive_connections = 1
+            keepalive_expiry = 30.0
+        else:
+            max_keepalive_connections = connection_pool_size
+            keepalive_expiry = 5.0
+        if keepalive_interval:
+            # Otherwise the connections expire before they are used by the keepalive task
+            keepalive_expiry = max(keepalive_expiry, 2 * keepalive_interval)
         limits = httpx.Limits(
-            max_connections=connection_pool_size, max_keepalive_connections=connection_pool_size
+            max_connections=connection_pool_size,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
         )
 
         # only use `proxy_url` if not `None`
@@ -94,10 +204,13 @@ class HTTPXRequest(BaseRequest):
         # TODO p0: Test client with proxy!
         # TODO p2: Document that this can also be specified via env vars
         #          https://www.python-httpx.org/advanced/#environment-variables
+        # The headers are the same for all requests, so we set them only once
         self._client = httpx.AsyncClient(
             timeout=timeout,
             proxies=proxy_url,
             limits=limits,
+            http2=http2,
+            headers={'User-Agent': self.USER_AGENT},
         )
 
     @property
@@ -105,13 +218,95 @@ class HTTPXRequest(BaseRequest):
         """See :attr:`BaseRequest.connection_pool_size`."""
         return self._connection_pool_size
 
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """See :attr:`BaseRequest.retry_policy`."""
+        return self._retry_policy
+
+    @property
+    def pool_stats(self) -> Dict[str, int]:
+        """Statistics about the reuse of pooled connections, which e.g. help to choose
+        :paramref:`connection_pool_size`: ``'hits'`` is the number of requests that were sent
+        over an already open connection and ``'misses'`` is the number of requests for which a
+        new connection had to be opened. The requests sent to open and keep open connections, see
+        :paramref:`warmup_connections`, are not counted.
+
+        Note:
+            Only HTTP/1.1 requests are taken into account.
+
+        .. versionadded:: 14.0
+        """
+        return {'hits': self._pool_hits, 'misses': self._pool_misses}
+
     async def initialize(self) -> None:
-        """See :meth:`BaseRequest.initialize`."""
+        """See :meth:`BaseRequest.initialize`. Opens :paramref:`warmup_connections`
+        connections and starts the background task that keeps them open, if
+        :paramref:`keepalive_interval` is set.
+        """
+        await self._warm_up()
+        if self._keepalive_interval and self._keepalive_task is None:
+            self._keepalive_task = asyncio.ensure_future(self._keep_alive())
 
     async def stop(self) -> None:
         """See :meth:`BaseRequest.stop`."""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass
+            self._keepalive_task = None
         await self._client.aclose()
 
+    async def _warm_up(self) -> None:
+        connections = self._warmup_connections
+        if self._http2:
+            connections = min(connections, 1)
+        # Concurrent requests can't share a HTTP/1.1 connection, so each one opens a connection
+        # unless there are enough idle ones
+        results = await asyncio.gather(
+            *(self._ping() for _ in range(connections)), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                _logger.debug(
+                    'Failed to open a connection to %s', self._warmup_url, exc_info=result
+                )
+
+    async def _ping(self) -> None:
+        response = await self._client.head(self._warmup_url)
+        self._track_connection(response, count=False)
+
+    async def _keep_alive(self) -> None:
+        while True:
+            await asyncio.sleep(self._keepalive_interval)  # type: ignore[arg-type]
+            await self._warm_up()
+
+    def _track_connection(self, response: httpx.Response, count: bool = True) -> None:
+        # httpcore passes the network stream of HTTP/1.1 connections along with the response.
+        # This allows us to set the socket options on new connections and to count how often
+        # open connections are reused.
+        stream = response.extensions.get('network_stream')
+        if stream is None:
+            return
+        if stream in self._known_streams:
+            if count:
+                self._pool_hits += 1
+            return
+
+        if count:
+            self._pool_misses += 1
+        self._known_streams.add(stream)
+        sock = stream.get_extra_info('socket')
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for option, value in _TCP_KEEPALIVE_OPTIONS:
+                sock.setsockopt(socket.IPPROTO_TCP, option, value)
+        except OSError as exc:
+            _logger.debug('Failed to enable TCP keepalive', exc_info=exc)
+
     async def do_request(
         self,
         method: str,
@@ -123,26 +318,7 @@ class HTTPXRequest(BaseRequest):
         pool_timeout: float = None,
     ) -> Tuple[int, bytes]:
         """See :meth:`BaseRequest.do_request`."""
-        timeout = httpx.Timeout(
-            connect=self._client.timeout.connect,
-            read=self._client.timeout.read,
-            write=self._client.timeout.write,
-            pool=self._client.timeout.pool,
-        )
-        if read_timeout is not None:
-            timeout.read = read_timeout
-        if write_timeout is not None:
-            timeout.write = write_timeout
-        if connect_timeout is not None:
-            timeout.connect = connect_timeout
-        if pool_timeout is not None:
-            timeout.pool = pool_timeout
-
-        # TODO p0: On Linux, use setsockopt to properly set socket level keepalive.
-        #          (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 120)
-        #          (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 30)
-        #          (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 8)
-        # TODO p4: Support setsockopt on lesser platforms than Linux.
+        timeout = self._build_timeout(connect_timeout, read_timeout, write_timeout, pool_timeout)
 
         files = request_data.multipart_data if request_data else None
         data = request_data.json_parameters if request_data else None
@@ -150,7 +326,6 @@ class HTTPXRequest(BaseRequest):
             res = await self._client.request(
                 method=method,
                 url=url,
-                headers={'User-Agent': self.USER_AGENT},
                 timeout=timeout,
                 files=files,
                 data=data,
@@ -162,4 +337,68 @@ class HTTPXRequest(BaseRequest):
             # TODO p4: do something smart here; for now just raise NetworkError
             raise NetworkError(f'httpx HTTPError: {err}') from err
 
+        self._track_connection(res)
         return res.status_code, res.content
+
+    async def do_stream_request(
+        self,
+        method: str,
+        url: str,
+        chunk_size: int = None,
+        connect_timeout: float = None,
+        read_timeout: float = None,
+        write_timeout: float = None,
+        pool_timeout: float = None,
+    ) -> Tuple[int, AsyncIterator[bytes]]:
+        """See :meth:`BaseRequest.do_stream_request`."""
+        request = self._client.build_request(
+            method=method,
+            url=url,
+            timeout=self._build_timeout(
+                connect_timeout, read_timeout, write_timeout, pool_timeout
+            ),
+        )
+        try:
+            response = await self._client.send(request, stream=True)
+        except httpx.TimeoutException as err:
+            raise TimedOut() from err
+        except httpx.HTTPError as err:
+            raise NetworkError(f'httpx HTTPError: {err}') from err
+
+        self._track_connection(response)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            try:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
+            except httpx.TimeoutException as err:
+                raise TimedOut() from err
+            except httpx.HTTPError as err:
+                raise NetworkError(f'httpx HTTPError: {err}') from err
+            finally:
+                await response.aclose()
+
+        return response.status_code, chunks()
+
+    def _build_timeout(
+        self,
+        connect_timeout: Optional[float],
+        read_timeout: Optional[float],
+        write_timeout: Optional[float],
+        pool_timeout: Optional[float],
+    ) -> httpx.Timeout:
+        default = self._client.timeout
+        # Most requests don't override any timeout, so we don't build a new object for those
+        if (
+            connect_timeout is None
+            and read_timeout is None
+            and write_timeout is None
+            and pool_timeout is None
+        ):
+            return default
+        return httpx.Timeout(
+            connect=default.connect if connect_timeout is None else connect_timeout,
+            read=default.read if read_timeout is None else read_timeout,
+            write=default.write if write_timeout is None else write_timeout,
+            pool=default.pool if pool_timeout is None else pool_timeout,
+        )
@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2021
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains an implementation of BaseRequest that answers requests from memory."""
+import asyncio
+import random
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from telegram._utils.jsoncodec import DEFAULT_JSON_CODEC
+from telegram._utils.types import JSONDict
+from telegram.error import NetworkError, TimedOut
+from telegram.request._baserequest import BaseRequest
+from telegram.request._requestdata import RequestData
+
+_MockResponse = Union[object, Callable[[Optional[RequestData]], object]]
+"""The result of a Bot API method or a callable computing it from the request data."""
+
+_MockError = Union[int, Type[NetworkError]]
+"""An HTTP status code of an error response or an exception class to raise."""
+
+
+class MockRequest(BaseRequest):
+    """Implementation of :class:`telegram.request.BaseRequest` that doesn't make any network
+    requests, but answers them with canned Bot API responses from memory. This is useful for
+    testing bots and for measuring their performance, as it removes the network from the
+    equation.
+
+    By default, ``getMe`` returns a bot user, ``sendMessage`` returns a message with the passed
+    ``chat_id`` and ``text`` and all other methods return :obj:`True`. Use :paramref:`responses`
+    to customize the results.
+
+    .. versionadded:: 14.0
+
+    Example:
+        .. code:: python
+
+            request = MockRequest(latency=0.05, error_rate=0.01)
+            with warnings.catch_warnings():
+                # Dispatcher warns about not being built via the DispatcherBuilder
+                warnings.simplefilter('ignore')
+                dispatcher = Dispatcher(
+                    bot=ExtBot('123:ABC', request=request),
+                    update_queue=asyncio.Queue(),
+                    job_queue=None,
+                    workers=4,
+                    persistence=None,
+                    context_types=ContextTypes(),
+                )
+
+    Args:
+        responses (Dict[:obj:`str`, :obj:`object` | :obj:`callable`], optional): Maps Bot API
+            methods, e.g. ``'sendMessage'``, to the ``result`` that is returned for them. If the
+            value is callable, it is called with the :class:`telegram.request.RequestData` of the
+            request (or :obj:`None`, if the request has no parameters) and must return the
+            result. :obj:`bytes` are returned as is instead of a Bot API response, which can be
+            used for file downloads, where the key is the last part of the file path. Extends
+            and overrides the default responses.
+        latency (:obj:`float`, optional): The time in seconds that each request takes. Defaults
+            to ``0``.
+        error_rate (:obj:`float`, optional): The probability for each request to fail with one
+            of :paramref:`errors`. Must be between ``0`` and ``1``. Defaults to ``0``.
+        errors (Sequence[:obj:`int` | :class:`telegram.error.NetworkError`], optional): The
+            errors that are injected. Status codes are answered with the corresponding Bot API
+            error response, i.e. ``429`` leads to :class:`telegram.error.RetryAfter` and ``502``
+            to :class:`telegram.error.NetworkError`. Exception classes are instantiated without
+            arguments and raised in place of the response. Each injected error is chosen at
+            random. Defaults to ``429``, ``502`` and
+            :class:`telegram.error.TimedOut`.
+        retry_after (:obj:`int`, optional): The ``retry_after`` value of injected ``429`` errors.
+            Defaults to ``1``.
+        record (:obj:`bool`, optional): Whether to record the requests in :attr:`requests`.
+            Defaults to :obj:`True`.
+        seed (:obj:`int`, optional): Seed for choosing the failing requests, such that test runs
+            are reproducible.
+        connection_pool_size (:obj:`int`, optional): The value of
+            :attr:`connection_pool_size`, which has no other effect. Defaults to ``256``.
+
+    Attributes:
+        responses (Dict[:obj:`str`, :obj:`object` | :obj:`callable`]): The responses by Bot API
+            method. Can be changed at any time.
+        latency (:obj:`float`): The time in seconds that each request takes.
+        error_rate (:obj:`float`): The probability for each request to fail.
+        errors (Tuple[:obj:`int` | :class:`telegram.error.NetworkError`]): The errors that are
+            injected.
+        retry_after (:obj:`int`): The ``retry_after`` value of injected ``429`` errors.
+        requests (List[Tuple[:obj:`str`, :class:`telegram.request.RequestData` | :obj:`None`]]):
+            The recorded requests as tuples of the Bot API method and the request data, in the
+            order in which they were made. Includes the requests that failed. Clear it with
+            ``requests.clear()``.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`error_rate` is not between ``0`` and ``1``.
+    """
+
+    __slots__ = (
+        'responses',
+        'latency',
+        'error_rate',
+        'errors',
+        'retry_after',
+        'requests',
+        '_record',
+        '_random',
+        '_connection_pool_size',
+        '_message_id',
+    )
+
+    def __init__(
+        self,
+        responses: Dict[str, _MockResponse] = None,
+        latency: float = 0,
+        error_rate: float = 0,
+        errors: Sequence[_MockError] = (429, 502, TimedOut),
+        retry_after: int = 1,
+        record: bool = True,
+        seed: int = None,
+        connection_pool_size: int = 256,
+    ):
+        if not 0 <= error_rate <= 1:
+            raise ValueError('`error_rate` must be between 0 and 1.')
+
+        self.responses: Dict[str, _MockResponse] = {
+            'getMe': {
+                'id': 1234567890,
+                'is_bot': True,
+                'first_name': 'Mock Bot',
+                'username': 'mock_bot',
+                'can_join_groups': True,
+                'can_read_all_group_messages': False,
+                'supports_inline_queries': False,
+            },
+            'sendMessage': self._send_message,
+        }
+        self.responses.update(responses or {})
+        self.latency = latency
+        self.error_rate = error_rate
+        self.errors = tuple(errors)
+        self.retry_after = retry_after
+        self.requests: List[Tuple[str, Optional[RequestData]]] = []
+        self._record = record
+        self._random = random.Random(seed)
+        self._connection_pool_size = connection_pool_size
+        self._message_id = 0
+
+    @property
+    def connection_pool_size(self) -> int:
+        """See :attr:`BaseRequest.connection_pool_size`."""
+        return self._connection_pool_size
+
+    async def initialize(self) -> None:
+        """Does nothing."""
+
+    async def stop(self) -> None:
+        """Does nothing."""
+
+    def _send_message(self, request_data: Optional[RequestData]) -> JSONDict:
+        parameters = request_data.parameters if request_data else {}
+        chat_id = parameters.get('chat_id', 0)
+        try:
+            chat_id = int(chat_id)  # type: ignore[arg-type]
+        except ValueError:
+            # A username like '@channel'
+            chat_id = 0
+        self._message_id += 1
+        return {
+            'message_id': self._message_id,
+            'date': int(time.time()),
+            'chat': {'id': chat_id, 'type': 'private' if chat_id > 0 else 'supergroup'},
+            'from': self.responses['getMe'],
+            'text': parameters.get('text', ''),
+        }
+
+    def _error_response(self, code: int) -> bytes:
+        payload: JSONDict = {'ok': False, 'error_code': code}
+        if code == 429:
+            payload['description'] = f'Too Many Requests: retry after {self.retry_after}'
+            payload['parameters'] = {'retry_after': self.retry_after}
+        else:
+            payload['description'] = 'Injected error'
+        return DEFAULT_JSON_CODEC.dumps_bytes(payload)
+
+    async def do_request(
+        self,
+        method: str,
+        url: str,
+        request_data: RequestData = None,
+        connect_timeout: float = None,
+        read_timeout: float = None,
+        write_timeout: float = None,
+        pool_timeout: float = None,
+    ) -> Tuple[int, bytes]:
+        """See :meth:`BaseRequest.do_request`."""
+        endpoint = url.rsplit('/', 1)[-1]
+        if self._record:
+            self.requests.append((endpoint, request_data))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            error = self._random.choice(self.errors)
+            if isinstance(error, int):
+                return error, self._error_response(error)
+            raise error()
+
+        result = self.responses.get(endpoint, True)
+        if callable(result):
+            result = result(request_data)
+        if isinstance(result, bytes):
+            return 200, result
+        return 200, DEFAULT_JSON_CODEC.dumps_bytes({'ok': True, 'result': result})
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2021
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a class that holds the serialized parameters of a reusable request to the
+Bot API."""
+from typing import Dict
+
+from telegram._utils.jsoncodec import JSONCodec
+from telegram._utils.types import JSONDict
+from telegram.request._requestparameter import RequestParameter
+
+
+class PreparedRequest:
+    """Instances of this class represent a request to the Bot API whose parameters - except for
+    the ones that differ between the single requests, e.g. the ``chat_id`` - have been converted
+    and JSON encoded ahead of time. This makes sending the same content to many chats cheaper,
+    as the parameters are not converted again for each request. Instances can be reused for any
+    number of requests, also concurrently.
+
+    Instances of this class are returned by e.g. :meth:`telegram.Bot.prepare_message` and can be
+    sent with :meth:`telegram.Bot.send_prepared`.
+
+    .. versionadded:: 14.0
+
+    Note:
+        As the parameters are converted on creation, changing the objects that were used to
+        create the instance, e.g. a :class:`telegram.InlineKeyboardMarkup`, has no effect on the
+        request.
+
+    Warning:
+        How exactly instances of this will are created should be considered an implementation
+        detail and not part of PTBs public API. Users should exclusively rely on the documented
+        attributes, properties and methods.
+
+    Args:
+        endpoint (:obj:`str`): The Bot API method, e.g. ``'sendMessage'``.
+        data (Dict[:obj:`str`, :obj:`object`]): The parameters of the request. :obj:`None`
+            values must already be removed and the defaults must already be inserted. Must not
+            contain files to be uploaded.
+        json_codec (:class:`telegram.request.JSONCodec`, optional): The codec used to encode the
+            parameters. Defaults to using ``ujson``, if installed, and :mod:`json` otherwise.
+
+    Attributes:
+        endpoint (:obj:`str`): The Bot API method, e.g. ``'sendMessage'``.
+        parameters (Dict[:obj:`str`, :obj:`object`]): The prepared parameters, which are passed
+            along to the request as is.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`data` contains files to be uploaded.
+    """
+
+    __slots__ = ('endpoint', 'parameters')
+
+    def __init__(self, endpoint: str, data: JSONDict, json_codec: JSONCodec = None):
+        self.endpoint = endpoint
+        self.parameters: Dict[str, RequestParameter] = {}
+        for key, value in data.items():
+            param = RequestParameter.from_input(key, value)
+            if param.input_files:
+                raise ValueError(
+                    'Files can not be uploaded with a prepared request, because they can only be '
+                    'read once. Please pass a file_id or URL instead.'
+                )
+            # Strings are passed along without encoding them, just like in RequestData
+            self.parameters[key] = RequestParameter(key, param.get_json_value(json_codec), None)
@@ -20,14 +20,10 @@
 from typing import List, Dict, Any, Union
 from urllib.parse import urlencode
 
+from telegram._utils.jsoncodec import DEFAULT_JSON_CODEC, JSONCodec
 from telegram._utils.types import UploadFileDict
 from telegram.request._requestparameter import RequestParameter
 
-try:
-    import ujson as json
-except ImportError:
-    import json  # type: ignore[no-redef]  # noqa: F723
-
 
 class RequestData:
     """Instances of this class represent a collection of parameters and files to be sent along
@@ -43,16 +39,20 @@ class RequestData:
     Attributes:
         contains_files (:obj:`bool`): Whether this object contains files to be uploaded via
             ``multipart/form-data``.
+        json_codec (:class:`telegram.request.JSONCodec`): The codec used to encode the
+            parameters and to decode the response of the request.
     """
 
-    __slots__ = ('_parameters', 'contains_files')
+    __slots__ = ('_parameters', 'contains_files', 'json_codec')
 
     def __init__(
         self,
         parameters: List[RequestParameter] = None,
+        json_codec: JSONCodec = None,
     ):
         self._parameters = parameters or []
         self.contains_files = any(param.input_files for param in self._parameters)
+        self.json_codec = json_codec or DEFAULT_JSON_CODEC
 
     @property
     def parameters(self) -> Dict[str, Union[str, int, List, Dict]]:
@@ -68,7 +68,7 @@ class RequestData:
         """Gives the parameters as mapping of parameter name to the respective JSON encoded
         value.
         """
-        return {param.name: param.json_value for param in self._parameters}
+        return {param.name: param.get_json_value(self.json_codec) for param in self._parameters}
 
     def url_encoded_parameters(self, encode_kwargs: Dict[str, Any] = None) -> str:
         """Encodes the parameters with :meth:`urllib.parse.urlencode`.
@@ -95,7 +95,7 @@ class RequestData:
     @property
     def json_payload(self) -> bytes:
         """The parameters as UTF-8 encoded JSON payload."""
-        return json.dumps(self.json_parameters).encode('utf-8')
+        return self.json_codec.dumps_bytes(self.json_parameters)
 
     @property
     def multipart_data(self) -> UploadFileDict:
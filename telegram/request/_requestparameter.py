@@ -24,13 +24,9 @@ from typing import Optional, List, Tuple
 
 from telegram import InputFile, InputMedia, TelegramObject
 from telegram._utils.datetime import to_timestamp
+from telegram._utils.jsoncodec import DEFAULT_JSON_CODEC, JSONCodec
 from telegram._utils.types import UploadFileDict
 
-try:
-    import ujson as json
-except ImportError:
-    import json  # type: ignore[no-redef]  # noqa: F723
-
 
 @dataclass(repr=False, eq=False, order=False, frozen=True)
 class RequestParameter:
@@ -65,10 +61,22 @@ class RequestParameter:
 
     @property
     def json_value(self) -> str:
-        """The JSON dumped :attr:`value`"""
+        """The JSON dumped :attr:`value`. Same as :meth:`get_json_value` with the default codec."""
+        return self.get_json_value()
+
+    def get_json_value(self, json_codec: JSONCodec = None) -> str:
+        """Gives the JSON dumped :attr:`value`. Strings are returned as is.
+
+        Args:
+            json_codec (:class:`telegram.request.JSONCodec`, optional): The codec to encode the
+                value with. Defaults to the default codec.
+
+        Returns:
+            :obj:`str`
+        """
         if isinstance(self.value, str):
             return self.value
-        return json.dumps(self.value)
+        return (json_codec or DEFAULT_JSON_CODEC).dumps(self.value)
 
     @property
     def multipart_data(self) -> Optional[UploadFileDict]:
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a class that describes when and how failed requests are retried."""
+import random
+from collections import Counter
+from typing import Collection, Dict, Optional, Tuple, Type
+
+from telegram.error import BadRequest, NetworkError
+
+
+class RetryPolicy:
+    """Describes which failed requests to the Bot API are retried by
+    :class:`telegram.request.BaseRequest` and how long to wait between the attempts.
+
+    A request is retried, if
+
+    * :meth:`telegram.request.BaseRequest.do_request` raised one of :paramref:`exceptions`, e.g.
+      because the connection failed or timed out, or the Bot API responded with one of
+      :paramref:`status_codes`, and
+    * the request is idempotent, i.e. sending it twice does no harm. These are the requests
+      that download files and the requests to the endpoints whose names start with ``get``,
+      e.g. ``getChat``, and those in :paramref:`idempotent_endpoints`. Other endpoints can be
+      opted in by passing a policy for them in :paramref:`endpoint_policies`, and
+    * fewer than :paramref:`max_attempts` attempts were made.
+
+    Before attempt ``n + 1``, a random time between ``0`` and
+    ``min(max_delay, base_delay * 2 ** (n - 1))`` seconds is waited ("full jitter"). This way,
+    the waiting time grows exponentially while many clients retrying at once don't hit the
+    server at the same time. :paramref:`max_attempts` and :paramref:`max_delay` bound the time
+    a request can take.
+
+    .. versionadded:: 14.0
+
+    Args:
+        max_attempts (:obj:`int`, optional): The maximum number of attempts per request,
+            including the first one. Defaults to ``3``.
+        base_delay (:obj:`float`, optional): The maximum waiting time in seconds before the
+            first retry. Defaults to ``0.5``.
+        max_delay (:obj:`float`, optional): The maximum waiting time in seconds before any
+            retry. Defaults to ``10``.
+        status_codes (Collection[:obj:`int`], optional): The HTTP status codes of responses to
+            retry. Defaults to ``(502, 504)``.
+        exceptions (Tuple[Type[:class:`telegram.error.TelegramError`]], optional): The
+            exceptions raised by :meth:`~telegram.request.BaseRequest.do_request` that are
+            retried. Defaults to ``(NetworkError,)``, which includes
+            :class:`telegram.error.TimedOut`. :class:`telegram.error.BadRequest` is never
+            retried.
+        idempotent_endpoints (Collection[:obj:`str`], optional): Names of additional endpoints
+            that are safe to retry, e.g. ``'answerCallbackQuery'``.
+        endpoint_policies (Dict[:obj:`str`, :class:`RetryPolicy`], optional): Policies to use
+            instead of this one for specific endpoints. Requests to these endpoints are retried
+            according to the respective policy even if they are not idempotent. The
+            :paramref:`endpoint_policies` of those policies are ignored. Use the key ``'file'``
+            for downloads of files.
+
+    Attributes:
+        max_attempts (:obj:`int`): The maximum number of attempts per request.
+        base_delay (:obj:`float`): The maximum waiting time before the first retry.
+        max_delay (:obj:`float`): The maximum waiting time before any retry.
+        status_codes (FrozenSet[:obj:`int`]): The HTTP status codes of responses to retry.
+        exceptions (Tuple[Type[:class:`telegram.error.TelegramError`]]): The exceptions that are
+            retried.
+        idempotent_endpoints (FrozenSet[:obj:`str`]): Additional endpoints that are safe to
+            retry.
+        endpoint_policies (Dict[:obj:`str`, :class:`RetryPolicy`]): Policies for specific
+            endpoints.
+        retries (:obj:`collections.Counter`): The number of retries made per endpoint. Downloads
+            of files are counted as ``'file'``.
+        failures (:obj:`collections.Counter`): The number of requests per endpoint that still
+            failed after the last allowed attempt.
+
+    Note:
+        The counters are kept by the policy passed to the request object, including those for
+        the endpoints in :attr:`endpoint_policies`.
+    """
+
+    __slots__ = (
+        'max_attempts',
+        'base_delay',
+        'max_delay',
+        'status_codes',
+        'exceptions',
+        'idempotent_endpoints',
+        'endpoint_policies',
+        'retries',
+        'failures',
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10,
+        status_codes: Collection[int] = (502, 504),
+        exceptions: Tuple[Type[Exception], ...] = (NetworkError,),
+        idempotent_endpoints: Collection[str] = (),
+        endpoint_policies: Dict[str, 'RetryPolicy'] = None,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.status_codes = frozenset(status_codes)
+        self.exceptions = exceptions
+        self.idempotent_endpoints = frozenset(idempotent_endpoints)
+        self.endpoint_policies = endpoint_policies or {}
+        self.retries: Counter = Counter()
+        self.failures: Counter = Counter()
+
+    def get_policy(self, method: str, endpoint: str) -> Optional['RetryPolicy']:
+        """Gives the policy that applies to a request.
+
+        Args:
+            method (:obj:`str`): The HTTP method of the request.
+            endpoint (:obj:`str`): The name of the endpoint, i.e. the last part of the URL, or
+                ``'file'`` for downloads of files.
+
+        Returns:
+            :class:`RetryPolicy` | :obj:`None`: The policy for :paramref:`endpoint` from
+            :attr:`endpoint_policies`, this policy if the request is idempotent and :obj:`None`
+            otherwise.
+        """
+        policy = self.endpoint_policies.get(endpoint)
+        if policy is not None:
+            return policy
+        if method == 'GET' or endpoint.startswith('get') or endpoint in self.idempotent_endpoints:
+            return self
+        return None
+
+    def is_retryable(self, status_code: int = None, exception: Exception = None) -> bool:
+        """Whether a failed attempt may be retried, if :attr:`max_attempts` is not reached yet.
+
+        Args:
+            status_code (:obj:`int`, optional): The HTTP status code of the response.
+            exception (:obj:`Exception`, optional): The exception raised by the attempt.
+
+        Returns:
+            :obj:`bool`
+        """
+        if exception is not None:
+            # BadRequest is a subclass of NetworkError, but sending the request again won't help
+            return isinstance(exception, self.exceptions) and not isinstance(exception, BadRequest)
+        return status_code in self.status_codes
+
+    def get_delay(self, attempt: int) -> float:
+        """Gives the time to wait before the next attempt.
+
+        Args:
+            attempt (:obj:`int`): The number of the failed attempt, starting at ``1``.
+
+        Returns:
+            :obj:`float`: The time in seconds.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import datetime
+from collections import defaultdict
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+
+from telegram.ext import BasePersistence, DictPersistence, ExtBot, TrackingDict
+from telegram.request import MockRequest
+
+
+class Color(Enum):
+    RED = 1
+
+
+class NoBot:
+    __ptb_no_bot__ = True
+
+    def __init__(self, bot=None):
+        self.bot = bot
+
+
+class Holder:
+    def __init__(self, bot):
+        self.bot = bot
+
+
+class BotInt(int):
+    pass
+
+
+@pytest.fixture(scope='function')
+async def bot():
+    bot = ExtBot('1234567890:AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA', request=MockRequest())
+    # Comparing and hashing bots needs the bot user
+    await bot.initialize()
+    return bot
+
+
+@pytest.fixture(scope='function')
+def persistence(bot):
+    persistence = DictPersistence()
+    persistence.set_bot(bot)
+    return persistence
+
+
+class TestReplaceInsertBot:
+    @pytest.mark.parametrize(
+        'obj',
+        [
+            None,
+            True,
+            1,
+            1.5,
+            1j,
+            'text',
+            b'bytes',
+            range(3),
+            Decimal('1.5'),
+            datetime.datetime(2021, 1, 1),
+            datetime.timedelta(seconds=1),
+            Color.RED,
+            (1, 'a', (2, None)),
+            frozenset({1, 'a'}),
+        ],
+        ids=lambda obj: type(obj).__name__,
+    )
+    def test_no_bot_objects_returned_as_they_are(self, persistence, obj):
+        assert BasePersistence.replace_bot(obj) is obj
+        assert persistence.insert_bot(obj) is obj
+
+    @pytest.mark.parametrize(
+        'obj', [[1, 'a'], {1, 'a'}, {1: 'a'}, defaultdict(list, {1: 'a'}), TrackingDict({1: 'a'})]
+    )
+    def test_no_bot_containers_copied(self, persistence, obj):
+        for new_obj in (BasePersistence.replace_bot(obj), persistence.insert_bot(obj)):
+            assert new_obj == obj
+            assert new_obj is not obj
+            assert type(new_obj) is type(obj)
+        assert BasePersistence.replace_bot(defaultdict(list)).default_factory is list
+
+    def test_replace_and_insert_nested_bot(self, persistence, bot):
+        shared = [bot]
+        data = {
+            'tuple': (1, bot),
+            'list': [1, 'a', shared],
+            'dict': {1: {'bot': bot}, bot: 2},
+            'shared': shared,
+            'holder': Holder(bot),
+        }
+
+        replaced = BasePersistence.replace_bot(data)
+        assert replaced['tuple'] == (1, BasePersistence.REPLACED_BOT)
+        assert replaced['list'][:2] == [1, 'a']
+        assert replaced['list'][2] == [BasePersistence.REPLACED_BOT]
+        assert replaced['list'][2] is replaced['shared']
+        assert replaced['dict'] == {
+            1: {'bot': BasePersistence.REPLACED_BOT},
+            BasePersistence.REPLACED_BOT: 2,
+        }
+        assert replaced['holder'].bot == BasePersistence.REPLACED_BOT
+        assert data['holder'].bot is bot
+
+        inserted = persistence.insert_bot(replaced)
+        assert inserted['tuple'] == (1, bot)
+        assert inserted['list'][2] == [bot]
+        assert inserted['list'][2] is inserted['shared']
+        assert inserted['dict'] == {1: {'bot': bot}, bot: 2}
+        assert inserted['holder'].bot is bot
+
+    @pytest.mark.parametrize(
+        'obj',
+        [
+            [1, BasePersistence.REPLACED_BOT],
+            {1, BasePersistence.REPLACED_BOT},
+            (1, BasePersistence.REPLACED_BOT),
+            frozenset({1, BasePersistence.REPLACED_BOT}),
+        ],
+        ids=['list', 'set', 'tuple', 'frozenset'],
+    )
+    def test_insert_bot_in_string_containers(self, persistence, bot, obj):
+        assert bot in persistence.insert_bot(obj)
+
+    def test_insert_bot_in_string_dicts(self, persistence, bot):
+        assert persistence.insert_bot({'bot': BasePersistence.REPLACED_BOT}) == {'bot': bot}
+        assert persistence.insert_bot({BasePersistence.REPLACED_BOT: 1}) == {bot: 1}
+
+    def test_opt_out(self, persistence, bot, recwarn):
+        obj = NoBot(bot)
+        assert BasePersistence.replace_bot([obj])[0] is obj
+        assert persistence.insert_bot((obj,))[0] is obj
+        assert obj.bot is bot
+        assert len(recwarn) == 0
+
+    def test_subclasses_not_skipped(self, bot):
+        number = BotInt(1)
+        number.bot = bot
+        replaced = BasePersistence.replace_bot(number)
+        assert replaced == 1
+        assert replaced.bot == BasePersistence.REPLACED_BOT
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import pytest
+
+from telegram import bench
+
+
+class TestBench:
+    def test_make_updates(self):
+        updates = bench.make_updates(100, users=10)
+        assert [update['update_id'] for update in updates] == list(range(100))
+        assert {key for update in updates for key in update} == {
+            'update_id',
+            'message',
+            'callback_query',
+        }
+        assert bench.make_updates(100, users=10) == updates
+
+    @pytest.mark.asyncio
+    async def test_run(self):
+        results = await bench.run(bench.make_updates(200), error_rate=0.2, trace_memory=True)
+        assert results['updates'] == 200
+        assert results['updates/s'] > 0
+        assert 0 < results['p50'] <= results['p99']
+        assert 0 < results['errors'] < 200
+        assert results['peak KiB'] > 0
+
+    def test_main(self, capsys):
+        bench.main(['--updates', '50', '--no-memory'])
+        output = capsys.readouterr().out
+        assert 'updates/s' in output
+        assert 'p99 handler latency' in output
+        assert 'memory' not in output
@@ -54,13 +54,16 @@ from telegram import (
     InputMedia,
 )
 from telegram.constants import ChatAction, ParseMode, InlineQueryLimit
-from telegram.ext import ExtBot, InvalidCallbackData
+from telegram.ext import Defaults, ExtBot, InvalidCallbackData
 from telegram.error import BadRequest, InvalidToken, NetworkError, TelegramError
 from telegram._utils.datetime import from_timestamp, to_timestamp
 from telegram._utils.defaultvalue import DefaultValue
 from telegram.helpers import escape_markdown
-from telegram.request import RequestData
+from telegram.request import PreparedRequest, RequestData
+from telegram.request._httpxrequest import HTTPXRequest
 from tests.conftest import (
+    DictBot,
+    DictExtBot,
     expect_bad_request,
     check_defaults_handling,
     GITHUB_ACTION,
@@ -184,6 +187,195 @@ class TestBot:
         with pytest.raises(InvalidToken, match='Invalid token'):
             Bot(token)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('max_concurrency', [None, 1, 3])
+    async def test_map_requests(self, max_concurrency):
+        temp_bot = Bot(FALLBACKS[0]['token'], request=HTTPXRequest(connection_pool_size=3))
+        in_flight = 0
+        max_in_flight = 0
+        finished = 0
+        consumed = []
+
+        async def request(value):
+            nonlocal in_flight, max_in_flight, finished
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Complete in a different order than started
+            await asyncio.sleep(0.01 * (value % 3))
+            in_flight -= 1
+            finished += 1
+            if value % 4 == 0:
+                raise TelegramError(str(value))
+            return value * 2
+
+        def requests():
+            for value in range(10):
+                consumed.append(value)
+                yield request, {'value': value}
+
+        results = {}
+        async for index, result in temp_bot.map_requests(
+            requests(), max_concurrency=max_concurrency
+        ):
+            # input is consumed lazily
+            assert len(consumed) <= finished + (max_concurrency or 2)
+            results[index] = result
+
+        assert max_in_flight == (max_concurrency or 2)
+        assert sorted(results) == list(range(10))
+        for index, result in results.items():
+            if index % 4 == 0:
+                assert isinstance(result, TelegramError)
+                assert str(result) == str(index)
+            else:
+                assert result == index * 2
+
+    @pytest.mark.asyncio
+    async def test_map_requests_close(self):
+        temp_bot = Bot(FALLBACKS[0]['token'], request=HTTPXRequest(connection_pool_size=3))
+        started, cancelled = [], []
+
+        async def request(delay):
+            started.append(delay)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(delay)
+                raise
+            return delay
+
+        iterator = temp_bot.map_requests((request, {'delay': d}) for d in (0, 10, 10, 10))
+        assert await iterator.__anext__() == (0, 0)
+        await iterator.aclose()
+        await asyncio.sleep(0)
+        # The request started after the first one completed never ran, the 4th one was not started
+        assert started == [0, 10]
+        assert cancelled == [10]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('pool_size, expected', [(1, 1), (2, 1), (5, 4)])
+    async def test_map_requests_default_concurrency(self, pool_size, expected):
+        temp_bot = Bot(FALLBACKS[0]['token'], request=HTTPXRequest(connection_pool_size=pool_size))
+        in_flight = 0
+        max_in_flight = 0
+
+        async def request():
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        async for _ in temp_bot.map_requests((request, {}) for _ in range(10)):
+            pass
+        # One connection is left for other requests
+        assert max_in_flight == expected
+
+    @pytest.mark.asyncio
+    async def test_map_requests_invalid_concurrency(self):
+        temp_bot = Bot(FALLBACKS[0]['token'])
+        with pytest.raises(ValueError, match='at least 1'):
+            async for _ in temp_bot.map_requests([], max_concurrency=0):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_send_many(self, monkeypatch):
+        temp_bot = DictBot(FALLBACKS[0]['token'], request=HTTPXRequest(connection_pool_size=4))
+        prepared = []
+
+        def prepare_message(text, **kwargs):
+            prepared.append((text, kwargs))
+            return PreparedRequest('sendMessage', {'text': text})
+
+        async def do_post(endpoint, data, **kwargs):
+            assert endpoint == 'sendMessage'
+            assert kwargs['read_timeout'] == 5
+            chat_id = data['chat_id']
+            if chat_id == 2:
+                raise BadRequest('Chat not found')
+            return Message(chat_id, 0, Chat(chat_id, Chat.PRIVATE), text='text').to_dict()
+
+        monkeypatch.setattr(temp_bot, 'prepare_message', prepare_message)
+        monkeypatch.setattr(temp_bot, '_do_post', do_post)
+        results = dict(
+            [
+                result
+                async for result in temp_bot.send_many(
+                    [1, 2, 3], 'text', parse_mode=ParseMode.HTML, read_timeout=5
+                )
+            ]
+        )
+        # The message is prepared only once
+        assert prepared == [('text', {'parse_mode': ParseMode.HTML})]
+        assert results[0].chat_id == 1
+        assert isinstance(results[1], BadRequest)
+        assert results[2].chat_id == 3
+
+    @pytest.mark.asyncio
+    async def test_send_prepared(self, monkeypatch):
+        temp_bot = DictBot(FALLBACKS[0]['token'])
+        reply_markup = InlineKeyboardMarkup.from_button(
+            InlineKeyboardButton('text', callback_data='data')
+        )
+        prepared = temp_bot.prepare_message(
+            'text', parse_mode=ParseMode.HTML, reply_markup=reply_markup, api_kwargs={'a': 1}
+        )
+        assert prepared.endpoint == 'sendMessage'
+        assert set(prepared.parameters) == {'text', 'parse_mode', 'reply_markup', 'a'}
+
+        async def post(url, request_data: RequestData, *args, **kwargs):
+            assert url.endswith('sendMessage')
+            assert request_data.json_parameters == {
+                'chat_id': str(chat_id),
+                'text': 'text',
+                'parse_mode': 'HTML',
+                'reply_markup': reply_markup.to_json(),
+                'a': '1',
+                'reply_to_message_id': '3',
+            }
+            return Message(1, 0, Chat(chat_id, Chat.PRIVATE), text='text').to_dict()
+
+        monkeypatch.setattr(temp_bot.request, 'post', post)
+        for chat_id in (1, 2):
+            message = await temp_bot.send_prepared(chat_id, prepared, reply_to_message_id=3)
+            assert message.chat_id == chat_id
+            assert message.get_bot() is temp_bot
+
+    @pytest.mark.asyncio
+    async def test_send_prepared_ext_bot(self, monkeypatch):
+        temp_bot = DictExtBot(
+            FALLBACKS[0]['token'],
+            defaults=Defaults(parse_mode=ParseMode.HTML, disable_notification=True),
+            arbitrary_callback_data=True,
+        )
+        temp_bot._bot_user = User(1, 'bot', True)
+        reply_markup = InlineKeyboardMarkup.from_button(
+            InlineKeyboardButton('text', callback_data={'some': 'data'})
+        )
+        prepared = temp_bot.prepare_message('text', reply_markup=reply_markup)
+
+        async def post(url, request_data: RequestData, *args, **kwargs):
+            parameters = request_data.json_parameters
+            assert parameters['parse_mode'] == 'HTML'
+            assert parameters['disable_notification'] == 'true'
+            # The callback data was replaced by an uuid when preparing the message
+            sent_markup = InlineKeyboardMarkup.de_json(
+                temp_bot._json_codec.loads(parameters['reply_markup']), temp_bot
+            )
+            assert sent_markup.inline_keyboard[0][0].callback_data != {'some': 'data'}
+            return Message(
+                1, 0, Chat(1, Chat.PRIVATE), from_user=temp_bot.bot, reply_markup=sent_markup
+            ).to_dict()
+
+        monkeypatch.setattr(temp_bot.request, 'post', post)
+        try:
+            message = await temp_bot.send_prepared(1, prepared)
+            # The callback data is inserted into the returned message
+            assert message.reply_markup.inline_keyboard[0][0].callback_data == {'some': 'data'}
+        finally:
+            temp_bot.callback_data_cache.clear_callback_data()
+            temp_bot.callback_data_cache.clear_callback_queries()
+
     @pytest.mark.asyncio
     async def test_initialize_and_stop(self, bot, monkeypatch):
         async def initialize(*args, **kwargs):
@@ -364,10 +556,20 @@ class TestBot:
                 'parse_data',
                 'get_updates',
                 'getUpdates',
+                'get_updates_json',
+                'getUpdatesJson',
                 'get_bot',
                 'set_bot',
                 'initialize',
                 'shutdown',
+                'map_requests',
+                'mapRequests',
+                'send_many',
+                'sendMany',
+                'prepare_message',
+                'prepareMessage',
+                'send_prepared',
+                'sendPrepared',
             ]
         ],
     )
@@ -459,7 +661,7 @@ class TestBot:
         # Some methods of ext.ExtBot
         global_extra_args = set()
         extra_args_per_method = defaultdict(
-            set, {'__init__': {'arbitrary_callback_data', 'defaults'}}
+            set, {'__init__': {'arbitrary_callback_data', 'defaults', 'rate_limiter'}}
         )
         different_hints_per_method = defaultdict(set, {'__setattr__': {'ext_bot'}})
 
@@ -26,6 +26,7 @@ from threading import Event
 
 import pytest
 
+from telegram.request import JSONCodec
 from telegram.request._httpxrequest import HTTPXRequest
 from .conftest import PRIVATE_KEY
 
@@ -158,9 +159,10 @@ class TestBuilder:
     def test_all_bot_args_custom(self, builder, bot):
         defaults = Defaults()
         request = HTTPXRequest(connection_pool_size=8)
+        json_codec = JSONCodec()
         builder.token(bot.token).base_url('base_url').base_file_url('base_file_url').private_key(
             PRIVATE_KEY
-        ).defaults(defaults).arbitrary_callback_data(42).request(request)
+        ).defaults(defaults).arbitrary_callback_data(42).request(request).json_codec(json_codec)
         built_bot = builder.build().bot
 
         assert built_bot.token == bot.token
@@ -168,6 +170,7 @@ class TestBuilder:
         assert built_bot.base_file_url == 'base_file_url' + bot.token
         assert built_bot.defaults is defaults
         assert built_bot.request is request
+        assert built_bot.json_codec is json_codec
         assert built_bot.callback_data_cache.maxsize == 42
 
         builder = builder.__class__()
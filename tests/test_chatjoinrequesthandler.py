@@ -35,7 +35,7 @@ from telegram import (
     ChatJoinRequest,
     ChatInviteLink,
 )
-from telegram.ext import CallbackContext, JobQueue, ChatJoinRequestHandler
+from telegram.ext import CallbackContext, JobQueue, ChatJoinRequestHandler, Dispatcher
 
 
 message = Message(1, None, Chat(1, ''), from_user=User(1, '', False), text='Text')
@@ -133,6 +133,11 @@ class TestChatJoinRequestHandler:
         assert not handler.check_update(false_update)
         assert not handler.check_update(True)
 
+    def test_update_types(self, false_update):
+        handler = ChatJoinRequestHandler(self.callback_context)
+        assert handler.update_types == {Update.CHAT_JOIN_REQUEST}
+        assert Dispatcher._get_update_type(false_update) not in handler.update_types
+
     def test_context(self, dp, chat_join_request_update):
         handler = ChatJoinRequestHandler(callback=self.callback_context)
         dp.add_handler(handler)
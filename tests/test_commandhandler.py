@@ -0,0 +1,333 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import warnings
+
+import pytest
+
+from telegram import Chat, Message, MessageEntity, Update, User
+from telegram.ext import (
+    CommandHandler,
+    ContextTypes,
+    Dispatcher,
+    ExtBot,
+    MessageHandler,
+    PrefixHandler,
+    filters,
+)
+from telegram.ext._commandhandler import CommandRouter
+from telegram.request import MockRequest
+
+TOKEN = '1234567890:AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA'
+
+
+@pytest.fixture(scope='function')
+async def bot():
+    bot = ExtBot(TOKEN, request=MockRequest())
+    # Parsing commands needs the username of the bot
+    await bot.initialize()
+    return bot
+
+
+def make_update(bot, text, command_length=None):
+    entities = []
+    if command_length is None and text.startswith('/'):
+        command_length = len(text.split()[0])
+    if command_length:
+        entities.append(MessageEntity(MessageEntity.BOT_COMMAND, 0, command_length))
+    message = Message(
+        1,
+        None,
+        Chat(1, Chat.PRIVATE),
+        from_user=User(1, 'name', False),
+        text=text,
+        entities=entities,
+    )
+    message.set_bot(bot)
+    return Update(1, message=message)
+
+
+async def callback(update, context):
+    pass
+
+
+class NamedCommandHandler(CommandHandler):
+    __slots__ = ('name',)
+
+    def __init__(self, name, command, **kwargs):
+        super().__init__(command, callback, **kwargs)
+        self.name = name
+
+
+class NamedPrefixHandler(PrefixHandler):
+    __slots__ = ('name',)
+
+    def __init__(self, name, prefix, command, **kwargs):
+        super().__init__(prefix, command, callback, **kwargs)
+        self.name = name
+
+
+class NamedMessageHandler(MessageHandler):
+    __slots__ = ('name',)
+
+    def __init__(self, name, message_filter=filters.ALL):
+        super().__init__(message_filter, callback)
+        self.name = name
+
+
+class OverridingCommandHandler(NamedCommandHandler):
+    __slots__ = ()
+
+    def check_update(self, update):
+        return True
+
+
+def names(handlers):
+    return [handler.name for handler in handlers]
+
+
+class TestCommandHandler:
+    @pytest.mark.parametrize(
+        'text, args',
+        [
+            ('/start', []),
+            ('/START', []),
+            ('/start@mock_bot', []),
+            ('/start@Mock_Bot', []),
+            ('/start a  b', ['a', 'b']),
+        ],
+    )
+    def test_match(self, bot, text, args):
+        handler = CommandHandler('Start', callback)
+        result = handler.check_update(make_update(bot, text))
+        assert result[0] == args
+        assert result[1]
+
+    @pytest.mark.parametrize(
+        'text, command_length',
+        [('/start@other_bot', None), ('/help', None), ('start', None), ('x /start', 0)],
+    )
+    def test_no_match(self, bot, text, command_length):
+        handler = CommandHandler('start', callback)
+        assert not handler.check_update(make_update(bot, text, command_length))
+
+    def test_filters(self, bot):
+        handler = CommandHandler('start', callback, filters=filters.ChatType.GROUP)
+        assert handler.check_update(make_update(bot, '/start')) is False
+
+    def test_command(self):
+        handler = CommandHandler(['Start', 'help'], callback)
+        assert handler.command == ['start', 'help']
+        handler.command = 'Other'
+        assert handler.command == ['other']
+        with pytest.raises(ValueError, match='not a valid bot command'):
+            handler.command = 'in valid'
+        with pytest.raises(ValueError, match='not a valid bot command'):
+            CommandHandler('in valid', callback)
+
+    def test_parse_cached_on_message(self, bot):
+        update = make_update(bot, '/start')
+        CommandHandler('start', callback).check_update(update)
+        PrefixHandler('/', 'start', callback).check_update(update)
+        # pylint: disable=protected-access
+        assert update.message._parsed_commands == {
+            'command': (('/start', 6, 'mock_bot'), ('start', ())),
+            'prefix': ('/start', ('/start', ())),
+        }
+
+        # Equal messages don't share the cache
+        other = make_update(bot, '/help')
+        other.message.message_id = update.message.message_id
+        assert other.message == update.message
+        assert not CommandHandler('start', callback).check_update(other)
+
+    def test_message_changed(self, bot):
+        update = make_update(bot, 'hello')
+        command_handler = CommandHandler('start', callback)
+        prefix_handler = PrefixHandler('!', 'start', callback)
+        assert command_handler.check_update(update) is None
+        assert prefix_handler.check_update(update) is None
+
+        # E.g. a handler in an earlier group may change the message
+        update.message.text = '/start arg'
+        update.message.entities = [MessageEntity(MessageEntity.BOT_COMMAND, 0, 6)]
+        assert command_handler.check_update(update)[0] == ['arg']
+        update.message.text = '/help arg'
+        assert command_handler.check_update(update) is None
+        update.message.text = '/startx'
+        update.message.entities = [MessageEntity(MessageEntity.BOT_COMMAND, 0, 7)]
+        assert command_handler.check_update(update) is None
+
+        update.message.text = '!start'
+        assert prefix_handler.check_update(update)
+        update.message.text = '!stop'
+        assert not prefix_handler.check_update(update)
+
+    def test_bot_username_changed(self, bot, monkeypatch):
+        update = make_update(bot, '/start@mock_bot')
+        handler = CommandHandler('start', callback)
+        assert handler.check_update(update)
+        monkeypatch.setattr(type(bot), 'username', property(lambda self: 'other_bot'))
+        assert handler.check_update(update) is None
+
+
+class TestPrefixHandler:
+    @pytest.mark.parametrize('text', ['!test', '#TEST', '!help arg', '#Help'])
+    def test_match(self, bot, text):
+        handler = PrefixHandler(['!', '#'], ['test', 'help'], callback)
+        assert handler.check_update(make_update(bot, text))
+
+    @pytest.mark.parametrize('text', ['test', '?test', '!tests', ' '])
+    def test_no_match(self, bot, text):
+        handler = PrefixHandler(['!', '#'], ['test', 'help'], callback)
+        assert not handler.check_update(make_update(bot, text))
+
+    def test_args(self, bot):
+        handler = PrefixHandler('!', 'test', callback)
+        assert handler.check_update(make_update(bot, '!test a b'))[0] == ['a', 'b']
+
+
+class TestCommandRouter:
+    def test_candidates(self, bot):
+        handlers = [
+            NamedMessageHandler('message 1'),
+            NamedCommandHandler('start', 'start'),
+            NamedMessageHandler('message 2'),
+            NamedCommandHandler('help', 'help'),
+            NamedPrefixHandler('prefix', '!', 'start'),
+            NamedCommandHandler('start 2', ['help', 'start']),
+        ]
+        router = CommandRouter(handlers)
+
+        # The order of the handlers is preserved
+        assert names(router.candidates(make_update(bot, '/start'))) == [
+            'message 1',
+            'start',
+            'message 2',
+            'start 2',
+        ]
+        assert names(router.candidates(make_update(bot, '/HELP@mock_bot'))) == [
+            'message 1',
+            'message 2',
+            'help',
+            'start 2',
+        ]
+        assert names(router.candidates(make_update(bot, '!Start'))) == [
+            'message 1',
+            'message 2',
+            'prefix',
+        ]
+        # Commands for other bots only reach the handlers that are always candidates
+        for text in ['/start@other_bot', '/unknown', 'text']:
+            assert names(router.candidates(make_update(bot, text))) == [
+                'message 1',
+                'message 2',
+            ]
+        assert names(router.candidates('custom update')) == ['message 1', 'message 2']
+
+    def test_overridden_check_update(self, bot):
+        router = CommandRouter(
+            [NamedCommandHandler('start', 'start'), OverridingCommandHandler('other', 'other')]
+        )
+        assert not CommandRouter.is_routable(router.handlers[1])
+        assert names(router.candidates(make_update(bot, '/help'))) == ['other']
+
+    def test_commands_changed(self, bot):
+        command_handler = NamedCommandHandler('command', 'start')
+        prefix_handler = NamedPrefixHandler('prefix', '!', 'start')
+        router = CommandRouter([command_handler, prefix_handler])
+        assert names(router.candidates(make_update(bot, '/start'))) == ['command']
+        assert names(router.candidates(make_update(bot, '!start'))) == ['prefix']
+
+        command_handler.command = 'help'
+        assert names(router.candidates(make_update(bot, '/start'))) == []
+        assert names(router.candidates(make_update(bot, '/help'))) == ['command']
+
+        prefix_handler.prefix = '#'
+        assert names(router.candidates(make_update(bot, '!start'))) == []
+        assert names(router.candidates(make_update(bot, '#start'))) == ['prefix']
+
+        prefix_handler.command = ['help']
+        assert names(router.candidates(make_update(bot, '#start'))) == []
+        assert names(router.candidates(make_update(bot, '#help'))) == ['prefix']
+
+
+class TestDispatcherCommands:
+    @staticmethod
+    def make_dispatcher(bot):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            return Dispatcher(
+                bot=bot,
+                update_queue=asyncio.Queue(),
+                job_queue=None,
+                workers=4,
+                persistence=None,
+                context_types=ContextTypes(),
+            )
+
+    @staticmethod
+    def add_recording_handler(dispatcher, calls, handler, group=0):
+        async def record(update, context):
+            calls.append((handler.name, context.args))
+
+        handler.callback = record
+        dispatcher.add_handler(handler, group=group)
+
+    @pytest.mark.asyncio
+    async def test_handler_order(self, bot):
+        dispatcher = self.make_dispatcher(bot)
+        calls = []
+        for handler in [
+            NamedCommandHandler('help', 'help'),
+            NamedMessageHandler('no text', ~filters.TEXT),
+            NamedCommandHandler('start', 'start'),
+            NamedMessageHandler('text', filters.TEXT),
+        ]:
+            self.add_recording_handler(dispatcher, calls, handler)
+        self.add_recording_handler(
+            dispatcher, calls, NamedPrefixHandler('prefix', '/', 'start'), 1
+        )
+        self.add_recording_handler(dispatcher, calls, NamedCommandHandler('group -1', 'help'), -1)
+
+        await dispatcher.process_update(make_update(bot, '/start a'))
+        assert calls == [('start', ['a']), ('prefix', ['a'])]
+
+        calls.clear()
+        await dispatcher.process_update(make_update(bot, '/help'))
+        assert calls == [('group -1', []), ('help', [])]
+
+        calls.clear()
+        await dispatcher.process_update(make_update(bot, '/start@other_bot'))
+        assert calls == [('text', None)]
+
+    @pytest.mark.asyncio
+    async def test_command_changed(self, bot):
+        dispatcher = self.make_dispatcher(bot)
+        calls = []
+        handler = NamedCommandHandler('command', 'start')
+        self.add_recording_handler(dispatcher, calls, handler)
+        await dispatcher.process_update(make_update(bot, '/start'))
+        assert calls == [('command', [])]
+
+        handler.command = 'help'
+        calls.clear()
+        await dispatcher.process_update(make_update(bot, '/start'))
+        await dispatcher.process_update(make_update(bot, '/help'))
+        assert calls == [('command', [])]
@@ -0,0 +1,505 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import threading
+import warnings
+from collections import defaultdict
+
+import pytest
+
+from telegram import CallbackQuery, Chat, Message, Update, User
+from telegram.ext import (
+    CallbackContext,
+    ContextTypes,
+    ConversationHandler,
+    Dispatcher,
+    DictPersistence,
+    ExtBot,
+    Handler,
+    MessageHandler,
+    PicklePersistence,
+    TrackingDict,
+    TypeHandler,
+    filters,
+)
+from telegram.request import MockRequest
+
+TOKEN = '1234567890:AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA'
+
+
+class RecordingPersistence(DictPersistence):
+    """Records the calls of the update methods together with the thread they were made in."""
+
+    def __init__(self, fail=False):
+        super().__init__()
+        self.calls = []
+        self.fail = fail
+
+    def update_user_data(self, user_id, data):
+        self.calls.append(('user_data', user_id, threading.current_thread()))
+        if self.fail:
+            raise RuntimeError('persistence failed')
+        super().update_user_data(user_id, data)
+
+    def update_chat_data(self, chat_id, data):
+        self.calls.append(('chat_data', chat_id, threading.current_thread()))
+        super().update_chat_data(chat_id, data)
+
+    def update_bot_data(self, data):
+        self.calls.append(('bot_data', None, threading.current_thread()))
+        super().update_bot_data(data)
+
+    def flush(self):
+        self.calls.append(('flush', None, threading.current_thread()))
+
+
+class ThreadRecordingPicklePersistence(PicklePersistence):
+    """Records the threads that the update methods are called in."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threads = set()
+
+    def update_user_data(self, user_id, data):
+        self.threads.add(threading.current_thread())
+        super().update_user_data(user_id, data)
+
+    def update_chat_data(self, chat_id, data):
+        self.threads.add(threading.current_thread())
+        super().update_chat_data(chat_id, data)
+
+    def update_bot_data(self, data):
+        self.threads.add(threading.current_thread())
+        super().update_bot_data(data)
+
+    def update_conversation(self, name, key, new_state):
+        self.threads.add(threading.current_thread())
+        super().update_conversation(name, key, new_state)
+
+
+class SyncMessageHandler(MessageHandler):
+    """ConversationHandler.handle_update is not a coroutine, so the handlers of its states have
+    to return the new state right away."""
+
+    __slots__ = ()
+
+    def handle_update(self, update, dispatcher, check_result, context):
+        return self.callback(update, context)
+
+
+def make_dispatcher(persistence, context_types=None):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return Dispatcher(
+            bot=ExtBot(TOKEN, request=MockRequest()),
+            update_queue=asyncio.Queue(),
+            job_queue=None,
+            workers=4,
+            persistence=persistence,
+            context_types=context_types or ContextTypes(),
+        )
+
+
+def make_update(user_id, text='hi'):
+    user = User(user_id, 'name', False)
+    return Update(
+        user_id, message=Message(1, None, Chat(user_id, Chat.PRIVATE), from_user=user, text=text)
+    )
+
+
+class RecordingHandler(Handler):
+    """Records the calls of check_update and of the callback in a shared list."""
+
+    def __init__(self, name, calls, update_types=None, accept=True):
+        self.name = name
+        self.calls = calls
+        self._update_types = update_types
+        self.accept = accept
+
+        async def callback(update, context):
+            calls.append(('handle', name))
+
+        super().__init__(callback)
+
+    @property
+    def update_types(self):
+        return self._update_types
+
+    def check_update(self, update):
+        self.calls.append(('check', self.name))
+        return self.accept
+
+
+def make_callback_query_update():
+    user = User(1, 'name', False)
+    return Update(2, callback_query=CallbackQuery('1', user, 'instance', data='data'))
+
+
+class TestDispatcherHandlerIndex:
+    @pytest.mark.asyncio
+    async def test_group_order(self):
+        dispatcher = make_dispatcher(None)
+        calls = []
+        for group in (1, -1, 0):
+            dispatcher.add_handler(RecordingHandler(group, calls), group=group)
+
+        await dispatcher.process_update(make_update(1))
+        assert [name for kind, name in calls if kind == 'handle'] == [-1, 0, 1]
+
+    @pytest.mark.asyncio
+    async def test_handler_order_within_group(self):
+        dispatcher = make_dispatcher(None)
+        calls = []
+        dispatcher.add_handler(RecordingHandler('first', calls, accept=False))
+        dispatcher.add_handler(RecordingHandler('second', calls))
+        dispatcher.add_handler(RecordingHandler('third', calls))
+
+        await dispatcher.process_update(make_update(1))
+        # Only the first matching handler of a group handles the update
+        assert calls == [('check', 'first'), ('check', 'second'), ('handle', 'second')]
+
+    @pytest.mark.asyncio
+    async def test_remove_handler(self):
+        dispatcher = make_dispatcher(None)
+        calls = []
+        first = RecordingHandler('first', calls)
+        other_group = RecordingHandler('other group', calls)
+        dispatcher.add_handler(first)
+        dispatcher.add_handler(RecordingHandler('second', calls))
+        dispatcher.add_handler(other_group, group=1)
+        await dispatcher.process_update(make_update(1))
+
+        calls.clear()
+        dispatcher.remove_handler(first)
+        dispatcher.remove_handler(other_group, group=1)
+        assert dispatcher.groups == [0]
+        await dispatcher.process_update(make_update(1))
+        assert calls == [('check', 'second'), ('handle', 'second')]
+
+    @pytest.mark.asyncio
+    async def test_update_types(self):
+        dispatcher = make_dispatcher(None)
+        calls = []
+        dispatcher.add_handler(RecordingHandler('query', calls, {Update.CALLBACK_QUERY}))
+        dispatcher.add_handler(
+            RecordingHandler('message', calls, {Update.MESSAGE, Update.CALLBACK_QUERY}), group=1
+        )
+        dispatcher.add_handler(RecordingHandler('all', calls), group=2)
+
+        await dispatcher.process_update(make_update(1))
+        assert [name for kind, name in calls if kind == 'check'] == ['message', 'all']
+
+        calls.clear()
+        await dispatcher.process_update(make_callback_query_update())
+        assert [name for kind, name in calls if kind == 'check'] == ['query', 'message', 'all']
+
+        # Custom updates are only checked by handlers without update types
+        calls.clear()
+        await dispatcher.process_update('custom update')
+        assert [name for kind, name in calls if kind == 'check'] == ['all']
+
+    @pytest.mark.asyncio
+    async def test_direct_changes(self):
+        dispatcher = make_dispatcher(None)
+        calls = []
+        dispatcher.add_handler(RecordingHandler('first', calls, accept=False))
+        await dispatcher.process_update(make_update(1))
+
+        # Changes that bypass add_handler and remove_handler are picked up as well
+        dispatcher.handlers[0].insert(0, RecordingHandler('inserted', calls))
+        calls.clear()
+        await dispatcher.process_update(make_update(1))
+        assert calls == [('check', 'inserted'), ('handle', 'inserted')]
+
+        dispatcher.handlers[0][0] = RecordingHandler('replaced', calls)
+        calls.clear()
+        await dispatcher.process_update(make_update(1))
+        assert calls == [('check', 'replaced'), ('handle', 'replaced')]
+
+        dispatcher.handlers[-1] = [RecordingHandler('new group', calls)]
+        dispatcher.groups.insert(0, -1)
+        calls.clear()
+        await dispatcher.process_update(make_update(1))
+        assert calls[:2] == [('check', 'new group'), ('handle', 'new group')]
+
+        dispatcher.handlers = {0: [RecordingHandler('plain dict', calls)]}
+        dispatcher.groups = [0]
+        calls.clear()
+        await dispatcher.process_update(make_update(1))
+        assert calls == [('check', 'plain dict'), ('handle', 'plain dict')]
+        dispatcher.handlers[0].clear()
+        calls.clear()
+        await dispatcher.process_update(make_update(1))
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_assigned_lists_are_copied(self):
+        dispatcher = make_dispatcher(None)
+        calls = []
+        handlers = [RecordingHandler('first', calls, accept=False)]
+        dispatcher.handlers[0] = handlers
+        dispatcher.groups = [0]
+        assert dispatcher.handlers[0] == handlers
+        assert dispatcher.handlers[0] is not handlers
+
+        # The passed list is detached from the dispatcher
+        handlers.append(RecordingHandler('detached', calls))
+        await dispatcher.process_update(make_update(1))
+        assert calls == [('check', 'first')]
+        assert len(dispatcher.handlers[0]) == 1
+
+        dispatcher.handlers[0].append(RecordingHandler('attached', calls))
+        calls.clear()
+        await dispatcher.process_update(make_update(1))
+        assert calls == [('check', 'first'), ('check', 'attached'), ('handle', 'attached')]
+
+
+class TestDispatcherUpdateFetcher:
+    @pytest.mark.asyncio
+    async def test_stop_wakes_idle_dispatcher(self):
+        dispatcher = make_dispatcher(None)
+        await dispatcher.start()
+        # Let the fetcher block on the empty queue
+        await asyncio.sleep(0.05)
+
+        await asyncio.wait_for(dispatcher.stop(), timeout=1)
+        assert not dispatcher.running
+        assert dispatcher.update_queue.empty()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('process_asyncio', [False, True])
+    async def test_update_batch_size(self, process_asyncio):
+        dispatcher = make_dispatcher(None)
+        dispatcher.update_batch_size = 10
+        dispatcher.process_asyncio = process_asyncio
+        handled = []
+        done = asyncio.Event()
+
+        async def callback(update, _):
+            handled.append(update)
+            if len(handled) == 3:
+                done.set()
+
+        dispatcher.add_handler(TypeHandler(str, callback))
+        await dispatcher.start()
+        for update in ('1', '2', '3'):
+            await dispatcher.update_queue.put(update)
+
+        # The updates are processed without waiting for a full batch of 10 updates
+        await asyncio.wait_for(done.wait(), timeout=1)
+        assert handled == ['1', '2', '3']
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_processes_pending_updates(self):
+        dispatcher = make_dispatcher(None)
+        dispatcher.update_batch_size = 10
+        handled = []
+
+        async def callback(update, _):
+            handled.append(update)
+
+        dispatcher.add_handler(TypeHandler(str, callback))
+        for update in ('1', '2'):
+            await dispatcher.update_queue.put(update)
+        await dispatcher.start()
+        # The stop signal ends up in the same batch as the pending updates
+        await dispatcher.stop()
+        assert handled == ['1', '2']
+
+
+class TestDispatcherPersistence:
+    @pytest.mark.asyncio
+    async def test_update_persistence_in_thread(self):
+        persistence = RecordingPersistence()
+        dispatcher = make_dispatcher(persistence)
+        dispatcher.user_data[1]['key'] = 'value'
+
+        await dispatcher.update_persistence(make_update(1))
+        # Nothing is written on the event loop
+        assert persistence.calls == []
+        await dispatcher.stop()
+
+        threads = {thread for _, _, thread in persistence.calls}
+        assert threading.current_thread() not in threads
+        assert len(threads) == 1
+        assert [(kind, key) for kind, key, _ in persistence.calls] == [
+            ('bot_data', None),
+            ('chat_data', 1),
+            ('user_data', 1),
+            ('flush', None),
+        ]
+        assert persistence.user_data == {1: {'key': 'value'}}
+
+    @pytest.mark.asyncio
+    async def test_update_persistence_coalesces(self):
+        persistence = RecordingPersistence()
+        dispatcher = make_dispatcher(persistence)
+        dispatcher.persistence_write_delay = 0.1
+
+        for _ in range(3):
+            for user_id in (1, 2):
+                await dispatcher.update_persistence(make_update(user_id))
+        await asyncio.sleep(0.2)
+
+        calls = [(kind, key) for kind, key, _ in persistence.calls]
+        assert sorted(calls) == [
+            ('bot_data', None),
+            ('chat_data', 1),
+            ('chat_data', 2),
+            ('user_data', 1),
+            ('user_data', 2),
+        ]
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_update_persistence_error(self):
+        persistence = RecordingPersistence(fail=True)
+        dispatcher = make_dispatcher(persistence)
+        errors = []
+
+        async def error_handler(update, context):
+            errors.append((update, context.error))
+
+        dispatcher.add_error_handler(error_handler)
+        await dispatcher.update_persistence(make_update(1))
+        await dispatcher.stop()
+
+        assert len(errors) == 1
+        assert errors[0][0] is None
+        assert str(errors[0][1]) == 'persistence failed'
+
+    @pytest.mark.asyncio
+    async def test_update_persistence_skips_unchanged_tracking_dicts(self):
+        persistence = RecordingPersistence()
+        # DictPersistence doesn't use the context types for the data it returns
+        persistence._user_data = defaultdict(TrackingDict)
+        persistence._chat_data = defaultdict(TrackingDict)
+        persistence._bot_data = TrackingDict()
+        context_types = ContextTypes(
+            user_data=TrackingDict, chat_data=TrackingDict, bot_data=TrackingDict
+        )
+        dispatcher = make_dispatcher(persistence, context_types)
+        dispatcher.user_data[1]['key'] = 'value'
+
+        await dispatcher.update_persistence(make_update(1))
+        await dispatcher.update_persistence(make_update(2))
+        await dispatcher.stop()
+        assert [(kind, key) for kind, key, _ in persistence.calls] == [
+            ('user_data', 1),
+            ('flush', None),
+        ]
+        assert not dispatcher.user_data[1].changed_keys
+
+        persistence.calls.clear()
+        await dispatcher.update_persistence(make_update(1))
+        dispatcher.bot_data['key'] = 'value'
+        await dispatcher.stop()
+        assert [(kind, key) for kind, key, _ in persistence.calls] == [
+            ('bot_data', None),
+            ('flush', None),
+        ]
+        assert persistence.bot_data == {'key': 'value'}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('append_only', [False, True], ids=['dump', 'append_only'])
+    async def test_conversations_and_user_data(self, tmp_path, append_only):
+        filepath = tmp_path / 'persistence'
+        persistence = ThreadRecordingPicklePersistence(filepath, append_only=append_only)
+        dispatcher = make_dispatcher(persistence)
+
+        def start(update, context):
+            context.user_data['steps'] = []
+            return 1
+
+        def step(update, context):
+            # The data is changed while earlier changes are being written
+            context.user_data['steps'] = context.user_data['steps'] + [update.message.text]
+            context.bot_data[update.effective_user.id] = len(context.user_data['steps'])
+            return ConversationHandler.END if update.message.text == 'end' else 1
+
+        conversation = ConversationHandler(
+            entry_points=[SyncMessageHandler(filters.Regex('^start$'), start)],
+            states={1: [SyncMessageHandler(filters.TEXT, step)]},
+            fallbacks=[],
+            name='conversation',
+            persistent=True,
+        )
+        dispatcher.add_handler(conversation)
+
+        async def chat(user_id):
+            texts = ['start', 'a', 'b'] + (['end'] if user_id % 2 else [])
+            for text in texts:
+                # Handles the update like Dispatcher.process_update does
+                update = make_update(user_id, text)
+                check = conversation.check_update(update)
+                context = CallbackContext.from_update(update, dispatcher)
+                conversation.handle_update(update, dispatcher, check, context)
+                await dispatcher.update_persistence(update)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(chat(user_id) for user_id in range(1, 11)))
+        await dispatcher.stop()
+
+        # Nothing is written on the event loop and all writes happen in the same thread
+        assert len(persistence.threads) == 1
+        assert threading.current_thread() not in persistence.threads
+
+        reloaded = PicklePersistence(filepath, append_only=append_only)
+        conversations = reloaded.get_conversations('conversation')
+        assert {key: state for key, state in conversations.items() if state is not None} == {
+            (user_id, user_id): 1 for user_id in range(2, 11, 2)
+        }
+        user_data = reloaded.get_user_data()
+        bot_data = reloaded.get_bot_data()
+        for user_id in range(1, 11):
+            expected = ['a', 'b', 'end'] if user_id % 2 else ['a', 'b']
+            assert user_data[user_id] == {'steps': expected}
+            assert bot_data[user_id] == len(expected)
+
+    @pytest.mark.asyncio
+    async def test_update_persistence_error_keeps_changes(self):
+        persistence = RecordingPersistence(fail=True)
+        persistence._user_data = defaultdict(TrackingDict)
+        context_types = ContextTypes(user_data=TrackingDict)
+        dispatcher = make_dispatcher(persistence, context_types)
+        errors = []
+
+        async def error_handler(update, context):
+            errors.append(context.error)
+
+        dispatcher.add_error_handler(error_handler)
+        dispatcher.user_data[1]['key'] = 'value'
+        await dispatcher.update_persistence(make_update(1))
+        for _ in range(100):
+            if errors:
+                break
+            await asyncio.sleep(0.01)
+        assert len(errors) == 1
+        # The failed write doesn't lose the change
+        assert dispatcher.user_data[1].changed_keys == {'key'}
+
+        # The data of user 1 is written again with the next write, although it's not changed
+        persistence.fail = False
+        await dispatcher.update_persistence(make_update(2))
+        await dispatcher.stop()
+        assert persistence.user_data == {1: {'key': 'value'}}
+        assert not dispatcher.user_data[1].changed_keys
+        assert [key for kind, key, _ in persistence.calls if kind == 'user_data'] == [1, 1]
+        assert len(errors) == 1
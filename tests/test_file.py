@@ -17,14 +17,15 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 import os
+from io import BytesIO
 from pathlib import Path
 from tempfile import TemporaryFile, mkstemp
 
 import pytest
 from flaky import flaky
 
-from telegram import File, Voice
-from telegram.error import TelegramError
+from telegram import File, FileCredentials, Voice
+from telegram.error import PassportDecryptionError, TelegramError
 from tests.conftest import data_file
 
 
@@ -101,9 +102,9 @@ class TestFile:
     @pytest.mark.asyncio
     async def test_download(self, monkeypatch, file):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content
 
-        monkeypatch.setattr(file.get_bot().request, 'retrieve', test)
+        monkeypatch.setattr(file.get_bot().request, 'stream', test)
         out_file = await file.download()
 
         try:
@@ -121,9 +122,9 @@ class TestFile:
     @pytest.mark.asyncio
     async def test_download_custom_path(self, monkeypatch, file, custom_path_type):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content
 
-        monkeypatch.setattr(file.get_bot().request, 'retrieve', test)
+        monkeypatch.setattr(file.get_bot().request, 'stream', test)
         file_handle, custom_path = mkstemp()
         custom_path = Path(custom_path)
         try:
@@ -152,11 +153,11 @@ class TestFile:
     @pytest.mark.asyncio
     async def test_download_no_filename(self, monkeypatch, file):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content
 
         file.file_path = None
 
-        monkeypatch.setattr(file.get_bot().request, 'retrieve', test)
+        monkeypatch.setattr(file.get_bot().request, 'stream', test)
         out_file = await file.download()
 
         assert str(out_file)[-len(file.file_id) :] == file.file_id
@@ -168,9 +169,9 @@ class TestFile:
     @pytest.mark.asyncio
     async def test_download_file_obj(self, monkeypatch, file):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content
 
-        monkeypatch.setattr(file.get_bot().request, 'retrieve', test)
+        monkeypatch.setattr(file.get_bot().request, 'stream', test)
         with TemporaryFile() as custom_fobj:
             out_fobj = await file.download(out=custom_fobj)
             assert out_fobj is custom_fobj
@@ -218,6 +219,115 @@ class TestFile:
         assert buf2[len(buf) :] == buf
         assert buf2[: len(buf)] == buf
 
+    @pytest.mark.asyncio
+    async def test_iter_bytes(self, monkeypatch, file):
+        async def stream(url, chunk_size=None, **kwargs):
+            assert url == file._get_encoded_url()
+            assert chunk_size == 4
+            assert kwargs == {
+                'read_timeout': 1,
+                'connect_timeout': 2,
+                'write_timeout': 3,
+                'pool_timeout': 4,
+            }
+            for start in range(0, len(self.file_content), chunk_size):
+                yield self.file_content[start : start + chunk_size]
+
+        monkeypatch.setattr(file.get_bot().request, 'stream', stream)
+        chunks = [
+            chunk
+            async for chunk in file.iter_bytes(
+                chunk_size=4, read_timeout=1, connect_timeout=2, write_timeout=3, pool_timeout=4
+            )
+        ]
+        assert len(chunks) == 3
+        assert b''.join(chunks) == self.file_content
+
+    @pytest.mark.asyncio
+    async def test_iter_bytes_local_file(self, local_file):
+        chunks = [chunk async for chunk in local_file.iter_bytes(chunk_size=4)]
+        assert len(chunks) == 3
+        assert b''.join(chunks) == self.file_content
+
+    @pytest.mark.asyncio
+    async def test_iter_bytes_credentials(self, monkeypatch, file):
+        async def stream(*args, **kwargs):
+            yield self.file_content
+
+        async def decrypt_stream(secret, hash, chunks):
+            assert (secret, hash) == (b'secret', b'hash')
+            async for chunk in chunks:
+                yield chunk[::-1]
+
+        monkeypatch.setattr(file.get_bot().request, 'stream', stream)
+        monkeypatch.setattr('telegram._files.file.decrypt_stream', decrypt_stream)
+        new_file = File(
+            self.file_id, self.file_unique_id, file_path=self.file_path, bot=file.get_bot()
+        )
+        new_file.set_credentials(FileCredentials('aGFzaA==', 'c2VjcmV0'))
+        chunks = [chunk async for chunk in new_file.iter_bytes()]
+        assert chunks == [self.file_content[::-1]]
+
+    @pytest.mark.asyncio
+    async def test_download_out_credentials_error(self, monkeypatch, file):
+        async def stream(*args, **kwargs):
+            yield self.file_content[:3]
+            yield self.file_content[3:]
+
+        async def decrypt_stream(secret, hash, chunks):
+            # Like the real one, the hash is checked after the chunks were yielded
+            async for chunk in chunks:
+                yield chunk
+            raise PassportDecryptionError('Hashes are not equal!')
+
+        monkeypatch.setattr(file.get_bot().request, 'stream', stream)
+        monkeypatch.setattr('telegram._files.file.decrypt_stream', decrypt_stream)
+        new_file = File(
+            self.file_id, self.file_unique_id, file_path=self.file_path, bot=file.get_bot()
+        )
+        new_file.set_credentials(FileCredentials('aGFzaA==', 'c2VjcmV0'))
+        out = BytesIO()
+        with pytest.raises(PassportDecryptionError, match='Hashes'):
+            await new_file.download(out=out)
+        # Unverified data is not written
+        assert out.getvalue() == b''
+
+        monkeypatch.setattr(
+            'telegram._files.file.decrypt_stream', lambda secret, hash, chunks: chunks
+        )
+        assert await new_file.download(out=out) is out
+        assert out.getvalue() == self.file_content
+
+    @pytest.mark.asyncio
+    async def test_download_to(self, monkeypatch, file, tmp_path):
+        async def stream(*args, chunk_size=None, **kwargs):
+            assert chunk_size == 3
+            yield self.file_content[:3]
+            yield self.file_content[3:]
+
+        monkeypatch.setattr(file.get_bot().request, 'stream', stream)
+        path = tmp_path / 'file'
+        assert await file.download_to(str(path), chunk_size=3) == path
+        assert path.read_bytes() == self.file_content
+
+    @pytest.mark.asyncio
+    async def test_download_to_error(self, monkeypatch, file, tmp_path):
+        async def stream(*args, **kwargs):
+            yield self.file_content
+            raise TelegramError('error')
+
+        monkeypatch.setattr(file.get_bot().request, 'stream', stream)
+        path = tmp_path / 'file'
+        with pytest.raises(TelegramError, match='error'):
+            await file.download_to(path)
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_download_to_local_file(self, local_file, tmp_path):
+        path = tmp_path / 'file'
+        assert await local_file.download_to(path) == path
+        assert path.read_bytes() == self.file_content
+
     def test_equality(self, bot):
         a = File(self.file_id, self.file_unique_id, bot)
         b = File('', self.file_unique_id, bot)
@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import random
+import re
+
+import pytest
+
+from telegram import CallbackQuery, Chat, Message, MessageEntity, Update, User
+from telegram.ext import filters
+from telegram.ext._utils.filtercache import CURRENT_FILTER_CACHE, cache_filter_results
+from telegram.ext.filters import (
+    MessageFilter,
+    UpdateFilter,
+    _InvertedFilter,
+    _MergedFilter,
+    _XORFilter,
+)
+
+
+def make_update(text, chat_id=1, edited=False, command=False):
+    entities = [MessageEntity(MessageEntity.BOT_COMMAND, 0, len(text))] if command else []
+    message = Message(
+        1,
+        None,
+        Chat(chat_id, Chat.PRIVATE),
+        from_user=User(1, 'name', False),
+        text=text,
+        entities=entities,
+    )
+    if edited:
+        return Update(1, edited_message=message)
+    return Update(1, message=message)
+
+
+UPDATES = [
+    make_update('abc'),
+    make_update('b c'),
+    make_update('xyz', chat_id=2),
+    make_update('/start', command=True),
+    make_update('ab bc', edited=True),
+    make_update('', chat_id=2),
+    Update(1, callback_query=CallbackQuery('1', User(1, 'name', False), 'instance')),
+]
+
+
+class CountingFilter(MessageFilter):
+    """Accepts messages whose text contains the given string."""
+
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        super().__init__(name=f'CountingFilter({text})')
+        self.text = text
+
+    def filter(self, message):
+        return bool(message.text) and self.text in message.text
+
+
+class MemoizedCountingFilter(CountingFilter):
+    __slots__ = ()
+
+    memoize = True
+
+
+class CustomText(filters.Text):
+    """A third-party subclass of a built-in filter."""
+
+    __slots__ = ()
+
+
+class CustomCheckUpdate(UpdateFilter):
+    __slots__ = ()
+
+    memoize = True
+
+    def check_update(self, update):
+        return True
+
+    def filter(self, update):
+        return True
+
+
+def reference(filter_, update):
+    """Evaluates a filter for a message update without compiling it, such that the results of
+    the compiled filters can be compared to the straightforward evaluation."""
+    if isinstance(filter_, _InvertedFilter):
+        return not bool(reference(filter_.inv_filter, update))
+    if isinstance(filter_, _XORFilter):
+        return reference(filter_.merged_filter, update)
+    if isinstance(filter_, _MergedFilter):
+        base_output = reference(filter_.base_filter, update)
+        if filter_.and_filter:
+            if base_output:
+                comp_output = reference(filter_.and_filter, update)
+                if comp_output:
+                    if filter_.data_filter:
+                        # pylint: disable=protected-access
+                        merged = _MergedFilter._merge(base_output, comp_output)
+                        if merged:
+                            return merged
+                    return True
+            return False
+        if base_output:
+            return base_output if filter_.data_filter else True
+        comp_output = reference(filter_.or_filter, update)
+        if comp_output:
+            return comp_output if filter_.data_filter else True
+        return False
+    if isinstance(filter_, MessageFilter):
+        return filter_.filter(update.effective_message)
+    return filter_.filter(update)
+
+
+def normalize(result):
+    # Match objects are compared by identity, so we compare the matched strings
+    if isinstance(result, dict):
+        return {
+            key: [item.group(0) if isinstance(item, re.Match) else item for item in value]
+            for key, value in result.items()
+        }
+    return result
+
+
+def random_filter(rng, leaves, depth):
+    if depth == 0 or rng.random() < 0.25:
+        return rng.choice(leaves)
+    kind = rng.choice(['and', 'or', 'xor', 'not'])
+    if kind == 'not':
+        return ~random_filter(rng, leaves, depth - 1)
+    left = random_filter(rng, leaves, depth - 1)
+    right = random_filter(rng, leaves, depth - 1)
+    if kind == 'and':
+        return left & right
+    if kind == 'or':
+        return left | right
+    return left ^ right
+
+
+class TestCompiledFilters:
+    @pytest.mark.parametrize('cached', [False, True])
+    def test_equivalence(self, cached):
+        rng = random.Random(1)
+        leaves = [
+            filters.TEXT,
+            filters.COMMAND,
+            filters.PHOTO,
+            filters.Regex('b'),
+            filters.Regex('(a)(b)?'),
+            filters.Regex('c'),
+            filters.Chat(1),
+            filters.UpdateType.EDITED_MESSAGE,
+            CountingFilter('b'),
+            MemoizedCountingFilter('x'),
+        ]
+        for _ in range(500):
+            filter_ = random_filter(rng, leaves, 4)
+            for update in UPDATES:
+                if not update.effective_message:
+                    expected = False
+                else:
+                    expected = normalize(reference(filter_, update))
+                if cached:
+                    with cache_filter_results(update):
+                        # The second check is answered from the cache
+                        assert normalize(filter_.check_update(update)) == expected
+                        assert normalize(filter_.check_update(update)) == expected
+                else:
+                    assert normalize(filter_.check_update(update)) == expected
+
+    def test_data_filters_merge(self):
+        update = make_update('abc')
+        regex = filters.Regex('(a)')
+        combined = regex & filters.Regex('(c)')
+        assert combined.data_filter
+        assert normalize(combined.check_update(update)) == {'matches': ['a', 'c']}
+        assert normalize((regex | filters.Regex('c')).check_update(update)) == {'matches': ['a']}
+        assert normalize((filters.Regex('x') | regex).check_update(update)) == {'matches': ['a']}
+        # If only one of the filters is a data filter, its result is kept
+        assert normalize((filters.TEXT & regex).check_update(update)) == {'matches': ['a']}
+        assert (filters.TEXT & filters.Regex('x')).check_update(update) is False
+
+    def test_data_filters_merge_cached(self):
+        update = make_update('abc')
+        regex = filters.Regex('(a)')
+        with cache_filter_results(update):
+            # Merging must not modify the cached result of the filter
+            assert normalize((regex & regex).check_update(update)) == {'matches': ['a', 'a']}
+            assert normalize((regex & regex).check_update(update)) == {'matches': ['a', 'a']}
+            assert normalize(regex.check_update(update)) == {'matches': ['a']}
+        assert regex.evaluations == 1
+
+    def test_non_message_updates(self):
+        update = UPDATES[-1]
+        for filter_ in [
+            ~filters.PHOTO,
+            filters.TEXT | ~filters.TEXT,
+            ~(filters.ALL ^ filters.ALL),
+        ]:
+            assert filter_.check_update(update) is False
+
+
+class TestFilterCache:
+    def test_built_in_filters_memoized(self):
+        update = make_update('abc')
+        text = filters.Text()
+        with cache_filter_results(update):
+            assert text.check_update(update)
+            assert text.check_update(update)
+        assert (text.evaluations, text.cache_hits) == (1, 1)
+
+    @pytest.mark.parametrize(
+        'filter_',
+        [CountingFilter('a'), CustomText(), CustomCheckUpdate()],
+        ids=['MessageFilter', 'built-in subclass', 'check_update'],
+    )
+    def test_third_party_filters_not_memoized(self, filter_):
+        update = make_update('abc')
+        with cache_filter_results(update):
+            assert filter_.check_update(update)
+            assert filter_.check_update(update)
+            combined = filters.TEXT & filter_
+            assert combined.check_update(update)
+            assert combined.check_update(update)
+        assert filter_.cache_hits == 0
+        assert combined.cache_hits == 0
+        assert not combined.memoize
+
+    def test_opt_in(self):
+        update = make_update('abc')
+        filter_ = MemoizedCountingFilter('a')
+        combined = filters.TEXT & filter_
+        with cache_filter_results(update):
+            for _ in range(3):
+                assert filter_.check_update(update)
+                assert combined.check_update(update)
+        # The combination is evaluated once, taking the result of the filter from the cache
+        assert (filter_.evaluations, filter_.cache_hits) == (1, 3)
+        assert (combined.evaluations, combined.cache_hits) == (1, 2)
+        assert combined.memoize
+
+    def test_opt_out(self):
+        # The chat ids may be changed by handlers while an update is processed
+        update = make_update('abc', chat_id=2)
+        chat_filter = filters.Chat(1)
+        combined = filters.TEXT & chat_filter
+        assert chat_filter.memoize is False
+        with cache_filter_results(update):
+            assert not chat_filter.check_update(update)
+            assert not combined.check_update(update)
+            chat_filter.add_chat_ids(2)
+            assert chat_filter.check_update(update)
+            assert combined.check_update(update)
+        assert chat_filter.cache_hits == 0
+        assert not combined.memoize
+
+    def test_scoping(self):
+        update, other_update = make_update('abc'), make_update('abc')
+        text = filters.Text()
+        assert CURRENT_FILTER_CACHE.get() is None
+        text.check_update(update)
+        text.check_update(update)
+        assert (text.evaluations, text.cache_hits) == (2, 0)
+
+        with cache_filter_results(update) as cache:
+            assert CURRENT_FILTER_CACHE.get() is cache
+            text.check_update(update)
+            # Other updates don't use the cache
+            text.check_update(other_update)
+        assert CURRENT_FILTER_CACHE.get() is None
+        with cache_filter_results(update):
+            # The results are not kept across contexts
+            text.check_update(update)
+        assert (text.evaluations, text.cache_hits) == (5, 0)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_scoping(self):
+        text = filters.Text()
+
+        async def process(update):
+            with cache_filter_results(update) as cache:
+                text.check_update(update)
+                await asyncio.sleep(0.01)
+                assert CURRENT_FILTER_CACHE.get() is cache
+                text.check_update(update)
+
+        await asyncio.gather(*(process(make_update('abc')) for _ in range(3)))
+        assert (text.evaluations, text.cache_hits) == (3, 3)
+
+    def test_statistics(self):
+        update = make_update('abc')
+        text = filters.Text()
+        combined = text & ~filters.PHOTO
+        with cache_filter_results(update):
+            combined.check_update(update)
+            combined.check_update(update)
+            text.check_update(update)
+        assert (combined.evaluations, combined.cache_hits) == (1, 1)
+        assert (text.evaluations, text.cache_hits) == (1, 1)
+
+        text.reset_statistics()
+        assert (text.evaluations, text.cache_hits) == (0, 0)
+        assert (combined.evaluations, combined.cache_hits) == (1, 1)
@@ -20,18 +20,22 @@
 from telegram.ext import Handler
 
 
-class TestHandler:
-    def test_slot_behaviour(self, mro_slots):
-        class SubclassHandler(Handler):
-            __slots__ = ()
+class SubclassHandler(Handler):
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(lambda x: None)
 
-            def __init__(self):
-                super().__init__(lambda x: None)
+    def check_update(self, update: object):
+        pass
 
-            def check_update(self, update: object):
-                pass
 
+class TestHandler:
+    def test_slot_behaviour(self, mro_slots):
         inst = SubclassHandler()
         for attr in inst.__slots__:
             assert getattr(inst, attr, 'err') != 'err', f"got extra slot '{attr}'"
         assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_update_types(self):
+        assert SubclassHandler().update_types is None
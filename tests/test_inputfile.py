@@ -21,6 +21,7 @@ import subprocess
 import sys
 from io import BytesIO
 
+import httpx
 import pytest
 
 from telegram import InputFile
@@ -56,6 +57,48 @@ class TestInputFile:
             # to kill it.
             pass
 
+    def test_stream_seekable_file(self, png_file):
+        reads = []
+
+        class TrackingBytesIO(BytesIO):
+            def read(self, size=-1):
+                reads.append(size)
+                return super().read(size)
+
+        content = png_file.read_bytes()
+        file = TrackingBytesIO(b'skipped' + content)
+        file.seek(len(b'skipped'))
+        in_file = InputFile(file)
+
+        # Only the start of the file is read for determining the mimetype
+        assert reads == [4096]
+        assert in_file.mimetype == 'image/png'
+        filename, stream, mimetype = in_file.field_tuple
+        assert not isinstance(stream, bytes)
+        assert (filename, mimetype) == ('image.png', 'image/png')
+
+        # The upload starts at the original position of the file, also when it is repeated
+        for _ in range(2):
+            reads.clear()
+            request = httpx.Request(
+                'POST', 'https://localhost', files={'file': in_file.field_tuple}
+            )
+            body = request.read()
+            assert content in body
+            assert b'skipped' not in body
+            assert int(request.headers['Content-Length']) == len(body)
+            assert -1 not in reads
+
+        assert in_file.input_file_content == content
+
+    def test_read_unseekable_file(self, png_file):
+        # e.g. for pipes
+        file = BytesIO(png_file.read_bytes())
+        file.seekable = lambda: False
+        in_file = InputFile(file)
+        assert in_file.field_tuple[1] == png_file.read_bytes()
+        assert in_file.input_file_content == png_file.read_bytes()
+
     def test_mimetypes(self, caplog):
         # Only test a few to make sure logic works okay
         assert InputFile(data_file('telegram.jpg').open('rb')).mimetype == 'image/jpeg'
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+
+import pytest
+
+import telegram._utils.jsoncodec
+from telegram.request import JSONCodec, OrjsonCodec, UJSONCodec
+
+
+def available_codecs():
+    codecs = [JSONCodec]
+    if telegram._utils.jsoncodec.UJSON_AVAILABLE:
+        codecs.append(UJSONCodec)
+    if telegram._utils.jsoncodec.ORJSON_AVAILABLE:
+        codecs.append(OrjsonCodec)
+    return codecs
+
+
+@pytest.fixture(params=available_codecs(), ids=lambda cls: cls.__name__)
+def codec(request):
+    return request.param()
+
+
+class TestJSONCodec:
+    obj = {'str': 'string ü', 'int': 1, 'float': 1.5, 'list': [True, None], 'dict': {'a': 'b'}}
+
+    def test_slot_behaviour(self, codec, mro_slots):
+        for attr in codec.__slots__:
+            assert getattr(codec, attr, 'err') != 'err', f"got extra slot '{attr}'"
+        assert len(mro_slots(codec)) == len(set(mro_slots(codec))), "duplicate slot"
+
+    def test_round_trip(self, codec):
+        assert codec.loads(codec.dumps(self.obj)) == self.obj
+        assert codec.loads(codec.dumps_bytes(self.obj)) == self.obj
+        assert codec.dumps_bytes(self.obj) == codec.dumps(self.obj).encode('utf-8')
+
+    def test_loads_bytes(self, codec):
+        assert codec.loads('{"text": "ü"}'.encode('utf-8')) == {'text': 'ü'}
+
+    def test_non_str_keys(self, codec):
+        assert codec.loads(codec.dumps({1: 'one'})) == {'1': 'one'}
+
+    def test_invalid_json(self, codec):
+        with pytest.raises(ValueError):
+            codec.loads(b'{result: "test_string"}')
+
+    @pytest.mark.parametrize(
+        'cls, flag', [(UJSONCodec, 'UJSON_AVAILABLE'), (OrjsonCodec, 'ORJSON_AVAILABLE')]
+    )
+    def test_not_installed(self, monkeypatch, cls, flag):
+        monkeypatch.setattr(telegram._utils.jsoncodec, flag, False)
+        with pytest.raises(RuntimeError, match=cls.__name__):
+            cls()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import textwrap
+import time
+import warnings
+from collections import Counter
+
+import pytest
+
+from telegram import Bot, Message
+from telegram.error import NetworkError, RetryAfter, TimedOut
+from telegram.ext import ContextTypes, Dispatcher, ExtBot
+from telegram.request import MockRequest, RequestData
+
+TOKEN = '1234567890:AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA'
+
+
+@pytest.fixture(scope='function')
+def mock_request():
+    return MockRequest(seed=1)
+
+
+class TestMockRequest:
+    def test_slot_behaviour(self, mock_request, mro_slots):
+        for attr in mock_request.__slots__:
+            assert getattr(mock_request, attr, 'err') != 'err', f"got extra slot '{attr}'"
+        assert len(mro_slots(mock_request)) == len(set(mro_slots(mock_request))), "same slot"
+
+    def test_docstring_example(self):
+        docstring = MockRequest.__doc__
+        code = docstring[docstring.index('.. code:: python') : docstring.index('Args:')]
+        code = textwrap.dedent(code.split('\n', 1)[1])
+        namespace = {
+            'asyncio': asyncio,
+            'warnings': warnings,
+            'ContextTypes': ContextTypes,
+            'Dispatcher': Dispatcher,
+            'ExtBot': ExtBot,
+            'MockRequest': MockRequest,
+        }
+        exec(code, namespace)  # pylint: disable=exec-used
+        dispatcher = namespace['dispatcher']
+        assert dispatcher.bot.request is namespace['request']
+
+    @pytest.mark.parametrize('error_rate', [-0.1, 1.1])
+    def test_init_invalid_error_rate(self, error_rate):
+        with pytest.raises(ValueError, match='between 0 and 1'):
+            MockRequest(error_rate=error_rate)
+
+    @pytest.mark.asyncio
+    async def test_default_responses(self, mock_request):
+        async with Bot(TOKEN, request=mock_request) as bot:
+            assert bot.username == 'mock_bot'
+            message = await bot.send_message(123, 'text')
+            assert isinstance(message, Message)
+            assert message.chat_id == 123
+            assert message.text == 'text'
+            assert message.from_user == bot.bot
+            assert (await bot.send_message('@channel', 'text')).message_id == 2
+            assert await bot.delete_message(123, 1) is True
+
+        assert [endpoint for endpoint, _ in mock_request.requests] == [
+            'getMe',
+            'sendMessage',
+            'sendMessage',
+            'deleteMessage',
+        ]
+        assert isinstance(mock_request.requests[1][1], RequestData)
+        assert mock_request.requests[1][1].parameters == {'chat_id': 123, 'text': 'text'}
+
+    @pytest.mark.asyncio
+    async def test_custom_responses(self):
+        request = MockRequest(
+            responses={
+                'getChatMemberCount': 42,
+                'sendDice': lambda data: {
+                    'message_id': 1,
+                    'date': 0,
+                    'chat': {'id': data.parameters['chat_id'], 'type': 'private'},
+                    'dice': {'emoji': '🎲', 'value': 6},
+                },
+                'file_0.txt': b'content',
+            },
+            record=False,
+        )
+        async with Bot(TOKEN, request=request) as bot:
+            assert await bot.get_chat_member_count(1) == 42
+            assert (await bot.send_dice(7)).dice.value == 6
+            assert await request.retrieve('https://api.telegram.org/file/bot/file_0.txt') == (
+                b'content'
+            )
+        assert request.requests == []
+
+    @pytest.mark.asyncio
+    async def test_latency(self, mock_request):
+        mock_request.latency = 0.1
+        start = time.perf_counter()
+        await mock_request.post('https://api.telegram.org/bot/getMe')
+        assert time.perf_counter() - start >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_error_injection(self):
+        request = MockRequest(error_rate=0.5, seed=1)
+        outcomes = Counter()
+        for _ in range(200):
+            try:
+                await request.post('https://api.telegram.org/bot/getMe')
+                outcomes['ok'] += 1
+            except RetryAfter as exc:
+                assert exc.retry_after == 1
+                outcomes['429'] += 1
+            except TimedOut:
+                outcomes['timeout'] += 1
+            except NetworkError:
+                outcomes['502'] += 1
+
+        assert set(outcomes) == {'ok', '429', '502', 'timeout'}
+        assert 60 < outcomes['ok'] < 140
+        assert len(request.requests) == 200
+
+    @pytest.mark.asyncio
+    async def test_error_injection_reproducible(self):
+        async def outcomes(seed):
+            request = MockRequest(error_rate=0.3, errors=[502], seed=seed)
+            results = []
+            for _ in range(50):
+                try:
+                    await request.post('https://api.telegram.org/bot/getMe')
+                    results.append(True)
+                except NetworkError:
+                    results.append(False)
+            return results
+
+        assert await outcomes(1) == await outcomes(1)
+        assert not all(await outcomes(1))
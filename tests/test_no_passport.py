@@ -74,6 +74,13 @@ class TestNoPassport:
         with pytest.raises(RuntimeError, match='passport'):
             credentials.decrypt(1, 1, 1)
 
+    @pytest.mark.asyncio
+    async def test_credentials_decrypt_stream(self, monkeypatch):
+        if not TEST_NO_PASSPORT:
+            monkeypatch.setattr(credentials, 'CRYPTO_INSTALLED', False)
+        with pytest.raises(RuntimeError, match='passport'):
+            await credentials.decrypt_stream(1, 1, None).__anext__()
+
     def test_encrypted_credentials_decrypted_secret(self, monkeypatch):
         if not TEST_NO_PASSPORT:
             monkeypatch.setattr(credentials, 'CRYPTO_INSTALLED', False)
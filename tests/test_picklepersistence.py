@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import pickle
+
+import pytest
+
+from telegram.ext import PicklePersistence
+from telegram.ext import _picklepersistence
+
+
+@pytest.fixture(scope='function')
+def filepath(tmp_path):
+    return tmp_path / 'persistence'
+
+
+def fill(persistence):
+    persistence.get_user_data()
+    persistence.update_user_data(1, {'user': 1})
+    persistence.update_user_data(2, {'user': 2})
+    persistence.update_user_data(1, {'user': 'one'})
+    persistence.update_chat_data(-1, {'chat': -1})
+    persistence.update_bot_data({'bot': True})
+    persistence.update_callback_data(([('uuid', 1.0, {'button': 1})], {'id': 'uuid'}))
+    persistence.update_conversation('name', (1, 2), 'state')
+
+
+def assert_filled(persistence):
+    assert persistence.get_user_data() == {1: {'user': 'one'}, 2: {'user': 2}}
+    assert persistence.get_chat_data() == {-1: {'chat': -1}}
+    assert persistence.get_bot_data() == {'bot': True}
+    assert persistence.get_callback_data() == (
+        [('uuid', 1.0, {'button': 1})],
+        {'id': 'uuid'},
+    )
+    assert persistence.get_conversations('name') == {(1, 2): 'state'}
+
+
+class TestPicklePersistenceAppendOnly:
+    def test_slot_behaviour(self, filepath, mro_slots):
+        inst = PicklePersistence(filepath, append_only=True)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, 'err') != 'err', f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init_requires_single_file(self, filepath):
+        with pytest.raises(ValueError, match='single_file'):
+            PicklePersistence(filepath, single_file=False, append_only=True)
+
+    def test_round_trip(self, filepath):
+        persistence = PicklePersistence(filepath, append_only=True)
+        fill(persistence)
+        assert_filled(PicklePersistence(filepath, append_only=True))
+
+    def test_appends_only_the_change(self, filepath):
+        persistence = PicklePersistence(filepath, append_only=True)
+        persistence.get_user_data()
+        for user_id in range(1000):
+            persistence.update_user_data(user_id, {'user': user_id})
+        size = filepath.stat().st_size
+
+        persistence.update_user_data(1, {'user': 'one'})
+        assert 0 < filepath.stat().st_size - size < 100
+        assert PicklePersistence(filepath, append_only=True).get_user_data()[1] == {'user': 'one'}
+
+    def test_unchanged_data_is_not_appended(self, filepath):
+        persistence = PicklePersistence(filepath, append_only=True)
+        fill(persistence)
+        size = filepath.stat().st_size
+        persistence.update_user_data(1, {'user': 'one'})
+        persistence.update_chat_data(-1, {'chat': -1})
+        persistence.update_bot_data({'bot': True})
+        persistence.update_conversation('name', (1, 2), 'state')
+        assert filepath.stat().st_size == size
+
+    def test_compaction(self, filepath, monkeypatch):
+        monkeypatch.setattr(_picklepersistence, '_MIN_COMPACTION_SIZE', 0)
+        persistence = PicklePersistence(filepath, append_only=True)
+        persistence.get_user_data()
+        persistence.update_user_data(1, {'user': 0})
+        sizes = set()
+        for value in range(1, 200):
+            persistence.update_user_data(1, {'user': value})
+            sizes.add(filepath.stat().st_size)
+
+        # The file doesn't grow, because the overwritten records are dropped on compaction
+        assert max(sizes) < 2 * min(sizes) + 100
+        assert not filepath.with_name('persistence.tmp').exists()
+        loaded = PicklePersistence(filepath, append_only=True)
+        assert loaded.get_user_data() == {1: {'user': 199}}
+
+    def test_incomplete_record(self, filepath, caplog):
+        persistence = PicklePersistence(filepath, append_only=True)
+        fill(persistence)
+        persistence.update_user_data(3, {'user': 3})
+        persistence.flush()
+        persistence.update_user_data(4, {'user': 4})
+        persistence.update_user_data(5, {'user': 5})
+        size = filepath.stat().st_size
+        # Simulate a crash while writing the last record
+        with filepath.open('r+b') as file:
+            file.truncate(size - 5)
+
+        persistence = PicklePersistence(filepath, append_only=True)
+        with caplog.at_level('WARNING'):
+            user_data = persistence.get_user_data()
+        assert 4 in user_data
+        assert 5 not in user_data
+        assert 'Discarding the incomplete end' in caplog.records[-1].getMessage()
+
+        # The incomplete record was removed, so new records can be appended
+        persistence.update_user_data(6, {'user': 6})
+        user_data = PicklePersistence(filepath, append_only=True).get_user_data()
+        assert 6 in user_data
+        assert 5 not in user_data
+
+    def test_invalid_file(self, filepath):
+        filepath.write_bytes(b'no pickle data')
+        with pytest.raises(TypeError, match='does not contain valid pickle data'):
+            PicklePersistence(filepath, append_only=True).get_user_data()
+
+    def test_flush_writes_regular_file(self, filepath):
+        persistence = PicklePersistence(filepath, append_only=True)
+        fill(persistence)
+        persistence.flush()
+
+        with filepath.open('rb') as file:
+            data = pickle.load(file)
+            assert file.read() == b''
+        assert data['user_data'] == {1: {'user': 'one'}, 2: {'user': 2}}
+        assert_filled(PicklePersistence(filepath))
+
+    def test_read_regular_file(self, filepath):
+        fill(PicklePersistence(filepath))
+        persistence = PicklePersistence(filepath, append_only=True)
+        assert_filled(persistence)
+
+        persistence.update_user_data(2, {'user': 'two'})
+        assert PicklePersistence(filepath, append_only=True).get_user_data()[2] == {'user': 'two'}
+
+    def test_on_flush(self, filepath):
+        persistence = PicklePersistence(filepath, on_flush=True, append_only=True)
+        fill(persistence)
+        assert not filepath.exists()
+        persistence.flush()
+        assert_filled(PicklePersistence(filepath, append_only=True))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import datetime
+
+import pytest
+
+from telegram import (
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    InputFile,
+    InputMediaPhoto,
+    MessageEntity,
+)
+from telegram.constants import ParseMode
+from telegram.request import JSONCodec, PreparedRequest, RequestData
+from telegram.request._requestparameter import RequestParameter
+from tests.conftest import data_file
+
+
+@pytest.fixture(scope='function')
+def data():
+    return {
+        'text': 'text',
+        'parse_mode': ParseMode.HTML,
+        'disable_notification': True,
+        'entities': [MessageEntity(MessageEntity.BOLD, 0, 4)],
+        'reply_markup': InlineKeyboardMarkup.from_button(
+            InlineKeyboardButton('text', callback_data='data')
+        ),
+        'date': datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc),
+    }
+
+
+class TestPreparedRequest:
+    def test_slot_behaviour(self, data, mro_slots):
+        inst = PreparedRequest('sendMessage', data)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, 'err') != 'err', f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_parameters(self, data):
+        prepared = PreparedRequest('sendMessage', data)
+        assert prepared.endpoint == 'sendMessage'
+        assert list(prepared.parameters) == list(data)
+
+        expected = RequestData(
+            [RequestParameter.from_input(key, value) for key, value in data.items()]
+        )
+        request_data = RequestData(list(prepared.parameters.values()))
+        assert not request_data.contains_files
+        assert request_data.json_parameters == expected.json_parameters
+        assert request_data.json_payload == expected.json_payload
+
+    def test_snapshot(self, data):
+        prepared = PreparedRequest('sendMessage', data)
+        json_value = prepared.parameters['entities'].value
+        data['entities'].append(MessageEntity(MessageEntity.ITALIC, 0, 4))
+        assert prepared.parameters['entities'].value == json_value
+
+    def test_json_codec(self, data):
+        class Codec(JSONCodec):
+            def dumps(self, obj):
+                return 'dumped'
+
+        prepared = PreparedRequest('sendMessage', data, json_codec=Codec())
+        for key, param in prepared.parameters.items():
+            assert param.value == (data[key] if isinstance(data[key], str) else 'dumped')
+
+    @pytest.mark.parametrize(
+        'value',
+        [
+            InputFile(b'content'),
+            InputMediaPhoto(data_file('telegram.jpg').read_bytes()),
+            [InputMediaPhoto('file_id'), InputMediaPhoto(b'content')],
+        ],
+        ids=['InputFile', 'InputMedia', 'list'],
+    )
+    def test_files(self, value):
+        with pytest.raises(ValueError, match='file_id or URL'):
+            PreparedRequest('sendMediaGroup', {'media': value})
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+
+import pytest
+from flaky import flaky
+
+from telegram.error import RetryAfter
+from telegram.ext import BaseRateLimiter, ExtBot, RateLimiter
+
+TOKEN = '1234567890:AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA'
+# Tolerance for the measured delays, since asyncio.sleep may return a bit early or late
+TOLERANCE = 0.03
+
+
+class Recorder:
+    """Callback for process_request that records when it was called"""
+
+    def __init__(self, failures: int = 0, retry_after: float = 0.2):
+        self.calls = []
+        self.failures = failures
+        self.retry_after = retry_after
+
+    async def __call__(self, chat_id):
+        self.calls.append((chat_id, asyncio.get_running_loop().time()))
+        if self.failures:
+            self.failures -= 1
+            raise RetryAfter(self.retry_after)
+        return chat_id
+
+
+async def send(rate_limiter, callback, chat_ids):
+    start = asyncio.get_running_loop().time()
+    results = await asyncio.gather(
+        *(
+            rate_limiter.process_request(
+                callback, (chat_id,), {}, 'sendMessage', {'chat_id': chat_id}
+            )
+            for chat_id in chat_ids
+        )
+    )
+    assert results == list(chat_ids)
+    return [(chat_id, time - start) for chat_id, time in callback.calls]
+
+
+class TestRateLimiter:
+    def test_slot_behaviour(self, mro_slots):
+        inst = RateLimiter()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, 'err') != 'err', f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    @flaky(3, 1)
+    @pytest.mark.asyncio
+    async def test_private_chat_limit(self):
+        rate_limiter = RateLimiter(overall_max_rate=0, private_max_rate=1, private_time_period=0.1)
+        calls = await send(rate_limiter, Recorder(), [1, 1, 1, 2])
+
+        times = [time for chat_id, time in calls if chat_id == 1]
+        assert times[0] < TOLERANCE
+        assert times[1] == pytest.approx(0.1, abs=TOLERANCE)
+        assert times[2] == pytest.approx(0.2, abs=TOLERANCE)
+        # Other chats are not affected
+        assert [time for chat_id, time in calls if chat_id == 2][0] < TOLERANCE
+
+    @flaky(3, 1)
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('chat_id', [-1, '@username'])
+    async def test_group_limit(self, chat_id):
+        rate_limiter = RateLimiter(overall_max_rate=0, group_max_rate=2, group_time_period=0.2)
+        calls = await send(rate_limiter, Recorder(), [chat_id] * 4)
+
+        times = [time for _, time in calls]
+        assert times[1] < TOLERANCE
+        assert times[2] == pytest.approx(0.1, abs=TOLERANCE)
+        assert times[3] == pytest.approx(0.2, abs=TOLERANCE)
+
+    @flaky(3, 1)
+    @pytest.mark.asyncio
+    async def test_overall_limit(self):
+        rate_limiter = RateLimiter(overall_max_rate=2, overall_time_period=0.1)
+        calls = await send(rate_limiter, Recorder(), [1, 2, 3, 4])
+
+        times = [time for _, time in calls]
+        assert times[1] < TOLERANCE
+        assert times[2] == pytest.approx(0.05, abs=TOLERANCE)
+        assert times[3] == pytest.approx(0.1, abs=TOLERANCE)
+
+    @flaky(3, 1)
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_chat(self):
+        rate_limiter = RateLimiter(overall_max_rate=0, private_time_period=0.01, max_retries=1)
+        callback = Recorder(failures=1)
+        calls = await send(rate_limiter, callback, [1, 2])
+
+        assert calls[0] == (1, pytest.approx(0, abs=TOLERANCE))
+        # The other chat is not paused
+        assert calls[1] == (2, pytest.approx(0, abs=TOLERANCE))
+        assert calls[2] == (1, pytest.approx(0.2, abs=TOLERANCE))
+
+    @flaky(3, 1)
+    @pytest.mark.asyncio
+    async def test_retry_after_exceeds_max_retries(self):
+        rate_limiter = RateLimiter(overall_max_rate=0, private_time_period=0.01, max_retries=1)
+        with pytest.raises(RetryAfter):
+            await send(rate_limiter, Recorder(failures=2), [1])
+
+        # The chat is still paused
+        calls = await send(rate_limiter, Recorder(), [1])
+        assert calls[0][1] == pytest.approx(0.2, abs=TOLERANCE)
+
+    @flaky(3, 1)
+    @pytest.mark.asyncio
+    async def test_queue_depth(self):
+        rate_limiter = RateLimiter(overall_max_rate=0, private_time_period=0.1)
+        task = asyncio.create_task(send(rate_limiter, Recorder(), [1, 1, 1, 2]))
+        await asyncio.sleep(0.01)
+
+        assert rate_limiter.queue_depth() == 2
+        assert rate_limiter.queue_depth(1) == 2
+        assert rate_limiter.queue_depth(2) == 0
+        assert rate_limiter.queue_depth(3) == 0
+        await task
+        assert rate_limiter.queue_depth() == 0
+
+    @pytest.mark.asyncio
+    async def test_ext_bot(self, monkeypatch):
+        class RecordingRateLimiter(BaseRateLimiter):
+            def __init__(self):
+                self.calls = []
+                self.initialized = False
+
+            async def initialize(self):
+                self.initialized = True
+
+            async def shutdown(self):
+                self.initialized = False
+
+            async def process_request(self, callback, args, kwargs, endpoint, data):
+                self.calls.append((endpoint, data))
+                return await callback(*args, **kwargs)
+
+        async def post(url, request_data=None, **kwargs):
+            return request_data.parameters
+
+        rate_limiter = RecordingRateLimiter()
+        bot = ExtBot(TOKEN, rate_limiter=rate_limiter)
+        monkeypatch.setattr(bot.request, 'post', post)
+        monkeypatch.setattr(bot, 'get_me', lambda: asyncio.sleep(0))
+
+        async with bot:
+            assert bot.rate_limiter is rate_limiter
+            assert rate_limiter.initialized
+            assert await bot._post('sendMessage', {'chat_id': 1, 'text': 'text'}) == {
+                'chat_id': 1,
+                'text': 'text',
+            }
+        assert not rate_limiter.initialized
+        assert rate_limiter.calls == [('sendMessage', {'chat_id': 1, 'text': 'text'})]
@@ -0,0 +1,328 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import itertools
+import random
+import re
+import warnings
+
+import pytest
+
+from telegram import CallbackQuery, Chat, InlineQuery, Message, Update, User
+from telegram.ext import (
+    CallbackQueryHandler,
+    ContextTypes,
+    Dispatcher,
+    ExtBot,
+    InlineQueryHandler,
+    MessageHandler,
+    StringRegexHandler,
+    filters,
+)
+from telegram.ext._utils.regexset import PatternRouter, RegexSet
+from telegram.request import MockRequest
+
+TOKEN = '1234567890:AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA'
+
+PATTERNS = [
+    # literals
+    'abc',
+    'b',
+    r'a\.c',
+    # anchors
+    '^ab',
+    r'\Aab',
+    'bc$',
+    r'^ab\Z',
+    '(?m)^bc',
+    '(?m)^b$',
+    re.compile('^c', re.MULTILINE),
+    # alternation
+    'ab|bc',
+    '(ab|ca)b',
+    'a(b|c)a',
+    # non-literal prefixes
+    r'\d*ab',
+    '[ab]c',
+    '.bc',
+    'a*bc',
+    'ab?c',
+    '(?:ab)+c',
+    r'\w+ b',
+    '(a)(b)',
+    '(?=ab)a',
+    '(?<=a)bc',
+    # flags
+    '(?i)AB',
+    re.compile('ab', re.IGNORECASE),
+    '(?i:A)bc',
+    '(?s)a.b',
+    'a.b',
+    '(?x) a b  c',
+    re.compile('^ a b', re.VERBOSE),
+    '',
+    '^',
+]
+
+
+def texts():
+    # All short texts over a small alphabet, including upper case letters and newlines
+    alphabet = 'abcAB.1 \n'
+    for length in range(4):
+        for chars in itertools.product(alphabet, repeat=length):
+            yield ''.join(chars)
+    rng = random.Random(1)
+    for _ in range(2000):
+        yield ''.join(rng.choice(alphabet) for _ in range(rng.randint(4, 12)))
+
+
+class TestRegexSet:
+    @pytest.mark.parametrize('search', [True, False], ids=['search', 'match'])
+    def test_prefilter(self, search):
+        regex_set = RegexSet(PATTERNS, search=search)
+        for text in texts():
+            candidates = regex_set.candidates(text)
+            matches = regex_set.matches(text)
+            for index, pattern in enumerate(regex_set.patterns):
+                expected = pattern.search(text) if search else pattern.match(text)
+                if expected:
+                    # Patterns that match must never be ruled out
+                    assert index in candidates, (pattern, text)
+                    assert matches[index].span() == expected.span()
+                    assert matches[index].groups() == expected.groups()
+                else:
+                    assert index not in matches, (pattern, text)
+
+    @pytest.mark.parametrize(
+        'pattern, search, text, candidate',
+        [
+            ('abc', True, 'xabcx', True),
+            ('abc', True, 'xabx', False),
+            ('abc', False, 'xabc', False),
+            ('^abc', True, 'xabc', False),
+            ('(?m)^abc', True, 'x\nabc', True),
+            ('(?m)^abc', False, 'x\nabc', False),
+            ('(?i)abc', True, 'ABC', True),
+            ('ab|xy', True, 'xy', True),
+        ],
+    )
+    def test_candidates(self, pattern, search, text, candidate):
+        assert (0 in RegexSet([pattern], search=search).candidates(text)) is candidate
+
+    def test_matches_returns_pattern_matches(self):
+        regex_set = RegexSet(['(a)(b)', '^x', 'b'], search=True)
+        matches = regex_set.matches('zab')
+        assert sorted(matches) == [0, 2]
+        assert matches[0].re is regex_set.patterns[0]
+        assert matches[0].groups() == ('a', 'b')
+
+
+async def callback(update, context):
+    pass
+
+
+def make_message_update(text=None, caption=None):
+    message = Message(
+        1,
+        None,
+        Chat(1, Chat.PRIVATE),
+        from_user=User(1, 'name', False),
+        text=text,
+        caption=caption,
+    )
+    return Update(1, message=message)
+
+
+def make_callback_query_update(data):
+    user = User(1, 'name', False)
+    return Update(1, callback_query=CallbackQuery('1', user, 'instance', data=data))
+
+
+def make_inline_query_update(query):
+    user = User(1, 'name', False)
+    return Update(1, inline_query=InlineQuery('1', user, query, ''))
+
+
+class NamedMixin:
+    """Gives handlers a name for readable assertions."""
+
+    def __init__(self, name, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name = name
+
+
+class NamedCallbackQueryHandler(NamedMixin, CallbackQueryHandler):
+    __slots__ = ('name',)
+
+
+class NamedInlineQueryHandler(NamedMixin, InlineQueryHandler):
+    __slots__ = ('name',)
+
+
+class NamedMessageHandler(NamedMixin, MessageHandler):
+    __slots__ = ('name',)
+
+
+class NamedStringRegexHandler(NamedMixin, StringRegexHandler):
+    __slots__ = ('name',)
+
+
+class OverridingMessageHandler(NamedMessageHandler):
+    __slots__ = ()
+
+    def check_update(self, update):
+        return super().check_update(update)
+
+
+def names(handlers):
+    return [handler.name for handler in handlers]
+
+
+class TestPatternRouter:
+    def test_is_routable(self):
+        assert PatternRouter.is_routable(CallbackQueryHandler(callback, pattern='a'))
+        assert PatternRouter.is_routable(MessageHandler(filters.Regex('a'), callback))
+        assert PatternRouter.is_routable(
+            MessageHandler(filters.TEXT & filters.CaptionRegex('a'), callback)
+        )
+        assert not PatternRouter.is_routable(CallbackQueryHandler(callback))
+        assert not PatternRouter.is_routable(CallbackQueryHandler(callback, pattern=str))
+        assert not PatternRouter.is_routable(
+            MessageHandler(filters.TEXT | filters.Regex('a'), callback)
+        )
+        assert not PatternRouter.is_routable(
+            OverridingMessageHandler('overriding', filters.Regex('a'), callback)
+        )
+
+    def test_candidates(self):
+        handlers = [
+            NamedCallbackQueryHandler('query a', callback, pattern='^a'),
+            NamedMessageHandler('text foo', filters.Regex('foo'), callback),
+            NamedCallbackQueryHandler('query any', callback),
+            NamedCallbackQueryHandler('query b', callback, pattern='b'),
+            NamedMessageHandler('text bar', filters.TEXT & filters.Regex('bar'), callback),
+            NamedMessageHandler('caption foo', filters.CaptionRegex('foo'), callback),
+            NamedInlineQueryHandler('inline x', callback, pattern='x'),
+            NamedMessageHandler('all', filters.ALL, callback),
+            NamedStringRegexHandler('string s', 's', callback),
+        ]
+        router = PatternRouter(handlers)
+        always = ['query any', 'all']
+
+        # The order of the handlers is preserved & callback queries are matched from the start
+        assert names(router.candidates(make_callback_query_update('ab'))) == [
+            'query a',
+            'query any',
+            'all',
+        ]
+        assert names(router.candidates(make_callback_query_update('ba'))) == [
+            'query any',
+            'query b',
+            'all',
+        ]
+        assert names(router.candidates(make_callback_query_update('xab'))) == always
+        assert names(router.candidates(make_callback_query_update(None))) == always
+        # Texts are searched
+        assert names(router.candidates(make_message_update('x foo bar'))) == [
+            'text foo',
+            'query any',
+            'text bar',
+            'all',
+        ]
+        assert names(router.candidates(make_message_update(caption='a foo'))) == [
+            'query any',
+            'caption foo',
+            'all',
+        ]
+        assert names(router.candidates(make_inline_query_update('xy'))) == [
+            'query any',
+            'inline x',
+            'all',
+        ]
+        assert names(router.candidates(make_inline_query_update(''))) == always
+        assert names(router.candidates('s')) == ['query any', 'all', 'string s']
+
+    @pytest.mark.asyncio
+    async def test_dispatcher_groups(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            dispatcher = Dispatcher(
+                bot=ExtBot(TOKEN, request=MockRequest()),
+                update_queue=asyncio.Queue(),
+                job_queue=None,
+                workers=4,
+                persistence=None,
+                context_types=ContextTypes(),
+            )
+        calls = []
+
+        def add(name, handler_filter, group):
+            async def record(update, context):
+                calls.append((name, [match.span() for match in context.matches or []]))
+
+            dispatcher.add_handler(NamedMessageHandler(name, handler_filter, record), group)
+
+        add('foo', filters.Regex('fo+'), 1)
+        add('bar', filters.Regex('bar'), 1)
+        add('foo bar', filters.Regex('bar') & filters.Regex('fo+'), 0)
+        add('text', filters.TEXT, 1)
+        add('caption', filters.CaptionRegex('foo'), 2)
+
+        await dispatcher.process_update(make_message_update('bar foo'))
+        assert calls == [('foo bar', [(0, 3), (4, 7)]), ('foo', [(4, 7)])]
+
+        calls.clear()
+        await dispatcher.process_update(make_message_update('baz bar'))
+        assert calls == [('bar', [(4, 7)])]
+
+        calls.clear()
+        await dispatcher.process_update(make_message_update('baz'))
+        assert calls == [('text', [])]
+
+    def test_matches_unchanged(self):
+        # The handlers that are left check the update themselves, so the matches are the very
+        # same as the ones of an unrouted handler
+        patterns = ['(a)(b)?', '^x', r'\d+']
+        handlers = [
+            NamedMessageHandler(pattern, filters.Regex(pattern), callback) for pattern in patterns
+        ]
+        router = PatternRouter(handlers)
+        for text in ['ab 12', 'x', 'a1', 'zz']:
+            update = make_message_update(text)
+            candidates = router.candidates(update)
+            for handler in handlers:
+                result = handler.check_update(update)
+                if result:
+                    assert handler in candidates
+                    expected = re.search(handler.filters.pattern, text)
+                    (match,) = result['matches']
+                    assert (match.span(), match.groups()) == (expected.span(), expected.groups())
+
+
+class TestMessageHandlerFalsyResult:
+    def test_empty_data_filter_result(self):
+        update = make_message_update('abc')
+        handler = MessageHandler(filters.Regex('x'), callback)
+        # filters.Regex returns an empty dict if it doesn't match, which must not count as match
+        assert filters.Regex('x').check_update(update) == {}
+        assert handler.check_update(update) is False
+        assert handler.check_update(make_message_update('x'))['matches'][0].group() == 'x'
+        assert MessageHandler(~filters.TEXT, callback).check_update(update) is False
+        assert MessageHandler(filters.TEXT, callback).check_update(update) is True
+        assert handler.check_update('not an update') is None
@@ -18,7 +18,10 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """Here we run tests directly with HTTPXRequest because that's easier than providing dummy
 implementations for BaseRequest and we want to test HTTPXRequest anyway."""
+import asyncio
 import json
+import socket
+from collections import Counter
 from http import HTTPStatus
 from typing import Tuple, Any, Coroutine, Callable
 
@@ -36,8 +39,8 @@ from telegram.error import (
     Conflict,
     TimedOut,
 )
-from telegram.request import BaseRequest, RequestData
-from telegram.request._httpxrequest import HTTPXRequest
+from telegram.request import BaseRequest, JSONCodec, RequestData, RetryPolicy
+from telegram.request._httpxrequest import H2_INSTALLED, HTTPXRequest
 
 # We only need the first fixture, but it uses the others, so pytest needs us to import them as well
 from .test_requestdata import (  # noqa: F401
@@ -141,6 +144,20 @@ class TestRequest:
         with pytest.raises(TelegramError, match='Invalid server response'):
             await httpx_request.post(None, None, None)
 
+    @pytest.mark.asyncio
+    async def test_json_codec(self, monkeypatch, httpx_request: HTTPXRequest):
+        class Codec(JSONCodec):
+            def loads(self, data):
+                # The response is decoded directly from bytes
+                assert data == b'{"result": "test_string"}'
+                return {'result': 'decoded'}
+
+        server_response = b'{"result": "test_string"}'
+        monkeypatch.setattr(httpx_request, 'do_request', mocker_factory(response=server_response))
+
+        request_data = RequestData(json_codec=Codec())
+        assert await httpx_request.post(None, request_data) == 'decoded'
+
     @pytest.mark.asyncio
     async def test_chat_migrated(self, monkeypatch, httpx_request: HTTPXRequest):
         server_response = b'{"ok": "False", "parameters": {"migrate_to_chat_id": "123"}}'
@@ -277,6 +294,131 @@ class TestRequest:
 
         with pytest.raises(NotImplementedError):
             Request().connection_pool_size
+        assert Request().retry_policy is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'endpoint, failures, outcome',
+        [
+            # idempotent endpoints are retried
+            ('getChat', [TimedOut()], 'success'),
+            ('getChat', [HTTPStatus.BAD_GATEWAY, HTTPStatus.GATEWAY_TIMEOUT], 'success'),
+            ('getChat', [RuntimeError('CustomError')], 'success'),
+            ('answerCallbackQuery', [NetworkError('error')], 'success'),
+            # ... but not more often than allowed
+            ('getChat', [TimedOut()] * 3, TimedOut),
+            ('getChat', [HTTPStatus.BAD_GATEWAY] * 3, NetworkError),
+            # other errors are not retried
+            ('getChat', [BadRequest('error')], BadRequest),
+            ('getChat', [HTTPStatus.INTERNAL_SERVER_ERROR], NetworkError),
+            # other endpoints are not retried
+            ('sendMessage', [TimedOut()], TimedOut),
+            ('sendMessage', [HTTPStatus.BAD_GATEWAY], NetworkError),
+            # unless they have an own policy
+            ('sendPhoto', [TimedOut()] * 4, 'success'),
+        ],
+    )
+    async def test_retry_policy(self, monkeypatch, endpoint, failures, outcome):
+        policy = RetryPolicy(
+            base_delay=0.01,
+            idempotent_endpoints=['answerCallbackQuery'],
+            endpoint_policies={'sendPhoto': RetryPolicy(max_attempts=5, base_delay=0.01)},
+        )
+        responses = list(failures)
+        calls = 0
+
+        async def do_request(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if not responses:
+                return HTTPStatus.OK, b'{"ok": "True", "result": {}}'
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response, b'{"ok": "False", "description": "Gateway problem"}'
+
+        async with HTTPXRequest(retry_policy=policy) as httpx_request:
+            assert httpx_request.retry_policy is policy
+            monkeypatch.setattr(httpx_request, 'do_request', do_request)
+            url = f'https://api.telegram.org/botTOKEN/{endpoint}'
+
+            if outcome == 'success':
+                assert await httpx_request.post(url) == {}
+                assert calls == len(failures) + 1
+                assert policy.retries == Counter({endpoint: len(failures)})
+                assert not policy.failures
+            else:
+                with pytest.raises(outcome):
+                    await httpx_request.post(url)
+                retries = calls - 1
+                assert calls == min(len(failures), 3)
+                assert policy.retries == (Counter({endpoint: retries}) if retries else Counter())
+                assert policy.failures == (Counter({endpoint: 1}) if retries else Counter())
+
+    @pytest.mark.asyncio
+    async def test_retry_policy_retrieve(self, monkeypatch):
+        policy = RetryPolicy(base_delay=0.01)
+        responses = [TimedOut(), (HTTPStatus.OK, b'content')]
+
+        async def do_request(*args, **kwargs):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        async with HTTPXRequest(retry_policy=policy) as httpx_request:
+            monkeypatch.setattr(httpx_request, 'do_request', do_request)
+            url = 'https://api.telegram.org/file/botTOKEN/photos/file_1.jpg'
+            assert await httpx_request.retrieve(url) == b'content'
+            assert policy.retries == Counter({'file': 1})
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'chunk_size, expected',
+        [(None, [b'0123456789']), (4, [b'0123', b'4567', b'89']), (20, [b'0123456789'])],
+    )
+    async def test_stream(self, chunk_size, expected):
+        class Request(BaseRequest):
+            async def do_request(self, *args, **kwargs):
+                return HTTPStatus.OK, b'0123456789'
+
+            async def initialize(self, *args, **kwargs):
+                pass
+
+            async def stop(self, *args, **kwargs):
+                pass
+
+        chunks = [chunk async for chunk in Request().stream('url', chunk_size=chunk_size)]
+        assert chunks == expected
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'code, exception',
+        [(HTTPStatus.BAD_REQUEST, BadRequest), (HTTPStatus.FORBIDDEN, Forbidden)],
+    )
+    async def test_stream_error_response(self, monkeypatch, httpx_request, code, exception):
+        server_response = b'{"ok": "False", "description": "Error"}'
+        monkeypatch.setattr(
+            httpx_request, 'do_request', mocker_factory(response=server_response, return_code=code)
+        )
+        monkeypatch.setattr(
+            httpx_request,
+            'do_stream_request',
+            BaseRequest.do_stream_request.__get__(httpx_request),
+        )
+        with pytest.raises(exception, match='Error'):
+            async for _ in httpx_request.stream('url'):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_stream_exception(self, monkeypatch, httpx_request):
+        async def do_stream_request(*args, **kwargs):
+            raise RuntimeError('CustomError')
+
+        monkeypatch.setattr(httpx_request, 'do_stream_request', do_stream_request)
+        with pytest.raises(NetworkError, match='HTTP implementation: CustomError'):
+            async for _ in httpx_request.stream('url'):
+                pass
 
     @pytest.mark.asyncio
     async def test_timeout_propagation(self, monkeypatch, httpx_request):
@@ -312,6 +454,7 @@ class TestHTTPXRequest:
         request = HTTPXRequest()
         assert request.connection_pool_size == 1
         assert request._client.timeout == httpx.Timeout(connect=5.0, read=5.0, write=5.0, pool=1.0)
+        assert request._client.headers['User-Agent'] == HTTPXRequest.USER_AGENT
 
         request = HTTPXRequest(
             connection_pool_size=42,
@@ -323,6 +466,118 @@ class TestHTTPXRequest:
         assert request.connection_pool_size == 42
         assert request._client.timeout == httpx.Timeout(connect=43, read=44, write=45, pool=46)
 
+    @pytest.mark.parametrize(
+        'http2',
+        [
+            False,
+            pytest.param(
+                True, marks=pytest.mark.skipif(not H2_INSTALLED, reason='h2 not installed')
+            ),
+        ],
+    )
+    def test_init_http2(self, http2):
+        request = HTTPXRequest(connection_pool_size=42, http2=http2)
+        pool = request._client._transport._pool
+        assert pool._http2 is http2
+        assert pool._max_connections == 42
+        assert pool._max_keepalive_connections == (1 if http2 else 42)
+
+    def test_init_http2_not_installed(self, monkeypatch):
+        monkeypatch.setattr('telegram.request._httpxrequest.H2_INSTALLED', False)
+        with pytest.raises(RuntimeError, match=r'python-telegram-bot\[http2\]'):
+            HTTPXRequest(http2=True)
+        # HTTP/1.1 still works
+        HTTPXRequest()
+
+    @pytest.mark.parametrize(
+        'kwargs, match',
+        [
+            ({'warmup_connections': 2}, 'warmup_connections'),
+            ({'warmup_connections': -1}, 'warmup_connections'),
+            ({'keepalive_interval': 0}, 'keepalive_interval'),
+        ],
+    )
+    def test_init_invalid_warmup(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            HTTPXRequest(connection_pool_size=1, **kwargs)
+
+    @pytest.mark.parametrize('keepalive_interval, keepalive_expiry', [(None, 5), (1, 5), (10, 20)])
+    def test_init_keepalive_expiry(self, keepalive_interval, keepalive_expiry):
+        request = HTTPXRequest(keepalive_interval=keepalive_interval)
+        assert request._client._transport._pool._keepalive_expiry == keepalive_expiry
+
+    @pytest.mark.asyncio
+    async def test_warmup_and_pool_stats(self):
+        class NetworkStream:
+            def __init__(self):
+                self.socket = socket.socket()
+
+            def get_extra_info(self, info):
+                return self.socket if info == 'socket' else None
+
+        streams = []
+        pings = []
+
+        def handler(request):
+            if request.method == 'HEAD':
+                assert request.url == 'https://localhost/warmup'
+                pings.append(request)
+                streams.append(NetworkStream())
+                stream = streams[-1]
+            elif request.url == 'https://localhost/new':
+                streams.append(NetworkStream())
+                stream = streams[-1]
+            else:
+                stream = streams[0]
+            return httpx.Response(HTTPStatus.OK, extensions={'network_stream': stream})
+
+        httpx_request = HTTPXRequest(
+            connection_pool_size=3, warmup_connections=3, warmup_url='https://localhost/warmup'
+        )
+        httpx_request._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            await httpx_request.initialize()
+            assert len(pings) == 3
+            # The warm-up requests are not counted
+            assert httpx_request.pool_stats == {'hits': 0, 'misses': 0}
+            for stream in streams:
+                assert stream.socket.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+                if hasattr(socket, 'TCP_KEEPIDLE'):
+                    assert stream.socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE) == 120
+
+            await httpx_request.do_request('POST', 'https://localhost/known')
+            await httpx_request.do_request('POST', 'https://localhost/known')
+            await httpx_request.do_request('POST', 'https://localhost/new')
+            assert httpx_request.pool_stats == {'hits': 2, 'misses': 1}
+            assert streams[-1].socket.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        finally:
+            await httpx_request.stop()
+            for stream in streams:
+                stream.socket.close()
+
+    @pytest.mark.asyncio
+    async def test_keepalive_task(self):
+        pings = []
+
+        def handler(request):
+            pings.append(request)
+            return httpx.Response(HTTPStatus.OK)
+
+        httpx_request = HTTPXRequest(
+            connection_pool_size=2, warmup_connections=2, keepalive_interval=0.02
+        )
+        httpx_request._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with httpx_request:
+            assert len(pings) == 2
+            await asyncio.sleep(0.1)
+            assert len(pings) >= 4
+            assert len(pings) % 2 == 0
+        assert httpx_request._keepalive_task is None
+
+        count = len(pings)
+        await asyncio.sleep(0.05)
+        assert len(pings) == count
+
     @pytest.mark.asyncio
     async def test_context_manager(self, monkeypatch):
         async def initialize():
@@ -360,11 +615,70 @@ class TestHTTPXRequest:
 
         assert self.test_flag == 'stop'
 
+    @pytest.mark.asyncio
+    async def test_do_stream_request(self):
+        content = b'x' * 100_000
+        closed = []
+
+        class Stream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                for start in range(0, len(content), 1000):
+                    yield content[start : start + 1000]
+
+            async def aclose(self):
+                closed.append(True)
+
+        def handler(request):
+            assert request.url == 'https://localhost/file'
+            assert request.headers['User-Agent'] == HTTPXRequest.USER_AGENT
+            assert request.extensions['timeout']['read'] == 42
+            return httpx.Response(HTTPStatus.OK, stream=Stream())
+
+        httpx_request = HTTPXRequest()
+        httpx_request._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), headers=httpx_request._client.headers
+        )
+        async with httpx_request:
+            chunks = [
+                chunk
+                async for chunk in httpx_request.stream(
+                    'https://localhost/file', chunk_size=4096, read_timeout=42
+                )
+            ]
+            assert b''.join(chunks) == content
+            assert {len(chunk) for chunk in chunks[:-1]} == {4096}
+            assert closed
+
+            # The response is closed also when not read completely
+            closed.clear()
+            stream = httpx_request.stream('https://localhost/file', read_timeout=42)
+            async for _ in stream:
+                break
+            assert not closed
+            await stream.aclose()
+            assert closed
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'raised_class, expected_class',
+        [(httpx.TimeoutException, TimedOut), (httpx.HTTPError, NetworkError)],
+    )
+    async def test_do_stream_request_exceptions(self, raised_class, expected_class):
+        def handler(request):
+            raise raised_class('message')
+
+        httpx_request = HTTPXRequest()
+        httpx_request._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with httpx_request:
+            with pytest.raises(expected_class):
+                async for _ in httpx_request.stream('https://localhost/file'):
+                    pass
+
     @pytest.mark.asyncio
     async def test_do_request_default_timeouts(self, monkeypatch, httpx_request):
         default_timeouts = httpx.Timeout(connect=5.0, read=5.0, write=5.0, pool=1.0)
 
-        async def make_assertion(self, method, url, headers, timeout, files, data):
+        async def make_assertion(self, method, url, timeout, files, data):
             self.test_flag = timeout == default_timeouts
             return httpx.Response(HTTPStatus.OK)
 
@@ -376,7 +690,7 @@ class TestHTTPXRequest:
     async def test_do_request_manual_timeouts(self, monkeypatch, httpx_request):
         default_timeouts = httpx.Timeout(connect=5.0, read=5.0, write=5.0, pool=1.0)
 
-        async def make_assertion(self, method, url, headers, timeout, files, data):
+        async def make_assertion(self, method, url, timeout, files, data):
             self.test_flag = timeout == httpx.Timeout(connect=5.0, read=5.5, write=5.6, pool=1.0)
             return httpx.Response(HTTPStatus.OK)
 
@@ -384,9 +698,25 @@ class TestHTTPXRequest:
         await httpx_request.do_request('GET', 'URL', read_timeout=5.5, write_timeout=5.6)
         assert httpx_request._client.timeout == default_timeouts
 
+    @pytest.mark.asyncio
+    async def test_do_request_timeout_objects(self, monkeypatch, httpx_request):
+        timeouts = []
+
+        async def request(self, method, url, timeout, files, data):
+            timeouts.append(timeout)
+            return httpx.Response(HTTPStatus.OK)
+
+        monkeypatch.setattr(httpx.AsyncClient, 'request', request)
+        await httpx_request.do_request('GET', 'URL')
+        await httpx_request.do_request('GET', 'URL')
+        await httpx_request.do_request('GET', 'URL', pool_timeout=3)
+        # Without overrides, the timeout of the client is reused
+        assert timeouts[0] is timeouts[1] is httpx_request._client.timeout
+        assert timeouts[2] == httpx.Timeout(connect=5.0, read=5.0, write=5.0, pool=3)
+
     @pytest.mark.asyncio
     async def test_do_request_params_no_data(self, monkeypatch, httpx_request):
-        async def make_assertion(self, method, url, headers, timeout, files, data):
+        async def make_assertion(self, method, url, timeout, files, data):
             method_assertion = method == 'method'
             url_assertion = url == 'url'
             files_assertion = files is None
@@ -405,7 +735,7 @@ class TestHTTPXRequest:
     async def test_do_request_params_with_data(
         self, monkeypatch, httpx_request, mixed_rqs  # noqa: 9811
     ):
-        async def make_assertion(self, method, url, headers, timeout, files, data):
+        async def make_assertion(self, method, url, timeout, files, data):
             method_assertion = method == 'method'
             url_assertion = url == 'url'
             files_assertion = files == mixed_rqs.multipart_data
@@ -426,7 +756,7 @@ class TestHTTPXRequest:
 
     @pytest.mark.asyncio
     async def test_do_request_return_value(self, monkeypatch, httpx_request):
-        async def make_assertion(self, method, url, headers, timeout, files, data):
+        async def make_assertion(self, method, url, timeout, files, data):
             return httpx.Response(123, content=b'content')
 
         monkeypatch.setattr(httpx.AsyncClient, 'request', make_assertion)
@@ -445,7 +775,7 @@ class TestHTTPXRequest:
     async def test_do_request_exceptions(
         self, monkeypatch, httpx_request, raised_class, expected_class
     ):
-        async def make_assertion(self, method, url, headers, timeout, files, data):
+        async def make_assertion(self, method, url, timeout, files, data):
             raise raised_class('message')
 
         monkeypatch.setattr(httpx.AsyncClient, 'request', make_assertion)
@@ -27,7 +27,7 @@ from typing import Any, Dict
 import pytest
 
 from telegram import InputFile, MessageEntity, InputMediaPhoto, InputMediaVideo
-from telegram.request import RequestData
+from telegram.request import JSONCodec, RequestData
 from telegram.request._requestparameter import RequestParameter
 from tests.conftest import data_file
 
@@ -163,6 +163,25 @@ class TestRequestData:
         assert file_rqs.json_payload == json.dumps(file_jsons).encode()
         assert mixed_rqs.json_payload == json.dumps(mixed_jsons).encode()
 
+    def test_json_codec(self, simple_params):
+        class Codec(JSONCodec):
+            def dumps(self, obj):
+                return 'dumped'
+
+            def dumps_bytes(self, obj):
+                assert obj == {'string': 'string', 'integer': 'dumped'}
+                return b'payload'
+
+        request_data = RequestData(
+            [
+                RequestParameter.from_input(key, simple_params[key])
+                for key in ('string', 'integer')
+            ],
+            json_codec=Codec(),
+        )
+        assert request_data.json_parameters == {'string': 'string', 'integer': 'dumped'}
+        assert request_data.json_payload == b'payload'
+
     def test_multipart_data(
         self,
         simple_rqs,
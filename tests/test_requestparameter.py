@@ -22,6 +22,7 @@ import pytest
 
 from telegram import InputFile, MessageEntity, InputMediaPhoto, InputMediaVideo
 from telegram.constants import ChatType
+from telegram.request import JSONCodec
 from telegram.request._requestparameter import RequestParameter
 from tests.conftest import data_file
 
@@ -53,6 +54,16 @@ class TestRequestParameter:
     def test_json_value(self, value, expected):
         request_parameter = RequestParameter('name', value, None)
         assert request_parameter.json_value == expected
+        assert request_parameter.get_json_value() == expected
+
+    def test_get_json_value_codec(self):
+        class Codec(JSONCodec):
+            def dumps(self, obj):
+                return f'dumped {obj}'
+
+        assert RequestParameter('name', 1, None).get_json_value(Codec()) == 'dumped 1'
+        # Strings are not encoded
+        assert RequestParameter('name', 'one', None).get_json_value(Codec()) == 'one'
 
     def test_multipart_data(self):
         assert RequestParameter('name', 'value', []).multipart_data is None
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+from collections import Counter
+
+import pytest
+
+from telegram.error import BadRequest, NetworkError, TimedOut
+from telegram.request import RetryPolicy
+
+
+class TestRetryPolicy:
+    def test_slot_behaviour(self, mro_slots):
+        inst = RetryPolicy()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, 'err') != 'err', f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init(self):
+        policy = RetryPolicy()
+        assert policy.max_attempts == 3
+        assert policy.base_delay == 0.5
+        assert policy.max_delay == 10
+        assert policy.status_codes == {502, 504}
+        assert policy.exceptions == (NetworkError,)
+        assert policy.idempotent_endpoints == frozenset()
+        assert policy.endpoint_policies == {}
+        assert policy.retries == Counter()
+        assert policy.failures == Counter()
+
+    def test_get_policy(self):
+        override = RetryPolicy(max_attempts=5)
+        policy = RetryPolicy(
+            idempotent_endpoints=['answerCallbackQuery'],
+            endpoint_policies={'sendMessage': override},
+        )
+        assert policy.get_policy('POST', 'getChat') is policy
+        assert policy.get_policy('GET', 'file') is policy
+        assert policy.get_policy('POST', 'answerCallbackQuery') is policy
+        assert policy.get_policy('POST', 'sendMessage') is override
+        assert policy.get_policy('POST', 'sendPhoto') is None
+
+    @pytest.mark.parametrize(
+        'status_code, exception, expected',
+        [
+            (502, None, True),
+            (504, None, True),
+            (500, None, False),
+            (200, None, False),
+            (None, NetworkError('error'), True),
+            (None, TimedOut(), True),
+            (None, BadRequest('error'), False),
+        ],
+    )
+    def test_is_retryable(self, status_code, exception, expected):
+        assert RetryPolicy().is_retryable(status_code, exception) is expected
+
+    def test_is_retryable_custom(self):
+        policy = RetryPolicy(status_codes=[500], exceptions=(TimedOut,))
+        assert policy.is_retryable(status_code=500)
+        assert not policy.is_retryable(status_code=502)
+        assert policy.is_retryable(exception=TimedOut())
+        assert not policy.is_retryable(exception=NetworkError('error'))
+
+    def test_get_delay(self):
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+        for attempt, bound in ((1, 1), (2, 2), (3, 4), (4, 5), (10, 5)):
+            delays = [policy.get_delay(attempt) for _ in range(200)]
+            assert all(0 <= delay <= bound for delay in delays)
+            # jitter
+            assert len(set(delays)) > 1
+            assert max(delays) > bound / 2
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import copy
+import pickle
+import sqlite3
+from collections import defaultdict
+
+import pytest
+
+from telegram.ext import ExtBot, SQLitePersistence
+
+TOKEN = '1234567890:AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA'
+
+
+@pytest.fixture(scope='function')
+def filepath(tmp_path):
+    return tmp_path / 'persistence.sqlite'
+
+
+def count_rows(filepath, table):
+    with sqlite3.connect(filepath) as connection:
+        return connection.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+
+class TestSQLitePersistence:
+    def test_slot_behaviour(self, filepath, mro_slots):
+        inst = SQLitePersistence(filepath)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, 'err') != 'err', f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_wal_mode(self, filepath):
+        persistence = SQLitePersistence(filepath)
+        assert persistence._connection.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+    def test_empty(self, filepath):
+        persistence = SQLitePersistence(filepath)
+        assert isinstance(persistence.get_user_data(), defaultdict)
+        assert persistence.get_user_data() == {}
+        assert isinstance(persistence.get_chat_data(), defaultdict)
+        assert persistence.get_chat_data() == {}
+        assert persistence.get_bot_data() == {}
+        assert persistence.get_callback_data() is None
+        assert persistence.get_conversations('name') == {}
+
+    def test_round_trip(self, filepath):
+        persistence = SQLitePersistence(filepath)
+        persistence.update_user_data(1, {'user': 1})
+        persistence.update_user_data(1, {'user': 'one'})
+        persistence.update_chat_data(-1, {'chat': -1})
+        persistence.update_bot_data({'bot': True})
+        persistence.update_callback_data(([('uuid', 1.0, {'button': 1})], {'id': 'uuid'}))
+        persistence.update_conversation('name', (1, 2), 'state')
+        persistence.update_conversation('name', (1, 3), None)
+        persistence.update_conversation('other', (1,), 'other state')
+        persistence.flush()
+
+        persistence = SQLitePersistence(filepath)
+        assert persistence.get_user_data()[1] == {'user': 'one'}
+        assert persistence.get_chat_data()[-1] == {'chat': -1}
+        assert persistence.get_bot_data() == {'bot': True}
+        assert persistence.get_callback_data() == (
+            [('uuid', 1.0, {'button': 1})],
+            {'id': 'uuid'},
+        )
+        assert persistence.get_conversations('name') == {(1, 2): 'state', (1, 3): None}
+        assert persistence.get_conversations('other') == {(1,): 'other state'}
+
+    def test_conversation_keys(self, filepath):
+        persistence = SQLitePersistence(filepath)
+        persistence.update_conversation('name', (1, 2), 'state')
+        persistence.update_conversation('name', (1, 2), 'new state')
+        persistence.flush()
+        # The keys are stored in a fixed format, regardless of the installed JSON libraries
+        with sqlite3.connect(filepath) as connection:
+            assert connection.execute('SELECT name, key FROM conversations').fetchall() == [
+                ('name', '[1,2]')
+            ]
+        assert SQLitePersistence(filepath).get_conversations('name') == {(1, 2): 'new state'}
+
+    def test_lazy_loading(self, filepath):
+        persistence = SQLitePersistence(filepath, batch_size=1000)
+        for user_id in range(100):
+            persistence.update_user_data(user_id, {'user': user_id})
+        persistence.flush()
+
+        user_data = SQLitePersistence(filepath).get_user_data()
+        assert len(user_data) == 0
+        # Only item access loads the data
+        assert user_data.get(5) is None
+        assert 5 not in user_data
+        assert user_data[5] == {'user': 5}
+        assert 5 in user_data
+        assert user_data[100] == {}
+        assert dict(user_data) == {5: {'user': 5}, 100: {}}
+
+    def test_lazy_loading_pending_changes(self, filepath):
+        persistence = SQLitePersistence(filepath, batch_size=1000, flush_interval=1000)
+        persistence.update_chat_data(1, {'chat': 1})
+        assert count_rows(filepath, 'chat_data') == 0
+        assert persistence.get_chat_data()[1] == {'chat': 1}
+
+    def test_copy_and_pickle(self, filepath):
+        persistence = SQLitePersistence(filepath)
+        persistence.update_user_data(1, {'user': 1})
+        persistence.flush()
+
+        user_data = persistence.get_user_data()
+        user_data[2]['user'] = 2
+        copied = copy.copy(user_data)
+        assert type(copied) is type(user_data)
+        assert copied == {2: {'user': 2}}
+        assert copied[1] == {'user': 1}
+        assert 1 not in user_data
+
+        unpickled = pickle.loads(pickle.dumps(user_data))
+        assert type(unpickled) is defaultdict
+        assert unpickled == {2: {'user': 2}}
+        assert unpickled[1] == {}
+
+    def test_batched_writes(self, filepath):
+        persistence = SQLitePersistence(filepath, batch_size=3, flush_interval=1000)
+        persistence.update_user_data(1, {'user': 1})
+        persistence.update_user_data(1, {'user': 'one'})
+        persistence.update_user_data(2, {'user': 2})
+        assert count_rows(filepath, 'user_data') == 0
+
+        persistence.update_chat_data(1, {'chat': 1})
+        assert count_rows(filepath, 'user_data') == 2
+        assert count_rows(filepath, 'chat_data') == 1
+
+        persistence.update_user_data(3, {'user': 3})
+        assert count_rows(filepath, 'user_data') == 2
+        persistence.flush()
+        assert count_rows(filepath, 'user_data') == 3
+
+    def test_flush_interval(self, filepath):
+        persistence = SQLitePersistence(filepath, batch_size=1000, flush_interval=0)
+        persistence.update_user_data(1, {'user': 1})
+        assert count_rows(filepath, 'user_data') == 1
+
+    def test_insert_bot(self, filepath):
+        bot = ExtBot(TOKEN)
+        persistence = SQLitePersistence(filepath)
+        persistence.set_bot(bot)
+        persistence.update_user_data(1, {'bot': bot})
+        persistence.update_bot_data({'bot': bot})
+        persistence.flush()
+
+        with sqlite3.connect(filepath) as connection:
+            data = connection.execute('SELECT data FROM user_data').fetchone()[0]
+        assert pickle.loads(data) == {'bot': SQLitePersistence.REPLACED_BOT}
+
+        persistence = SQLitePersistence(filepath)
+        persistence.set_bot(bot)
+        assert persistence.get_user_data()[1]['bot'] is bot
+        assert persistence.get_bot_data()['bot'] is bot
@@ -86,6 +86,30 @@ class TestTelegramObject:
         subclass_instance = TelegramObjectSubclass()
         assert subclass_instance.to_dict() == {'a': 1}
 
+    def test_to_dict_nested(self):
+        class Child(TelegramObject):
+            __slots__ = ('value',)
+
+            def __init__(self, value):
+                self.value = value
+
+        class Parent(TelegramObject):
+            __slots__ = ('from_user', 'child', 'children', 'rows', 'unset', 'none')
+
+            def __init__(self):
+                self.from_user = Child(1)
+                self.child = Child(2)
+                self.children = [Child(3), 4]
+                self.rows = ((Child(5),), (Child(6), Child(7)))
+                self.none = None
+
+        assert Parent().to_dict() == {
+            'from': {'value': 1},
+            'child': {'value': 2},
+            'children': [{'value': 3}, 4],
+            'rows': (({'value': 5},), ({'value': 6}, {'value': 7})),
+        }
+
     def test_slot_behaviour(self, mro_slots):
         inst = TelegramObject()
         for attr in inst.__slots__:
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import pickle
+from copy import copy, deepcopy
+
+import pytest
+
+from telegram.ext import DictPersistence, ExtBot, TrackingDict
+from telegram.request import MockRequest
+
+
+@pytest.fixture(scope='function')
+def tracking_dict():
+    return TrackingDict({1: 'a', 2: 'b'})
+
+
+class TestTrackingDict:
+    def test_slot_behaviour(self, tracking_dict, mro_slots):
+        for attr in tracking_dict.__slots__:
+            assert getattr(tracking_dict, attr, 'err') != 'err', f"got extra slot '{attr}'"
+        assert len(mro_slots(tracking_dict)) == len(
+            set(mro_slots(tracking_dict))
+        ), "duplicate slot"
+
+    def test_init_unchanged(self, tracking_dict):
+        assert tracking_dict == {1: 'a', 2: 'b'}
+        assert tracking_dict.changed_keys == frozenset()
+        assert TrackingDict(a=1).changed_keys == frozenset()
+
+    @pytest.mark.parametrize(
+        'mutate, keys',
+        [
+            (lambda d: d.__setitem__(3, 'c'), {3}),
+            (lambda d: d.__delitem__(1), {1}),
+            (lambda d: d.update({1: 'x'}, y=2), {1, 'y'}),
+            (lambda d: d.update([(4, 'd')]), {4}),
+            (lambda d: d.__ior__({5: 'e'}), {5}),
+            (lambda d: d.setdefault(1, 'x'), set()),
+            (lambda d: d.setdefault(3, 'c'), {3}),
+            (lambda d: d.pop(2), {2}),
+            (lambda d: d.pop(3, None), set()),
+            (lambda d: d.popitem(), {2}),
+            (lambda d: d.clear(), {1, 2}),
+        ],
+        ids=[
+            'setitem',
+            'delitem',
+            'update',
+            'update_iterable',
+            'ior',
+            'setdefault_existing',
+            'setdefault_new',
+            'pop',
+            'pop_missing',
+            'popitem',
+            'clear',
+        ],
+    )
+    def test_changed_keys(self, tracking_dict, mutate, keys):
+        mutate(tracking_dict)
+        assert tracking_dict.changed_keys == keys
+
+    def test_ior_returns_self(self, tracking_dict):
+        result = tracking_dict
+        result |= {3: 'c'}
+        assert result is tracking_dict
+        assert result[3] == 'c'
+
+    def test_mark_unchanged(self, tracking_dict):
+        tracking_dict[1] = 'x'
+        tracking_dict.mark_unchanged()
+        assert tracking_dict.changed_keys == frozenset()
+        assert tracking_dict == {1: 'x', 2: 'b'}
+
+    def test_mark_changed(self, tracking_dict):
+        tracking_dict[1] = 'x'
+        tracking_dict.mark_changed(2, 3)
+        assert tracking_dict.changed_keys == {1, 2, 3}
+        assert tracking_dict == {1: 'x', 2: 'b'}
+
+    def test_nested_changes_not_tracked(self):
+        tracking_dict = TrackingDict({'list': []})
+        tracking_dict['list'].append(1)
+        assert tracking_dict.changed_keys == frozenset()
+
+    @pytest.mark.parametrize(
+        'duplicate',
+        [copy, deepcopy, TrackingDict.copy, lambda d: pickle.loads(pickle.dumps(d))],
+        ids=['copy', 'deepcopy', 'copy_method', 'pickle'],
+    )
+    def test_copies_unchanged(self, tracking_dict, duplicate):
+        tracking_dict[3] = 'c'
+        duplicated = duplicate(tracking_dict)
+        assert isinstance(duplicated, TrackingDict)
+        assert duplicated == tracking_dict
+        assert duplicated.changed_keys == frozenset()
+        assert tracking_dict.changed_keys == {3}
+
+    def test_insert_bot_unchanged(self):
+        bot = ExtBot('1234567890:AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA', request=MockRequest())
+        persistence = DictPersistence()
+        persistence.set_bot(bot)
+        tracking_dict = TrackingDict({'bot': persistence.REPLACED_BOT})
+        inserted = persistence.insert_bot(tracking_dict)
+        assert inserted['bot'] is bot
+        assert inserted.changed_keys == frozenset()
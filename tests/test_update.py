@@ -16,6 +16,8 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
+import copy
+import pickle
 import time
 
 import pytest
@@ -126,6 +128,35 @@ class TestUpdate:
                 assert getattr(update, _type) == paramdict[_type]
         assert i == 1
 
+    @pytest.mark.parametrize('paramdict', argvalues=params, ids=ids)
+    def test_de_json_lazy(self, bot, paramdict):
+        json_dict = {'update_id': TestUpdate.update_id}
+        json_dict.update({k: v.to_dict() for k, v in paramdict.items()})
+        eager = Update.de_json(json_dict, bot)
+        lazy = Update.de_json(json_dict, bot, lazy=True)
+
+        assert isinstance(lazy, Update)
+        assert lazy == eager
+        assert hash(lazy) == hash(eager)
+        assert lazy.to_dict() == eager.to_dict()
+        for _type in all_types:
+            assert getattr(lazy, _type) == getattr(eager, _type)
+        assert lazy.effective_chat == eager.effective_chat
+        assert lazy.effective_user == eager.effective_user
+
+        # Pickling and copying results in a plain update
+        lazy = Update.de_json(json_dict, None, lazy=True)
+        for restored in (pickle.loads(pickle.dumps(lazy)), copy.deepcopy(lazy)):
+            assert type(restored) is Update
+            assert restored.to_dict() == eager.to_dict()
+
+    def test_de_json_no_copy(self, bot):
+        json_dict = {'update_id': TestUpdate.update_id, 'message': message.to_dict()}
+        update = Update.de_json(json_dict, bot, copy=False)
+
+        assert update.message == message
+        assert isinstance(json_dict['message'], Message)
+
     def test_update_de_json_empty(self, bot):
         update = Update.de_json(None, bot)
 
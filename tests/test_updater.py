@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2021
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import json
+import threading
+import warnings
+from http import HTTPStatus
+
+import pytest
+
+from telegram import Update
+from telegram.error import InvalidToken
+from telegram.ext import ExtBot, Updater
+from telegram.ext._utils.webhookhandler import WebhookASGIApp, process_webhook_payload
+from telegram.request import MockRequest
+
+TOKEN = '1234567890:AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA'
+
+
+def make_message_update(update_id):
+    return {
+        'update_id': update_id,
+        'message': {
+            'message_id': update_id,
+            'date': 0,
+            'chat': {'id': 1, 'type': 'private'},
+            'text': 'hi',
+        },
+    }
+
+
+class GetUpdates:
+    """Answers getUpdates with the given batches and records the offsets together with the
+    size of the update queue at the time of each request."""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.calls = []
+        self.update_queue = None
+
+    def __call__(self, request_data):
+        offset = request_data.parameters.get('offset')
+        self.calls.append((offset, self.update_queue.qsize()))
+        return self.batches.pop(0) if self.batches else []
+
+
+def make_updater(get_updates):
+    # Each request takes a bit, so polling without updates doesn't block the event loop
+    request = MockRequest(responses={'getUpdates': get_updates}, latency=0.01)
+    get_updates.update_queue = asyncio.Queue()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return Updater(
+            bot=ExtBot(TOKEN, request=request),
+            update_queue=get_updates.update_queue,
+            exception_event=threading.Event(),
+        )
+
+
+async def wait_for(condition, timeout=1):
+    async def wait():
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(wait(), timeout)
+
+
+class TestUpdaterPolling:
+    @pytest.mark.asyncio
+    async def test_start_stop(self):
+        get_updates = GetUpdates([])
+        updater = make_updater(get_updates)
+
+        update_queue = await updater.start_polling()
+        # The polling task is ready once start_polling returns
+        assert update_queue is updater.update_queue
+        assert updater.running
+        # Starting again does nothing
+        assert await updater.start_polling() is None
+        await wait_for(lambda: get_updates.calls)
+
+        await updater.stop()
+        assert not updater.running
+        calls = len(get_updates.calls)
+        await asyncio.sleep(0.05)
+        assert len(get_updates.calls) == calls
+
+    @pytest.mark.asyncio
+    async def test_updates_queued_before_next_fetch(self):
+        get_updates = GetUpdates([[make_message_update(1), make_message_update(2)]])
+        updater = make_updater(get_updates)
+
+        await updater.start_polling()
+        await wait_for(lambda: len(get_updates.calls) >= 2)
+        await updater.stop()
+
+        # The batch is confirmed with the next offset only after both updates were queued
+        assert get_updates.calls[:2] == [(None, 0), (3, 2)]
+        assert updater.last_update_id == 3
+        updates = [updater.update_queue.get_nowait() for _ in range(2)]
+        assert all(isinstance(update, Update) for update in updates)
+        assert [update.update_id for update in updates] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_batch_not_confirmed_on_error(self):
+        # The second update can't be deserialized
+        get_updates = GetUpdates([[make_message_update(1), {'update_id': 2, 'message': 1}]])
+        updater = make_updater(get_updates)
+
+        await updater.start_polling()
+        await wait_for(updater.exception_event.is_set)
+        await updater.stop()
+
+        assert get_updates.calls == [(None, 0)]
+        assert updater.last_update_id == 0
+
+    @pytest.mark.asyncio
+    async def test_poll_interval(self):
+        get_updates = GetUpdates([[make_message_update(1)]])
+        updater = make_updater(get_updates)
+
+        await updater.start_polling(poll_interval=0.2)
+        await asyncio.sleep(0.1)
+        # The next request waits for the poll interval
+        assert get_updates.calls == [(None, 0)]
+        await wait_for(lambda: len(get_updates.calls) >= 2)
+        await updater.stop()
+        assert get_updates.calls[1] == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_start_fails_before_ready(self):
+        updater = make_updater(GetUpdates([]))
+
+        def delete_webhook(_):
+            raise InvalidToken()
+
+        updater.bot.request.responses['deleteWebhook'] = delete_webhook
+        # start_polling doesn't wait forever for the ready event, if bootstrapping fails
+        with pytest.raises(InvalidToken):
+            await asyncio.wait_for(updater.start_polling(), timeout=1)
+        assert not updater.running
+        await updater.stop()
+
+
+async def call_asgi(app, scope, messages):
+    """Calls the ASGI app with the messages to receive and returns the sent messages."""
+    received = list(messages)
+    sent = []
+
+    async def receive():
+        return received.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await asyncio.wait_for(app(scope, receive, send), timeout=1)
+    return sent
+
+
+async def post(app, path='/webhook', body=None, content_type=b'application/json', method='POST'):
+    if body is None:
+        body = json.dumps(make_message_update(1)).encode()
+    scope = {
+        'type': 'http',
+        'path': path,
+        'method': method,
+        'headers': [(b'content-type', content_type)],
+    }
+    # Send the body in two chunks
+    middle = len(body) // 2
+    messages = [
+        {'type': 'http.request', 'body': body[:middle], 'more_body': True},
+        {'type': 'http.request', 'body': body[middle:], 'more_body': False},
+    ]
+    start, _ = await call_asgi(app, scope, messages)
+    return start['status'], dict(start['headers'])
+
+
+class TestWebhookASGIApp:
+    @pytest.mark.asyncio
+    async def test_lifespan(self):
+        updater = make_updater(GetUpdates([]))
+        app = updater.asgi_app('webhook')
+
+        sent = await call_asgi(
+            app,
+            {'type': 'lifespan'},
+            [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}],
+        )
+        assert sent == [
+            {'type': 'lifespan.startup.complete'},
+            {'type': 'lifespan.shutdown.complete'},
+        ]
+        assert not updater.running
+
+    @pytest.mark.asyncio
+    async def test_lifespan_startup_failed(self):
+        async def on_startup():
+            raise RuntimeError('no bot')
+
+        app = WebhookASGIApp('/webhook', None, asyncio.Queue(), on_startup=on_startup)
+        sent = await call_asgi(app, {'type': 'lifespan'}, [{'type': 'lifespan.startup'}])
+        assert sent == [{'type': 'lifespan.startup.failed', 'message': "RuntimeError('no bot')"}]
+
+    @pytest.mark.asyncio
+    async def test_lifespan_shutdown_failed(self):
+        async def on_shutdown():
+            raise RuntimeError('stuck')
+
+        app = WebhookASGIApp('/webhook', None, asyncio.Queue(), on_shutdown=on_shutdown)
+        sent = await call_asgi(
+            app,
+            {'type': 'lifespan'},
+            [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}],
+        )
+        assert sent[1] == {'type': 'lifespan.shutdown.failed', 'message': "RuntimeError('stuck')"}
+
+    @pytest.mark.asyncio
+    async def test_update(self):
+        updater = make_updater(GetUpdates([]))
+        app = updater.asgi_app('/webhook/')
+
+        status, _ = await post(app)
+        assert status == HTTPStatus.OK
+        update = updater.update_queue.get_nowait()
+        assert isinstance(update, Update)
+        assert update.message.text == 'hi'
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'kwargs, status',
+        [
+            ({'path': '/other'}, HTTPStatus.NOT_FOUND),
+            ({'method': 'GET'}, HTTPStatus.METHOD_NOT_ALLOWED),
+            ({'content_type': b'text/plain'}, HTTPStatus.FORBIDDEN),
+            ({'body': b'{not json'}, HTTPStatus.BAD_REQUEST),
+        ],
+        ids=['path', 'method', 'content_type', 'invalid_json'],
+    )
+    async def test_rejected_requests(self, kwargs, status):
+        updater = make_updater(GetUpdates([]))
+        app = updater.asgi_app('webhook')
+
+        assert (await post(app, **kwargs))[0] == status
+        assert updater.update_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_high_water_mark(self):
+        updater = make_updater(GetUpdates([]))
+        app = updater.asgi_app('webhook', high_water_mark=2)
+
+        for _ in range(2):
+            assert (await post(app))[0] == HTTPStatus.OK
+        status, headers = await post(app)
+        assert status == HTTPStatus.SERVICE_UNAVAILABLE
+        assert headers[b'retry-after'] == b'1'
+        assert updater.update_queue.qsize() == 2
+
+        updater.update_queue.get_nowait()
+        assert (await post(app))[0] == HTTPStatus.OK
+
+
+class TestProcessWebhookPayload:
+    def test_full_queue(self):
+        bot = ExtBot(TOKEN, request=MockRequest())
+        update_queue = asyncio.Queue(maxsize=1)
+        payload = json.dumps(make_message_update(1)).encode()
+
+        assert process_webhook_payload(payload, bot, update_queue, None) == HTTPStatus.OK
+        assert (
+            process_webhook_payload(payload, bot, update_queue, None)
+            == HTTPStatus.SERVICE_UNAVAILABLE
+        )
+        assert update_queue.qsize() == 1
+
+    def test_invalid_json(self):
+        bot = ExtBot(TOKEN, request=MockRequest())
+        with pytest.raises(ValueError):
+            process_webhook_payload(b'{', bot, asyncio.Queue(), None)